@@ -0,0 +1,30 @@
+"""内容模式吞吐量基准测试
+
+用法:
+    uv run python benchmarks/bench_patterns.py --dir /mnt/target --size-mb 1024
+"""
+import argparse
+
+from filetools.models.benchmark import DEFAULT_BENCHMARK_BYTES, benchmark_patterns
+
+
+def main() -> None:
+    """运行内容模式基准测试并打印结果表格"""
+    parser = argparse.ArgumentParser(description="对比各内容模式与全零写入的吞吐量")
+    parser.add_argument("--dir", default=None, help="测试文件所在目录（默认系统临时目录）")
+    parser.add_argument(
+        "--size-mb", type=int, default=DEFAULT_BENCHMARK_BYTES // (1024 * 1024), help="每个模式的数据量（MB）"
+    )
+    args = parser.parse_args()
+    
+    results = benchmark_patterns(args.dir, args.size_mb * 1024 * 1024)
+    print(f"{'模式':<14}{'生成 MB/s':>14}{'写入 MB/s':>14}{'相对全零':>10}")
+    for result in results:
+        print(
+            f"{result.pattern:<14}{result.fill_mbps:>14.0f}"
+            f"{result.write_mbps:>14.0f}{result.relative_to_zeros:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""文件生成与磁盘监控热点路径的基准套件
+
+用法:
+    # 在 tmpfs 与 loopback 文件系统上运行并保存基线
+    uv run python benchmarks/bench_suite.py run --target tmpfs=/dev/shm --target loop=/mnt/filetools-loop \\
+        --output baseline.json
+
+    # 再次运行后与基线对比，变慢超过 10% 时退出码为 1
+    uv run python benchmarks/bench_suite.py run --target tmpfs=/dev/shm --output current.json
+    uv run python benchmarks/bench_suite.py compare baseline.json current.json --threshold 0.1
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+from filetools.config.constants import CONTENT_PATTERNS
+from filetools.models.bench_suite import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    DEFAULT_SUITE_CHUNK_SIZES_MB,
+    DEFAULT_SUITE_MOUNT_COUNTS,
+    DEFAULT_SUITE_REPEAT,
+    DEFAULT_SUITE_SIZES_MB,
+    compare_reports,
+    load_baseline,
+    run_suite,
+    save_baseline,
+)
+
+
+def _parse_targets(values):
+    """解析 name=path 形式的测试目标，未指定时使用 /dev/shm（tmpfs）与系统临时目录"""
+    if not values:
+        targets = {"tmp": tempfile.gettempdir()}
+        if os.path.isdir("/dev/shm"):
+            targets = {"tmpfs": "/dev/shm", **targets}
+        return targets
+    targets = {}
+    for value in values:
+        name, sep, path = value.partition("=")
+        if not sep or not name or not path:
+            raise SystemExit(f"测试目标格式应为 name=path: {value}")
+        targets[name] = path
+    return targets
+
+
+def cmd_run(args) -> int:
+    """运行基准套件并保存结果"""
+    report = run_suite(
+        _parse_targets(args.target), args.sizes_mb, args.chunk_sizes_mb, args.patterns, args.mount_counts, args.repeat
+    )
+    save_baseline(args.output, report)
+    for result in report["results"]:
+        print(f"{result['name']:<72}{result['value']:>12.1f} {result['unit']}")
+    print(f"结果已保存到 {args.output}")
+    return 0
+
+
+def cmd_compare(args) -> int:
+    """对比两次运行结果，有回退时返回 1"""
+    comparisons = compare_reports(load_baseline(args.baseline), load_baseline(args.current), args.threshold)
+    regressions = 0
+    for comparison in comparisons:
+        flag = "回退" if comparison.regressed else ""
+        regressions += comparison.regressed
+        print(
+            f"{comparison.name:<72}{comparison.baseline:>10.1f} → {comparison.current:>10.1f} {comparison.unit:<5}"
+            f"{comparison.change:>+8.1%}  {flag}"
+        )
+    print(f"共对比 {len(comparisons)} 项，回退 {regressions} 项（阈值 {args.threshold:.0%}）")
+    return 1 if regressions else 0
+
+
+def main() -> int:
+    """解析命令行并执行子命令"""
+    parser = argparse.ArgumentParser(description="文件生成与磁盘监控基准套件")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="运行基准套件并保存 JSON 结果")
+    run.add_argument("--target", action="append", metavar="NAME=PATH", help="测试目标（可重复指定）")
+    run.add_argument("--output", required=True, help="结果 JSON 路径")
+    run.add_argument("--sizes-mb", type=int, nargs="+", default=list(DEFAULT_SUITE_SIZES_MB), help="文件大小（MB）")
+    run.add_argument(
+        "--chunk-sizes-mb", type=int, nargs="+", default=list(DEFAULT_SUITE_CHUNK_SIZES_MB), help="块大小（MB）"
+    )
+    run.add_argument("--patterns", nargs="+", choices=CONTENT_PATTERNS, default=list(CONTENT_PATTERNS), help="内容模式")
+    run.add_argument(
+        "--mount-counts", type=int, nargs="+", default=list(DEFAULT_SUITE_MOUNT_COUNTS), help="合成挂载点数量"
+    )
+    run.add_argument("--repeat", type=int, default=DEFAULT_SUITE_REPEAT, help="每个用例的重复次数")
+    run.set_defaults(func=cmd_run)
+
+    compare = subparsers.add_parser("compare", help="与基线对比，变慢超过阈值时退出码为 1")
+    compare.add_argument("baseline", help="基线 JSON 路径")
+    compare.add_argument("current", help="当前结果 JSON 路径")
+    compare.add_argument(
+        "--threshold", type=float, default=DEFAULT_REGRESSION_THRESHOLD, help="回退阈值（相对变化比例）"
+    )
+    compare.set_defaults(func=cmd_compare)
+
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
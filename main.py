@@ -1,15 +1,13 @@
 """主入口文件"""
-from filetools.config.logger import logger
-from filetools.ui.interface import create_interface
+import sys
+
+from filetools.cli import main as cli_main
 
 
 def main():
-    """主函数：启动Gradio Web应用"""
-    logger.info("启动文件大小生成工具")
-    app = create_interface()
-    logger.info("Gradio 界面已创建，正在启动服务器...")
-    app.launch(server_name="0.0.0.0", server_port=7860, share=False)
+    """主函数：启动Gradio Web应用（等同于 filetools serve，额外参数透传给 serve 子命令）"""
+    return cli_main(["serve", *sys.argv[1:]])
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -0,0 +1,6 @@
+"""支持 python -m filetools 运行命令行"""
+import sys
+
+from filetools.cli import main
+
+sys.exit(main())
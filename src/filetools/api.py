@@ -0,0 +1,239 @@
+"""JSON HTTP 接口：提交、查询、取消生成任务，以及读取磁盘快照
+
+所有接口都直接调用 models 层：提交任务后立即返回任务 ID，生成在 JobManager 的线程池中执行，
+磁盘快照读取快照缓存，请求不会因为正在进行的生成而阻塞。失败时返回稳定的错误码：
+
+    {"error": {"code": "job_not_found", "message": "任务不存在: 1a2b3c4d"}}
+"""
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, Field
+
+from filetools.config.constants import (
+    ALLOCATION_MODES,
+    CONTENT_PATTERNS,
+    DEFAULT_ALLOCATION_MODE,
+    DEFAULT_CONTENT_PATTERN,
+    DEFAULT_DURABILITY,
+    DEFAULT_IO_MODE,
+    DEFAULT_QUEUE_DEPTH,
+    DEFAULT_SYNC_INTERVAL,
+    DEFAULT_UNIT,
+    DURABILITY_MODES,
+    IO_MODES,
+    MAX_QUEUE_DEPTH,
+    UNIT_MAPPING,
+)
+from filetools.models.disk_snapshot import disk_snapshot_cache
+from filetools.models.disk_usage import DiskUsage
+from filetools.models.generation_result import ERROR_INVALID_ARGUMENT
+from filetools.models.job_manager import (
+    ERROR_FILE_EXISTS,
+    ERROR_JOB_FINISHED,
+    ERROR_JOB_NOT_FOUND,
+    ERROR_QUEUE_FULL,
+    Job,
+    JobError,
+    job_manager,
+)
+
+# 请求体格式错误（缺少字段、类型不符）的错误码
+ERROR_INVALID_REQUEST = "invalid_request"
+
+# 错误码对应的 HTTP 状态码
+_ERROR_STATUS = {
+    ERROR_INVALID_REQUEST: 422,
+    ERROR_INVALID_ARGUMENT: 400,
+    ERROR_JOB_NOT_FOUND: 404,
+    ERROR_JOB_FINISHED: 409,
+    ERROR_QUEUE_FULL: 429,
+    ERROR_FILE_EXISTS: 409,
+}
+
+
+class ApiError(Exception):
+    """
+    接口错误
+
+    :param code: 稳定的错误码
+    :param message: 本地化的错误消息
+    """
+
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class SubmitJobRequest(BaseModel):
+    """提交任务的请求体"""
+    file_path: str = Field(description="文件路径")
+    file_size: int = Field(description="文件大小数值")
+    unit: str = Field(DEFAULT_UNIT, description="文件大小单位")
+    allocation: str = Field(DEFAULT_ALLOCATION_MODE, description="分配模式")
+    pattern: str = Field(DEFAULT_CONTENT_PATTERN, description="内容模式")
+    resume: bool = Field(False, description="是否从检查点继续写入")
+    io_mode: str = Field(DEFAULT_IO_MODE, description="I/O 模式")
+    durability: str = Field(DEFAULT_DURABILITY, description="持久化策略")
+    sync_interval: int = Field(DEFAULT_SYNC_INTERVAL, description="interval 策略的落盘间隔（字节）")
+    queue_depth: int = Field(DEFAULT_QUEUE_DEPTH, description="队列深度（同时执行 pwrite 的线程数）")
+
+
+def _error_response(code: str, message: str) -> JSONResponse:
+    return JSONResponse({"error": {"code": code, "message": message}}, status_code=_ERROR_STATUS.get(code, 400))
+
+
+def _validate_submit(request: SubmitJobRequest) -> None:
+    """提交前校验参数，避免把明显错误的请求放进队列"""
+    choices = (
+        ("unit", request.unit, list(UNIT_MAPPING)),
+        ("allocation", request.allocation, ALLOCATION_MODES),
+        ("pattern", request.pattern, CONTENT_PATTERNS),
+        ("io_mode", request.io_mode, IO_MODES),
+        ("durability", request.durability, DURABILITY_MODES),
+    )
+    for name, value, allowed in choices:
+        if value not in allowed:
+            raise ApiError(ERROR_INVALID_ARGUMENT, f"不支持的 {name}: {value}。支持: {', '.join(allowed)}")
+    if not request.file_path.strip():
+        raise ApiError(ERROR_INVALID_ARGUMENT, "文件路径不能为空")
+    if request.file_size <= 0:
+        raise ApiError(ERROR_INVALID_ARGUMENT, "文件大小必须大于0")
+    if request.sync_interval <= 0:
+        raise ApiError(ERROR_INVALID_ARGUMENT, "落盘间隔必须大于0")
+    if not 1 <= request.queue_depth <= MAX_QUEUE_DEPTH:
+        raise ApiError(ERROR_INVALID_ARGUMENT, f"队列深度必须在 1 到 {MAX_QUEUE_DEPTH} 之间")
+
+
+def job_to_dict(job: Job) -> Dict[str, Any]:
+    """
+    任务转换为 JSON 对象
+
+    :param job: 任务
+    :return: 任务字段、进度与写入速度（bytes_per_second 为最近一次进度的瞬时速度）
+    """
+    event = job.progress
+    elapsed = event.elapsed if event else 0.0
+    return {
+        "job_id": job.job_id,
+        "kind": job.kind,
+        "file_path": job.file_path,
+        "file_size": job.file_size,
+        "unit": job.unit,
+        "allocation": job.allocation,
+        "pattern": job.pattern,
+        "io_mode": job.io_mode,
+        "durability": job.durability,
+        "queue_depth": job.queue_depth,
+        "status": job.status,
+        "finished": job.finished,
+        "error_code": job.error_code or None,
+        "message": job.message,
+        "bytes_written": event.bytes_written if event else 0,
+        "total_bytes": event.total_bytes if event else job.file_size * UNIT_MAPPING.get(job.unit, 0),
+        "percent": event.percent if event else 0,
+        "bytes_per_second": int(event.mbps * 1024 * 1024) if event else 0,
+        "average_bytes_per_second": int(event.bytes_written / elapsed) if event and elapsed > 0 else 0,
+        "eta_seconds": event.eta if event else None,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+    }
+
+
+def disk_to_dict(disk: DiskUsage) -> Dict[str, Any]:
+    """
+    磁盘使用情况转换为 JSON 对象
+
+    :param disk: 磁盘使用情况
+    :return: 空间与 inode 字段（字节）
+    """
+    return {
+        "device": disk.device,
+        "mountpoint": disk.mountpoint,
+        "fstype": disk.fstype,
+        "available": disk.available,
+        "total": disk.total,
+        "used": disk.used,
+        "free": disk.free,
+        "reserved": disk.reserved,
+        "percent": disk.percent,
+        "inodes_total": disk.inodes_total,
+        "inodes_free": disk.inodes_free,
+        "block_size": disk.block_size,
+    }
+
+
+def _require_job(job_id: str) -> Job:
+    job = job_manager.get(job_id)
+    if job is None:
+        raise ApiError(ERROR_JOB_NOT_FOUND, f"任务不存在: {job_id}")
+    return job
+
+
+def create_api_router() -> APIRouter:
+    """
+    创建 /api 路由
+
+    :return: 路由
+    """
+    router = APIRouter(prefix="/api")
+
+    @router.post("/jobs", status_code=202)
+    def submit_job(request: SubmitJobRequest) -> Dict[str, Any]:
+        """提交文件生成任务（立即返回）"""
+        _validate_submit(request)
+        job = job_manager.submit(
+            request.file_path.strip(), request.file_size, request.unit, request.allocation, request.pattern,
+            request.resume, request.io_mode, request.durability, request.sync_interval, request.queue_depth,
+        )
+        return job_to_dict(job)
+
+    @router.get("/jobs")
+    def list_jobs() -> Dict[str, Any]:
+        """按提交顺序列出全部任务"""
+        return {"jobs": [job_to_dict(job) for job in job_manager.list_jobs()]}
+
+    @router.get("/jobs/{job_id}")
+    def get_job(job_id: str) -> Dict[str, Any]:
+        """任务状态与写入速度"""
+        return job_to_dict(_require_job(job_id))
+
+    @router.post("/jobs/{job_id}/cancel")
+    def cancel_job(job_id: str) -> Dict[str, Any]:
+        """取消任务"""
+        return job_to_dict(job_manager.cancel(job_id))
+
+    @router.get("/disks")
+    def list_disks(mountpoint: Optional[str] = None) -> Dict[str, Any]:
+        """磁盘使用情况快照（读取快照缓存，不等待全量扫描）"""
+        disks = disk_snapshot_cache.peek()
+        if mountpoint is not None:
+            disks = [disk for disk in disks if disk.mountpoint == mountpoint]
+        return {"snapshot_age": disk_snapshot_cache.age, "disks": [disk_to_dict(disk) for disk in disks]}
+
+    return router
+
+
+def install_api(app: FastAPI) -> None:
+    """
+    在应用上注册 /api 路由与统一的错误响应
+
+    :param app: FastAPI 应用
+    """
+    app.include_router(create_api_router())
+
+    @app.exception_handler(ApiError)
+    async def handle_api_error(request: Request, exc: ApiError) -> JSONResponse:
+        return _error_response(exc.code, exc.message)
+
+    @app.exception_handler(JobError)
+    async def handle_job_error(request: Request, exc: JobError) -> JSONResponse:
+        return _error_response(exc.code, str(exc))
+
+    @app.exception_handler(RequestValidationError)
+    async def handle_validation_error(request: Request, exc: RequestValidationError) -> JSONResponse:
+        details = "; ".join(f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}" for error in exc.errors())
+        return _error_response(ERROR_INVALID_REQUEST, details)
@@ -0,0 +1,276 @@
+"""命令行入口
+
+generate、clone、fill、monitor、bench 子命令只导入 filetools.models，不加载 Gradio，适合无界面的构建机；
+只有 serve 子命令才导入界面模块并启动 Web 服务。
+"""
+import argparse
+import logging
+import sys
+import time
+from typing import List, Optional
+
+from filetools.config.constants import (
+    ALLOCATION_MODES,
+    CONTENT_PATTERNS,
+    DEFAULT_ALLOCATION_MODE,
+    DEFAULT_CLONE_PREFIX,
+    DEFAULT_CONTENT_PATTERN,
+    DEFAULT_DURABILITY,
+    DEFAULT_IO_MODE,
+    DEFAULT_QUEUE_DEPTH,
+    DEFAULT_SYNC_INTERVAL,
+    DEFAULT_UNIT,
+    DURABILITY_MODES,
+    IO_MODES,
+    MAX_QUEUE_DEPTH,
+    UNIT_MAPPING,
+)
+from filetools.config.logger import configure_logging, default_log_file
+from filetools.models.benchmark import DEFAULT_BENCHMARK_BYTES
+
+# Web 服务默认监听地址与端口
+DEFAULT_HOST = "0.0.0.0"
+DEFAULT_PORT = 7860
+
+# 可选的日志级别
+LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR"]
+
+
+def _print_progress(event) -> None:
+    """在同一行刷新生成进度（输出到 stderr，不干扰结果输出）"""
+    message = f"\r{event.percent:3d}%  {event.bytes_written / UNIT_MAPPING['MB']:.0f} MB  {event.mbps:.1f} MB/s"
+    if event.eta is not None:
+        message += f"  剩余 {event.eta:.0f} 秒"
+    sys.stderr.write(message.ljust(60))
+    if event.finished:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
+
+
+def cmd_generate(args: argparse.Namespace) -> int:
+    """生成单个文件"""
+    from filetools.models.file_generator import run_generation
+
+    result = run_generation(
+        args.path, args.size, args.unit, None, args.allocation, args.pattern,
+        None if args.quiet else _print_progress, None, args.resume, args.io_mode, args.durability,
+        args.sync_interval_mb * UNIT_MAPPING["MB"], args.queue_depth,
+    )
+    print(result.message)
+    return 0 if result.ok else 1
+
+
+def cmd_clone(args: argparse.Namespace) -> int:
+    """生成一个模板文件并复制出多个相同的文件"""
+    from filetools.models.clone_generator import generate_clones
+
+    try:
+        result = generate_clones(
+            args.dir, args.count, args.size * UNIT_MAPPING[args.unit], prefix=args.prefix, pattern=args.pattern,
+            durability=args.durability, force_allocate=args.force_allocate,
+            progress_events=None if args.quiet else _print_progress,
+        )
+    except (ValueError, OSError) as e:
+        print(f"克隆失败：{e}", file=sys.stderr)
+        return 1
+    methods = "，".join(f"{method} {count} 个" for method, count in result.methods.items()) or "无"
+    print(
+        f"克隆完成：文件 {len(result.files)} 个，模板生成 {result.template_stats.elapsed:.1f} 秒，"
+        f"复制 {result.clone_elapsed:.1f} 秒（{result.clone_mbps:.0f} MB/s），复制方式：{methods}"
+    )
+    if result.shared_extents:
+        print("注意：副本与模板共享数据块，不占用新的磁盘空间；需要真正占满磁盘时请使用 --force-allocate", file=sys.stderr)
+    return 0
+
+
+def cmd_fill(args: argparse.Namespace) -> int:
+    """填充挂载点到目标使用率或目标剩余空间"""
+    from filetools.models.fill_target import fill_to_target
+
+    target = (
+        {"target_percent": args.percent}
+        if args.percent is not None
+        else {"target_free_bytes": int(args.free * UNIT_MAPPING[args.unit])}
+    )
+    try:
+        result = fill_to_target(args.mountpoint, directory=args.dir, pattern=args.pattern, **target)
+    except (ValueError, OSError) as e:
+        print(f"填充失败：{e}", file=sys.stderr)
+        return 1
+    print(
+        f"填充完成：写入 {result.bytes_written / UNIT_MAPPING['MB']:.0f} MB，文件 {len(result.files)} 个，"
+        f"当前使用率 {result.final_percent:.1f}%，剩余 {result.final_free / UNIT_MAPPING['MB']:.0f} MB"
+    )
+    if result.warning:
+        print(f"警告：{result.warning}", file=sys.stderr)
+    return 0
+
+
+def _print_disks(unit: str) -> None:
+    """打印全部分区的使用情况"""
+    from filetools.models.disk_monitor import get_disk_usage_info
+
+    divider = UNIT_MAPPING[unit]
+    print(f"{'挂载点':<24}{'类型':<10}{'使用率':>8}{'可用':>14}{'总计':>14}{'inode':>8}")
+    for disk in get_disk_usage_info():
+        if not disk.available:
+            print(f"{disk.mountpoint:<24}{disk.fstype:<10}{'不可用':>8}")
+            continue
+        inode = f"{disk.inode_percent:.1f}%" if disk.inodes_total else "-"
+        print(
+            f"{disk.mountpoint:<24}{disk.fstype:<10}{disk.percent:>7.1f}%"
+            f"{disk.free / divider:>11.2f} {unit}{disk.total / divider:>11.2f} {unit}{inode:>8}"
+        )
+
+
+def cmd_monitor(args: argparse.Namespace) -> int:
+    """打印磁盘使用情况，--watch 时按间隔持续刷新"""
+    if not args.watch:
+        _print_disks(args.unit)
+        return 0
+    try:
+        while True:
+            print(time.strftime("%Y-%m-%d %H:%M:%S"))
+            _print_disks(args.unit)
+            print()
+            time.sleep(args.watch)
+    except KeyboardInterrupt:
+        return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    """运行内容模式基准测试并打印结果表格"""
+    from filetools.models.benchmark import benchmark_patterns
+
+    results = benchmark_patterns(args.dir, args.size_mb * UNIT_MAPPING["MB"], args.patterns or CONTENT_PATTERNS)
+    print(f"{'模式':<14}{'生成 MB/s':>14}{'写入 MB/s':>14}{'相对全零':>10}")
+    for result in results:
+        print(
+            f"{result.pattern:<14}{result.fill_mbps:>14.0f}"
+            f"{result.write_mbps:>14.0f}{result.relative_to_zeros:>10.2f}"
+        )
+    return 0
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    """启动 Web 服务：Gradio 界面与 /metrics 接口（只有这里才导入 Gradio）"""
+    from filetools.config.logger import logger
+    from filetools.models.disk_io import disk_io_sampler
+    from filetools.models.disk_sampler import disk_usage_sampler
+
+    logger.info("启动文件大小生成工具")
+    disk_usage_sampler.start()
+    disk_io_sampler.start()
+    if args.share:
+        # 公共链接只能通过 Gradio 自带的服务器创建，此时不提供 /metrics
+        from filetools.ui.interface import create_interface
+
+        logger.warning("使用 --share 时由 Gradio 启动服务器，/metrics 不可用")
+        create_interface().launch(server_name=args.host, server_port=args.port, share=True)
+        return 0
+
+    import uvicorn
+
+    from filetools.server import create_app
+
+    app = create_app()
+    logger.info(f"Gradio 界面已创建，正在启动服务器 http://{args.host}:{args.port}（指标: /metrics）...")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    构建命令行参数解析器
+
+    :return: 参数解析器
+    """
+    parser = argparse.ArgumentParser(prog="filetools", description="文件大小生成工具")
+    parser.add_argument(
+        "--log-level", choices=LOG_LEVELS, default=None, help="日志级别（默认 serve 为 INFO，其他为 WARNING）"
+    )
+    parser.add_argument("--log-file", default=None, help="日志文件路径（默认只有 serve 写入 logs/filetools.log）")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    generate = subparsers.add_parser("generate", help="生成指定大小的文件")
+    generate.add_argument("path", help="文件路径")
+    generate.add_argument("size", type=int, help="文件大小数值")
+    generate.add_argument("--unit", choices=list(UNIT_MAPPING), default=DEFAULT_UNIT, help="文件大小单位")
+    generate.add_argument("--allocation", choices=ALLOCATION_MODES, default=DEFAULT_ALLOCATION_MODE, help="分配模式")
+    generate.add_argument("--pattern", choices=CONTENT_PATTERNS, default=DEFAULT_CONTENT_PATTERN, help="内容模式")
+    generate.add_argument("--io-mode", choices=IO_MODES, default=DEFAULT_IO_MODE, help="I/O 模式")
+    generate.add_argument("--durability", choices=DURABILITY_MODES, default=DEFAULT_DURABILITY, help="持久化策略")
+    generate.add_argument(
+        "--sync-interval-mb", type=int, default=DEFAULT_SYNC_INTERVAL // UNIT_MAPPING["MB"],
+        help="interval 策略的落盘间隔（MB）",
+    )
+    generate.add_argument(
+        "--queue-depth", type=int, choices=range(1, MAX_QUEUE_DEPTH + 1), default=DEFAULT_QUEUE_DEPTH,
+        metavar="N", help=f"同时执行 pwrite 的线程数（1-{MAX_QUEUE_DEPTH}，1 为单线程顺序写入）",
+    )
+    generate.add_argument("--resume", action="store_true", help="从检查点继续写入")
+    generate.add_argument("-q", "--quiet", action="store_true", help="不显示进度")
+    generate.set_defaults(func=cmd_generate)
+
+    clone = subparsers.add_parser("clone", help="生成一个模板文件并在内核中复制出多个相同的文件")
+    clone.add_argument("dir", help="目标目录")
+    clone.add_argument("count", type=int, help="文件总数（含模板）")
+    clone.add_argument("size", type=int, help="单个文件大小数值")
+    clone.add_argument("--unit", choices=list(UNIT_MAPPING), default=DEFAULT_UNIT, help="文件大小单位")
+    clone.add_argument("--prefix", default=DEFAULT_CLONE_PREFIX, help="文件名前缀")
+    clone.add_argument("--pattern", choices=CONTENT_PATTERNS, default=DEFAULT_CONTENT_PATTERN, help="模板的内容模式")
+    clone.add_argument("--durability", choices=DURABILITY_MODES, default=DEFAULT_DURABILITY, help="持久化策略")
+    clone.add_argument(
+        "--force-allocate", action="store_true", help="为每个副本分配真实数据块（不使用 reflink 共享数据块）"
+    )
+    clone.add_argument("-q", "--quiet", action="store_true", help="不显示进度")
+    clone.set_defaults(func=cmd_clone)
+
+    fill = subparsers.add_parser("fill", help="填充挂载点到目标使用率或目标剩余空间")
+    fill.add_argument("mountpoint", help="挂载点")
+    target = fill.add_mutually_exclusive_group(required=True)
+    target.add_argument("--percent", type=float, help="目标使用率（0-100）")
+    target.add_argument("--free", type=float, help="目标剩余空间数值")
+    fill.add_argument("--unit", choices=list(UNIT_MAPPING), default=DEFAULT_UNIT, help="目标剩余空间单位")
+    fill.add_argument("--dir", default=None, help="填充文件目录（默认挂载点下的 filetools_fill）")
+    fill.add_argument("--pattern", choices=CONTENT_PATTERNS, default=DEFAULT_CONTENT_PATTERN, help="内容模式")
+    fill.set_defaults(func=cmd_fill)
+
+    monitor = subparsers.add_parser("monitor", help="显示磁盘使用情况")
+    monitor.add_argument("--unit", choices=list(UNIT_MAPPING), default=DEFAULT_UNIT, help="显示单位")
+    monitor.add_argument("--watch", type=float, default=0, metavar="SECONDS", help="按间隔持续刷新")
+    monitor.set_defaults(func=cmd_monitor)
+
+    bench = subparsers.add_parser("bench", help="内容模式吞吐量基准测试")
+    bench.add_argument("--dir", default=None, help="测试文件所在目录（默认系统临时目录）")
+    bench.add_argument(
+        "--size-mb", type=int, default=DEFAULT_BENCHMARK_BYTES // UNIT_MAPPING["MB"], help="每个模式的数据量（MB）"
+    )
+    bench.add_argument("--patterns", nargs="+", choices=CONTENT_PATTERNS, help="需要测试的内容模式")
+    bench.set_defaults(func=cmd_bench)
+
+    serve = subparsers.add_parser("serve", help="启动 Web 界面")
+    serve.add_argument("--host", default=DEFAULT_HOST, help="监听地址")
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT, help="监听端口")
+    serve.add_argument("--share", action="store_true", help="创建 Gradio 公共链接")
+    serve.set_defaults(func=cmd_serve)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    命令行主函数
+
+    :param argv: 命令行参数，为 None 时使用 sys.argv
+    :return: 退出码
+    """
+    args = build_parser().parse_args(argv)
+    serving = args.command == "serve"
+    level = args.log_level or ("INFO" if serving else "WARNING")
+    log_file = args.log_file or (default_log_file() if serving else None)
+    configure_logging(getattr(logging, level), log_file)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
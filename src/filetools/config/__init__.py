@@ -4,15 +4,138 @@ from .constants import (
     CHUNK_SIZE,
     DEFAULT_UNIT,
     MIN_DISK_SIZE,
+    ALLOCATION_MODES,
+    DEFAULT_ALLOCATION_MODE,
+    CONTENT_PATTERNS,
+    DEFAULT_CONTENT_PATTERN,
+    PATTERN_BLOCK_SIZE,
+    PATTERN_POOL_SIZE,
+    DEFAULT_COMPRESSION_RATIO,
+    DEFAULT_BATCH_WORKERS,
+    DEFAULT_PER_DEVICE_CONCURRENCY,
+    DEFAULT_FILL_MAX_FILE_SIZE,
+    FILL_DIR_NAME,
+    FILL_RECHECK_BYTES,
+    FILL_MIN_EFFECTIVE_RATIO,
+    MOUNT_TABLE_TTL,
+    DEFAULT_FS_BLOCK_SIZE,
+    PREALLOCATE_METADATA_RATIO,
+    DISK_SNAPSHOT_TTL,
+    DISK_STAT_TIMEOUT,
+    DISK_STAT_BACKOFF,
+    DISK_STAT_WORKERS,
+    DISK_SAMPLE_INTERVAL,
+    DISK_HISTORY_SIZE,
+    FILL_RATE_WINDOW,
+    PROGRESS_MIN_INTERVAL,
+    PROGRESS_MIN_BYTES,
+    DEFAULT_JOB_WORKERS,
+    JOB_QUEUE_LIMIT,
+    JOB_HISTORY_LIMIT,
+    JOB_POLL_INTERVAL,
+    CHECKPOINT_SUFFIX,
+    CHECKPOINT_INTERVAL,
+    IO_MODES,
+    DEFAULT_IO_MODE,
+    DIRECT_IO_ALIGNMENT,
+    DROPBEHIND_INTERVAL,
+    DURABILITY_MODES,
+    DEFAULT_DURABILITY,
+    DEFAULT_SYNC_INTERVAL,
+    DEFAULT_QUEUE_DEPTH,
+    MAX_QUEUE_DEPTH,
+    CLONE_METHODS,
+    CLONE_COPY_CHUNK,
+    DEFAULT_CLONE_PREFIX,
+    CHUNK_PROBE_SIZES,
+    CHUNK_PROBE_BYTES,
+    CHUNK_TUNE_TOLERANCE,
+    CHUNK_MEMORY_FRACTION,
+    DEFAULT_TREE_FANOUT,
+    DEFAULT_TREE_DEPTH,
+    DEFAULT_TREE_FILES,
+    DEFAULT_TREE_FILE_SIZE,
+    TREE_SIZE_DISTRIBUTIONS,
+    TREE_LOGNORMAL_SIGMA,
+    TREE_MAX_FILE_SIZE,
+    DEFAULT_TREE_WORKERS,
+    INODE_WARN_PERCENT,
+    IO_SAMPLE_INTERVAL,
+    IO_EMA_ALPHA,
+    WRITE_LATENCY_BUCKETS,
+    FLUSH_LATENCY_BUCKETS,
 )
-from .logger import logger, setup_logger
+from .logger import configure_logging, default_log_file, logger, setup_logger, shutdown_logging
 
 __all__ = [
     'UNIT_MAPPING',
     'CHUNK_SIZE',
     'DEFAULT_UNIT',
     'MIN_DISK_SIZE',
+    'ALLOCATION_MODES',
+    'DEFAULT_ALLOCATION_MODE',
+    'CONTENT_PATTERNS',
+    'DEFAULT_CONTENT_PATTERN',
+    'PATTERN_BLOCK_SIZE',
+    'PATTERN_POOL_SIZE',
+    'DEFAULT_COMPRESSION_RATIO',
+    'DEFAULT_BATCH_WORKERS',
+    'DEFAULT_PER_DEVICE_CONCURRENCY',
+    'DEFAULT_FILL_MAX_FILE_SIZE',
+    'FILL_DIR_NAME',
+    'FILL_RECHECK_BYTES',
+    'FILL_MIN_EFFECTIVE_RATIO',
+    'MOUNT_TABLE_TTL',
+    'DEFAULT_FS_BLOCK_SIZE',
+    'PREALLOCATE_METADATA_RATIO',
+    'DISK_SNAPSHOT_TTL',
+    'DISK_STAT_TIMEOUT',
+    'DISK_STAT_BACKOFF',
+    'DISK_STAT_WORKERS',
+    'DISK_SAMPLE_INTERVAL',
+    'DISK_HISTORY_SIZE',
+    'FILL_RATE_WINDOW',
+    'PROGRESS_MIN_INTERVAL',
+    'PROGRESS_MIN_BYTES',
+    'DEFAULT_JOB_WORKERS',
+    'JOB_QUEUE_LIMIT',
+    'JOB_HISTORY_LIMIT',
+    'JOB_POLL_INTERVAL',
+    'CHECKPOINT_SUFFIX',
+    'CHECKPOINT_INTERVAL',
+    'IO_MODES',
+    'DEFAULT_IO_MODE',
+    'DIRECT_IO_ALIGNMENT',
+    'DROPBEHIND_INTERVAL',
+    'DURABILITY_MODES',
+    'DEFAULT_DURABILITY',
+    'DEFAULT_SYNC_INTERVAL',
+    'DEFAULT_QUEUE_DEPTH',
+    'MAX_QUEUE_DEPTH',
+    'CLONE_METHODS',
+    'CLONE_COPY_CHUNK',
+    'DEFAULT_CLONE_PREFIX',
+    'CHUNK_PROBE_SIZES',
+    'CHUNK_PROBE_BYTES',
+    'CHUNK_TUNE_TOLERANCE',
+    'CHUNK_MEMORY_FRACTION',
+    'DEFAULT_TREE_FANOUT',
+    'DEFAULT_TREE_DEPTH',
+    'DEFAULT_TREE_FILES',
+    'DEFAULT_TREE_FILE_SIZE',
+    'TREE_SIZE_DISTRIBUTIONS',
+    'TREE_LOGNORMAL_SIGMA',
+    'TREE_MAX_FILE_SIZE',
+    'DEFAULT_TREE_WORKERS',
+    'INODE_WARN_PERCENT',
+    'IO_SAMPLE_INTERVAL',
+    'IO_EMA_ALPHA',
+    'WRITE_LATENCY_BUCKETS',
+    'FLUSH_LATENCY_BUCKETS',
     'logger',
     'setup_logger',
+    'configure_logging',
+    'shutdown_logging',
+    'default_log_file',
 ]
 
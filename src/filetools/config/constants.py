@@ -1,5 +1,5 @@
 """常量配置"""
-from typing import Dict
+from typing import Dict, Tuple
 
 # 单位映射（字节数）
 UNIT_MAPPING: Dict[str, int] = {
@@ -18,3 +18,184 @@ DEFAULT_UNIT: str = "GB"
 # 最小有效磁盘大小（1MB）
 MIN_DISK_SIZE: int = 1024 * 1024
 
+
+# 文件分配模式：顺序写入 / 预分配磁盘块 / 稀疏文件
+ALLOCATION_MODES: Tuple[str, ...] = ("stream", "preallocate", "sparse")
+
+# 默认分配模式
+DEFAULT_ALLOCATION_MODE: str = "stream"
+
+# 文件内容模式：全零 / 伪随机 / 指定压缩比 / 每块唯一（抗去重）
+CONTENT_PATTERNS: Tuple[str, ...] = ("zeros", "random", "compressible", "unique")
+
+# 默认内容模式
+DEFAULT_CONTENT_PATTERN: str = "zeros"
+
+# 内容模式的块粒度（4KB，与常见文件系统块和去重粒度一致）
+PATTERN_BLOCK_SIZE: int = 4 * 1024
+
+# 伪随机数据池大小（8MB，远大于常见压缩窗口和记录大小）
+PATTERN_POOL_SIZE: int = 8 * 1024 * 1024
+
+# compressible 模式的默认目标压缩比
+DEFAULT_COMPRESSION_RATIO: float = 2.0
+
+# 批量生成默认线程数
+DEFAULT_BATCH_WORKERS: int = 8
+
+# 批量生成时每个设备的默认最大并发写入数
+DEFAULT_PER_DEVICE_CONCURRENCY: int = 2
+
+# 单个填充文件的默认最大大小（4GB）
+DEFAULT_FILL_MAX_FILE_SIZE: int = 4 * 1024 * 1024 * 1024
+
+# 填充文件默认所在目录名（位于挂载点下）
+FILL_DIR_NAME: str = "filetools_fill"
+
+# 填充时每写入多少字节重新检查一次磁盘使用情况（1GB）
+FILL_RECHECK_BYTES: int = 1024 * 1024 * 1024
+
+# 写入数据至少有多少比例体现为已用空间增长，低于此比例视为被压缩或去重
+FILL_MIN_EFFECTIVE_RATIO: float = 0.5
+
+# 挂载点表缓存有效期（秒）
+MOUNT_TABLE_TTL: float = 60.0
+
+# 无法获取文件系统块大小时使用的默认值（4KB）
+DEFAULT_FS_BLOCK_SIZE: int = 4 * 1024
+
+# 预估文件系统为大文件分配的元数据块占比（0.1%，保守估计）
+PREALLOCATE_METADATA_RATIO: float = 0.001
+
+# 磁盘使用情况快照缓存有效期（秒）
+DISK_SNAPSHOT_TTL: float = 5.0
+
+# 统计全部分区的总等待时间（秒），超时的挂载点标记为不可用
+DISK_STAT_TIMEOUT: float = 2.0
+
+# 超时挂载点的退避时间（秒），期间不再统计
+DISK_STAT_BACKOFF: float = 60.0
+
+# 保留的空闲分区统计工作线程数（卡死的挂载点各占用一个线程，不计入此数）
+DISK_STAT_WORKERS: int = 8
+
+# 后台磁盘采样间隔（秒）
+DISK_SAMPLE_INTERVAL: float = 2.0
+
+# 每个挂载点保留的采样点数（2 秒间隔下约 1 小时）
+DISK_HISTORY_SIZE: int = 1800
+
+# 估计写入速率使用的时间窗口（秒）
+FILL_RATE_WINDOW: float = 60.0
+
+# 两次进度上报的最小间隔（秒）
+PROGRESS_MIN_INTERVAL: float = 0.5
+
+# 两次进度上报之间的最小字节数（未达到时不读取时钟，块很小时也几乎没有开销）
+PROGRESS_MIN_BYTES: int = 1024 * 1024
+
+# 同时执行的生成任务数
+DEFAULT_JOB_WORKERS: int = 2
+
+# 未结束任务（排队中与执行中）的最大数量
+JOB_QUEUE_LIMIT: int = 32
+
+# 保留的任务记录数量
+JOB_HISTORY_LIMIT: int = 100
+
+# 界面轮询任务状态的间隔（秒）
+JOB_POLL_INTERVAL: float = 1.0
+
+# 断点续传检查点文件后缀
+CHECKPOINT_SUFFIX: str = ".ftckpt"
+
+# 每写入多少字节落盘并更新一次检查点（1GB）；文件不超过该大小时不写检查点
+CHECKPOINT_INTERVAL: int = 1024 * 1024 * 1024
+
+# 支持的 I/O 模式
+# - buffered: 经过页缓存写入
+# - direct: O_DIRECT 绕过页缓存
+# - dropbehind: 经过页缓存写入，定期回写并丢弃已落盘的缓存
+IO_MODES: Tuple[str, ...] = ("buffered", "direct", "dropbehind")
+
+# 默认 I/O 模式
+DEFAULT_IO_MODE: str = "buffered"
+
+# O_DIRECT 写入的地址与长度对齐要求（字节）
+DIRECT_IO_ALIGNMENT: int = 4 * 1024
+
+# dropbehind 模式每写入多少字节提交一次回写并丢弃上一段缓存（64MB）
+DROPBEHIND_INTERVAL: int = 64 * 1024 * 1024
+
+# 支持的持久化策略
+# - none: 不主动落盘
+# - end: 写完后 fdatasync 一次
+# - interval: 每写入 DEFAULT_SYNC_INTERVAL 字节 fdatasync 一次
+# - chunk: 每个块写入后 fdatasync
+DURABILITY_MODES: Tuple[str, ...] = ("none", "end", "interval", "chunk")
+
+# 默认持久化策略（返回时数据已落盘，大小校验才有意义）
+DEFAULT_DURABILITY: str = "end"
+
+# interval 策略的默认落盘间隔（256MB）
+DEFAULT_SYNC_INTERVAL: int = 256 * 1024 * 1024
+
+# 单个文件的默认写入队列深度（同时执行 pwrite 的线程数，1 为单线程顺序写入）
+DEFAULT_QUEUE_DEPTH: int = 1
+
+# 单个文件写入队列深度的上限
+MAX_QUEUE_DEPTH: int = 64
+
+# 克隆模式的复制方式（按优先级）：FICLONE 共享数据块 / copy_file_range / sendfile / 用户态读写
+CLONE_METHODS: Tuple[str, ...] = ("reflink", "copy_file_range", "sendfile", "copy")
+
+# 克隆模式每次内核复制调用的字节数（64MB，两次调用之间检查取消并上报进度）
+CLONE_COPY_CHUNK: int = 64 * 1024 * 1024
+
+# 克隆模式默认文件名前缀
+DEFAULT_CLONE_PREFIX: str = "clone"
+
+# 块大小调优的候选块大小（1MB / 4MB / 16MB / 64MB）
+CHUNK_PROBE_SIZES: Tuple[int, ...] = (1024 * 1024, 4 * 1024 * 1024, 16 * 1024 * 1024, 64 * 1024 * 1024)
+
+# 每个候选块大小的探测写入字节数（128MB，写完后落盘）
+CHUNK_PROBE_BYTES: int = 128 * 1024 * 1024
+
+# 速度与最快结果相差不超过该比例时选择更小的块（节省内存）
+CHUNK_TUNE_TOLERANCE: float = 0.05
+
+# 单个写缓冲区最多占用可用内存的比例，超过的候选块大小不参与探测
+CHUNK_MEMORY_FRACTION: float = 0.1
+
+# 小文件目录树的默认参数：每级子目录数、目录层数、文件数、平均文件大小（4KB）
+DEFAULT_TREE_FANOUT: int = 10
+DEFAULT_TREE_DEPTH: int = 2
+DEFAULT_TREE_FILES: int = 10000
+DEFAULT_TREE_FILE_SIZE: int = 4 * 1024
+
+# 小文件大小分布：固定大小 / 0 到 2 倍平均值均匀分布 / 对数正态分布（多数文件很小，少数较大）
+TREE_SIZE_DISTRIBUTIONS: Tuple[str, ...] = ("fixed", "uniform", "lognormal")
+
+# lognormal 分布的形状参数（对数标准差）
+TREE_LOGNORMAL_SIGMA: float = 1.0
+
+# 单个小文件的最大大小（1MB），同时也是共享内容缓冲区的大小
+TREE_MAX_FILE_SIZE: int = 1024 * 1024
+
+# 目录树生成的默认线程数（按目录并行创建文件）
+DEFAULT_TREE_WORKERS: int = 8
+
+# inode 使用率达到该百分比时磁盘监控显示即将耗尽的警告
+INODE_WARN_PERCENT: float = 90.0
+
+# 磁盘 I/O 计数器采样间隔（秒）
+IO_SAMPLE_INTERVAL: float = 1.0
+
+# I/O 速率指数移动平均的平滑系数（越大越跟随最新值）
+IO_EMA_ALPHA: float = 0.3
+
+# 每个块 write 耗时直方图的桶上限（秒）
+WRITE_LATENCY_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 每次 fdatasync 耗时直方图的桶上限（秒）
+FLUSH_LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
@@ -1,52 +1,152 @@
-"""日志配置模块"""
+"""日志配置模块
+
+导入本模块没有任何副作用：不创建目录、不打开文件，默认日志记录器只挂一个 NullHandler。
+命令行、Web 服务等入口在启动时显式调用 configure_logging 配置处理器。
+"""
+import atexit
 import logging
+import os
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import List, Optional, Union
 
 # 日志格式
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
-# 日志目录
-LOG_DIR = Path(__file__).parent.parent / "logs"
-LOG_DIR.mkdir(exist_ok=True)
+# 日志记录器名称
+LOGGER_NAME = "filetools"
+
+# 日志目录环境变量（未设置时使用当前工作目录下的 logs/）
+LOG_DIR_ENV = "FILETOOLS_LOG_DIR"
+
+# 日志文件名
+LOG_FILE_NAME = "filetools.log"
+
+# 单个日志文件的最大字节数与保留的轮转文件数
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+# 默认日志记录器：未调用 configure_logging 时不输出任何内容
+logger = logging.getLogger(LOGGER_NAME)
+logger.addHandler(logging.NullHandler())
+
+_configure_lock = threading.Lock()
+_listener: Optional[QueueListener] = None
+_installed: List[logging.Handler] = []
+
+
+def default_log_file() -> Path:
+    """
+    默认日志文件路径（只计算路径，不创建目录）
+
+    :return: $FILETOOLS_LOG_DIR/filetools.log，未设置环境变量时为 ./logs/filetools.log
+    """
+    return Path(os.environ.get(LOG_DIR_ENV) or "logs") / LOG_FILE_NAME
+
+
+def _file_handler(log_file: Path, max_bytes: int, backup_count: int) -> Optional[logging.Handler]:
+    """
+    创建轮转文件处理器，目录不可写（如只读安装）时返回 None
 
-# 日志文件路径
-LOG_FILE = LOG_DIR / "filetools.log"
+    :param log_file: 日志文件路径
+    :param max_bytes: 单个日志文件的最大字节数
+    :param backup_count: 保留的轮转文件数
+    :return: 文件处理器
+    """
+    try:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        return RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+    except OSError as e:
+        sys.stderr.write(f"无法写入日志文件 {log_file}: {e}，仅输出到控制台\n")
+        return None
 
 
-def setup_logger(name: str = "filetools", level: int = logging.INFO) -> logging.Logger:
+def configure_logging(
+    level: int = logging.INFO,
+    log_file: Union[str, Path, None] = None,
+    console: bool = True,
+    use_queue: bool = True,
+    max_bytes: int = LOG_MAX_BYTES,
+    backup_count: int = LOG_BACKUP_COUNT,
+) -> logging.Logger:
     """
-    配置并返回日志记录器
-    
-    :param name: 日志记录器名称
+    配置默认日志记录器（重复调用时替换之前的配置）
+
+    use_queue 为 True 时记录器只挂一个 QueueHandler，调用方只把记录放入内存队列；
+    控制台与文件输出由 QueueListener 后台线程完成，生成文件和刷新磁盘信息时的日志调用不会因磁盘 I/O 阻塞。
+
     :param level: 日志级别
+    :param log_file: 日志文件路径，为 None 时不写文件（可用 default_log_file() 获取默认路径）
+    :param console: 是否输出到控制台（stderr，不干扰命令行的结果输出）
+    :param use_queue: 是否通过队列在后台线程输出
+    :param max_bytes: 单个日志文件的最大字节数，超过后轮转
+    :param backup_count: 保留的轮转文件数
     :return: 配置好的日志记录器
     """
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
-    
-    # 避免重复添加处理器
-    if logger.handlers:
-        return logger
-    
-    # 控制台处理器
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(level)
-    console_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
-    # 文件处理器
-    file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
-    file_handler.setLevel(level)
-    file_formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
-    
+    global _listener
+    formatter = logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+    handlers: List[logging.Handler] = []
+    if console:
+        handlers.append(logging.StreamHandler(sys.stderr))
+    if log_file is not None:
+        file_handler = _file_handler(Path(log_file), max_bytes, backup_count)
+        if file_handler is not None:
+            handlers.append(file_handler)
+    for handler in handlers:
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+
+    with _configure_lock:
+        _shutdown_locked()
+        if use_queue and handlers:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            _listener.start()
+            _installed.append(QueueHandler(log_queue))
+        else:
+            _installed.extend(handlers)
+        for handler in _installed:
+            logger.addHandler(handler)
+        logger.setLevel(level)
     return logger
 
 
-# 默认日志记录器
-logger = setup_logger()
+def _shutdown_locked() -> None:
+    """停止后台输出线程并移除 configure_logging 添加的处理器（调用方持有锁）"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    for handler in _installed:
+        logger.removeHandler(handler)
+        handler.close()
+    _installed.clear()
+
+
+def shutdown_logging() -> None:
+    """输出队列中剩余的日志并恢复为未配置状态（进程退出时自动调用）"""
+    with _configure_lock:
+        _shutdown_locked()
+        logger.setLevel(logging.NOTSET)
+
 
+atexit.register(shutdown_logging)
+
+
+def setup_logger(name: str = LOGGER_NAME, level: int = logging.INFO) -> logging.Logger:
+    """
+    配置并返回日志记录器（兼容旧接口，输出到控制台和默认日志文件）
+
+    :param name: 日志记录器名称（只支持默认记录器，其他名称直接返回对应记录器）
+    :param level: 日志级别
+    :return: 配置好的日志记录器
+    """
+    if name != LOGGER_NAME:
+        return logging.getLogger(name)
+    return configure_logging(level=level, log_file=default_log_file())
@@ -1,7 +1,78 @@
 """业务逻辑模块"""
-from .file_generator import generate_file_with_progress, generate_file
+from .file_generator import generate_file_with_progress, generate_file, run_generation
 from .disk_monitor import get_disk_usage_info
 from .disk_usage import DiskUsage
+from .generation_stats import GenerationStats
+from .generation_result import GenerationResult
+from .content_pattern import ContentPattern, create_pattern
+from .batch_generator import BatchFileResult, BatchResult, generate_files_batch
+from .fill_target import FillResult, compute_fill_bytes, fill_to_target
+from .space_check import SpaceCheck, check_free_space, resolve_mountpoint
+from .disk_snapshot import DiskSnapshotCache, disk_snapshot_cache
+from .disk_io import DeviceIOStats, DiskIOSampler, disk_io_sampler
+from .disk_sampler import DiskSampler, FillRate, MountHistory, disk_usage_sampler
+from .chunk_tuner import ChunkProbeResult, ChunkTuner, ChunkTuning, chunk_size_tuner
+from .tree_generator import TreeResult, generate_tree
+from .clone_generator import CloneResult, clone_file, generate_clones
+from .job_control import JobCancelled, JobControl
+from .job_manager import Job, JobError, JobManager, job_manager
+from .metrics import GenerationMetrics, Histogram, generation_metrics
+from .openmetrics import collect_openmetrics, render_openmetrics
+from .progress import ProgressEvent, ProgressThrottle
+from .region_writer import split_regions, write_regions
+from .write_buffer import WriteBuffer
 
-__all__ = ['generate_file_with_progress', 'generate_file', 'get_disk_usage_info', 'DiskUsage']
-
+__all__ = [
+    'generate_file_with_progress',
+    'generate_file',
+    'run_generation',
+    'get_disk_usage_info',
+    'DiskUsage',
+    'GenerationStats',
+    'GenerationResult',
+    'WriteBuffer',
+    'ContentPattern',
+    'create_pattern',
+    'BatchFileResult',
+    'BatchResult',
+    'generate_files_batch',
+    'FillResult',
+    'compute_fill_bytes',
+    'fill_to_target',
+    'SpaceCheck',
+    'check_free_space',
+    'resolve_mountpoint',
+    'DiskSnapshotCache',
+    'disk_snapshot_cache',
+    'DiskSampler',
+    'FillRate',
+    'MountHistory',
+    'disk_usage_sampler',
+    'DeviceIOStats',
+    'DiskIOSampler',
+    'disk_io_sampler',
+    'ProgressEvent',
+    'ProgressThrottle',
+    'split_regions',
+    'write_regions',
+    'ChunkProbeResult',
+    'ChunkTuner',
+    'ChunkTuning',
+    'chunk_size_tuner',
+    'TreeResult',
+    'generate_tree',
+    'CloneResult',
+    'clone_file',
+    'generate_clones',
+    'JobCancelled',
+    'JobControl',
+    'Job',
+    'JobError',
+    'JobManager',
+    'job_manager',
+    'GenerationMetrics',
+    'Histogram',
+    'generation_metrics',
+    'collect_openmetrics',
+    'render_openmetrics',
+]
@@ -0,0 +1,149 @@
+"""批量文件生成业务逻辑"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from filetools.config.constants import DEFAULT_BATCH_WORKERS, DEFAULT_PER_DEVICE_CONCURRENCY
+from filetools.config.logger import logger
+from filetools.models.file_generator import generate_file
+from filetools.models.generation_stats import GenerationStats
+from filetools.models.space_check import get_device_id
+
+
+@dataclass
+class BatchFileResult:
+    """
+    批量生成中单个文件的结果
+
+    :param path: 文件路径
+    :param size_bytes: 目标大小（字节）
+    :param device: 文件所在设备 ID
+    :param elapsed: 耗时（秒，包含等待设备并发名额之后的实际生成时间）
+    :param stats: 生成统计信息（失败时为 None）
+    :param error: 错误信息（成功时为 None）
+    """
+    path: str
+    size_bytes: int
+    device: int
+    elapsed: float = 0.0
+    stats: Optional[GenerationStats] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        """是否生成成功"""
+        return self.error is None
+
+    @property
+    def throughput_mbps(self) -> float:
+        """写入速度（MB/s）"""
+        if not self.stats or self.elapsed <= 0:
+            return 0.0
+        return self.stats.bytes_written / (1024 * 1024) / self.elapsed
+
+
+@dataclass
+class BatchResult:
+    """
+    批量生成的汇总结果
+
+    :param files: 各文件结果（与提交顺序一致）
+    :param elapsed: 总耗时（秒）
+    """
+    files: List[BatchFileResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def bytes_written(self) -> int:
+        """所有文件实际写入的总字节数"""
+        return sum(result.stats.bytes_written for result in self.files if result.stats)
+
+    @property
+    def failed(self) -> List[BatchFileResult]:
+        """失败的文件结果"""
+        return [result for result in self.files if not result.success]
+
+    @property
+    def aggregate_mbps(self) -> float:
+        """总体写入速度（MB/s，按总耗时计算）"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.bytes_written / (1024 * 1024) / self.elapsed
+
+
+def _interleave_by_device(results: List[BatchFileResult]) -> List[BatchFileResult]:
+    """
+    按设备轮询排列任务，避免同一设备的任务扎堆占满线程池
+
+    :param results: 待执行的文件结果
+    :return: 重新排列后的列表
+    """
+    by_device: Dict[int, List[BatchFileResult]] = {}
+    for result in results:
+        by_device.setdefault(result.device, []).append(result)
+    rounds = zip_longest(*by_device.values())
+    return [result for batch in rounds for result in batch if result is not None]
+
+
+def _run_job(result: BatchFileResult, semaphore: threading.Semaphore, generate_kwargs: Dict[str, Any]) -> None:
+    """
+    在设备并发名额内生成单个文件，结果写回 result
+
+    :param result: 文件结果（原地更新）
+    :param semaphore: 文件所在设备的并发信号量
+    :param generate_kwargs: 透传给 generate_file 的参数
+    """
+    with semaphore:
+        start = time.perf_counter()
+        try:
+            result.stats = generate_file(result.path, result.size_bytes, None, **generate_kwargs)
+        except (OSError, ValueError) as e:
+            result.error = str(e)
+            logger.error(f"批量生成文件失败: {result.path}: {e}")
+        except Exception as e:
+            result.error = f"未知错误 - {e}"
+            logger.error(f"批量生成文件时发生未知错误: {result.path}: {e}", exc_info=True)
+        result.elapsed = time.perf_counter() - start
+
+
+def generate_files_batch(
+    jobs: Sequence[Tuple[str, int]],
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    per_device_limit: int = DEFAULT_PER_DEVICE_CONCURRENCY,
+    **generate_kwargs: Any,
+) -> BatchResult:
+    """
+    使用线程池批量生成文件
+
+    写入系统调用会释放 GIL，多个设备上的文件可以真正并行写入；每个设备的并发数受 per_device_limit 限制，
+    避免同一块盘上的多个顺序写互相干扰。每个并发任务各自持有一个写缓冲区，内存占用约为并发数乘以块大小。
+
+    :param jobs: (文件路径, 文件大小字节数) 列表
+    :param max_workers: 线程池大小
+    :param per_device_limit: 每个设备的最大并发写入数
+    :param generate_kwargs: 透传给 generate_file 的参数（allocation、pattern 等）
+    :return: 批量生成结果，包含每个文件和总体的 MB/s
+    """
+    if max_workers <= 0 or per_device_limit <= 0:
+        raise ValueError("并发数必须大于0")
+    results = [BatchFileResult(path=path, size_bytes=size, device=get_device_id(path)) for path, size in jobs]
+    semaphores = {result.device: threading.BoundedSemaphore(per_device_limit) for result in results}
+    logger.info(
+        f"开始批量生成 {len(results)} 个文件, 设备数: {len(semaphores)}, "
+        f"线程数: {max_workers}, 每设备并发: {per_device_limit}"
+    )
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="filetools-batch") as executor:
+        for result in _interleave_by_device(results):
+            executor.submit(_run_job, result, semaphores[result.device], generate_kwargs)
+    batch = BatchResult(files=results, elapsed=time.perf_counter() - start)
+
+    logger.info(
+        f"批量生成完成: 成功 {len(results) - len(batch.failed)} 个, 失败 {len(batch.failed)} 个, "
+        f"总写入 {batch.bytes_written} 字节, 总体速度 {batch.aggregate_mbps:.1f} MB/s"
+    )
+    return batch
@@ -0,0 +1,291 @@
+"""可复现的性能基准套件：文件生成吞吐量、分区扫描延迟与内存峰值
+
+结果保存为 JSON 基线，之后的运行与基线逐项对比，超过阈值的变慢视为回退。
+"""
+import json
+import os
+import platform
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+from filetools.config.constants import CONTENT_PATTERNS
+from filetools.config.logger import logger
+from filetools.models.benchmark import BENCHMARK_SEED
+from filetools.models.disk_monitor import get_disk_usage_info
+from filetools.models.file_generator import generate_file
+
+# 基线文件格式版本
+BASELINE_VERSION: int = 1
+
+# 默认测试的文件大小、块大小（MB）与合成挂载点数量
+DEFAULT_SUITE_SIZES_MB: Sequence[int] = (16, 256)
+DEFAULT_SUITE_CHUNK_SIZES_MB: Sequence[int] = (1, 4, 16, 100)
+DEFAULT_SUITE_MOUNT_COUNTS: Sequence[int] = (10, 200)
+
+# 每个用例重复次数（取中位数）
+DEFAULT_SUITE_REPEAT: int = 3
+
+# 默认回退阈值（变慢超过 10% 视为回退）
+DEFAULT_REGRESSION_THRESHOLD: float = 0.10
+
+# 内存增长的绝对容差（MB），低于该值的差异视为噪声
+MEMORY_TOLERANCE_MB: float = 4.0
+
+# 扫描延迟的绝对容差（毫秒）
+LATENCY_TOLERANCE_MS: float = 1.0
+
+
+@dataclass
+class BenchResult:
+    """
+    单个基准用例的结果
+
+    :param name: 用例名称（基线对比时的键，如 generate/tmpfs/size=16MB/chunk=4MB/pattern=random/mbps）
+    :param value: 测量值（多次重复的中位数）
+    :param unit: 单位
+    :param higher_is_better: 数值越大越好（吞吐量）还是越小越好（延迟、内存）
+    :param tolerance: 绝对容差，变化量不超过该值时不视为回退
+    """
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = True
+    tolerance: float = 0.0
+
+
+@dataclass
+class BenchComparison:
+    """
+    基线与当前结果的对比
+
+    :param name: 用例名称
+    :param baseline: 基线值
+    :param current: 当前值
+    :param unit: 单位
+    :param higher_is_better: 数值越大越好还是越小越好
+    :param regressed: 是否超过阈值变慢
+    """
+    name: str
+    baseline: float
+    current: float
+    unit: str
+    higher_is_better: bool
+    regressed: bool = False
+
+    @property
+    def change(self) -> float:
+        """相对基线的变化比例（正数表示数值增大）"""
+        if self.baseline == 0:
+            return 0.0 if self.current == 0 else float('inf')
+        return (self.current - self.baseline) / self.baseline
+
+
+def _median_generate(path: Path, size: int, chunk_size: int, pattern: str, repeat: int) -> Dict[str, float]:
+    """
+    重复生成同一个文件并取各项指标的中位数，测试文件生成后即删除
+
+    :param path: 测试文件路径
+    :param size: 文件大小（字节）
+    :param chunk_size: 块大小（字节）
+    :param pattern: 内容模式
+    :param repeat: 重复次数
+    :return: mbps（写入加落盘的平均速度）、rss_mb（内存增长）
+    """
+    throughputs = []
+    memory = []
+    for _ in range(repeat):
+        try:
+            stats = generate_file(str(path), size, None, pattern=pattern, seed=BENCHMARK_SEED, chunk_size=chunk_size)
+        finally:
+            path.unlink(missing_ok=True)
+        throughputs.append(stats.throughput_mbps)
+        memory.append(stats.rss_growth / (1024 * 1024))
+    return {"mbps": statistics.median(throughputs), "rss_mb": statistics.median(memory)}
+
+
+def bench_generate(
+    target: str,
+    directory: str,
+    sizes_mb: Sequence[int] = DEFAULT_SUITE_SIZES_MB,
+    chunk_sizes_mb: Sequence[int] = DEFAULT_SUITE_CHUNK_SIZES_MB,
+    patterns: Sequence[str] = CONTENT_PATTERNS,
+    repeat: int = DEFAULT_SUITE_REPEAT,
+) -> List[BenchResult]:
+    """
+    测量不同文件大小、块大小和内容模式下 generate_file 的吞吐量与内存增长
+
+    块大小大于文件大小的组合会被跳过（与更小的块大小结果相同）。
+
+    :param target: 目标名称（如 tmpfs、loop），用于用例名称
+    :param directory: 测试目录
+    :param sizes_mb: 文件大小列表（MB）
+    :param chunk_sizes_mb: 块大小列表（MB）
+    :param patterns: 内容模式列表
+    :param repeat: 每个用例的重复次数
+    :return: 基准结果
+    """
+    results = []
+    path = Path(directory) / f"filetools_suite_{os.getpid()}.bin"
+    for size_mb in sizes_mb:
+        for chunk_mb in chunk_sizes_mb:
+            if chunk_mb > size_mb:
+                continue
+            for pattern in patterns:
+                name = f"generate/{target}/size={size_mb}MB/chunk={chunk_mb}MB/pattern={pattern}"
+                measured = _median_generate(path, size_mb * 1024 * 1024, chunk_mb * 1024 * 1024, pattern, repeat)
+                logger.info(f"{name}: {measured['mbps']:.0f} MB/s, 内存增长 {measured['rss_mb']:.1f} MB")
+                results.append(BenchResult(f"{name}/mbps", measured["mbps"], "MB/s"))
+                results.append(BenchResult(
+                    f"{name}/rss", measured["rss_mb"], "MB", higher_is_better=False, tolerance=MEMORY_TOLERANCE_MB
+                ))
+    return results
+
+
+def bench_disk_scan(
+    target: str,
+    directory: str,
+    mount_counts: Sequence[int] = DEFAULT_SUITE_MOUNT_COUNTS,
+    repeat: int = DEFAULT_SUITE_REPEAT,
+) -> List[BenchResult]:
+    """
+    测量 get_disk_usage_info 在大量挂载点下的扫描延迟
+
+    在测试目录下创建若干子目录作为合成挂载点（statvfs 对任意目录都有效），直接传给 get_disk_usage_info，
+    不需要 root 权限也不修改系统挂载表。
+
+    :param target: 目标名称，用于用例名称
+    :param directory: 测试目录
+    :param mount_counts: 合成挂载点数量列表
+    :param repeat: 每个用例的重复次数
+    :return: 基准结果（中位数与最大值，毫秒）
+    """
+    results = []
+    with tempfile.TemporaryDirectory(prefix="filetools_mounts_", dir=directory) as root:
+        for count in mount_counts:
+            partitions = []
+            for index in range(count):
+                mountpoint = os.path.join(root, f"m{index:05d}")
+                os.makedirs(mountpoint, exist_ok=True)
+                partitions.append((f"synthetic{index}", mountpoint, "synthetic"))
+            latencies = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                get_disk_usage_info(partitions)
+                latencies.append((time.perf_counter() - start) * 1000)
+            name = f"disk_scan/{target}/mounts={count}"
+            logger.info(f"{name}: 中位数 {statistics.median(latencies):.1f} ms, 最大 {max(latencies):.1f} ms")
+            results.append(BenchResult(
+                f"{name}/median", statistics.median(latencies), "ms",
+                higher_is_better=False, tolerance=LATENCY_TOLERANCE_MS,
+            ))
+            results.append(BenchResult(
+                f"{name}/max", max(latencies), "ms", higher_is_better=False, tolerance=LATENCY_TOLERANCE_MS
+            ))
+    return results
+
+
+def run_suite(
+    targets: Mapping[str, str],
+    sizes_mb: Sequence[int] = DEFAULT_SUITE_SIZES_MB,
+    chunk_sizes_mb: Sequence[int] = DEFAULT_SUITE_CHUNK_SIZES_MB,
+    patterns: Sequence[str] = CONTENT_PATTERNS,
+    mount_counts: Sequence[int] = DEFAULT_SUITE_MOUNT_COUNTS,
+    repeat: int = DEFAULT_SUITE_REPEAT,
+) -> Dict[str, Any]:
+    """
+    在每个目标目录上运行完整基准套件
+
+    :param targets: 目标名称 -> 测试目录（如 {"tmpfs": "/dev/shm", "loop": "/mnt/filetools-loop"}）
+    :param sizes_mb: 文件大小列表（MB）
+    :param chunk_sizes_mb: 块大小列表（MB）
+    :param patterns: 内容模式列表
+    :param mount_counts: 合成挂载点数量列表
+    :param repeat: 每个用例的重复次数
+    :return: 可直接保存为 JSON 的基线报告
+    """
+    if repeat <= 0:
+        raise ValueError("重复次数必须大于0")
+    results: List[BenchResult] = []
+    for target, directory in targets.items():
+        if not os.path.isdir(directory):
+            raise ValueError(f"测试目录不存在: {directory}")
+        logger.info(f"开始基准套件: 目标={target}, 目录={directory}")
+        results.extend(bench_generate(target, directory, sizes_mb, chunk_sizes_mb, patterns, repeat))
+        results.extend(bench_disk_scan(target, directory, mount_counts, repeat))
+    return {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        },
+        "targets": dict(targets),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def save_baseline(path: str, report: Mapping[str, Any]) -> None:
+    """
+    保存基线报告
+
+    :param path: JSON 文件路径
+    :param report: run_suite 返回的报告
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    """
+    读取基线报告
+
+    :param path: JSON 文件路径
+    :return: 报告
+    """
+    with open(path, encoding='utf-8') as file:
+        report = json.load(file)
+    if report.get("version") != BASELINE_VERSION:
+        raise ValueError(f"不支持的基线版本: {report.get('version')}")
+    return report
+
+
+def compare_reports(
+    baseline: Mapping[str, Any],
+    current: Mapping[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+) -> List[BenchComparison]:
+    """
+    逐项对比两次运行结果，只对比两边都存在的用例
+
+    数值越大越好的指标下降超过 threshold、越小越好的指标上升超过 threshold，且变化量超过用例的绝对容差时，视为回退。
+
+    :param baseline: 基线报告
+    :param current: 当前报告
+    :param threshold: 回退阈值（相对变化比例）
+    :return: 对比结果（按用例名称排序）
+    """
+    if threshold < 0:
+        raise ValueError("回退阈值不能为负数")
+    previous = {item["name"]: item for item in baseline.get("results", [])}
+    comparisons = []
+    for item in current.get("results", []):
+        old: Optional[Dict[str, Any]] = previous.get(item["name"])
+        if old is None:
+            continue
+        higher_is_better = item.get("higher_is_better", True)
+        worse = old["value"] - item["value"] if higher_is_better else item["value"] - old["value"]
+        regressed = worse > item.get("tolerance", 0.0) and worse > threshold * abs(old["value"])
+        comparisons.append(BenchComparison(
+            name=item["name"],
+            baseline=old["value"],
+            current=item["value"],
+            unit=item.get("unit", ""),
+            higher_is_better=higher_is_better,
+            regressed=regressed,
+        ))
+    return sorted(comparisons, key=lambda comparison: comparison.name)
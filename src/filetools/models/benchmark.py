@@ -0,0 +1,125 @@
+"""性能基准测试"""
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from filetools.config.constants import CHUNK_SIZE, CONTENT_PATTERNS
+from filetools.config.logger import logger
+from filetools.models.content_pattern import create_pattern
+from filetools.models.file_generator import generate_file
+from filetools.models.write_buffer import WriteBuffer
+
+# 基准测试默认数据量（256MB）
+DEFAULT_BENCHMARK_BYTES: int = 256 * 1024 * 1024
+
+# 基准测试使用的固定种子，保证结果可复现
+BENCHMARK_SEED: int = 20251220
+
+
+@dataclass
+class PatternBenchmarkResult:
+    """
+    内容模式基准测试结果
+
+    :param pattern: 内容模式
+    :param total_bytes: 数据量（字节）
+    :param fill_seconds: 仅生成内容（不写盘）的耗时（秒）
+    :param write_seconds: 生成并写入文件的耗时（秒）
+    :param zeros_write_seconds: 同等数据量全零写入的耗时（秒），作为对比基线
+    """
+    pattern: str
+    total_bytes: int
+    fill_seconds: float
+    write_seconds: float
+    zeros_write_seconds: float = 0.0
+
+    @staticmethod
+    def _mbps(total_bytes: int, seconds: float) -> float:
+        return total_bytes / (1024 * 1024) / seconds if seconds > 0 else float('inf')
+
+    @property
+    def fill_mbps(self) -> float:
+        """内容生成速度（MB/s）"""
+        return self._mbps(self.total_bytes, self.fill_seconds)
+
+    @property
+    def write_mbps(self) -> float:
+        """写入速度（MB/s）"""
+        return self._mbps(self.total_bytes, self.write_seconds)
+
+    @property
+    def relative_to_zeros(self) -> float:
+        """写入速度相对全零写入的比例（1.0 表示与全零写入一样快）"""
+        if self.write_seconds <= 0:
+            return 1.0
+        return self.zeros_write_seconds / self.write_seconds
+
+
+def measure_pattern_fill(pattern: str, total_bytes: int, chunk_size: int = CHUNK_SIZE) -> float:
+    """
+    测量内容模式生成指定数据量所需的时间（不包含磁盘写入）
+
+    :param pattern: 内容模式
+    :param total_bytes: 数据量（字节）
+    :param chunk_size: 块大小（字节）
+    :return: 耗时（秒）
+    """
+    content = create_pattern(pattern, BENCHMARK_SEED)
+    chunk_size = min(chunk_size, total_bytes)
+    start = time.perf_counter()
+    with WriteBuffer(chunk_size + content.extra_capacity(chunk_size)) as buffer:
+        content.prepare(buffer, chunk_size)
+        for index, offset in enumerate(range(0, total_bytes, chunk_size)):
+            content.chunk_view(buffer, index, min(chunk_size, total_bytes - offset))
+    return time.perf_counter() - start
+
+
+def _measure_pattern_write(directory: str, pattern: str, total_bytes: int) -> float:
+    """
+    测量使用内容模式生成文件的耗时，测试文件写完即删除
+
+    :param directory: 测试目录
+    :param pattern: 内容模式
+    :param total_bytes: 数据量（字节）
+    :return: 耗时（秒）
+    """
+    path = Path(directory) / f"filetools_bench_{pattern}.bin"
+    try:
+        return generate_file(str(path), total_bytes, None, pattern=pattern, seed=BENCHMARK_SEED).elapsed
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def benchmark_patterns(
+    directory: Optional[str] = None,
+    total_bytes: int = DEFAULT_BENCHMARK_BYTES,
+    patterns: Sequence[str] = CONTENT_PATTERNS,
+) -> List[PatternBenchmarkResult]:
+    """
+    对比各内容模式的生成速度与写入速度，并以全零写入为基线
+
+    :param directory: 测试文件所在目录，为 None 时使用系统临时目录
+    :param total_bytes: 每个模式的数据量（字节）
+    :param patterns: 需要测试的内容模式
+    :return: 各内容模式的测试结果
+    """
+    directory = directory or tempfile.gettempdir()
+    logger.info(f"开始内容模式基准测试: 目录={directory}, 数据量={total_bytes} 字节")
+    zeros_seconds = _measure_pattern_write(directory, 'zeros', total_bytes)
+    results = []
+    for pattern in patterns:
+        result = PatternBenchmarkResult(
+            pattern=pattern,
+            total_bytes=total_bytes,
+            fill_seconds=measure_pattern_fill(pattern, total_bytes),
+            write_seconds=_measure_pattern_write(directory, pattern, total_bytes),
+            zeros_write_seconds=zeros_seconds,
+        )
+        logger.info(
+            f"内容模式 {pattern}: 生成 {result.fill_mbps:.0f} MB/s, "
+            f"写入 {result.write_mbps:.0f} MB/s, 相对全零 {result.relative_to_zeros:.2f}"
+        )
+        results.append(result)
+    return results
@@ -0,0 +1,83 @@
+"""断点续传检查点"""
+import json
+import os
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Optional
+
+from filetools.config.constants import CHECKPOINT_SUFFIX
+from filetools.config.logger import logger
+
+
+@dataclass
+class GenerationCheckpoint:
+    """
+    生成任务的检查点（与目标文件同目录的小型 JSON 旁路文件）
+
+    只在数据落盘之后更新，bytes_written 始终是完整写入的块边界。
+
+    :param file_size: 目标文件大小（字节）
+    :param pattern: 内容模式
+    :param seed: 内容模式的随机种子
+    :param chunk_size: 写入块大小（字节）
+    :param compression_ratio: compressible 模式的目标压缩比
+    :param bytes_written: 已完整写入并落盘的字节数
+    """
+    file_size: int
+    pattern: str
+    seed: int
+    chunk_size: int
+    compression_ratio: float
+    bytes_written: int = 0
+
+    @staticmethod
+    def path_for(file_path: str) -> Path:
+        """
+        获取文件对应的检查点路径
+
+        :param file_path: 目标文件路径
+        :return: 检查点路径
+        """
+        path = Path(file_path)
+        return path.with_name(path.name + CHECKPOINT_SUFFIX)
+
+    @classmethod
+    def load(cls, file_path: str) -> Optional["GenerationCheckpoint"]:
+        """
+        读取文件对应的检查点
+
+        :param file_path: 目标文件路径
+        :return: 检查点，不存在或内容损坏时为 None
+        """
+        checkpoint_path = cls.path_for(file_path)
+        try:
+            data = json.loads(checkpoint_path.read_text(encoding='utf-8'))
+            return cls(**{f.name: data[f.name] for f in fields(cls)})
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"检查点文件无效，忽略: {checkpoint_path}: {e}")
+            return None
+
+    def save(self, file_path: str) -> None:
+        """
+        原子写入检查点（先写临时文件再替换，进程崩溃时不会留下半个检查点）
+
+        :param file_path: 目标文件路径
+        """
+        checkpoint_path = self.path_for(file_path)
+        tmp_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(asdict(self), file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, checkpoint_path)
+
+    @classmethod
+    def remove(cls, file_path: str) -> None:
+        """
+        删除文件对应的检查点
+
+        :param file_path: 目标文件路径
+        """
+        cls.path_for(file_path).unlink(missing_ok=True)
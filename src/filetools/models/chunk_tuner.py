@@ -0,0 +1,204 @@
+"""按设备自动调优写入块大小"""
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import psutil
+
+from filetools.config.constants import (
+    CHUNK_MEMORY_FRACTION,
+    CHUNK_PROBE_BYTES,
+    CHUNK_PROBE_SIZES,
+    CHUNK_TUNE_TOLERANCE,
+    DEFAULT_IO_MODE,
+)
+from filetools.config.logger import logger
+from filetools.models.content_pattern import create_pattern
+from filetools.models.io_engine import ChunkWriter, open_for_write
+from filetools.models.space_check import get_device_id
+from filetools.models.write_buffer import WriteBuffer
+
+# 探测使用固定种子的随机数据，避免压缩文件系统让小数据量的探测失真
+_PROBE_SEED = 0x5EED
+
+
+@dataclass
+class ChunkProbeResult:
+    """
+    单个块大小的探测结果
+
+    :param chunk_size: 块大小（字节）
+    :param bytes_written: 探测写入的字节数
+    :param elapsed: 写入并落盘的耗时（秒）
+    """
+    chunk_size: int
+    bytes_written: int
+    elapsed: float
+
+    @property
+    def throughput_mbps(self) -> float:
+        """写入速度（MB/s）"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.bytes_written / (1024 * 1024) / self.elapsed
+
+
+@dataclass
+class ChunkTuning:
+    """
+    设备的块大小调优结果
+
+    :param device: 设备 ID（st_dev）
+    :param directory: 探测目录
+    :param chunk_size: 选出的块大小（字节）
+    :param results: 各块大小的探测结果
+    :param tuned_at: 调优时间（时间戳）
+    """
+    device: int
+    directory: str
+    chunk_size: int
+    results: List[ChunkProbeResult] = field(default_factory=list)
+    tuned_at: float = field(default_factory=time.time)
+
+
+def memory_limited_sizes(sizes: Sequence[int]) -> List[int]:
+    """
+    过滤掉超过可用内存预算（CHUNK_MEMORY_FRACTION）的块大小，至少保留最小的一个
+
+    :param sizes: 候选块大小
+    :return: 可用的块大小（升序）
+    """
+    budget = psutil.virtual_memory().available * CHUNK_MEMORY_FRACTION
+    ordered = sorted(sizes)
+    allowed = [size for size in ordered if size <= budget]
+    return allowed or ordered[:1]
+
+
+def probe_chunk_size(directory: str, chunk_size: int, probe_bytes: int, io_mode: str = DEFAULT_IO_MODE) -> ChunkProbeResult:
+    """
+    以指定块大小写入一个临时文件并落盘，测量持续写入速度
+
+    探测写入不计入 /metrics 的累计写入字节数和耗时直方图。
+
+    :param directory: 探测目录（位于待测设备上）
+    :param chunk_size: 块大小（字节）
+    :param probe_bytes: 探测写入的字节数（至少写满两个块）
+    :param io_mode: I/O 模式
+    :return: 探测结果
+    """
+    total = max(probe_bytes, 2 * chunk_size)
+    path = Path(directory) / f".filetools_probe_{os.getpid()}_{threading.get_ident()}.tmp"
+    pattern = create_pattern("random", _PROBE_SEED)
+    try:
+        with WriteBuffer(chunk_size + pattern.extra_capacity(chunk_size)) as buffer:
+            pattern.prepare(buffer, chunk_size)
+            file, actual_mode = open_for_write(path, truncate=True, io_mode=io_mode)
+            with file:
+                writer = ChunkWriter(file, actual_mode, durability="end", metrics=None)
+                start = time.perf_counter()
+                written = 0
+                while written < total:
+                    length = min(chunk_size, total - written)
+                    writer.write(pattern.chunk_view(buffer, written // chunk_size, length))
+                    written += length
+                writer.finish()
+                elapsed = time.perf_counter() - start
+    finally:
+        path.unlink(missing_ok=True)
+    return ChunkProbeResult(chunk_size=chunk_size, bytes_written=total, elapsed=elapsed)
+
+
+def pick_chunk_size(results: Sequence[ChunkProbeResult], tolerance: float = CHUNK_TUNE_TOLERANCE) -> int:
+    """
+    选出最佳块大小：速度与最快结果相差不超过 tolerance 时选择更小的块，节省内存
+
+    :param results: 探测结果
+    :param tolerance: 速度容差（比例）
+    :return: 块大小（字节）
+    """
+    best = max(result.throughput_mbps for result in results)
+    candidates = [result.chunk_size for result in results if result.throughput_mbps >= best * (1 - tolerance)]
+    return min(candidates)
+
+
+class ChunkTuner:
+    """
+    按设备缓存的块大小调优器
+
+    对目标挂载点依次用几个块大小写入一小段数据并落盘，按设备 ID 缓存最佳块大小；
+    generate_file 未指定块大小时使用缓存值，未调优过的设备使用默认的 CHUNK_SIZE。
+
+    :param sizes: 候选块大小
+    :param probe_bytes: 每个块大小的探测写入字节数
+    """
+
+    def __init__(self, sizes: Sequence[int] = CHUNK_PROBE_SIZES, probe_bytes: int = CHUNK_PROBE_BYTES):
+        self.sizes = tuple(sizes)
+        self.probe_bytes = probe_bytes
+        self._lock = threading.Lock()
+        self._tunings: Dict[int, ChunkTuning] = {}
+
+    def tune(self, directory: str, io_mode: str = DEFAULT_IO_MODE) -> ChunkTuning:
+        """
+        探测目录所在设备并缓存结果（覆盖已有结果）
+
+        :param directory: 探测目录
+        :param io_mode: I/O 模式
+        :return: 调优结果
+        """
+        if not os.path.isdir(directory):
+            raise ValueError(f"探测目录不存在: {directory}")
+        device = get_device_id(directory)
+        results = []
+        for size in memory_limited_sizes(self.sizes):
+            result = probe_chunk_size(directory, size, self.probe_bytes, io_mode)
+            logger.info(f"块大小探测: 设备 {device}, 块大小 {size} 字节, {result.throughput_mbps:.1f} MB/s")
+            results.append(result)
+        tuning = ChunkTuning(device=device, directory=directory, chunk_size=pick_chunk_size(results), results=results)
+        with self._lock:
+            self._tunings[device] = tuning
+        logger.info(f"块大小调优完成: 设备 {device}, 选用 {tuning.chunk_size} 字节")
+        return tuning
+
+    def get(self, file_path: str) -> Optional[ChunkTuning]:
+        """
+        获取路径所在设备的调优结果
+
+        :param file_path: 文件或目录路径（可以尚不存在）
+        :return: 调优结果，未调优时为 None
+        """
+        device = get_device_id(file_path)
+        with self._lock:
+            return self._tunings.get(device)
+
+    def chunk_size_for(self, file_path: str, default: int) -> int:
+        """
+        获取路径所在设备应使用的块大小
+
+        :param file_path: 文件路径
+        :param default: 未调优时使用的块大小
+        :return: 块大小（字节）
+        """
+        tuning = self.get(file_path)
+        return tuning.chunk_size if tuning else default
+
+    def tunings(self) -> List[ChunkTuning]:
+        """
+        列出全部调优结果
+
+        :return: 调优结果列表
+        """
+        with self._lock:
+            return list(self._tunings.values())
+
+    def clear(self) -> None:
+        """清空缓存的调优结果"""
+        with self._lock:
+            self._tunings.clear()
+
+
+# 默认调优器，UI 与生成逻辑共享
+chunk_size_tuner = ChunkTuner()
@@ -0,0 +1,334 @@
+"""模板克隆模式：生成一个模板文件后在内核中快速复制出多个相同的文件"""
+import errno
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, List, Optional
+
+from filetools.config.constants import (
+    CLONE_COPY_CHUNK,
+    CLONE_METHODS,
+    DEFAULT_CLONE_PREFIX,
+    DEFAULT_COMPRESSION_RATIO,
+    DEFAULT_CONTENT_PATTERN,
+    DEFAULT_DURABILITY,
+    DURABILITY_MODES,
+)
+from filetools.config.logger import logger
+from filetools.models.disk_snapshot import disk_snapshot_cache
+from filetools.models.file_generator import generate_file
+from filetools.models.generation_stats import GenerationStats
+from filetools.models.io_engine import fdatasync
+from filetools.models.job_control import JobCancelled, JobControl
+from filetools.models.metrics import generation_metrics
+from filetools.models.progress import ProgressEvent, ProgressThrottle, percent_listener
+from filetools.models.write_buffer import WriteBuffer, write_fully
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# FICLONE ioctl 请求号（linux/fs.h：_IOW(0x94, 9, int)）
+_FICLONE = 0x40049409
+
+# 表示文件系统或内核不支持该复制方式的错误码，遇到后换下一种方式
+_UNSUPPORTED_ERRNOS = {
+    errno.EOPNOTSUPP,
+    getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP),
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EXDEV,
+    errno.ENOTTY,
+}
+
+# 可能让目标文件与模板共享数据块的复制方式：copy_file_range 在 btrfs、XFS、NFS 4.2 上会直接 reflink
+_SHARING_METHODS = ("reflink", "copy_file_range")
+
+
+class _Unsupported(Exception):
+    """当前复制方式不可用"""
+
+
+@dataclass
+class CloneResult:
+    """
+    模板克隆结果
+
+    :param template: 模板文件路径
+    :param files: 全部文件路径（第一个为模板）
+    :param file_size: 单个文件大小（字节）
+    :param methods: 各复制方式完成的文件数
+    :param template_stats: 模板文件的生成统计信息
+    :param clone_elapsed: 复制耗时（秒，不含模板生成）
+    :param elapsed: 总耗时（秒）
+    """
+    template: str
+    files: List[str] = field(default_factory=list)
+    file_size: int = 0
+    methods: Dict[str, int] = field(default_factory=dict)
+    template_stats: Optional[GenerationStats] = None
+    clone_elapsed: float = 0.0
+    elapsed: float = 0.0
+
+    @property
+    def copies(self) -> int:
+        """复制出的文件数（不含模板）"""
+        return max(0, len(self.files) - 1)
+
+    @property
+    def shared_extents(self) -> bool:
+        """是否有副本可能与模板共享数据块（不占用新的磁盘空间）"""
+        return any(self.methods.get(method) for method in _SHARING_METHODS)
+
+    @property
+    def clone_mbps(self) -> float:
+        """按逻辑大小计算的复制速度（MB/s）"""
+        if self.clone_elapsed <= 0:
+            return 0.0
+        return self.copies * self.file_size / (1024 * 1024) / self.clone_elapsed
+
+
+def _check_errno(e: OSError) -> None:
+    """不支持类错误转换为 _Unsupported，其他错误（如 ENOSPC）继续抛出"""
+    if e.errno in _UNSUPPORTED_ERRNOS:
+        raise _Unsupported(str(e)) from e
+    raise e
+
+
+def _reflink(source: BinaryIO, target: BinaryIO, size: int, on_copied: Callable[[int], None]) -> None:
+    """FICLONE：目标文件直接引用模板的数据块，不复制数据"""
+    if fcntl is None:
+        raise _Unsupported("当前平台不支持 ioctl")
+    try:
+        fcntl.ioctl(target.fileno(), _FICLONE, source.fileno())
+    except OSError as e:
+        _check_errno(e)
+    on_copied(size)
+
+
+def _copy_file_range(source: BinaryIO, target: BinaryIO, size: int, on_copied: Callable[[int], None]) -> None:
+    """copy_file_range：数据在内核中复制，文件系统支持时可能直接共享数据块"""
+    if not hasattr(os, 'copy_file_range'):
+        raise _Unsupported("当前平台不支持 copy_file_range")
+    offset = 0
+    while offset < size:
+        try:
+            copied = os.copy_file_range(
+                source.fileno(), target.fileno(), min(CLONE_COPY_CHUNK, size - offset), offset, offset
+            )
+        except OSError as e:
+            _check_errno(e)
+        if not copied:
+            # 部分文件系统（如 procfs、早期 FUSE）不报错而是返回 0
+            raise _Unsupported(f"copy_file_range 仅复制 {offset}/{size} 字节")
+        offset += copied
+        on_copied(copied)
+
+
+def _sendfile(source: BinaryIO, target: BinaryIO, size: int, on_copied: Callable[[int], None]) -> None:
+    """sendfile：数据经页缓存在内核中复制，总会为目标文件分配新的数据块"""
+    if not hasattr(os, 'sendfile'):
+        raise _Unsupported("当前平台不支持 sendfile")
+    offset = 0
+    while offset < size:
+        try:
+            copied = os.sendfile(target.fileno(), source.fileno(), offset, min(CLONE_COPY_CHUNK, size - offset))
+        except OSError as e:
+            _check_errno(e)
+        if not copied:
+            raise _Unsupported(f"sendfile 仅复制 {offset}/{size} 字节")
+        offset += copied
+        on_copied(copied)
+
+
+def _copy(source: BinaryIO, target: BinaryIO, size: int, on_copied: Callable[[int], None]) -> None:
+    """用户态读写复制（所有平台都可用的最后手段），复用一个按页对齐的缓冲区"""
+    source.seek(0)
+    offset = 0
+    with WriteBuffer(max(1, min(CLONE_COPY_CHUNK, size))) as buffer:
+        while offset < size:
+            view = buffer.view(min(buffer.size, size - offset))
+            length = source.readinto(view)
+            if not length:
+                raise OSError(f"模板文件在复制过程中变短：仅读取 {offset}/{size} 字节")
+            write_fully(target, view[:length])
+            offset += length
+            on_copied(length)
+
+
+_COPIERS: Dict[str, Callable[[BinaryIO, BinaryIO, int, Callable[[int], None]], None]] = {
+    "reflink": _reflink,
+    "copy_file_range": _copy_file_range,
+    "sendfile": _sendfile,
+    "copy": _copy,
+}
+
+
+def clone_methods(force_allocate: bool = False) -> List[str]:
+    """
+    按优先级返回可尝试的复制方式
+
+    :param force_allocate: 是否强制为副本分配真实数据块（排除可能共享数据块的 reflink 与 copy_file_range）
+    :return: 复制方式列表
+    """
+    if force_allocate:
+        return [method for method in CLONE_METHODS if method not in _SHARING_METHODS]
+    return list(CLONE_METHODS)
+
+
+def clone_file(
+    source: str,
+    target: str,
+    methods: Optional[List[str]] = None,
+    on_copied: Optional[Callable[[int], None]] = None,
+    sync: bool = False,
+) -> str:
+    """
+    把模板文件复制为目标文件，按优先级尝试各复制方式
+
+    某种方式不被文件系统或内核支持（EOPNOTSUPP、EXDEV、EINVAL 等）时截断目标文件并换下一种方式；
+    磁盘写满等其他错误直接抛出，目标文件由调用方处理。
+
+    :param source: 模板文件路径
+    :param target: 目标文件路径（已存在时覆盖）
+    :param methods: 按优先级尝试的复制方式，为 None 时使用 clone_methods()
+    :param on_copied: 每复制一段后调用，参数为本段字节数（可在其中检查取消）
+    :param sync: 复制完成后是否 fdatasync 目标文件
+    :return: 实际使用的复制方式
+    :raises OSError: 所有方式都不可用或复制失败
+    """
+    methods = list(methods) if methods is not None else clone_methods()
+    unknown = [method for method in methods if method not in _COPIERS]
+    if unknown or not methods:
+        raise ValueError(f"不支持的复制方式: {', '.join(unknown) or '空'}。支持的方式: {', '.join(CLONE_METHODS)}")
+    callback = on_copied or (lambda length: None)
+    size = os.path.getsize(source)
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    with open(source, 'rb', buffering=0) as src, open(os.open(target, flags, 0o666), 'wb', buffering=0) as dst:
+        for method in methods:
+            try:
+                _COPIERS[method](src, dst, size, callback)
+            except _Unsupported as e:
+                logger.debug(f"复制方式 {method} 不可用，尝试下一种: {target}: {e}")
+                dst.truncate(0)
+                dst.seek(0)
+                continue
+            if sync:
+                fdatasync(dst.fileno())
+            return method
+    raise OSError(errno.EOPNOTSUPP, f"没有可用的复制方式: {', '.join(methods)}")
+
+
+def generate_clones(
+    directory: str,
+    count: int,
+    file_size_bytes: int,
+    prefix: str = DEFAULT_CLONE_PREFIX,
+    pattern: str = DEFAULT_CONTENT_PATTERN,
+    seed: Optional[int] = None,
+    compression_ratio: float = DEFAULT_COMPRESSION_RATIO,
+    durability: str = DEFAULT_DURABILITY,
+    force_allocate: bool = False,
+    progress_callback: Optional[Callable[[int], int]] = None,
+    progress_events: Optional[Callable[[ProgressEvent], None]] = None,
+    control: Optional[JobControl] = None,
+) -> CloneResult:
+    """
+    生成 count 个内容相同的文件：先用 generate_file 写出一个模板，再在内核中复制出其余文件
+
+    复制方式按优先级尝试：
+    - reflink: FICLONE，btrfs、XFS 等支持时副本直接引用模板的数据块，几乎不耗时也不占用新的空间
+    - copy_file_range: 数据在内核中复制，不经过用户态（btrfs、XFS、NFS 4.2 上也可能共享数据块）
+    - sendfile: 数据经页缓存在内核中复制，总会分配新的数据块
+    - copy: 用户态读写复制
+    第一个文件确定可用的方式后，后续文件直接从该方式开始，不重复尝试不支持的方式。
+
+    共享数据块的副本不会真正占用磁盘空间，用于“磁盘写满”测试时请设置 force_allocate，
+    只使用 sendfile 或用户态复制，保证每个副本都分配真实的数据块。
+
+    文件命名为 <prefix>_00000.bin（模板）、<prefix>_00001.bin……；持久化策略不为 none 时每个副本复制后 fdatasync 一次。
+    进度按全部文件的逻辑大小汇总上报；传入 control 时每复制 CLONE_COPY_CHUNK 字节检查一次暂停与取消，
+    取消时删除正在复制的文件（已完成的文件保留）并抛出 JobCancelled。
+
+    :param directory: 目标目录（不存在时创建）
+    :param count: 文件总数（含模板）
+    :param file_size_bytes: 单个文件大小（字节）
+    :param prefix: 文件名前缀
+    :param pattern: 模板的内容模式
+    :param seed: 内容模式的随机种子，为 None 时随机选择
+    :param compression_ratio: compressible 模式的目标压缩比
+    :param durability: 持久化策略（none, end, interval, chunk），模板按该策略生成
+    :param force_allocate: 是否强制为每个副本分配真实数据块（不共享模板的数据块）
+    :param progress_callback: 进度回调函数，参数为当前进度(0-100)
+    :param progress_events: 进度事件回调
+    :param control: 任务控制标志
+    :return: 克隆结果，包含各复制方式完成的文件数与复制速度
+    """
+    if count <= 0:
+        raise ValueError("文件数必须大于0")
+    if file_size_bytes <= 0:
+        raise ValueError("文件大小必须大于0")
+    if durability not in DURABILITY_MODES:
+        raise ValueError(f"不支持的持久化策略: {durability}。支持的策略: {', '.join(DURABILITY_MODES)}")
+    if not prefix or os.sep in prefix or (os.altsep and os.altsep in prefix):
+        raise ValueError(f"文件名前缀不合法: {prefix!r}")
+
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+    paths = [str(root / f"{prefix}_{index:05d}.bin") for index in range(count)]
+    result = CloneResult(template=paths[0], file_size=file_size_bytes)
+    listener = percent_listener(progress_callback, progress_events)
+    progress = ProgressThrottle(file_size_bytes * count, listener) if listener else None
+    logger.info(
+        f"开始克隆生成: {root}, 文件数: {count}, 单个大小: {file_size_bytes} 字节, 内容模式: {pattern}, "
+        f"强制分配数据块: {force_allocate}"
+    )
+
+    start = time.perf_counter()
+    result.template_stats = generate_file(
+        paths[0], file_size_bytes, pattern=pattern, seed=seed, compression_ratio=compression_ratio,
+        durability=durability, control=control,
+        progress_events=(lambda event: progress.update(event.bytes_written)) if progress else None,
+    )
+    result.files.append(paths[0])
+
+    methods = clone_methods(force_allocate)
+    clone_start = time.perf_counter()
+    for index, path in enumerate(paths[1:], start=1):
+        done = index * file_size_bytes
+
+        def on_copied(length: int) -> None:
+            nonlocal done
+            # 某种方式中途不可用时会从头重新复制，进度不超过当前文件的末尾
+            done = min(done + length, (index + 1) * file_size_bytes)
+            if control:
+                control.checkpoint()
+            if progress:
+                progress.update(done)
+
+        if control:
+            control.checkpoint()
+        try:
+            method = clone_file(paths[0], path, methods, on_copied, sync=durability != 'none')
+        except (JobCancelled, OSError):
+            Path(path).unlink(missing_ok=True)
+            disk_snapshot_cache.invalidate_path(str(root))
+            raise
+        # 后续文件从已确认可用的方式开始
+        methods = methods[methods.index(method):]
+        result.methods[method] = result.methods.get(method, 0) + 1
+        result.files.append(path)
+        generation_metrics.file_generated()
+    result.clone_elapsed = time.perf_counter() - clone_start
+    result.elapsed = time.perf_counter() - start
+
+    disk_snapshot_cache.invalidate_path(str(root))
+    if progress:
+        progress.finish(file_size_bytes * count)
+    logger.info(
+        f"克隆生成完成: {root}, 文件 {len(result.files)} 个, 复制方式: {result.methods}, "
+        f"复制耗时 {result.clone_elapsed:.2f} 秒, {result.clone_mbps:.1f} MB/s, 共享数据块: {result.shared_extents}"
+    )
+    return result
@@ -0,0 +1,189 @@
+"""文件内容模式"""
+import random
+import struct
+from typing import Dict, Optional, Type
+
+from filetools.config.constants import (
+    CONTENT_PATTERNS,
+    DEFAULT_COMPRESSION_RATIO,
+    PATTERN_BLOCK_SIZE,
+    PATTERN_POOL_SIZE,
+)
+from filetools.models.write_buffer import WriteBuffer
+
+# 每块唯一标记：种子 + 块序号（各 8 字节）
+_BLOCK_STAMP = struct.Struct('<QQ')
+
+# 用于把块序号打散成缓冲区偏移的 64 位乘法常数（黄金分割）
+_MIX_MULTIPLIER = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+
+def _fill_repeating(buffer: WriteBuffer, pool: bytes) -> None:
+    """
+    用数据池循环填满整个缓冲区
+
+    :param buffer: 写缓冲区
+    :param pool: 数据池
+    """
+    pool_size = len(pool)
+    for offset in range(0, buffer.size, pool_size):
+        length = min(pool_size, buffer.size - offset)
+        buffer.view(length, offset)[:] = pool[:length]
+
+
+class ContentPattern:
+    """
+    内容模式基类（全零）
+
+    内容模式在任务开始时一次性填充写缓冲区（prepare），之后为每个块返回要写入的视图（chunk_view）。
+    昂贵的随机数生成只在 prepare 中发生一次，每块的额外开销必须远低于磁盘带宽。
+
+    :param seed: 随机种子，相同种子和块大小生成完全相同的内容
+    """
+    name = "zeros"
+    # chunk_view 是否会改写缓冲区；不改写时多个写入线程可以共享同一个缓冲区
+    mutates_buffer = False
+
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+
+    def extra_capacity(self, chunk_size: int) -> int:
+        """
+        缓冲区需要在块大小之外额外预留的字节数
+
+        :param chunk_size: 块大小（字节）
+        :return: 额外字节数
+        """
+        return 0
+
+    def prepare(self, buffer: WriteBuffer, chunk_size: int) -> None:
+        """
+        一次性填充缓冲区（匿名 mmap 初始即为全零，无需处理）
+
+        :param buffer: 写缓冲区
+        :param chunk_size: 块大小（字节）
+        """
+
+    def chunk_view(self, buffer: WriteBuffer, chunk_index: int, length: int) -> memoryview:
+        """
+        返回第 chunk_index 个块要写入的数据视图
+
+        :param buffer: 已 prepare 的写缓冲区
+        :param chunk_index: 块序号（从 0 开始）
+        :param length: 块长度（字节）
+        :return: 数据视图
+        """
+        return buffer.view(length)
+
+
+class RandomPattern(ContentPattern):
+    """
+    快速伪随机模式（不可压缩）
+
+    用种子生成一个数据池并循环铺满缓冲区，每个块从不同的偏移开始取窗口，
+    不需要逐块生成随机数，也不产生任何拷贝。窗口偏移按 4KB 对齐，可直接用于 O_DIRECT 写入。
+    """
+    name = "random"
+
+    def _pool_size(self, chunk_size: int) -> int:
+        return min(PATTERN_POOL_SIZE, chunk_size)
+
+    def extra_capacity(self, chunk_size: int) -> int:
+        return self._pool_size(chunk_size)
+
+    def prepare(self, buffer: WriteBuffer, chunk_size: int) -> None:
+        self._pool_length = self._pool_size(chunk_size)
+        _fill_repeating(buffer, random.Random(self.seed).randbytes(self._pool_length))
+
+    def chunk_view(self, buffer: WriteBuffer, chunk_index: int, length: int) -> memoryview:
+        shift = (((chunk_index + 1) * _MIX_MULTIPLIER + self.seed) & _MASK_64) % self._pool_length
+        return buffer.view(length, shift - shift % PATTERN_BLOCK_SIZE)
+
+
+class CompressiblePattern(ContentPattern):
+    """
+    指定压缩比模式
+
+    每个 4KB 块的前 1/ratio 为随机数据，其余为零，压缩后约为原大小的 1/ratio。
+
+    :param seed: 随机种子
+    :param compression_ratio: 目标压缩比（>= 1.0）
+    """
+    name = "compressible"
+
+    def __init__(self, seed: int = 0, compression_ratio: float = DEFAULT_COMPRESSION_RATIO):
+        if compression_ratio < 1.0:
+            raise ValueError(f"压缩比必须大于等于1: {compression_ratio}")
+        super().__init__(seed)
+        self.compression_ratio = compression_ratio
+
+    def prepare(self, buffer: WriteBuffer, chunk_size: int) -> None:
+        random_length = max(1, round(PATTERN_BLOCK_SIZE / self.compression_ratio))
+        pool = random.Random(self.seed).randbytes(min(PATTERN_POOL_SIZE, max(random_length, chunk_size)))
+        pool_span = len(pool) - random_length + 1
+        for index, offset in enumerate(range(0, chunk_size, PATTERN_BLOCK_SIZE)):
+            length = min(random_length, chunk_size - offset)
+            start = (index * random_length) % pool_span
+            buffer.view(length, offset)[:] = pool[start:start + length]
+
+
+class UniquePattern(ContentPattern):
+    """
+    每块唯一模式（抗去重、不可压缩）
+
+    缓冲区先用随机数据池铺满，每个块写入前在每个 4KB 块头部写入 (种子, 全局块号)，
+    保证整个文件内没有两个相同的块。标记按文件绝对偏移对齐到 4KB 边界：块大小不按 4KB 对齐时，
+    视图从缓冲区中与文件偏移同余的位置开始，标记在缓冲区中的位置固定，去重按文件系统块比较时仍每块唯一。
+    """
+    name = "unique"
+    mutates_buffer = True
+
+    def extra_capacity(self, chunk_size: int) -> int:
+        if chunk_size % PATTERN_BLOCK_SIZE == 0:
+            return 0
+        return PATTERN_BLOCK_SIZE + _BLOCK_STAMP.size
+
+    def prepare(self, buffer: WriteBuffer, chunk_size: int) -> None:
+        self._chunk_size = chunk_size
+        _fill_repeating(buffer, random.Random(self.seed).randbytes(min(PATTERN_POOL_SIZE, chunk_size)))
+
+    def chunk_view(self, buffer: WriteBuffer, chunk_index: int, length: int) -> memoryview:
+        start = chunk_index * self._chunk_size
+        shift = start % PATTERN_BLOCK_SIZE
+        whole = buffer.view(buffer.size)
+        pack_into = _BLOCK_STAMP.pack_into
+        seed = self.seed & _MASK_64
+        block_number = start // PATTERN_BLOCK_SIZE
+        # 与视图相交的每个标记都重写，块内容不依赖缓冲区上一次写入的块
+        for offset in range(0, min(shift + length, buffer.size - _BLOCK_STAMP.size + 1), PATTERN_BLOCK_SIZE):
+            pack_into(whole, offset, seed, block_number)
+            block_number += 1
+        return buffer.view(length, shift)
+
+
+_PATTERN_CLASSES: Dict[str, Type[ContentPattern]] = {
+    cls.name: cls for cls in (ContentPattern, RandomPattern, CompressiblePattern, UniquePattern)
+}
+
+
+def create_pattern(
+    name: str,
+    seed: Optional[int] = None,
+    compression_ratio: float = DEFAULT_COMPRESSION_RATIO,
+) -> ContentPattern:
+    """
+    根据名称创建内容模式
+
+    :param name: 模式名称（zeros, random, compressible, unique）
+    :param seed: 随机种子，为 None 时随机选择
+    :param compression_ratio: compressible 模式的目标压缩比
+    :return: 内容模式实例
+    """
+    if name not in CONTENT_PATTERNS:
+        raise ValueError(f"不支持的内容模式: {name}。支持的模式: {', '.join(CONTENT_PATTERNS)}")
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(32)
+    if name == CompressiblePattern.name:
+        return CompressiblePattern(seed, compression_ratio)
+    return _PATTERN_CLASSES[name](seed)
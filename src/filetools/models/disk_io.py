@@ -0,0 +1,203 @@
+"""磁盘 I/O 吞吐量采样（基于 psutil.disk_io_counters）"""
+import os
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, List, Optional
+
+import psutil
+
+from filetools.config.constants import IO_EMA_ALPHA, IO_SAMPLE_INTERVAL
+from filetools.config.logger import logger
+
+
+@dataclass
+class DeviceIOStats:
+    """
+    单个设备的 I/O 速率
+
+    :param device: 设备名称（与 disk_io_counters 的键一致，如 sda1、nvme0n1p1、dm-0）
+    :param mountpoints: 设备上的挂载点
+    :param read_mbps: 最近一个采样间隔的读取速度（MB/s）
+    :param write_mbps: 最近一个采样间隔的写入速度（MB/s）
+    :param read_iops: 最近一个采样间隔的读 IOPS
+    :param write_iops: 最近一个采样间隔的写 IOPS
+    :param avg_write_mbps: 写入速度的指数移动平均（MB/s）
+    :param avg_write_iops: 写 IOPS 的指数移动平均
+    :param busy_percent: 设备繁忙时间占比（仅 Linux 提供 busy_time，其他平台为 None）
+    """
+    device: str
+    mountpoints: List[str] = field(default_factory=list)
+    read_mbps: float = 0.0
+    write_mbps: float = 0.0
+    read_iops: float = 0.0
+    write_iops: float = 0.0
+    avg_write_mbps: float = 0.0
+    avg_write_iops: float = 0.0
+    busy_percent: Optional[float] = None
+
+
+def _counter_key(device: str) -> str:
+    """
+    把挂载表中的设备路径转换为 disk_io_counters 的键
+
+    /dev/mapper/vg-root 等符号链接先解析为 /dev/dm-0，再取文件名。
+
+    :param device: 挂载表中的设备路径
+    :return: 计数器键
+    """
+    if device.startswith('/dev/'):
+        device = os.path.realpath(device)
+    return os.path.basename(device.rstrip('/\\'))
+
+
+def map_devices_to_mounts() -> Dict[str, List[str]]:
+    """
+    建立 I/O 计数器设备到挂载点的映射（只读取挂载表）
+
+    :return: 计数器键 -> 挂载点列表
+    """
+    mapping: Dict[str, List[str]] = {}
+    for partition in psutil.disk_partitions(all=False):
+        if partition.device:
+            mapping.setdefault(_counter_key(partition.device), []).append(partition.mountpoint)
+    return mapping
+
+
+class DiskIOSampler:
+    """
+    后台磁盘 I/O 采样线程
+
+    按固定间隔读取一次 disk_io_counters(perdisk=True)，与上一次的计数求差得到每个设备的 MB/s 与 IOPS，
+    并维护指数移动平均，用于判断生成任务是否已经跑满磁盘带宽。计数器回绕或设备重新出现时跳过该次差值。
+
+    :param interval: 采样间隔（秒）
+    :param alpha: 移动平均的平滑系数（0-1，越大越跟随最新值）
+    :param counters: 计数器读取函数
+    :param mounts: 设备到挂载点映射函数
+    """
+
+    def __init__(
+        self,
+        interval: float = IO_SAMPLE_INTERVAL,
+        alpha: float = IO_EMA_ALPHA,
+        counters: Callable[[], Optional[Dict[str, Any]]] = lambda: psutil.disk_io_counters(perdisk=True),
+        mounts: Callable[[], Dict[str, List[str]]] = map_devices_to_mounts,
+    ):
+        if not 0 < alpha <= 1:
+            raise ValueError("平滑系数必须在 0 到 1 之间")
+        self.interval = interval
+        self.alpha = alpha
+        self._counters = counters
+        self._mounts = mounts
+        self._lock = threading.Lock()
+        self._previous: Dict[str, Any] = {}
+        self._previous_time: Optional[float] = None
+        self._stats: Dict[str, DeviceIOStats] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """采样线程是否在运行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def _update_device(self, device: str, current: Any, previous: Any, elapsed: float, mountpoints: List[str]) -> None:
+        """
+        用两次计数的差值更新单个设备的速率（调用方持有锁）
+
+        :param device: 设备名称
+        :param current: 本次计数
+        :param previous: 上次计数
+        :param elapsed: 两次采样的间隔（秒）
+        :param mountpoints: 设备上的挂载点
+        """
+        deltas = (
+            current.read_bytes - previous.read_bytes,
+            current.write_bytes - previous.write_bytes,
+            current.read_count - previous.read_count,
+            current.write_count - previous.write_count,
+        )
+        if min(deltas) < 0:
+            return
+        read_bytes, write_bytes, read_count, write_count = deltas
+        stats = self._stats.get(device)
+        if stats is None:
+            stats = self._stats[device] = DeviceIOStats(device=device)
+            stats.avg_write_mbps = write_bytes / (1024 * 1024) / elapsed
+            stats.avg_write_iops = write_count / elapsed
+        stats.mountpoints = mountpoints
+        stats.read_mbps = read_bytes / (1024 * 1024) / elapsed
+        stats.write_mbps = write_bytes / (1024 * 1024) / elapsed
+        stats.read_iops = read_count / elapsed
+        stats.write_iops = write_count / elapsed
+        stats.avg_write_mbps += self.alpha * (stats.write_mbps - stats.avg_write_mbps)
+        stats.avg_write_iops += self.alpha * (stats.write_iops - stats.avg_write_iops)
+        if hasattr(current, 'busy_time') and hasattr(previous, 'busy_time'):
+            busy = (current.busy_time - previous.busy_time) / 1000
+            stats.busy_percent = min(100.0, max(0.0, busy / elapsed * 100))
+
+    def sample_once(self) -> List[DeviceIOStats]:
+        """
+        立即采样一次
+
+        :return: 当前的设备 I/O 速率
+        """
+        counters = self._counters() or {}
+        mounts = self._mounts()
+        now = time.monotonic()
+        with self._lock:
+            elapsed = now - self._previous_time if self._previous_time is not None else 0.0
+            if elapsed > 0:
+                for device, current in counters.items():
+                    previous = self._previous.get(device)
+                    if previous is not None:
+                        self._update_device(device, current, previous, elapsed, mounts.get(device, []))
+            for device in set(self._stats) - set(counters):
+                del self._stats[device]
+            self._previous = dict(counters)
+            self._previous_time = now
+        return self.latest()
+
+    def _run(self) -> None:
+        """采样线程主循环"""
+        while not self._stop_event.is_set():
+            try:
+                self.sample_once()
+            except Exception as e:
+                logger.error(f"磁盘 I/O 采样失败: {e}", exc_info=True)
+            self._stop_event.wait(self.interval)
+
+    def start(self) -> None:
+        """启动后台采样线程（已在运行时忽略）"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="filetools-disk-io", daemon=True)
+        self._thread.start()
+        logger.info(f"磁盘 I/O 采样线程已启动，间隔 {self.interval} 秒")
+
+    def stop(self) -> None:
+        """停止后台采样线程"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+        logger.info("磁盘 I/O 采样线程已停止")
+
+    def latest(self, mounted_only: bool = True) -> List[DeviceIOStats]:
+        """
+        最近一次采样结果（不做任何系统调用）
+
+        :param mounted_only: 只返回有挂载点的设备；没有任何设备能对应到挂载点时（如容器内）返回全部设备
+        :return: 按写入速度降序排列的设备 I/O 速率
+        """
+        with self._lock:
+            stats = [replace(item) for item in self._stats.values()]
+        if mounted_only and any(item.mountpoints for item in stats):
+            stats = [item for item in stats if item.mountpoints]
+        return sorted(stats, key=lambda item: (-item.avg_write_mbps, item.device))
+
+
+# 默认 I/O 采样器，由服务启动时开启
+disk_io_sampler = DiskIOSampler()
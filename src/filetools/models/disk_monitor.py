@@ -2,12 +2,22 @@
 import os
 import psutil
 import platform
-from typing import List
+import queue
+import threading
+import time
+from concurrent.futures import Future, wait
+from typing import Dict, List, Optional, Tuple
 
-from filetools.config.constants import MIN_DISK_SIZE
+from filetools.config.constants import DISK_STAT_BACKOFF, DISK_STAT_TIMEOUT, DISK_STAT_WORKERS, MIN_DISK_SIZE
 from filetools.config.logger import logger
 from filetools.models.disk_usage import DiskUsage
 
+# 尚未返回的统计（挂载点 -> Future），同一挂载点最多只有一个线程阻塞在系统调用中
+_pending_stats: Dict[str, Future] = {}
+# 超时挂载点的退避截止时间（单调时钟秒数）
+_backoff_until: Dict[str, float] = {}
+_stat_lock = threading.Lock()
+
 
 def _should_skip_partition_macos(mountpoint: str, partition_opts: str) -> bool:
     """
@@ -82,62 +92,252 @@ def _get_device_name(partition: psutil._common.sdiskpart, is_macos: bool) -> str
         return partition.device if partition.device else partition.mountpoint
 
 
-def get_disk_usage_info() -> List[DiskUsage]:
+def get_mount_usage(device: str, mountpoint: str, fstype: str = "") -> DiskUsage:
     """
-    获取磁盘使用情况
-    
-    :return: 磁盘使用情况列表
+    获取单个挂载点的使用情况
+
+    空间、inode、块大小和预留空间全部来自一次 os.statvfs 调用，已用空间与使用率的算法与 psutil.disk_usage 一致；
+    没有 statvfs 的平台（Windows）使用 psutil.disk_usage，inode、块大小和预留空间为 0。
+
+    :param device: 设备名称
+    :param mountpoint: 挂载点
+    :param fstype: 文件系统类型（来自挂载表）
+    :return: 磁盘使用情况
+    """
+    if not hasattr(os, 'statvfs'):
+        usage = psutil.disk_usage(mountpoint)
+        return DiskUsage(
+            device=device,
+            total=usage.total,
+            used=usage.used,
+            percent=usage.percent,
+            mountpoint=mountpoint,
+            fstype=fstype,
+        )
+    stat = os.statvfs(mountpoint)
+    block_size = stat.f_frsize or stat.f_bsize
+    used = (stat.f_blocks - stat.f_bfree) * block_size
+    user_total = used + stat.f_bavail * block_size
+    return DiskUsage(
+        device=device,
+        total=stat.f_blocks * block_size,
+        used=used,
+        percent=round(used / user_total * 100, 1) if user_total else 0.0,
+        mountpoint=mountpoint,
+        inodes_total=stat.f_files,
+        inodes_free=stat.f_favail,
+        fstype=fstype,
+        block_size=block_size,
+        reserved=(stat.f_bfree - stat.f_bavail) * block_size,
+    )
+
+
+def _unavailable_usage(device: str, mountpoint: str, fstype: str) -> DiskUsage:
+    """
+    构造不可用挂载点的占位结果
+
+    :param device: 设备名称
+    :param mountpoint: 挂载点
+    :param fstype: 文件系统类型
+    :return: available 为 False 的磁盘使用情况
+    """
+    return DiskUsage(
+        device=device, total=0, used=0, percent=0.0, mountpoint=mountpoint, available=False, fstype=fstype
+    )
+
+
+def _run_stat(future: Future, device: str, mountpoint: str, fstype: str) -> None:
+    """
+    统计挂载点，结果写入 future
+
+    :param future: 结果 Future
+    :param device: 设备名称
+    :param mountpoint: 挂载点
+    :param fstype: 文件系统类型
+    """
+    # 超时后被调用方取消的排队任务不再执行
+    if not future.set_running_or_notify_cancel():
+        return
+    try:
+        future.set_result(get_mount_usage(device, mountpoint, fstype))
+    except BaseException as e:
+        future.set_exception(e)
+    finally:
+        with _stat_lock:
+            if _pending_stats.get(mountpoint) is future:
+                del _pending_stats[mountpoint]
+
+
+class _StatPool:
+    """
+    分区统计工作线程池
+
+    每个任务提交时占用一个空闲工作线程，没有空闲线程时新开一个，统计任务从不排在卡死的线程后面；
+    任务完成后若已有 DISK_STAT_WORKERS 个空闲线程则退出。调用方保证同一挂载点不会重复提交，
+    线程数不超过无响应的挂载点数加上 DISK_STAT_WORKERS。
+    使用守护线程而不是 ThreadPoolExecutor：卡死在网络文件系统上的系统调用无法取消，
+    ThreadPoolExecutor 的线程会在进程退出时被等待。
+    """
+
+    def __init__(self):
+        # 待执行的统计任务 (Future, 设备名称, 挂载点, 文件系统类型)
+        self.tasks: queue.SimpleQueue = queue.SimpleQueue()
+        # 工作线程（含阻塞在系统调用中的线程）
+        self.workers: List[threading.Thread] = []
+        # 空闲（未被任务占用）的工作线程数
+        self.idle = 0
+        self.lock = threading.Lock()
+
+    def submit(self, future: Future, device: str, mountpoint: str, fstype: str) -> None:
+        """
+        提交统计任务
+
+        :param future: 结果 Future
+        :param device: 设备名称
+        :param mountpoint: 挂载点
+        :param fstype: 文件系统类型
+        """
+        with self.lock:
+            if self.idle:
+                self.idle -= 1
+            else:
+                worker = threading.Thread(target=self._work, name="filetools-disk-stat", daemon=True)
+                self.workers.append(worker)
+                worker.start()
+        self.tasks.put((future, device, mountpoint, fstype))
+
+    def _work(self) -> None:
+        """工作线程：依次执行队列中的统计任务"""
+        while True:
+            _run_stat(*self.tasks.get())
+            with self.lock:
+                if self.idle >= DISK_STAT_WORKERS:
+                    self.workers.remove(threading.current_thread())
+                    return
+                self.idle += 1
+
+
+_stat_pool = _StatPool()
+
+
+def _submit_stat(device: str, mountpoint: str, fstype: str) -> Optional[Future]:
+    """
+    把挂载点统计交给工作线程池；该挂载点上一次统计仍未返回时跳过，返回 None
+
+    :param device: 设备名称
+    :param mountpoint: 挂载点
+    :param fstype: 文件系统类型
+    :return: 结果 Future，已有统计在执行时为 None
+    """
+    with _stat_lock:
+        if mountpoint in _pending_stats:
+            return None
+        future = _pending_stats[mountpoint] = Future()
+    _stat_pool.submit(future, device, mountpoint, fstype)
+    return future
+
+
+def _list_partitions() -> List[Tuple[str, str, str]]:
+    """
+    枚举需要统计的分区（只读取挂载表，不访问文件系统）
+
+    :return: (设备名称, 挂载点, 文件系统类型) 列表
     """
-    logger.info("开始获取磁盘使用情况")
-    disk_usages = []
     partitions = psutil.disk_partitions(all=False)  # 只获取已挂载的分区
     
     # macOS特定处理
     is_macos = platform.system() == 'Darwin'
     seen_mountpoints = set()
+    candidates = []
     
     for partition in partitions:
+        # Windows: 跳过CD-ROM
+        if os.name == 'nt' and 'cdrom' in partition.opts:
+            continue
+        
+        mountpoint = partition.mountpoint
+        
+        # 避免重复挂载点
+        if mountpoint in seen_mountpoints:
+            continue
+        
+        # macOS: 过滤系统分区
+        if is_macos and _should_skip_partition_macos(mountpoint, partition.opts):
+            continue
+        
+        # 获取设备友好名称
+        candidates.append((_get_device_name(partition, is_macos), mountpoint, partition.fstype))
+        seen_mountpoints.add(mountpoint)
+    
+    return candidates
+
+
+def get_disk_usage_info(partitions: Optional[List[Tuple[str, str, str]]] = None) -> List[DiskUsage]:
+    """
+    获取磁盘使用情况
+    
+    所有分区并行统计，总等待时间不超过 DISK_STAT_TIMEOUT，与分区数量无关。
+    超时的挂载点（如无响应的 NFS/CIFS）在结果中标记为不可用，并在 DISK_STAT_BACKOFF 秒内跳过统计；
+    退避结束时上一次统计仍未返回的挂载点不再提交，直接标记为不可用并重新退避。
+    
+    :param partitions: 需要统计的 (设备名称, 挂载点, 文件系统类型) 列表，为 None 时读取挂载表
+    :return: 磁盘使用情况列表
+    """
+    logger.info("开始获取磁盘使用情况")
+    now = time.monotonic()
+    submitted = []
+    for device_name, mountpoint, fstype in (_list_partitions() if partitions is None else partitions):
+        with _stat_lock:
+            backoff = _backoff_until.get(mountpoint, 0.0) > now
+        future = None
+        if not backoff:
+            future = _submit_stat(device_name, mountpoint, fstype)
+            if future is None:
+                logger.warning(f"分区 {mountpoint} 的上一次统计仍未返回，{DISK_STAT_BACKOFF:.0f} 秒内不再统计")
+                with _stat_lock:
+                    _backoff_until[mountpoint] = now + DISK_STAT_BACKOFF
+        submitted.append((device_name, mountpoint, fstype, future))
+    
+    futures = [future for _, _, _, future in submitted if future is not None]
+    if futures:
+        wait(futures, timeout=DISK_STAT_TIMEOUT)
+    
+    disk_usages = []
+    for device_name, mountpoint, fstype, future in submitted:
+        if future is None:
+            disk_usages.append(_unavailable_usage(device_name, mountpoint, fstype))
+            continue
+        if not future.done():
+            if future.cancel():
+                # 还在排队、未开始执行的统计直接丢弃，不算作挂载点无响应，下次扫描重新提交
+                logger.warning(f"统计分区 {mountpoint} 未能在超时前开始执行")
+                with _stat_lock:
+                    if _pending_stats.get(mountpoint) is future:
+                        del _pending_stats[mountpoint]
+            else:
+                logger.warning(f"统计分区超时 {mountpoint}，{DISK_STAT_BACKOFF:.0f} 秒内不再统计")
+                with _stat_lock:
+                    _backoff_until[mountpoint] = time.monotonic() + DISK_STAT_BACKOFF
+            disk_usages.append(_unavailable_usage(device_name, mountpoint, fstype))
+            continue
         try:
-            # Windows: 跳过CD-ROM
-            if os.name == 'nt' and 'cdrom' in partition.opts:
-                continue
-            
-            mountpoint = partition.mountpoint
-            
-            # 避免重复挂载点
-            if mountpoint in seen_mountpoints:
-                continue
-            
-            # macOS: 过滤系统分区
-            if is_macos and _should_skip_partition_macos(mountpoint, partition.opts):
-                continue
-            
-            usage = psutil.disk_usage(mountpoint)
-            
-            # 跳过总空间为0或很小的分区（可能是伪设备）
-            if usage.total < MIN_DISK_SIZE:
-                logger.debug(f"跳过小分区: {mountpoint} (总空间: {usage.total} 字节)")
-                continue
-            
-            # 获取设备友好名称
-            device_name = _get_device_name(partition, is_macos)
-            
-            disk_usage = DiskUsage(
-                device=device_name,
-                total=usage.total,
-                used=usage.used,
-                percent=usage.percent
-            )
-            disk_usages.append(disk_usage)
-            seen_mountpoints.add(mountpoint)
-            
+            disk_usage = future.result()
         except (PermissionError, OSError) as e:
             # 跳过没有权限访问的分区
-            logger.warning(f"无法访问分区 {partition.mountpoint}: {e}")
+            logger.warning(f"无法访问分区 {mountpoint}: {e}")
             continue
         except Exception as e:
-            logger.error(f"获取分区信息时发生未知错误 {partition.mountpoint}: {e}")
+            logger.error(f"获取分区信息时发生未知错误 {mountpoint}: {e}")
+            continue
+        
+        # 跳过总空间为0或很小的分区（可能是伪设备）
+        if disk_usage.total < MIN_DISK_SIZE:
+            logger.debug(f"跳过小分区: {mountpoint} (总空间: {disk_usage.total} 字节)")
             continue
+        
+        with _stat_lock:
+            _backoff_until.pop(mountpoint, None)
+        disk_usages.append(disk_usage)
     
     logger.info(f"成功获取 {len(disk_usages)} 个磁盘的使用情况")
     return disk_usages
@@ -0,0 +1,245 @@
+"""后台磁盘使用情况采样"""
+import threading
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from filetools.config.constants import DISK_HISTORY_SIZE, DISK_SAMPLE_INTERVAL, FILL_RATE_WINDOW
+from filetools.config.logger import logger
+from filetools.models.disk_monitor import get_disk_usage_info
+from filetools.models.disk_snapshot import DiskSnapshotCache, disk_snapshot_cache
+from filetools.models.disk_usage import DiskUsage
+
+
+@dataclass
+class FillRate:
+    """
+    挂载点写入速率估计
+
+    :param mountpoint: 挂载点
+    :param device: 设备名称
+    :param bytes_per_second: 已用空间增长速率（字节/秒，负数表示在释放空间）
+    :param free: 当前剩余空间（字节）
+    :param seconds_to_full: 按当前速率预计写满的秒数（速率不为正时为 None）
+    """
+    mountpoint: str
+    device: str
+    bytes_per_second: float
+    free: int
+    seconds_to_full: Optional[float] = None
+
+
+class MountHistory:
+    """
+    单个挂载点的定长环形历史（array 存储，内存占用固定）
+
+    :param capacity: 最多保留的采样点数
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 2:
+            raise ValueError("历史容量至少为2")
+        self.capacity = capacity
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._used = array('q', bytes(8 * capacity))
+        self._next = 0
+        self.count = 0
+
+    def append(self, timestamp: float, used: int) -> None:
+        """
+        追加一个采样点，写满后覆盖最旧的采样点
+
+        :param timestamp: 采样时间（单调时钟秒数）
+        :param used: 已用空间（字节）
+        """
+        self._timestamps[self._next] = timestamp
+        self._used[self._next] = used
+        self._next = (self._next + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def _newest_first(self) -> Iterator[int]:
+        """从环形缓冲的写入位置向前，按从新到旧的顺序给出采样点下标"""
+        index = self._next
+        for _ in range(self.count):
+            index = (index or self.capacity) - 1
+            yield index
+
+    def samples(self, window: Optional[float] = None) -> List[Tuple[float, int]]:
+        """
+        按时间顺序返回采样点
+
+        :param window: 只返回距最新采样点 window 秒以内的采样点（为 None 时返回全部）
+        :return: (采样时间, 已用空间) 列表
+        """
+        samples = []
+        newest = None
+        for index in self._newest_first():
+            timestamp = self._timestamps[index]
+            if newest is None:
+                newest = timestamp
+            elif window is not None and newest - timestamp > window:
+                break
+            samples.append((timestamp, self._used[index]))
+        samples.reverse()
+        return samples
+
+    def fill_rate(self, window: float = FILL_RATE_WINDOW) -> float:
+        """
+        用最近 window 秒内采样点的最小二乘斜率估计写入速率
+
+        从最新的采样点向前遍历 array 存储，到窗口起点为止，只累加求和，不构造采样点列表；
+        时间和已用空间都取相对最新采样点的差值，避免大数相乘损失精度。
+
+        :param window: 时间窗口（秒）
+        :return: 速率（字节/秒），采样点不足时为 0
+        """
+        if self.count < 2:
+            return 0.0
+        newest_index = (self._next or self.capacity) - 1
+        newest_t, newest_u = self._timestamps[newest_index], self._used[newest_index]
+        n = 0
+        sum_t = sum_u = sum_tt = sum_tu = 0.0
+        for index in self._newest_first():
+            t = self._timestamps[index] - newest_t
+            if -t > window:
+                break
+            u = self._used[index] - newest_u
+            n += 1
+            sum_t += t
+            sum_u += u
+            sum_tt += t * t
+            sum_tu += t * u
+        variance = n * sum_tt - sum_t * sum_t
+        if n < 2 or variance <= 0:
+            return 0.0
+        return (n * sum_tu - sum_t * sum_u) / variance
+
+
+class DiskSampler:
+    """
+    后台磁盘采样线程
+
+    按固定间隔调用一次分区扫描，把结果写入每个挂载点的环形历史，并同步到快照缓存。
+    UI 和接口只读取采样结果，不自行统计磁盘。
+
+    :param interval: 采样间隔（秒）
+    :param capacity: 每个挂载点保留的采样点数
+    :param loader: 分区扫描函数
+    :param cache: 需要同步的快照缓存
+    """
+
+    def __init__(
+        self,
+        interval: float = DISK_SAMPLE_INTERVAL,
+        capacity: int = DISK_HISTORY_SIZE,
+        loader: Callable[[], List[DiskUsage]] = get_disk_usage_info,
+        cache: Optional[DiskSnapshotCache] = disk_snapshot_cache,
+    ):
+        self.interval = interval
+        self.capacity = capacity
+        self._loader = loader
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._histories: Dict[str, MountHistory] = {}
+        self._latest: List[DiskUsage] = []
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """采样线程是否在运行"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def sample_once(self) -> List[DiskUsage]:
+        """
+        立即采样一次
+
+        :return: 本次采样的磁盘使用情况
+        """
+        snapshot = self._loader()
+        now = time.monotonic()
+        with self._lock:
+            for disk in snapshot:
+                if not disk.available:
+                    continue
+                history = self._histories.get(disk.mountpoint)
+                if history is None:
+                    history = self._histories[disk.mountpoint] = MountHistory(self.capacity)
+                history.append(now, disk.used)
+            self._latest = snapshot
+        if self._cache is not None:
+            self._cache.update(snapshot)
+        return snapshot
+
+    def _run(self) -> None:
+        """采样线程主循环"""
+        while not self._stop_event.is_set():
+            try:
+                self.sample_once()
+            except Exception as e:
+                logger.error(f"磁盘采样失败: {e}", exc_info=True)
+            self._stop_event.wait(self.interval)
+
+    def start(self) -> None:
+        """启动后台采样线程（已在运行时忽略）"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="filetools-disk-sampler", daemon=True)
+        self._thread.start()
+        logger.info(f"磁盘采样线程已启动，间隔 {self.interval} 秒，每个挂载点保留 {self.capacity} 个采样点")
+
+    def stop(self) -> None:
+        """停止后台采样线程"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+        logger.info("磁盘采样线程已停止")
+
+    def latest(self) -> List[DiskUsage]:
+        """
+        最近一次采样结果（不做任何系统调用）
+
+        :return: 磁盘使用情况列表
+        """
+        with self._lock:
+            return list(self._latest)
+
+    def history(self, mountpoint: str) -> Optional[MountHistory]:
+        """
+        获取挂载点的采样历史
+
+        :param mountpoint: 挂载点
+        :return: 采样历史，未采样过时为 None
+        """
+        with self._lock:
+            return self._histories.get(mountpoint)
+
+    def fill_rates(self, window: float = FILL_RATE_WINDOW) -> List[FillRate]:
+        """
+        计算最近一次采样中每个挂载点的写入速率和预计写满时间
+
+        :param window: 速率估计的时间窗口（秒）
+        :return: 写入速率列表
+        """
+        rates = []
+        with self._lock:
+            for disk in self._latest:
+                if not disk.available:
+                    continue
+                rate = self._histories[disk.mountpoint].fill_rate(window)
+                free = disk.free
+                rates.append(FillRate(
+                    mountpoint=disk.mountpoint,
+                    device=disk.device,
+                    bytes_per_second=rate,
+                    free=free,
+                    seconds_to_full=free / rate if rate > 0 else None,
+                ))
+        return rates
+
+
+# 默认采样器，由服务启动时开启
+disk_usage_sampler = DiskSampler()
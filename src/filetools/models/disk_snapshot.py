@@ -0,0 +1,129 @@
+"""磁盘使用情况快照缓存"""
+import os
+import threading
+import time
+from typing import Callable, List, Optional, Set
+
+from filetools.config.constants import DISK_SNAPSHOT_TTL
+from filetools.config.logger import logger
+from filetools.models.disk_monitor import get_disk_usage_info, get_mount_usage
+from filetools.models.disk_usage import DiskUsage
+from filetools.models.space_check import resolve_mountpoint
+
+
+class DiskSnapshotCache:
+    """
+    带 TTL 的磁盘使用情况快照缓存
+
+    - 快照在 ttl 秒内直接复用，不做任何系统调用
+    - 文件写入后按挂载点失效，下次读取时只重新统计失效的挂载点，不重新枚举分区
+    - peek() 只读取内存中的快照，用于切换显示单位等纯展示场景
+
+    :param ttl: 快照有效期（秒）
+    :param loader: 全量扫描函数，默认为 get_disk_usage_info
+    """
+
+    def __init__(self, ttl: float = DISK_SNAPSHOT_TTL, loader: Callable[[], List[DiskUsage]] = get_disk_usage_info):
+        self.ttl = ttl
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._snapshot: List[DiskUsage] = []
+        self._loaded_at: Optional[float] = None
+        self._stale_mounts: Set[str] = set()
+
+    def _expired(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+    def _refresh_stale(self) -> None:
+        """只重新统计已失效的挂载点"""
+        refreshed = []
+        for disk in self._snapshot:
+            if disk.available and disk.mountpoint in self._stale_mounts:
+                try:
+                    disk = get_mount_usage(disk.device, disk.mountpoint, disk.fstype)
+                except OSError as e:
+                    logger.warning(f"无法刷新挂载点 {disk.mountpoint}: {e}")
+            refreshed.append(disk)
+        self._snapshot = refreshed
+        self._stale_mounts.clear()
+
+    def get(self, force: bool = False) -> List[DiskUsage]:
+        """
+        获取磁盘使用情况快照
+
+        :param force: 是否强制全量刷新
+        :return: 磁盘使用情况列表
+        """
+        with self._lock:
+            if force or self._expired():
+                self._snapshot = self._loader()
+                self._loaded_at = time.monotonic()
+                self._stale_mounts.clear()
+            elif self._stale_mounts:
+                self._refresh_stale()
+            return list(self._snapshot)
+
+    def peek(self) -> List[DiskUsage]:
+        """
+        获取内存中的快照，不做任何系统调用（尚无快照时才加载一次）
+
+        :return: 磁盘使用情况列表
+        """
+        with self._lock:
+            loaded = self._loaded_at is not None
+        return self.get() if not loaded else list(self._snapshot)
+
+    def cached(self) -> List[DiskUsage]:
+        """
+        获取内存中的快照，任何情况下都不做系统调用（尚无快照时返回空列表）
+
+        :return: 磁盘使用情况列表
+        """
+        with self._lock:
+            return list(self._snapshot)
+
+    @property
+    def age(self) -> Optional[float]:
+        """快照距今的秒数，尚无快照时为 None"""
+        with self._lock:
+            loaded_at = self._loaded_at
+        return None if loaded_at is None else time.monotonic() - loaded_at
+
+    def update(self, snapshot: List[DiskUsage]) -> None:
+        """
+        用外部采集到的快照替换缓存
+
+        :param snapshot: 磁盘使用情况列表
+        """
+        with self._lock:
+            self._snapshot = list(snapshot)
+            self._loaded_at = time.monotonic()
+            self._stale_mounts.clear()
+
+    def invalidate(self, mountpoint: Optional[str] = None) -> None:
+        """
+        使缓存失效
+
+        :param mountpoint: 需要失效的挂载点；为 None 时整个快照失效
+        """
+        with self._lock:
+            if mountpoint is None:
+                self._loaded_at = None
+            else:
+                self._stale_mounts.add(mountpoint)
+
+    def invalidate_path(self, file_path: str) -> None:
+        """
+        使文件所在挂载点的缓存失效（写入文件后调用）
+
+        :param file_path: 文件路径
+        """
+        mountpoint = resolve_mountpoint(file_path)
+        with self._lock:
+            known = {os.path.normcase(disk.mountpoint): disk.mountpoint for disk in self._snapshot}
+        if mountpoint in known:
+            self.invalidate(known[mountpoint])
+
+
+# 默认快照缓存，UI 与业务逻辑共享
+disk_snapshot_cache = DiskSnapshotCache()
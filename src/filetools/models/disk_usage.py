@@ -2,18 +2,50 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class DiskUsage:
     """
     磁盘使用情况数据模型
     
+    使用 __slots__，实例不带 __dict__，大量历史快照的内存占用更小。
+    
     :param device: 设备名称
     :param total: 总空间（字节）
     :param used: 已用空间（字节）
-    :param percent: 使用百分比
+    :param percent: 使用百分比（按普通用户可用空间计算，与 psutil 一致）
+    :param mountpoint: 挂载点
+    :param available: 是否统计成功（挂载点响应超时时为 False，其余字段为 0）
+    :param inodes_total: inode 总数（平台不支持或文件系统不限制 inode 时为 0）
+    :param inodes_free: 可用 inode 数
+    :param fstype: 文件系统类型（如 ext4、xfs、tmpfs、overlay、nfs）
+    :param block_size: 文件系统块大小（字节）
+    :param reserved: 为 root 预留的空间（字节），普通用户无法使用
     """
     device: str
     total: int
     used: int
     percent: float
+    mountpoint: str = ""
+    available: bool = True
+    inodes_total: int = 0
+    inodes_free: int = 0
+    fstype: str = ""
+    block_size: int = 0
+    reserved: int = 0
+
+    @property
+    def free(self) -> int:
+        """普通用户可用空间（字节，已扣除预留空间）"""
+        return max(0, self.total - self.used - self.reserved)
+
+    @property
+    def inodes_used(self) -> int:
+        """已用 inode 数"""
+        return self.inodes_total - self.inodes_free
 
+    @property
+    def inode_percent(self) -> float:
+        """inode 使用百分比"""
+        if self.inodes_total <= 0:
+            return 0.0
+        return self.inodes_used / self.inodes_total * 100
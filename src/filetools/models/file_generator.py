@@ -1,77 +1,511 @@
 """文件生成业务逻辑"""
+import errno
+import os
+import time
 from pathlib import Path
-from typing import Callable, Optional
-from filetools.config.constants import CHUNK_SIZE, UNIT_MAPPING
+from typing import BinaryIO, Callable, Optional
+
+import psutil
+
+from filetools.config.constants import (
+    ALLOCATION_MODES,
+    CHECKPOINT_INTERVAL,
+    CHUNK_SIZE,
+    CONTENT_PATTERNS,
+    DEFAULT_ALLOCATION_MODE,
+    DEFAULT_COMPRESSION_RATIO,
+    DEFAULT_CONTENT_PATTERN,
+    DEFAULT_DURABILITY,
+    DEFAULT_IO_MODE,
+    DEFAULT_QUEUE_DEPTH,
+    DEFAULT_SYNC_INTERVAL,
+    DIRECT_IO_ALIGNMENT,
+    DURABILITY_MODES,
+    IO_MODES,
+    MAX_QUEUE_DEPTH,
+    UNIT_MAPPING,
+)
 from filetools.config.logger import logger
+from filetools.models.checkpoint import GenerationCheckpoint
+from filetools.models.chunk_tuner import chunk_size_tuner
+from filetools.models.content_pattern import ContentPattern, create_pattern
+from filetools.models.disk_snapshot import disk_snapshot_cache
+from filetools.models.generation_result import (
+    ERROR_INSUFFICIENT_SPACE,
+    ERROR_INTERNAL,
+    ERROR_INVALID_ARGUMENT,
+    ERROR_OS_ERROR,
+    ERROR_PERMISSION_DENIED,
+    ERROR_VERIFICATION_FAILED,
+    RESULT_OK,
+    GenerationResult,
+)
+from filetools.models.generation_stats import GenerationStats
+from filetools.models.job_control import JobCancelled, JobControl
+from filetools.models.metrics import generation_metrics
+from filetools.models.progress import ProgressEvent, ProgressThrottle, percent_listener
+from filetools.models.region_writer import write_regions
+from filetools.models.space_check import check_free_space
+from filetools.models.io_engine import ChunkWriter, open_for_write
+from filetools.models.write_buffer import WriteBuffer
+
+# 表示文件系统不支持 fallocate 的错误码
+_FALLOCATE_UNSUPPORTED_ERRNOS = {
+    errno.EOPNOTSUPP,
+    getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP),
+    errno.ENOSYS,
+    errno.EINVAL,
+}
+
+
+def _sample_rss(process: psutil.Process, stats: GenerationStats) -> None:
+    """
+    采样当前进程常驻内存并更新峰值
+
+    memory_info() 是一次系统调用，只在进度上报时和写入结束时采样，不逐块调用。
+
+    :param process: 当前进程
+    :param stats: 生成统计信息
+    """
+    stats.peak_rss = max(stats.peak_rss, process.memory_info().rss)
+
+
+def _stream_write(
+    writer: ChunkWriter,
+    file_size_bytes: int,
+    stats: GenerationStats,
+    pattern: ContentPattern,
+    progress: Optional[ProgressThrottle] = None,
+    control: Optional[JobControl] = None,
+    checkpoint: Optional[GenerationCheckpoint] = None,
+    chunk_size: int = CHUNK_SIZE,
+    keep_on_cancel: bool = False,
+) -> None:
+    """
+    以流式顺序写入内容模式生成的数据
+
+    从 stats.bytes_written 处继续写入（断点续传时不为 0），块序号与首次写入时一致，续写的内容完全相同。
+
+    :param writer: 按 I/O 模式写入的块写入器
+    :param file_size_bytes: 文件大小（字节）
+    :param stats: 生成统计信息（原地更新）
+    :param pattern: 内容模式
+    :param progress: 进度上报器（已限流，每个块调用一次开销可忽略）
+    :param control: 任务控制标志，每个块之前检查一次暂停与取消
+    :param checkpoint: 检查点，每写入 CHECKPOINT_INTERVAL 字节落盘并更新一次
+    :param chunk_size: 块大小（字节）
+    :param keep_on_cancel: 取消后是否保留部分文件，保留时落盘并把检查点更新到取消位置
+    """
+    if file_size_bytes <= 0:
+        return
+    process = psutil.Process()
+    buffer_size = min(chunk_size, file_size_bytes)
+    with WriteBuffer(buffer_size + pattern.extra_capacity(buffer_size)) as buffer:
+        stats.buffer_allocations = buffer.allocations
+        stats.buffer_size = buffer.capacity
+        pattern.prepare(buffer, buffer_size)
+        while stats.bytes_written < file_size_bytes:
+            if control:
+                try:
+                    control.checkpoint()
+                except JobCancelled:
+                    # 取消发生在块之间，已写入的都是完整的块：落盘后把检查点推进到当前位置，之后可以续传
+                    if keep_on_cancel and checkpoint and stats.bytes_written > checkpoint.bytes_written:
+                        writer.flush()
+                        checkpoint.bytes_written = stats.bytes_written
+                        checkpoint.save(stats.file_path)
+                    raise
+            length = min(chunk_size, file_size_bytes - stats.bytes_written)
+            writer.write(pattern.chunk_view(buffer, stats.chunks_written, length))
+            stats.bytes_written += length
+            stats.chunks_written += 1
+            
+            # 数据落盘后再推进检查点，检查点记录的字节数始终可信
+            if (
+                checkpoint
+                and stats.bytes_written < file_size_bytes
+                and stats.bytes_written - checkpoint.bytes_written >= CHECKPOINT_INTERVAL
+            ):
+                writer.flush()
+                checkpoint.bytes_written = stats.bytes_written
+                checkpoint.save(stats.file_path)
+            
+            # 更新进度，进度上报时顺便采样内存
+            if progress and progress.update(stats.bytes_written):
+                _sample_rss(process, stats)
+        _sample_rss(process, stats)
+
 
+def _write_content(
+    writer: ChunkWriter,
+    file_size_bytes: int,
+    stats: GenerationStats,
+    pattern: ContentPattern,
+    progress: Optional[ProgressThrottle],
+    control: Optional[JobControl],
+    checkpoint: Optional[GenerationCheckpoint],
+    chunk_size: int,
+    queue_depth: int,
+    keep_on_cancel: bool = False,
+) -> None:
+    """
+    写入文件内容：队列深度为 1 时顺序写入，否则按区域多线程并行写入
+
+    并行写入时各区域的写入耗时与落盘耗时取最大值、落盘次数累加、I/O 模式回退汇总到 writer，
+    由 writer.finish() 统一做最后一次落盘。
+
+    :param writer: 块写入器
+    :param file_size_bytes: 文件大小（字节）
+    :param stats: 生成统计信息（原地更新）
+    :param pattern: 内容模式
+    :param progress: 进度上报器
+    :param control: 任务控制标志
+    :param checkpoint: 检查点（仅顺序写入使用）
+    :param chunk_size: 块大小（字节）
+    :param queue_depth: 队列深度
+    :param keep_on_cancel: 取消后是否保留部分文件（仅顺序写入使用）
+    """
+    if queue_depth <= 1:
+        _stream_write(
+            writer, file_size_bytes, stats, pattern, progress, control, checkpoint, chunk_size, keep_on_cancel
+        )
+        return
+    regions = write_regions(
+        Path(stats.file_path), writer.io_mode, file_size_bytes, stats, pattern, queue_depth, progress, control,
+        chunk_size, writer.durability, writer.sync_interval,
+    )
+    # 各区域同时写入，耗时取最慢的区域而不是累加，否则速度会被低估约队列深度倍
+    writer.write_time += max((region.write_time for region in regions), default=0.0)
+    writer.flush_time += max((region.flush_time for region in regions), default=0.0)
+    for region in regions:
+        writer.flushes += region.flushes
+        if region.io_mode != writer.io_mode:
+            writer.io_mode = region.io_mode
 
-def generate_file(file_path: str, file_size_bytes: int, progress_callback: Optional[Callable[[int], int]] = None) -> None:
+
+def _load_resume_checkpoint(
+    path: Path,
+    file_size_bytes: int,
+    pattern: str,
+    seed: Optional[int],
+    compression_ratio: float,
+    chunk_size: Optional[int] = None,
+) -> Optional[GenerationCheckpoint]:
+    """
+    读取并校验断点续传检查点
+
+    :param path: 目标文件路径
+    :param file_size_bytes: 文件大小（字节）
+    :param pattern: 内容模式
+    :param seed: 请求的随机种子（为 None 时使用检查点中的种子）
+    :param compression_ratio: compressible 模式的目标压缩比
+    :param chunk_size: 请求的块大小（为 None 时使用检查点中的块大小）
+    :return: 可用的检查点；没有检查点或文件已短于检查点记录时为 None（从头开始）
+    :raises ValueError: 检查点与请求参数不一致
+    """
+    checkpoint = GenerationCheckpoint.load(str(path))
+    if checkpoint is None:
+        return None
+    expected = {
+        "file_size": file_size_bytes,
+        "pattern": pattern,
+        "compression_ratio": compression_ratio,
+    }
+    if seed is not None:
+        expected["seed"] = seed
+    if chunk_size is not None:
+        expected["chunk_size"] = chunk_size
+    mismatched = [name for name, value in expected.items() if getattr(checkpoint, name) != value]
+    if mismatched:
+        raise ValueError(f"检查点与请求参数不一致，无法续传: {', '.join(mismatched)}")
+    actual_size = path.stat().st_size if path.exists() else 0
+    if actual_size < checkpoint.bytes_written:
+        logger.warning(
+            f"文件大小 {actual_size} 字节小于检查点记录的 {checkpoint.bytes_written} 字节，从头开始生成: {path}"
+        )
+        return None
+    return checkpoint
+
+
+def _try_preallocate(file: BinaryIO, file_size_bytes: int) -> bool:
+    """
+    尝试通过 posix_fallocate 真实预留磁盘块
+
+    :param file: 已打开的文件对象
+    :param file_size_bytes: 文件大小（字节）
+    :return: 是否预分配成功；平台或文件系统不支持时返回 False
+    """
+    if not hasattr(os, 'posix_fallocate'):
+        logger.warning("当前平台不支持 posix_fallocate，回退为 stream 模式")
+        return False
+    try:
+        os.posix_fallocate(file.fileno(), 0, file_size_bytes)
+        return True
+    except OSError as e:
+        if e.errno not in _FALLOCATE_UNSUPPORTED_ERRNOS:
+            raise
+        logger.warning(f"文件系统不支持预分配，回退为 stream 模式: {e}")
+        return False
+
+
+def generate_file(
+    file_path: str,
+    file_size_bytes: int,
+    progress_callback: Optional[Callable[[int], int]] = None,
+    allocation: str = DEFAULT_ALLOCATION_MODE,
+    pattern: str = DEFAULT_CONTENT_PATTERN,
+    seed: Optional[int] = None,
+    compression_ratio: float = DEFAULT_COMPRESSION_RATIO,
+    progress_events: Optional[Callable[[ProgressEvent], None]] = None,
+    control: Optional[JobControl] = None,
+    resume: bool = False,
+    io_mode: str = DEFAULT_IO_MODE,
+    durability: str = DEFAULT_DURABILITY,
+    sync_interval: int = DEFAULT_SYNC_INTERVAL,
+    chunk_size: Optional[int] = None,
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+) -> GenerationStats:
     """
     生成指定大小的文件
     
-    使用单线程顺序写入，因为文件I/O通常是磁盘带宽限制的，多线程并不会提升性能。
+    默认使用单线程顺序写入，因为文件I/O通常是磁盘带宽限制的，多线程并不会提升性能。
+    每个任务只分配一个按页对齐的缓冲区，通过 memoryview 切片写入，内存占用与文件大小无关。
+    
+    条带化的 NVMe 或并行文件系统上单个写入流跑不满带宽，此时把 queue_depth 设为大于 1：
+    文件按块划分为 queue_depth 个连续区域，由多个线程共享内容缓冲区用 os.pwrite 并行写入，
+    进度汇总后上报（见 region_writer）。并行写入不写检查点，不能与 resume 同时使用。
+    
+    分配模式：
+    - stream: 顺序写入零数据（默认）
+    - preallocate: 使用 posix_fallocate 真实预留磁盘块，不支持时自动回退为 stream
+    - sparse: 仅截断到目标大小，生成稀疏文件，不占用实际磁盘块
+    
+    内容模式：
+    - zeros: 全零（默认，可能被压缩或去重的文件系统“吃掉”）
+    - random: 快速伪随机数据，不可压缩
+    - compressible: 按目标压缩比混合随机数据与零
+    - unique: 每个 4KB 块唯一，抗去重且不可压缩
+    
+    preallocate 模式搭配非零内容模式时，先预留磁盘块再写入内容。
+    
+    I/O 模式：
+    - buffered: 经过页缓存写入（默认）
+    - direct: O_DIRECT 绕过页缓存，不挤占其他服务的缓存；文件系统不支持时回退为 dropbehind
+    - dropbehind: 经过页缓存写入，定期提交回写并丢弃已落盘的缓存，脏页占用有上限
+    
+    持久化策略（fdatasync）：
+    - none: 不主动落盘，返回时数据可能只在页缓存中
+    - end: 写完后落盘一次（默认）
+    - interval: 每写入 sync_interval 字节落盘一次
+    - chunk: 每个块写入后落盘
+    统计信息分别记录写入耗时与落盘耗时，用于区分页缓存速度和设备持续带宽。
+    
+    块大小：未指定时使用块大小调优器为目标设备缓存的结果（见 chunk_tuner），
+    设备未调优过时使用 CHUNK_SIZE；这里不会隐式触发探测。
+    
+    进度按 PROGRESS_MIN_INTERVAL 和 PROGRESS_MIN_BYTES 限流上报，结束时总会上报一次 100%。
+    传入 control 时每个块之前检查暂停与取消，取消后抛出 JobCancelled：resume 为 True 且写检查点时
+    落盘并更新检查点后保留部分文件，之后可以再次 resume；其余情况删除已写入的部分文件与检查点。
+    
+    文件大于 CHECKPOINT_INTERVAL 时，每写入 CHECKPOINT_INTERVAL 字节先落盘再更新旁路检查点文件
+    （文件名加 .ftckpt 后缀），成功后删除。resume 为 True 时校验检查点中的大小、内容模式、种子和块大小，
+    从最后一个完整写入的块之后继续追加，进程崩溃最多损失一个检查点间隔的数据。
     
     :param file_path: 文件路径
     :param file_size_bytes: 文件大小（字节）
     :param progress_callback: 进度回调函数，参数为当前进度(0-100)，返回更新后的进度
+    :param allocation: 分配模式（stream, preallocate, sparse）
+    :param pattern: 内容模式（zeros, random, compressible, unique）
+    :param seed: 内容模式的随机种子，为 None 时随机选择
+    :param compression_ratio: compressible 模式的目标压缩比
+    :param progress_events: 进度事件回调，事件包含已写入字节数、瞬时 MB/s 和预计剩余时间
+    :param control: 任务控制标志（取消、暂停、恢复）
+    :param resume: 是否从检查点继续写入
+    :param io_mode: I/O 模式（buffered, direct, dropbehind）
+    :param durability: 持久化策略（none, end, interval, chunk）
+    :param sync_interval: interval 策略的落盘间隔（字节）
+    :param chunk_size: 写入块大小（字节），为 None 时使用调优结果或 CHUNK_SIZE；续传时使用检查点中的块大小
+    :param queue_depth: 队列深度（同时执行 pwrite 的线程数，1 为单线程顺序写入）
+    :return: 生成统计信息（实际分配模式、内容模式、写入字节数、缓冲区分配次数、内存峰值等）
     """
+    if allocation not in ALLOCATION_MODES:
+        raise ValueError(f"不支持的分配模式: {allocation}。支持的模式: {', '.join(ALLOCATION_MODES)}")
+    if allocation == 'sparse' and pattern != DEFAULT_CONTENT_PATTERN:
+        raise ValueError(f"sparse 模式不写入数据，不能使用内容模式: {pattern}")
+    if io_mode not in IO_MODES:
+        raise ValueError(f"不支持的 I/O 模式: {io_mode}。支持的模式: {', '.join(IO_MODES)}")
+    if durability not in DURABILITY_MODES:
+        raise ValueError(f"不支持的持久化策略: {durability}。支持的策略: {', '.join(DURABILITY_MODES)}")
+    if durability == 'interval' and sync_interval <= 0:
+        raise ValueError("落盘间隔必须大于0")
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError("块大小必须大于0")
+    if queue_depth <= 0 or queue_depth > MAX_QUEUE_DEPTH:
+        raise ValueError(f"队列深度必须在 1 到 {MAX_QUEUE_DEPTH} 之间")
+    if queue_depth > 1 and resume:
+        raise ValueError("并行写入不写检查点，不能与断点续传同时使用")
+    
     path = Path(file_path)
-    logger.info(f"开始生成文件: {path}, 大小: {file_size_bytes} 字节")
+    checkpoint = None
+    if resume and allocation != 'sparse':
+        checkpoint = _load_resume_checkpoint(path, file_size_bytes, pattern, seed, compression_ratio, chunk_size)
+        if checkpoint is not None:
+            seed = checkpoint.seed
+            chunk_size = checkpoint.chunk_size
+    if chunk_size is None:
+        chunk_size = chunk_size_tuner.chunk_size_for(str(path), CHUNK_SIZE)
+    resume_from = checkpoint.bytes_written if checkpoint else 0
+    content = create_pattern(pattern, seed, compression_ratio)
+    if (
+        checkpoint is None
+        and allocation != 'sparse'
+        and queue_depth == 1
+        and file_size_bytes > CHECKPOINT_INTERVAL
+    ):
+        checkpoint = GenerationCheckpoint(
+            file_size=file_size_bytes,
+            pattern=pattern,
+            seed=content.seed,
+            chunk_size=chunk_size,
+            compression_ratio=compression_ratio,
+        )
+    
+    logger.info(
+        f"开始生成文件: {path}, 大小: {file_size_bytes} 字节, 分配模式: {allocation}, "
+        f"内容模式: {pattern}, 种子: {content.seed}, I/O 模式: {io_mode}, 块大小: {chunk_size} 字节, "
+        f"队列深度: {queue_depth}, 续传起点: {resume_from} 字节"
+    )
     
     # 确保父目录存在
     path.parent.mkdir(parents=True, exist_ok=True)
     
-    # 计算块数
-    total_chunks = file_size_bytes // CHUNK_SIZE
-    last_chunk_size = file_size_bytes % CHUNK_SIZE
-    total_size = file_size_bytes
-    
-    written = 0
+    stats = GenerationStats(
+        file_path=str(path),
+        chunk_size=chunk_size,
+        requested_allocation=allocation,
+        pattern=pattern,
+        pattern_seed=content.seed,
+        bytes_written=resume_from,
+        chunks_written=resume_from // chunk_size,
+        resumed_from=resume_from,
+        requested_io_mode=io_mode,
+        durability=durability,
+        queue_depth=queue_depth,
+    )
+    stats.rss_before = stats.peak_rss = psutil.Process().memory_info().rss
+    listener = percent_listener(progress_callback, progress_events)
+    progress = ProgressThrottle(file_size_bytes, listener, initial_bytes=resume_from) if listener else None
+    start = time.perf_counter()
     
-    # 使用二进制追加模式创建文件
-    with open(path, 'wb') as file:
-        # 写入完整块
-        for i in range(total_chunks):
-            file.write(b'\0' * CHUNK_SIZE)
-            written += CHUNK_SIZE
-            
-            # 更新进度
-            if progress_callback:
-                progress = int((written / total_size) * 100)
-                progress_callback(progress)
-        
-        # 写入最后一个不完整的块
-        if last_chunk_size > 0:
-            file.write(b'\0' * last_chunk_size)
-            written += last_chunk_size
+    # 使用无缓冲二进制模式创建文件，memoryview 直接写入，不经过额外拷贝；续传时截断到检查点后追加
+    # 块大小不按 DIRECT_IO_ALIGNMENT 对齐时只有第一个块能用 O_DIRECT 写入，直接按 dropbehind 打开并如实记录
+    open_mode = io_mode
+    if io_mode == 'direct' and chunk_size % DIRECT_IO_ALIGNMENT:
+        logger.warning(f"块大小 {chunk_size} 字节不是 {DIRECT_IO_ALIGNMENT} 的整数倍，回退为 dropbehind 模式")
+        open_mode = 'dropbehind'
+    try:
+        file, stats.io_mode = open_for_write(path, truncate=not resume_from, io_mode=open_mode)
+        with file:
+            if resume_from:
+                file.truncate(resume_from)
+                file.seek(resume_from)
+            writer = ChunkWriter(
+                file, stats.io_mode, offset=resume_from, durability=durability, sync_interval=sync_interval
+            )
+            if allocation == 'sparse':
+                file.truncate(file_size_bytes)
+                stats.bytes_written = file_size_bytes
+            elif allocation == 'preallocate' and file_size_bytes > 0 and _try_preallocate(file, file_size_bytes):
+                if pattern == DEFAULT_CONTENT_PATTERN:
+                    stats.bytes_written = file_size_bytes
+                else:
+                    _write_content(
+                        writer, file_size_bytes, stats, content, progress, control, checkpoint, chunk_size,
+                        queue_depth, resume,
+                    )
+            else:
+                allocation = 'stream'
+                _write_content(
+                    writer, file_size_bytes, stats, content, progress, control, checkpoint, chunk_size, queue_depth,
+                    resume,
+                )
+            writer.finish()
+            stats.io_mode = writer.io_mode
+            stats.write_time, stats.flush_time, stats.flushes = writer.write_time, writer.flush_time, writer.flushes
+    except JobCancelled:
+        disk_snapshot_cache.invalidate_path(str(path))
+        if resume and GenerationCheckpoint.path_for(str(path)).exists():
+            logger.info(f"任务已取消，保留部分文件与检查点以便续传: {path}, 已写入 {stats.bytes_written} 字节")
+            raise
+        GenerationCheckpoint.remove(str(path))
+        path.unlink(missing_ok=True)
+        logger.info(f"任务已取消，已删除部分文件: {path}, 已写入 {stats.bytes_written} 字节")
+        raise
+    GenerationCheckpoint.remove(str(path))
+    stats.allocation_mode = allocation
+    disk_snapshot_cache.invalidate_path(str(path))
+    generation_metrics.file_generated()
     
     # 确保最终进度为100%
-    if progress_callback:
-        progress_callback(100)
+    if progress:
+        progress.finish(stats.bytes_written)
     
-    logger.info(f"文件生成完成: {path}, 实际大小: {written} 字节")
+    stats.elapsed = time.perf_counter() - start
+    logger.info(
+        f"文件生成完成: {path}, 实际大小: {stats.bytes_written} 字节, 实际分配模式: {stats.allocation_mode}, "
+        f"实际 I/O 模式: {stats.io_mode}, 写入耗时 {stats.write_time:.2f} 秒, "
+        f"落盘耗时 {stats.flush_time:.2f} 秒（{stats.flushes} 次）, "
+        f"缓冲区分配 {stats.buffer_allocations} 次, 内存峰值 {stats.peak_rss} 字节"
+    )
+    return stats
 
 
-def generate_file_with_progress(
+def run_generation(
     file_path: str, 
     file_size: int, 
     unit: str, 
-    progress_callback: Optional[Callable[[int], int]] = None
-) -> str:
+    progress_callback: Optional[Callable[[int], int]] = None,
+    allocation: str = DEFAULT_ALLOCATION_MODE,
+    pattern: str = DEFAULT_CONTENT_PATTERN,
+    progress_events: Optional[Callable[[ProgressEvent], None]] = None,
+    control: Optional[JobControl] = None,
+    resume: bool = False,
+    io_mode: str = DEFAULT_IO_MODE,
+    durability: str = DEFAULT_DURABILITY,
+    sync_interval: int = DEFAULT_SYNC_INTERVAL,
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+) -> GenerationResult:
     """
-    执行文件生成，包含单位转换和错误处理
+    执行文件生成，包含单位转换和错误处理，返回带稳定结果码的结果
     
     :param file_path: 文件路径
     :param file_size: 文件大小数值
     :param unit: 单位（KB, MB, GB, TB）
     :param progress_callback: 进度回调函数，参数为当前进度(0-100)
-    :return: 结果消息
+    :param allocation: 分配模式（stream, preallocate, sparse）
+    :param pattern: 内容模式（zeros, random, compressible, unique）
+    :param progress_events: 进度事件回调
+    :param control: 任务控制标志；任务被取消时 JobCancelled 会继续向上抛出
+    :param resume: 是否从检查点继续写入
+    :param io_mode: I/O 模式（buffered, direct, dropbehind）
+    :param durability: 持久化策略（none, end, interval, chunk）
+    :param sync_interval: interval 策略的落盘间隔（字节）
+    :param queue_depth: 队列深度（同时执行 pwrite 的线程数，1 为单线程顺序写入）
+    :return: 生成结果（code 为 RESULT_OK 或 ERROR_* 之一）
     """
     try:
         # 验证单位
         if unit not in UNIT_MAPPING:
             raise ValueError(f"不支持的单位: {unit}。支持的单位: {', '.join(UNIT_MAPPING.keys())}")
         
+        # 验证分配模式
+        if allocation not in ALLOCATION_MODES:
+            raise ValueError(f"不支持的分配模式: {allocation}。支持的模式: {', '.join(ALLOCATION_MODES)}")
+        
+        # 验证内容模式
+        if pattern not in CONTENT_PATTERNS:
+            raise ValueError(f"不支持的内容模式: {pattern}。支持的模式: {', '.join(CONTENT_PATTERNS)}")
+        
         # 验证文件大小
         if file_size <= 0:
             raise ValueError("文件大小必须大于0")
@@ -80,58 +514,111 @@ def generate_file_with_progress(
         unit_multiplier = UNIT_MAPPING[unit]
         file_size_bytes = file_size * unit_multiplier
         
-        # 检查磁盘空间（粗略检查，避免创建超大文件导致系统问题）
+        # 检查目标路径所在挂载点的可用空间（一次 statvfs，不枚举全部分区）；续传时只需要剩余部分的空间
+        existing = os.path.getsize(file_path) if resume and os.path.isfile(file_path) else 0
         try:
-            from filetools.models.disk_monitor import get_disk_usage_info
-            disk_usages = get_disk_usage_info()
-            if disk_usages:
-                # 检查第一个磁盘的可用空间
-                first_disk = disk_usages[0]
-                available = first_disk.total - first_disk.used
-                if file_size_bytes > available:
-                    error_msg = f"文件生成失败：磁盘空间不足。需要 {file_size_bytes / (1024**3):.2f} GB，可用 {available / (1024**3):.2f} GB"
-                    logger.error(error_msg)
-                    return error_msg
+            space = check_free_space(file_path, max(0, file_size_bytes - existing), allocation)
+            if not space.sufficient:
+                error_msg = (
+                    f"文件生成失败：磁盘空间不足。挂载点 {space.mountpoint} 需要 {space.required / (1024**3):.2f} GB，"
+                    f"可用 {space.available / (1024**3):.2f} GB（文件系统预留 {space.reserved / (1024**3):.2f} GB）"
+                )
+                logger.error(error_msg)
+                return GenerationResult(ERROR_INSUFFICIENT_SPACE, error_msg)
         except (PermissionError, OSError) as e:
             # 如果无法检查磁盘空间，继续执行（可能是权限问题）
             logger.warning(f"无法检查磁盘空间，继续执行: {e}")
-        except Exception as e:
-            # 其他未知错误，记录但继续执行
-            logger.warning(f"检查磁盘空间时发生未知错误，继续执行: {e}")
         
         # 执行文件生成
-        generate_file(file_path, file_size_bytes, progress_callback)
+        stats = generate_file(
+            file_path, file_size_bytes, progress_callback,
+            allocation=allocation, pattern=pattern, progress_events=progress_events, control=control,
+            resume=resume, io_mode=io_mode, durability=durability, sync_interval=sync_interval,
+            queue_depth=queue_depth,
+        )
         
         # 验证文件是否成功创建
         path = Path(file_path)
         if not path.exists():
             error_msg = "文件生成失败：文件创建后未找到"
             logger.error(error_msg)
-            return error_msg
+            return GenerationResult(ERROR_VERIFICATION_FAILED, error_msg, stats)
         
         actual_size = path.stat().st_size
         if actual_size != file_size_bytes:
             error_msg = f"文件生成失败：文件大小不匹配。期望 {file_size_bytes} 字节，实际 {actual_size} 字节"
             logger.error(error_msg)
-            return error_msg
+            return GenerationResult(ERROR_VERIFICATION_FAILED, error_msg, stats)
         
-        success_msg = "文件生成成功！"
+        success_msg = f"文件生成成功！（分配模式: {stats.allocation_mode}，内容模式: {stats.pattern}）"
+        if stats.queue_depth > 1:
+            success_msg += f"\n按区域并行写入（队列深度 {stats.queue_depth}）"
+        if stats.resumed_from:
+            success_msg += f"\n已从 {stats.resumed_from} 字节处续传"
+        if stats.allocation_mode != stats.requested_allocation:
+            success_msg += f"\n文件系统不支持 {stats.requested_allocation}，已自动回退为 {stats.allocation_mode}"
+        if stats.flushes and stats.write_time > 0:
+            success_msg += (
+                f"\n写入 {stats.write_mbps:.1f} MB/s（页缓存），落盘后持续带宽 {stats.sustained_mbps:.1f} MB/s"
+            )
+        if stats.io_mode != stats.requested_io_mode:
+            success_msg += f"\n文件系统不支持 {stats.requested_io_mode} I/O，已自动回退为 {stats.io_mode}"
         logger.info(f"{success_msg} 文件路径: {file_path}, 大小: {actual_size} 字节")
-        return success_msg
+        return GenerationResult(RESULT_OK, success_msg, stats)
+    except JobCancelled:
+        raise
     except ValueError as e:
         error_msg = f"文件生成失败：{str(e)}"
         logger.error(error_msg)
-        return error_msg
+        return GenerationResult(ERROR_INVALID_ARGUMENT, error_msg)
     except PermissionError as e:
         error_msg = f"文件生成失败：没有权限写入文件或目录: {e}"
         logger.error(error_msg)
-        return error_msg
+        return GenerationResult(ERROR_PERMISSION_DENIED, error_msg)
     except OSError as e:
         error_msg = f"文件生成失败：系统错误 - {str(e)}"
         logger.error(error_msg)
-        return error_msg
+        return GenerationResult(ERROR_OS_ERROR, error_msg)
     except Exception as e:
         error_msg = f"文件生成失败：未知错误 - {str(e)}"
         logger.error(error_msg, exc_info=True)
-        return error_msg
+        return GenerationResult(ERROR_INTERNAL, error_msg)
+
+
+def generate_file_with_progress(
+    file_path: str, 
+    file_size: int, 
+    unit: str, 
+    progress_callback: Optional[Callable[[int], int]] = None,
+    allocation: str = DEFAULT_ALLOCATION_MODE,
+    pattern: str = DEFAULT_CONTENT_PATTERN,
+    progress_events: Optional[Callable[[ProgressEvent], None]] = None,
+    control: Optional[JobControl] = None,
+    resume: bool = False,
+    io_mode: str = DEFAULT_IO_MODE,
+    durability: str = DEFAULT_DURABILITY,
+    sync_interval: int = DEFAULT_SYNC_INTERVAL,
+    queue_depth: int = DEFAULT_QUEUE_DEPTH,
+) -> str:
+    """
+    执行文件生成，包含单位转换和错误处理
 
+    :param file_path: 文件路径
+    :param file_size: 文件大小数值
+    :param unit: 单位（KB, MB, GB, TB）
+    :param progress_callback: 进度回调函数，参数为当前进度(0-100)
+    :param allocation: 分配模式（stream, preallocate, sparse）
+    :param pattern: 内容模式（zeros, random, compressible, unique）
+    :param progress_events: 进度事件回调
+    :param control: 任务控制标志；任务被取消时 JobCancelled 会继续向上抛出
+    :param resume: 是否从检查点继续写入
+    :param io_mode: I/O 模式（buffered, direct, dropbehind）
+    :param durability: 持久化策略（none, end, interval, chunk）
+    :param sync_interval: interval 策略的落盘间隔（字节）
+    :param queue_depth: 队列深度（同时执行 pwrite 的线程数，1 为单线程顺序写入）
+    :return: 结果消息
+    """
+    return run_generation(
+        file_path, file_size, unit, progress_callback, allocation, pattern,
+        progress_events, control, resume, io_mode, durability, sync_interval, queue_depth,
+    ).message
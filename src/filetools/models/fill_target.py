@@ -0,0 +1,296 @@
+"""填充磁盘到目标使用率业务逻辑"""
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional, Tuple
+
+import psutil
+
+from filetools.config.constants import (
+    CHUNK_SIZE,
+    DEFAULT_CONTENT_PATTERN,
+    DEFAULT_FILL_MAX_FILE_SIZE,
+    FILL_DIR_NAME,
+    FILL_MIN_EFFECTIVE_RATIO,
+    FILL_RECHECK_BYTES,
+)
+from filetools.config.logger import logger
+from filetools.models.content_pattern import ContentPattern, create_pattern
+from filetools.models.disk_snapshot import disk_snapshot_cache
+from filetools.models.job_control import JobCancelled, JobControl
+from filetools.models.progress import ProgressEvent, ProgressThrottle, percent_listener
+from filetools.models.write_buffer import WriteBuffer, write_fully
+
+
+@dataclass
+class FillResult:
+    """
+    填充结果
+
+    :param mountpoint: 挂载点
+    :param target: 目标描述（如 "95.0%" 或 "剩余 500 MB"）
+    :param bytes_needed: 开始时计算出的需要写入的字节数
+    :param bytes_written: 实际写入字节数
+    :param files: 生成的填充文件路径
+    :param final_percent: 结束时的使用率
+    :param final_free: 结束时的剩余空间（字节）
+    :param elapsed: 耗时（秒）
+    :param warning: 提前停止的原因（正常完成时为 None）
+    """
+    mountpoint: str
+    target: str
+    bytes_needed: int = 0
+    bytes_written: int = 0
+    files: List[str] = field(default_factory=list)
+    final_percent: float = 0.0
+    final_free: int = 0
+    elapsed: float = 0.0
+    warning: Optional[str] = None
+
+
+def compute_fill_bytes(
+    mountpoint: str,
+    target_percent: Optional[float] = None,
+    target_free_bytes: Optional[int] = None,
+) -> int:
+    """
+    根据当前磁盘使用情况计算达到目标还需写入的字节数
+
+    使用率与 psutil 口径一致：used / (used + free)，不计入文件系统为 root 预留的空间。
+
+    :param mountpoint: 挂载点
+    :param target_percent: 目标使用率（0-100）
+    :param target_free_bytes: 目标剩余空间（字节）
+    :return: 还需写入的字节数（已达到目标时为 0）
+    """
+    usage = psutil.disk_usage(mountpoint)
+    if target_percent is not None:
+        needed = int((usage.used + usage.free) * target_percent / 100) - usage.used
+    else:
+        needed = usage.free - target_free_bytes
+    return max(0, needed)
+
+
+def _validate_target(
+    mountpoint: str,
+    target_percent: Optional[float],
+    target_free_bytes: Optional[int],
+    max_file_size: int,
+) -> None:
+    """
+    验证填充参数
+
+    :param mountpoint: 挂载点
+    :param target_percent: 目标使用率
+    :param target_free_bytes: 目标剩余空间
+    :param max_file_size: 单个填充文件最大大小
+    """
+    if (target_percent is None) == (target_free_bytes is None):
+        raise ValueError("必须且只能指定目标使用率或目标剩余空间中的一个")
+    if target_percent is not None and not 0 < target_percent <= 100:
+        raise ValueError(f"目标使用率必须在 0-100 之间: {target_percent}")
+    if target_free_bytes is not None and target_free_bytes < 0:
+        raise ValueError(f"目标剩余空间不能为负数: {target_free_bytes}")
+    if max_file_size <= 0:
+        raise ValueError("单个文件最大大小必须大于0")
+    if not os.path.isdir(mountpoint):
+        raise ValueError(f"挂载点不存在: {mountpoint}")
+
+
+class _Filler:
+    """
+    填充执行器：在多个填充文件中持续写入，并定期重新检查磁盘使用情况
+
+    :param mountpoint: 挂载点
+    :param directory: 填充文件目录
+    :param measure: 计算剩余字节数的函数
+    :param max_file_size: 单个填充文件最大大小
+    :param result: 填充结果（原地更新）
+    :param progress: 进度上报器
+    :param control: 任务控制标志，每个块之前检查一次暂停与取消
+    """
+
+    def __init__(
+        self,
+        mountpoint: str,
+        directory: Path,
+        measure: Callable[[], int],
+        max_file_size: int,
+        result: FillResult,
+        progress: Optional[ProgressThrottle] = None,
+        control: Optional[JobControl] = None,
+    ):
+        self.mountpoint = mountpoint
+        self.directory = directory
+        self.measure = measure
+        self.max_file_size = max_file_size
+        self.result = result
+        self.progress = progress
+        self.control = control
+        self.chunk_size = CHUNK_SIZE
+        self.chunk_index = 0
+        self.file_index = 0
+        self.since_check = 0
+        self.used_at_check = psutil.disk_usage(mountpoint).used
+
+    def _recheck(self, file: BinaryIO) -> int:
+        """
+        落盘后重新测量剩余字节数；写入后已用空间几乎没有增长时说明数据被压缩或去重，停止填充
+
+        :param file: 当前填充文件
+        :return: 剩余字节数
+        """
+        os.fsync(file.fileno())
+        used = psutil.disk_usage(self.mountpoint).used
+        effective = used - self.used_at_check
+        if self.since_check >= CHUNK_SIZE and effective < self.since_check * FILL_MIN_EFFECTIVE_RATIO:
+            self.result.warning = (
+                f"写入 {self.since_check} 字节后已用空间仅增长 {max(0, effective)} 字节，"
+                "文件系统可能启用了压缩或去重，请使用 random 或 unique 内容模式"
+            )
+            logger.warning(self.result.warning)
+            return 0
+        self.used_at_check = used
+        self.since_check = 0
+        return self.measure()
+
+    def _fill_file(self, file: BinaryIO, buffer: WriteBuffer, content: ContentPattern, remaining: int) -> int:
+        """
+        向单个填充文件写入数据，直到达到单文件上限或目标
+
+        每块长度不超过 prepare 时的块大小：重新检查后剩余字节数可能比开始时更多（其他进程释放了空间），
+        块长度仍受缓冲区大小限制。
+
+        :param file: 填充文件
+        :param buffer: 已 prepare 的写缓冲区
+        :param content: 内容模式
+        :param remaining: 剩余字节数
+        :return: 剩余字节数
+        """
+        file_written = 0
+        while remaining > 0 and file_written < self.max_file_size:
+            if self.control:
+                self.control.checkpoint()
+            length = min(self.chunk_size, remaining, self.max_file_size - file_written)
+            write_fully(file, content.chunk_view(buffer, self.chunk_index, length))
+            self.chunk_index += 1
+            file_written += length
+            self.since_check += length
+            self.result.bytes_written += length
+            remaining -= length
+            if self.since_check >= FILL_RECHECK_BYTES or remaining <= 0:
+                remaining = self._recheck(file)
+                if self.progress:
+                    self.progress.total_bytes = self.result.bytes_written + remaining
+            if self.progress:
+                self.progress.update(self.result.bytes_written)
+        return remaining
+
+    def _create_file(self) -> Tuple[Path, BinaryIO]:
+        """
+        创建下一个填充文件：以 O_EXCL 创建，序号已被占用（之前的填充留下的文件）时跳到下一个序号
+
+        不覆盖已有的填充文件：截断它们会释放正在填充的空间，并悄悄删除之前写入的数据。
+
+        :return: (文件路径, 以无缓冲方式打开的文件)
+        """
+        while True:
+            path = self.directory / f"fill_{self.file_index:04d}.bin"
+            self.file_index += 1
+            try:
+                fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+            except FileExistsError:
+                continue
+            return path, os.fdopen(fd, 'wb', buffering=0)
+
+    def run(self, content: ContentPattern) -> None:
+        """
+        执行填充
+
+        任务被取消时删除正在写入的填充文件，已写完的填充文件保留；目录中已有的填充文件不会被覆盖。
+
+        :param content: 内容模式
+        """
+        remaining = self.result.bytes_needed
+        self.chunk_size = min(CHUNK_SIZE, remaining)
+        with WriteBuffer(self.chunk_size + content.extra_capacity(self.chunk_size)) as buffer:
+            content.prepare(buffer, self.chunk_size)
+            while remaining > 0:
+                path, file = self._create_file()
+                try:
+                    with file:
+                        remaining = self._fill_file(file, buffer, content, remaining)
+                except JobCancelled:
+                    path.unlink(missing_ok=True)
+                    disk_snapshot_cache.invalidate_path(str(path))
+                    logger.info(f"填充已取消，删除正在写入的文件: {path}")
+                    raise
+                self.result.files.append(str(path))
+                disk_snapshot_cache.invalidate_path(str(path))
+                logger.info(f"填充文件完成: {path}, 累计写入 {self.result.bytes_written} 字节, 剩余 {remaining} 字节")
+
+
+def fill_to_target(
+    mountpoint: str,
+    target_percent: Optional[float] = None,
+    target_free_bytes: Optional[int] = None,
+    directory: Optional[str] = None,
+    max_file_size: int = DEFAULT_FILL_MAX_FILE_SIZE,
+    pattern: str = DEFAULT_CONTENT_PATTERN,
+    seed: Optional[int] = None,
+    progress_callback: Optional[Callable[[int], int]] = None,
+    progress_events: Optional[Callable[[ProgressEvent], None]] = None,
+    control: Optional[JobControl] = None,
+) -> FillResult:
+    """
+    持续写入填充文件，直到挂载点达到目标使用率或目标剩余空间
+
+    写入过程中每隔 FILL_RECHECK_BYTES 重新读取一次磁盘使用情况，其他进程同时写入同一磁盘时也能准确落在目标上；
+    数据量较大时分散到多个不超过 max_file_size 的文件中。
+
+    :param mountpoint: 挂载点
+    :param target_percent: 目标使用率（0-100），与 target_free_bytes 二选一
+    :param target_free_bytes: 目标剩余空间（字节），与 target_percent 二选一
+    :param directory: 填充文件目录，默认为挂载点下的 filetools_fill 目录
+    :param max_file_size: 单个填充文件最大大小（字节）
+    :param pattern: 内容模式
+    :param seed: 内容模式的随机种子
+    :param progress_callback: 进度回调函数，参数为当前进度(0-100)
+    :param progress_events: 进度事件回调（总字节数随每次重新检查更新）
+    :param control: 任务控制标志（暂停、恢复、取消），取消时抛出 JobCancelled
+    :return: 填充结果
+    :raises JobCancelled: 任务被取消（正在写入的填充文件已删除）
+    """
+    _validate_target(mountpoint, target_percent, target_free_bytes, max_file_size)
+    fill_dir = Path(directory) if directory else Path(mountpoint) / FILL_DIR_NAME
+    fill_dir.mkdir(parents=True, exist_ok=True)
+    if os.stat(fill_dir).st_dev != os.stat(mountpoint).st_dev:
+        raise ValueError(f"填充目录 {fill_dir} 不在挂载点 {mountpoint} 上")
+
+    def measure() -> int:
+        return compute_fill_bytes(mountpoint, target_percent, target_free_bytes)
+
+    target = f"{target_percent:.1f}%" if target_percent is not None else f"剩余 {target_free_bytes} 字节"
+    result = FillResult(mountpoint=mountpoint, target=target, bytes_needed=measure())
+    logger.info(f"开始填充磁盘: {mountpoint}, 目标: {target}, 需要写入 {result.bytes_needed} 字节, 目录: {fill_dir}")
+
+    listener = percent_listener(progress_callback, progress_events)
+    progress = ProgressThrottle(result.bytes_needed, listener) if listener else None
+    start = time.perf_counter()
+    if result.bytes_needed > 0:
+        _Filler(mountpoint, fill_dir, measure, max_file_size, result, progress, control).run(
+            create_pattern(pattern, seed)
+        )
+    result.elapsed = time.perf_counter() - start
+
+    usage = psutil.disk_usage(mountpoint)
+    result.final_percent, result.final_free = usage.percent, usage.free
+    if progress:
+        progress.total_bytes = result.bytes_written
+        progress.finish(result.bytes_written)
+    logger.info(
+        f"填充完成: {mountpoint}, 写入 {result.bytes_written} 字节, 文件 {len(result.files)} 个, "
+        f"当前使用率 {usage.percent:.1f}%, 剩余 {usage.free} 字节"
+    )
+    return result
@@ -0,0 +1,34 @@
+"""文件生成结果与稳定错误码"""
+from dataclasses import dataclass
+from typing import Optional
+
+from filetools.models.generation_stats import GenerationStats
+
+# 结果码：接口与脚本按结果码判断，不依赖本地化的消息文本
+RESULT_OK = "ok"
+ERROR_INVALID_ARGUMENT = "invalid_argument"
+ERROR_INSUFFICIENT_SPACE = "insufficient_space"
+ERROR_PERMISSION_DENIED = "permission_denied"
+ERROR_OS_ERROR = "os_error"
+ERROR_VERIFICATION_FAILED = "verification_failed"
+ERROR_CANCELLED = "cancelled"
+ERROR_INTERNAL = "internal_error"
+
+
+@dataclass
+class GenerationResult:
+    """
+    文件生成结果
+
+    :param code: 结果码（成功为 ok，失败为 ERROR_* 之一）
+    :param message: 面向用户的本地化消息
+    :param stats: 生成统计信息（生成失败时为 None）
+    """
+    code: str
+    message: str
+    stats: Optional[GenerationStats] = None
+
+    @property
+    def ok(self) -> bool:
+        """是否生成成功"""
+        return self.code == RESULT_OK
@@ -0,0 +1,79 @@
+"""文件生成统计数据模型"""
+from dataclasses import dataclass
+
+
+@dataclass
+class GenerationStats:
+    """
+    单次文件生成的统计信息
+
+    :param file_path: 文件路径
+    :param bytes_written: 实际写入字节数
+    :param requested_allocation: 请求的分配模式
+    :param allocation_mode: 实际执行的分配模式（不支持预分配时会回退为 stream）
+    :param pattern: 内容模式
+    :param pattern_seed: 内容模式的随机种子
+    :param chunk_size: 写入块大小（字节）
+    :param chunks_written: 写入块数
+    :param buffer_allocations: 写缓冲区分配次数
+    :param buffer_size: 写缓冲区大小（字节）
+    :param rss_before: 生成前进程常驻内存（字节）
+    :param peak_rss: 生成过程中采样到的进程常驻内存峰值（字节）
+    :param elapsed: 耗时（秒）
+    :param resumed_from: 断点续传时的起始偏移（字节），bytes_written 包含这部分
+    :param requested_io_mode: 请求的 I/O 模式
+    :param io_mode: 实际执行的 I/O 模式（文件系统不支持 O_DIRECT 时会回退）
+    :param durability: 持久化策略
+    :param write_time: write 系统调用累计耗时（秒，并行写入时为最慢区域的耗时）
+    :param flush_time: fdatasync 与回写等待累计耗时（秒，并行写入时为最慢区域的耗时）
+    :param flushes: fdatasync 次数
+    :param queue_depth: 队列深度（并行写入的区域数，1 为单线程顺序写入）
+    """
+    file_path: str
+    bytes_written: int = 0
+    requested_allocation: str = "stream"
+    allocation_mode: str = "stream"
+    pattern: str = "zeros"
+    pattern_seed: int = 0
+    chunk_size: int = 0
+    chunks_written: int = 0
+    buffer_allocations: int = 0
+    buffer_size: int = 0
+    rss_before: int = 0
+    peak_rss: int = 0
+    elapsed: float = 0.0
+    resumed_from: int = 0
+    requested_io_mode: str = "buffered"
+    io_mode: str = "buffered"
+    durability: str = "none"
+    write_time: float = 0.0
+    flush_time: float = 0.0
+    flushes: int = 0
+    queue_depth: int = 1
+
+    @property
+    def rss_growth(self) -> int:
+        """生成过程中常驻内存的增长量（字节）"""
+        return max(0, self.peak_rss - self.rss_before)
+
+    @property
+    def throughput_mbps(self) -> float:
+        """平均写入速度（MB/s，不含断点续传之前已写入的部分）"""
+        if self.elapsed <= 0:
+            return 0.0
+        return (self.bytes_written - self.resumed_from) / (1024 * 1024) / self.elapsed
+
+    @property
+    def write_mbps(self) -> float:
+        """只按 write 耗时计算的速度（MB/s，未落盘时接近页缓存速度）"""
+        if self.write_time <= 0:
+            return 0.0
+        return (self.bytes_written - self.resumed_from) / (1024 * 1024) / self.write_time
+
+    @property
+    def sustained_mbps(self) -> float:
+        """按写入加落盘耗时计算的设备持续带宽（MB/s）"""
+        busy = self.write_time + self.flush_time
+        if busy <= 0:
+            return 0.0
+        return (self.bytes_written - self.resumed_from) / (1024 * 1024) / busy
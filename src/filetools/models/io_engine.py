@@ -0,0 +1,280 @@
+"""写入 I/O 模式（页缓存 / 直接 I/O / 写后丢弃缓存）"""
+import ctypes
+import ctypes.util
+import errno
+import os
+import sys
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional, Tuple
+
+from filetools.config.constants import (
+    DEFAULT_DURABILITY,
+    DEFAULT_SYNC_INTERVAL,
+    DIRECT_IO_ALIGNMENT,
+    DROPBEHIND_INTERVAL,
+    DURABILITY_MODES,
+    IO_MODES,
+)
+from filetools.config.logger import logger
+from filetools.models.metrics import GenerationMetrics, generation_metrics
+from filetools.models.write_buffer import pwrite_fully, write_fully
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# 表示文件系统不支持 O_DIRECT 的错误码
+_DIRECT_UNSUPPORTED_ERRNOS = {errno.EINVAL, errno.EOPNOTSUPP, getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP)}
+
+# sync_file_range 标志（linux/fs.h）
+_SYNC_FILE_RANGE_WAIT_BEFORE = 1
+_SYNC_FILE_RANGE_WRITE = 2
+_SYNC_FILE_RANGE_WAIT_AFTER = 4
+
+_sync_file_range: Optional[Callable[[int, int, int, int], int]] = None
+_sync_file_range_loaded = False
+
+
+def _load_sync_file_range() -> Optional[Callable[[int, int, int, int], int]]:
+    """
+    从 libc 加载 sync_file_range（标准库未提供，仅 Linux 可用）
+
+    :return: sync_file_range 函数，不可用时为 None
+    """
+    global _sync_file_range, _sync_file_range_loaded
+    if _sync_file_range_loaded:
+        return _sync_file_range
+    _sync_file_range_loaded = True
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        func = libc.sync_file_range
+    except (OSError, AttributeError):
+        return None
+    func.argtypes = (ctypes.c_int, ctypes.c_int64, ctypes.c_int64, ctypes.c_uint)
+    func.restype = ctypes.c_int
+    _sync_file_range = func
+    return func
+
+
+def sync_range(fd: int, offset: int, length: int, wait: bool) -> None:
+    """
+    把文件指定范围的脏页提交回写；没有 sync_file_range 的平台退化为 fdatasync
+
+    :param fd: 文件描述符
+    :param offset: 起始偏移
+    :param length: 长度
+    :param wait: 是否等待回写完成
+    """
+    func = _load_sync_file_range()
+    if func is None:
+        getattr(os, 'fdatasync', os.fsync)(fd)
+        return
+    flags = _SYNC_FILE_RANGE_WRITE
+    if wait:
+        flags |= _SYNC_FILE_RANGE_WAIT_BEFORE | _SYNC_FILE_RANGE_WAIT_AFTER
+    if func(fd, offset, length, flags) != 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+
+
+def open_for_write(path: Path, truncate: bool, io_mode: str) -> Tuple[BinaryIO, str]:
+    """
+    以无缓冲模式打开目标文件
+
+    direct 模式使用 O_DIRECT 打开；平台没有 O_DIRECT 或文件系统拒绝（如 tmpfs 返回 EINVAL）时回退为 dropbehind。
+
+    :param path: 文件路径
+    :param truncate: 是否截断已有文件
+    :param io_mode: I/O 模式（buffered, direct, dropbehind）
+    :return: (文件对象, 实际 I/O 模式)
+    """
+    if io_mode not in IO_MODES:
+        raise ValueError(f"不支持的 I/O 模式: {io_mode}。支持的模式: {', '.join(IO_MODES)}")
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_TRUNC if truncate else 0) | getattr(os, 'O_BINARY', 0)
+    if io_mode == 'direct':
+        if not hasattr(os, 'O_DIRECT') or fcntl is None:
+            logger.warning("当前平台不支持 O_DIRECT，回退为 dropbehind 模式")
+            io_mode = 'dropbehind'
+        else:
+            try:
+                return open(os.open(path, flags | os.O_DIRECT, 0o666), 'wb', buffering=0), io_mode
+            except OSError as e:
+                if e.errno not in _DIRECT_UNSUPPORTED_ERRNOS:
+                    raise
+                logger.warning(f"文件系统不支持 O_DIRECT，回退为 dropbehind 模式: {e}")
+                io_mode = 'dropbehind'
+    return open(os.open(path, flags, 0o666), 'wb', buffering=0), io_mode
+
+
+def disable_direct(file: BinaryIO) -> None:
+    """
+    清除文件描述符上的 O_DIRECT 标志
+
+    :param file: 文件对象
+    """
+    fd = file.fileno()
+    fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) & ~os.O_DIRECT)
+
+
+def fdatasync(fd: int) -> None:
+    """
+    把文件数据刷到磁盘（不支持 fdatasync 的平台使用 fsync）
+
+    :param fd: 文件描述符
+    """
+    getattr(os, 'fdatasync', os.fsync)(fd)
+
+
+class ChunkWriter:
+    """
+    按 I/O 模式和持久化策略写入数据块，并分别统计写入耗时与落盘耗时
+
+    - buffered: 直接写入页缓存
+    - direct: O_DIRECT 绕过页缓存，写入长度按 DIRECT_IO_ALIGNMENT 对齐，文件末尾不足对齐的部分清除 O_DIRECT 后写入；
+      写入时被拒绝则清除 O_DIRECT 并回退为 dropbehind
+    - dropbehind: 写入页缓存，每 DROPBEHIND_INTERVAL 字节提交一次回写，并等待上一段落盘后用
+      posix_fadvise(DONTNEED) 丢弃，脏页与缓存占用都限制在两段以内
+
+    持久化策略（fdatasync）：
+    - none: 不主动落盘，数据可能只在页缓存中
+    - end: 写完后落盘一次
+    - interval: 每写入 sync_interval 字节落盘一次，写完后再落盘一次
+    - chunk: 每个块写入后都落盘
+
+    write_time 只包含 write 系统调用的耗时（页缓存速度），flush_time 包含 fdatasync 与回写等待的耗时，
+    两者之和才是设备的持续写入带宽。
+
+    :param file: 以 open_for_write 打开的文件对象
+    :param io_mode: 实际 I/O 模式
+    :param offset: 当前文件偏移（断点续传时不为 0）
+    :param interval: dropbehind 模式的回写间隔（字节）
+    :param durability: 持久化策略（none, end, interval, chunk）
+    :param sync_interval: interval 策略的落盘间隔（字节）
+    :param positional: 是否用 os.pwrite 按 offset 写入（不依赖文件偏移，多个写入器可以共享同一个文件写不同区域）
+    :param metrics: 记录块写入与落盘耗时的指标（为 None 时不记录，如块大小探测写入）
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        io_mode: str,
+        offset: int = 0,
+        interval: int = DROPBEHIND_INTERVAL,
+        durability: str = DEFAULT_DURABILITY,
+        sync_interval: int = DEFAULT_SYNC_INTERVAL,
+        positional: bool = False,
+        metrics: Optional[GenerationMetrics] = generation_metrics,
+    ):
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"不支持的持久化策略: {durability}。支持的策略: {', '.join(DURABILITY_MODES)}")
+        if durability == 'interval' and sync_interval <= 0:
+            raise ValueError("落盘间隔必须大于0")
+        self.file = file
+        self.io_mode = io_mode
+        self.offset = offset
+        self.interval = interval
+        self.durability = durability
+        self.sync_interval = sync_interval
+        self.positional = positional
+        self.metrics = metrics
+        self.write_time = 0.0
+        self.flush_time = 0.0
+        self.flushes = 0
+        self._direct = io_mode == 'direct'
+        self._window_start = offset
+        self._previous_start: Optional[int] = None
+        self._synced_offset = offset
+
+    def write(self, view: memoryview) -> None:
+        """
+        写入一个数据块
+
+        :param view: 数据视图
+        """
+        start = time.perf_counter()
+        if self._direct:
+            self._write_direct(view)
+        else:
+            self._write_at(view, self.offset)
+        elapsed = time.perf_counter() - start
+        self.write_time += elapsed
+        if self.metrics is not None:
+            self.metrics.observe_write(len(view), elapsed)
+        self.offset += len(view)
+        if self.io_mode == 'dropbehind' and self.offset - self._window_start >= self.interval:
+            start = time.perf_counter()
+            self._drop_behind()
+            self.flush_time += time.perf_counter() - start
+        if self.durability == 'chunk' or (
+            self.durability == 'interval' and self.offset - self._synced_offset >= self.sync_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """fdatasync 落盘，并计入落盘耗时"""
+        start = time.perf_counter()
+        fdatasync(self.file.fileno())
+        elapsed = time.perf_counter() - start
+        self.flush_time += elapsed
+        if self.metrics is not None:
+            self.metrics.observe_flush(elapsed)
+        self.flushes += 1
+        self._synced_offset = self.offset
+
+    def _write_at(self, view: memoryview, offset: int) -> None:
+        """在 offset 处写入（positional 模式用 pwrite，否则按文件偏移顺序写入）"""
+        if self.positional:
+            pwrite_fully(self.file.fileno(), view, offset)
+        else:
+            write_fully(self.file, view)
+
+    def _write_direct(self, view: memoryview) -> None:
+        """对齐部分用 O_DIRECT 写入，剩余的尾部清除 O_DIRECT 后写入"""
+        aligned = len(view) - len(view) % DIRECT_IO_ALIGNMENT
+        if aligned:
+            try:
+                self._write_at(view[:aligned], self.offset)
+            except OSError as e:
+                if e.errno not in _DIRECT_UNSUPPORTED_ERRNOS:
+                    raise
+                logger.warning(f"O_DIRECT 写入被拒绝，回退为 dropbehind 模式: {e}")
+                if not self.positional:
+                    self.file.seek(self.offset)
+                disable_direct(self.file)
+                self._direct = False
+                self.io_mode = 'dropbehind'
+                self._write_at(view, self.offset)
+                return
+        if aligned < len(view):
+            # 只有文件最后一个块可能不对齐，之后不再写入
+            disable_direct(self.file)
+            self._direct = False
+            self._write_at(view[aligned:], self.offset + aligned)
+
+    def _drop_behind(self) -> None:
+        """提交当前窗口的回写，等待上一个窗口落盘后把它移出页缓存"""
+        fd = self.file.fileno()
+        sync_range(fd, self._window_start, self.offset - self._window_start, wait=False)
+        if self._previous_start is not None:
+            length = self._window_start - self._previous_start
+            sync_range(fd, self._previous_start, length, wait=True)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, self._previous_start, length, os.POSIX_FADV_DONTNEED)
+        self._previous_start, self._window_start = self._window_start, self.offset
+
+    def finish(self) -> None:
+        """写入结束：丢弃剩余窗口的页缓存（dropbehind 模式），并按持久化策略做最后一次落盘"""
+        start = self._previous_start if self._previous_start is not None else self._window_start
+        if self.io_mode == 'dropbehind' and self.offset > start:
+            begin = time.perf_counter()
+            fd = self.file.fileno()
+            sync_range(fd, start, self.offset - start, wait=True)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, start, self.offset - start, os.POSIX_FADV_DONTNEED)
+            self.flush_time += time.perf_counter() - begin
+        if self.durability != 'none' and (self.flushes == 0 or self._synced_offset != self.offset):
+            self.flush()
@@ -0,0 +1,55 @@
+"""生成任务的取消与暂停控制"""
+import threading
+
+
+class JobCancelled(Exception):
+    """任务已被取消"""
+
+
+class JobControl:
+    """
+    任务控制标志
+
+    写入循环在每个块之间调用 checkpoint()：未暂停也未取消时只检查两个 Event，开销可忽略；
+    暂停时阻塞直到恢复或取消，取消时抛出 JobCancelled。
+    """
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._resumed = threading.Event()
+        self._resumed.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已请求取消"""
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self) -> bool:
+        """是否处于暂停状态"""
+        return not self._resumed.is_set()
+
+    def cancel(self) -> None:
+        """请求取消（暂停中的任务也会立即醒来并退出）"""
+        self._cancelled.set()
+        self._resumed.set()
+
+    def pause(self) -> None:
+        """请求暂停"""
+        if not self.cancelled:
+            self._resumed.clear()
+
+    def resume(self) -> None:
+        """恢复执行"""
+        self._resumed.set()
+
+    def checkpoint(self) -> None:
+        """
+        在块之间调用：暂停时等待恢复，已取消时抛出 JobCancelled
+
+        :raises JobCancelled: 任务已被取消
+        """
+        if not self._resumed.is_set():
+            self._resumed.wait()
+        if self._cancelled.is_set():
+            raise JobCancelled("任务已取消")
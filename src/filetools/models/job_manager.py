@@ -0,0 +1,516 @@
+"""文件生成任务队列"""
+import errno
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from filetools.config.constants import (
+    DEFAULT_ALLOCATION_MODE,
+    DEFAULT_CONTENT_PATTERN,
+    DEFAULT_DURABILITY,
+    DEFAULT_IO_MODE,
+    DEFAULT_JOB_WORKERS,
+    DEFAULT_QUEUE_DEPTH,
+    DEFAULT_SYNC_INTERVAL,
+    DEFAULT_TREE_DEPTH,
+    DEFAULT_TREE_FANOUT,
+    JOB_HISTORY_LIMIT,
+    JOB_QUEUE_LIMIT,
+)
+from filetools.config.logger import logger
+from filetools.models.checkpoint import GenerationCheckpoint
+from filetools.models.file_generator import run_generation
+from filetools.models.fill_target import fill_to_target
+from filetools.models.generation_result import (
+    ERROR_CANCELLED,
+    ERROR_INSUFFICIENT_SPACE,
+    ERROR_INTERNAL,
+    ERROR_INVALID_ARGUMENT,
+    ERROR_OS_ERROR,
+    RESULT_OK,
+)
+from filetools.models.job_control import JobCancelled, JobControl
+from filetools.models.progress import ProgressEvent
+from filetools.models.tree_generator import format_tree_result, generate_tree
+
+# 任务状态
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_PAUSED = "paused"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+# 已结束的任务状态
+FINISHED_STATES = (JOB_COMPLETED, JOB_FAILED, JOB_CANCELLED)
+
+# 任务类型
+JOB_KIND_GENERATE = "generate"
+JOB_KIND_FILL = "fill"
+JOB_KIND_TREE = "tree"
+
+# 任务操作的错误码
+ERROR_JOB_NOT_FOUND = "job_not_found"
+ERROR_JOB_FINISHED = "job_finished"
+ERROR_QUEUE_FULL = "queue_full"
+ERROR_FILE_EXISTS = "file_exists"
+
+
+class JobError(ValueError):
+    """
+    任务操作失败（继承 ValueError，兼容按 ValueError 处理的调用方）
+
+    :param code: 稳定的错误码（ERROR_JOB_NOT_FOUND, ERROR_JOB_FINISHED, ERROR_QUEUE_FULL, ERROR_FILE_EXISTS）
+    :param message: 本地化的错误消息
+    """
+
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+@dataclass
+class Job:
+    """
+    文件生成任务
+
+    :param job_id: 任务 ID
+    :param file_path: 文件路径
+    :param file_size: 文件大小数值
+    :param unit: 文件大小单位
+    :param allocation: 分配模式
+    :param pattern: 内容模式
+    :param resume: 是否从检查点继续写入
+    :param io_mode: I/O 模式
+    :param durability: 持久化策略
+    :param sync_interval: interval 策略的落盘间隔（字节）
+    :param queue_depth: 队列深度（同时执行 pwrite 的线程数）
+    :param kind: 任务类型（generate 生成单个文件，fill 填充挂载点，此时 file_path 为挂载点；
+        tree 生成小文件目录树，此时 file_path 为根目录、file_size 为平均文件大小（字节），进度按文件数上报）
+    :param target_percent: 填充任务的目标使用率
+    :param target_free_bytes: 填充任务的目标剩余空间（字节）
+    :param file_count: 目录树任务的文件总数
+    :param fanout: 目录树任务的每级子目录数
+    :param depth: 目录树任务的目录层数
+    :param distribution: 目录树任务的文件大小分布
+    :param status: 任务状态
+    :param message: 结果消息（结束后填写）
+    :param error_code: 结果码（结束后填写，成功为 ok，失败时为稳定的错误码）
+    :param progress: 最近一次进度事件
+    :param created_at: 提交时间（时间戳）
+    :param finished_at: 结束时间（时间戳）
+    """
+    job_id: str
+    file_path: str
+    file_size: int
+    unit: str
+    allocation: str = DEFAULT_ALLOCATION_MODE
+    pattern: str = DEFAULT_CONTENT_PATTERN
+    resume: bool = False
+    io_mode: str = DEFAULT_IO_MODE
+    durability: str = DEFAULT_DURABILITY
+    sync_interval: int = DEFAULT_SYNC_INTERVAL
+    queue_depth: int = DEFAULT_QUEUE_DEPTH
+    kind: str = JOB_KIND_GENERATE
+    target_percent: Optional[float] = None
+    target_free_bytes: Optional[int] = None
+    file_count: int = 0
+    fanout: int = DEFAULT_TREE_FANOUT
+    depth: int = DEFAULT_TREE_DEPTH
+    distribution: str = "fixed"
+    status: str = JOB_QUEUED
+    message: str = ""
+    error_code: str = ""
+    progress: Optional[ProgressEvent] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    control: JobControl = field(default_factory=JobControl, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """任务是否已结束"""
+        return self.status in FINISHED_STATES
+
+
+def check_target(file_path: str, resume: bool = False) -> None:
+    """
+    检查生成目标：文件已存在时拒绝，除非要求续传且存在检查点
+
+    界面与接口提交任务时都经过这里，两者对已存在文件的处理一致。
+
+    :param file_path: 文件路径
+    :param resume: 是否从检查点继续写入
+    :raises JobError: 文件已存在且不能续传（ERROR_FILE_EXISTS）
+    """
+    if Path(file_path).exists() and not (resume and GenerationCheckpoint.path_for(file_path).exists()):
+        message = f"文件已存在：{file_path}"
+        if resume:
+            message += "（没有找到检查点，无法续传）"
+        raise JobError(ERROR_FILE_EXISTS, message)
+
+
+class JobManager:
+    """
+    文件生成任务管理器
+
+    提交任务后立即返回任务 ID，任务在有界线程池中执行；界面通过轮询任务状态显示进度，
+    不再占用 Gradio 的事件处理线程。
+
+    :param max_workers: 同时执行的任务数
+    :param queue_limit: 未结束任务（排队中与执行中）的最大数量
+    :param history_limit: 保留的任务数量（超出时丢弃最早结束的任务）
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_JOB_WORKERS,
+        queue_limit: int = JOB_QUEUE_LIMIT,
+        history_limit: int = JOB_HISTORY_LIMIT,
+    ):
+        if max_workers <= 0:
+            raise ValueError("并发数必须大于0")
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.history_limit = history_limit
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """首次提交任务时才创建线程池"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="filetools-job")
+        return self._executor
+
+    def _prune(self) -> None:
+        """超出保留数量时丢弃最早结束的任务（调用方持有锁）"""
+        excess = len(self._jobs) - self.history_limit
+        for job_id in [job.job_id for job in self._jobs.values() if job.finished][:max(0, excess)]:
+            del self._jobs[job_id]
+
+    def submit(
+        self,
+        file_path: str,
+        file_size: int,
+        unit: str,
+        allocation: str = DEFAULT_ALLOCATION_MODE,
+        pattern: str = DEFAULT_CONTENT_PATTERN,
+        resume: bool = False,
+        io_mode: str = DEFAULT_IO_MODE,
+        durability: str = DEFAULT_DURABILITY,
+        sync_interval: int = DEFAULT_SYNC_INTERVAL,
+        queue_depth: int = DEFAULT_QUEUE_DEPTH,
+    ) -> Job:
+        """
+        提交文件生成任务（立即返回）
+
+        :param file_path: 文件路径
+        :param file_size: 文件大小数值
+        :param unit: 文件大小单位
+        :param allocation: 分配模式
+        :param pattern: 内容模式
+        :param resume: 是否从检查点继续写入
+        :param io_mode: I/O 模式
+        :param durability: 持久化策略
+        :param sync_interval: interval 策略的落盘间隔（字节）
+        :param queue_depth: 队列深度（同时执行 pwrite 的线程数）
+        :return: 已排队的任务
+        :raises JobError: 文件已存在且不能续传（ERROR_FILE_EXISTS），或未结束的任务数已达到上限（ERROR_QUEUE_FULL）
+        """
+        check_target(file_path, resume)
+        job = Job(
+            job_id=uuid.uuid4().hex[:8],
+            file_path=file_path,
+            file_size=file_size,
+            unit=unit,
+            allocation=allocation,
+            pattern=pattern,
+            resume=resume,
+            io_mode=io_mode,
+            durability=durability,
+            sync_interval=sync_interval,
+            queue_depth=queue_depth,
+        )
+        self._enqueue(job)
+        logger.info(f"任务已提交: {job.job_id}, 文件: {file_path}, 大小: {file_size} {unit}")
+        return job
+
+    def submit_fill(
+        self,
+        mountpoint: str,
+        target_percent: Optional[float] = None,
+        target_free_bytes: Optional[int] = None,
+        pattern: str = DEFAULT_CONTENT_PATTERN,
+    ) -> Job:
+        """
+        提交填充到目标任务（立即返回），与文件生成任务共用队列、进度与暂停/取消
+
+        :param mountpoint: 挂载点
+        :param target_percent: 目标使用率（0-100），与 target_free_bytes 二选一
+        :param target_free_bytes: 目标剩余空间（字节），与 target_percent 二选一
+        :param pattern: 内容模式
+        :return: 已排队的任务
+        :raises JobError: 未结束的任务数已达到上限（ERROR_QUEUE_FULL）
+        """
+        job = Job(
+            job_id=uuid.uuid4().hex[:8],
+            file_path=mountpoint,
+            file_size=0,
+            unit="B",
+            pattern=pattern,
+            kind=JOB_KIND_FILL,
+            target_percent=target_percent,
+            target_free_bytes=target_free_bytes,
+        )
+        self._enqueue(job)
+        logger.info(f"填充任务已提交: {job.job_id}, 挂载点: {mountpoint}")
+        return job
+
+    def submit_tree(
+        self,
+        root: str,
+        file_count: int,
+        fanout: int = DEFAULT_TREE_FANOUT,
+        depth: int = DEFAULT_TREE_DEPTH,
+        file_size: int = 0,
+        distribution: str = "fixed",
+        pattern: str = DEFAULT_CONTENT_PATTERN,
+    ) -> Job:
+        """
+        提交小文件目录树任务（立即返回），与文件生成任务共用队列、进度与暂停/取消
+
+        :param root: 根目录
+        :param file_count: 文件总数
+        :param fanout: 每级子目录数
+        :param depth: 目录层数
+        :param file_size: 平均文件大小（字节）
+        :param distribution: 大小分布
+        :param pattern: 内容模式
+        :return: 已排队的任务
+        :raises JobError: 未结束的任务数已达到上限（ERROR_QUEUE_FULL）
+        """
+        job = Job(
+            job_id=uuid.uuid4().hex[:8],
+            file_path=root,
+            file_size=file_size,
+            unit="B",
+            pattern=pattern,
+            kind=JOB_KIND_TREE,
+            file_count=file_count,
+            fanout=fanout,
+            depth=depth,
+            distribution=distribution,
+        )
+        self._enqueue(job)
+        logger.info(f"目录树任务已提交: {job.job_id}, 根目录: {root}, 文件数: {file_count}")
+        return job
+
+    def _enqueue(self, job: Job) -> None:
+        """
+        登记任务并交给线程池执行
+
+        :param job: 任务
+        :raises JobError: 未结束的任务数已达到上限（ERROR_QUEUE_FULL）
+        """
+        with self._lock:
+            active = sum(1 for existing in self._jobs.values() if not existing.finished)
+            if active >= self.queue_limit:
+                raise JobError(ERROR_QUEUE_FULL, f"任务队列已满（{self.queue_limit} 个），请稍后再试")
+            self._jobs[job.job_id] = job
+            self._prune()
+            executor = self._get_executor()
+        executor.submit(self._run, job)
+
+    def _run(self, job: Job) -> None:
+        """
+        在工作线程中执行任务
+
+        :param job: 任务
+        """
+        with self._lock:
+            if job.control.cancelled:
+                return
+            job.status = JOB_PAUSED if job.control.paused else JOB_RUNNING
+
+        def on_progress(event: ProgressEvent) -> None:
+            job.progress = event
+
+        try:
+            if job.kind == JOB_KIND_FILL:
+                job.message, job.error_code = self._run_fill(job, on_progress)
+            elif job.kind == JOB_KIND_TREE:
+                job.message, job.error_code = self._run_tree(job, on_progress)
+            else:
+                result = run_generation(
+                    job.file_path, job.file_size, job.unit, None, job.allocation, job.pattern,
+                    on_progress, job.control, job.resume, job.io_mode, job.durability, job.sync_interval,
+                    job.queue_depth,
+                )
+                job.message, job.error_code = result.message, result.code
+            status = JOB_COMPLETED if job.error_code == RESULT_OK else JOB_FAILED
+        except JobCancelled:
+            if job.kind == JOB_KIND_GENERATE and job.resume and GenerationCheckpoint.path_for(job.file_path).exists():
+                job.message = "任务已取消，已保留部分文件与检查点，可勾选断点续传重新提交"
+            elif job.kind == JOB_KIND_TREE:
+                job.message = "任务已取消，已创建的目录和文件保留"
+            else:
+                job.message = "任务已取消，部分文件已删除"
+            job.error_code = ERROR_CANCELLED
+            status = JOB_CANCELLED
+        except Exception as e:
+            job.message, job.error_code = f"文件生成失败：未知错误 - {e}", ERROR_INTERNAL
+            logger.error(f"任务执行时发生未知错误: {job.job_id}: {e}", exc_info=True)
+            status = JOB_FAILED
+        with self._lock:
+            job.status = status
+            job.finished_at = time.time()
+        logger.info(f"任务结束: {job.job_id}, 状态: {status}")
+
+    @staticmethod
+    def _run_fill(job: Job, on_progress: Callable[[ProgressEvent], None]) -> Tuple[str, str]:
+        """
+        执行填充任务
+
+        :param job: 填充任务
+        :param on_progress: 进度事件回调
+        :return: (结果消息, 结果码)
+        """
+        try:
+            result = fill_to_target(
+                job.file_path, job.target_percent, job.target_free_bytes, pattern=job.pattern,
+                progress_events=on_progress, control=job.control,
+            )
+        except ValueError as e:
+            return f"填充失败：{e}", ERROR_INVALID_ARGUMENT
+        except OSError as e:
+            logger.error(f"填充失败: {job.job_id}: {e}")
+            code = ERROR_INSUFFICIENT_SPACE if e.errno in (errno.ENOSPC, errno.EDQUOT) else ERROR_OS_ERROR
+            return f"填充失败：{e}", code
+        message = (
+            f"填充完成：写入 {result.bytes_written} 字节，文件 {len(result.files)} 个，"
+            f"当前使用率 {result.final_percent:.1f}%，剩余 {result.final_free} 字节"
+        )
+        if result.warning:
+            message = f"{message}\n{result.warning}"
+        return message, RESULT_OK
+
+    @staticmethod
+    def _run_tree(job: Job, on_progress: Callable[[ProgressEvent], None]) -> Tuple[str, str]:
+        """
+        执行目录树任务
+
+        :param job: 目录树任务
+        :param on_progress: 进度事件回调
+        :return: (结果消息, 结果码)
+        """
+        try:
+            result = generate_tree(
+                job.file_path, job.file_count, job.fanout, job.depth, job.file_size, job.distribution, job.pattern,
+                progress_events=on_progress, control=job.control,
+            )
+        except ValueError as e:
+            return f"目录树生成失败：{e}", ERROR_INVALID_ARGUMENT
+        except OSError as e:
+            logger.error(f"目录树生成失败: {job.job_id}: {e}")
+            code = ERROR_INSUFFICIENT_SPACE if e.errno in (errno.ENOSPC, errno.EDQUOT) else ERROR_OS_ERROR
+            return f"目录树生成失败：{e}", code
+        return format_tree_result(result), RESULT_OK
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        获取任务
+
+        :param job_id: 任务 ID
+        :return: 任务，不存在时为 None
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Job]:
+        """
+        按提交顺序列出全部任务
+
+        :return: 任务列表
+        """
+        with self._lock:
+            return list(self._jobs.values())
+
+    def _require(self, job_id: str) -> Job:
+        """获取未结束的任务，不存在或已结束时抛出 JobError"""
+        job = self.get(job_id)
+        if job is None:
+            raise JobError(ERROR_JOB_NOT_FOUND, f"任务不存在: {job_id}")
+        if job.finished:
+            raise JobError(ERROR_JOB_FINISHED, f"任务已结束: {job_id}（{job.status}）")
+        return job
+
+    def cancel(self, job_id: str) -> Job:
+        """
+        取消任务：排队中的任务直接取消，执行中的任务在下一个块之前退出；
+        以断点续传方式提交且写检查点的任务保留部分文件与检查点，之后可以再次续传，其余任务删除部分文件与检查点
+
+        :param job_id: 任务 ID
+        :return: 任务
+        """
+        job = self._require(job_id)
+        job.control.cancel()
+        with self._lock:
+            if job.status == JOB_QUEUED:
+                job.status = JOB_CANCELLED
+                job.message = "任务已取消"
+                job.error_code = ERROR_CANCELLED
+                job.finished_at = time.time()
+        logger.info(f"请求取消任务: {job_id}")
+        return job
+
+    def pause(self, job_id: str) -> Job:
+        """
+        暂停任务（在下一个块之前生效）
+
+        :param job_id: 任务 ID
+        :return: 任务
+        """
+        job = self._require(job_id)
+        job.control.pause()
+        with self._lock:
+            if job.status == JOB_RUNNING:
+                job.status = JOB_PAUSED
+        logger.info(f"请求暂停任务: {job_id}")
+        return job
+
+    def resume(self, job_id: str) -> Job:
+        """
+        恢复已暂停的任务
+
+        :param job_id: 任务 ID
+        :return: 任务
+        """
+        job = self._require(job_id)
+        job.control.resume()
+        with self._lock:
+            if job.status == JOB_PAUSED:
+                job.status = JOB_RUNNING
+        logger.info(f"恢复任务: {job_id}")
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        取消全部未结束的任务并关闭线程池
+
+        :param wait: 是否等待执行中的任务退出
+        """
+        for job in self.list_jobs():
+            if not job.finished:
+                self.cancel(job.job_id)
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+# 默认任务管理器，UI 与接口共享
+job_manager = JobManager()
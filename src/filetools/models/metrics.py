@@ -0,0 +1,128 @@
+"""文件生成的进程内指标（写入字节数、块写入耗时与落盘耗时直方图）"""
+import bisect
+import threading
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from filetools.config.constants import FLUSH_LATENCY_BUCKETS, WRITE_LATENCY_BUCKETS
+
+
+@dataclass
+class HistogramSnapshot:
+    """
+    直方图快照
+
+    :param buckets: 桶上限（不含 +Inf）
+    :param counts: 每个桶的累计计数（最后一项为 +Inf，等于 count）
+    :param total: 观测值之和
+    :param count: 观测次数
+    """
+    buckets: Sequence[float]
+    counts: List[int]
+    total: float
+    count: int
+
+
+class Histogram:
+    """
+    固定桶的线程安全直方图
+
+    每次观测只做一次二分查找和一次加法，可以放在每个块的写入路径上。
+
+    :param buckets: 递增的桶上限（秒）
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError("桶上限必须非空且递增")
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        记录一次观测
+
+        :param value: 观测值
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._total += value
+
+    def snapshot(self) -> HistogramSnapshot:
+        """
+        获取累计计数快照
+
+        :return: 直方图快照
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._total
+        cumulative = []
+        running = 0
+        for count in counts:
+            running += count
+            cumulative.append(running)
+        return HistogramSnapshot(self.buckets, cumulative, total, running)
+
+
+class GenerationMetrics:
+    """
+    文件生成指标，由 ChunkWriter 与 generate_file 在写入路径上更新，抓取时只读取内存中的计数
+
+    :param write_buckets: 块写入耗时直方图的桶上限（秒）
+    :param flush_buckets: 落盘耗时直方图的桶上限（秒）
+    """
+
+    def __init__(
+        self,
+        write_buckets: Sequence[float] = WRITE_LATENCY_BUCKETS,
+        flush_buckets: Sequence[float] = FLUSH_LATENCY_BUCKETS,
+    ):
+        self.write_latency = Histogram(write_buckets)
+        self.flush_latency = Histogram(flush_buckets)
+        self._lock = threading.Lock()
+        self._bytes_written = 0
+        self._files_generated = 0
+
+    @property
+    def bytes_written(self) -> int:
+        """累计写入字节数"""
+        with self._lock:
+            return self._bytes_written
+
+    @property
+    def files_generated(self) -> int:
+        """累计生成完成的文件数"""
+        with self._lock:
+            return self._files_generated
+
+    def observe_write(self, length: int, seconds: float) -> None:
+        """
+        记录一次块写入
+
+        :param length: 写入字节数
+        :param seconds: write 系统调用耗时（秒）
+        """
+        with self._lock:
+            self._bytes_written += length
+        self.write_latency.observe(seconds)
+
+    def observe_flush(self, seconds: float) -> None:
+        """
+        记录一次落盘
+
+        :param seconds: fdatasync 耗时（秒）
+        """
+        self.flush_latency.observe(seconds)
+
+    def file_generated(self) -> None:
+        """记录一个文件生成完成"""
+        with self._lock:
+            self._files_generated += 1
+
+
+# 进程内默认指标
+generation_metrics = GenerationMetrics()
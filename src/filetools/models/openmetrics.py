@@ -0,0 +1,144 @@
+"""OpenMetrics（Prometheus）文本格式导出
+
+抓取时只读取内存中的数据：磁盘指标来自快照缓存（由后台采样线程更新），任务与写入指标来自进程内计数，
+不做任何磁盘系统调用，可以每秒抓取一次。
+"""
+from typing import Dict, List, Optional, Sequence
+
+from filetools.models.disk_snapshot import disk_snapshot_cache
+from filetools.models.disk_usage import DiskUsage
+from filetools.models.job_manager import (
+    FINISHED_STATES,
+    JOB_CANCELLED,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_PAUSED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    Job,
+    job_manager,
+)
+from filetools.models.metrics import GenerationMetrics, HistogramSnapshot, generation_metrics
+
+# /metrics 响应的内容类型
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+# 任务状态（按固定顺序输出，数量为 0 的状态也输出）
+_JOB_STATES = (JOB_QUEUED, JOB_RUNNING, JOB_PAUSED, JOB_COMPLETED, JOB_FAILED, JOB_CANCELLED)
+
+
+def _escape(value: str) -> str:
+    """转义标签值中的反斜杠、双引号与换行"""
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return "+Inf"
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+class _MetricWriter:
+    """按指标族顺序拼接 OpenMetrics 文本"""
+
+    def __init__(self):
+        self.lines: List[str] = []
+
+    def family(self, name: str, metric_type: str, help_text: str, unit: str = "") -> None:
+        self.lines.append(f"# TYPE {name} {metric_type}")
+        if unit:
+            self.lines.append(f"# UNIT {name} {unit}")
+        self.lines.append(f"# HELP {name} {help_text}")
+
+    def sample(self, name: str, value: float, labels: Optional[Dict[str, str]] = None) -> None:
+        self.lines.append(f"{name}{_format_labels(labels or {})} {_format_value(value)}")
+
+    def histogram(self, name: str, snapshot: HistogramSnapshot) -> None:
+        for bound, count in zip(list(snapshot.buckets) + [float('inf')], snapshot.counts):
+            self.sample(f"{name}_bucket", count, {"le": _format_value(float(bound))})
+        self.sample(f"{name}_count", snapshot.count)
+        self.sample(f"{name}_sum", snapshot.total)
+
+    def render(self) -> str:
+        return "\n".join(self.lines + ["# EOF"]) + "\n"
+
+
+def _write_disk_metrics(writer: _MetricWriter, disks: Sequence[DiskUsage], snapshot_age: Optional[float]) -> None:
+    """输出每个挂载点的空间与 inode 指标"""
+    gauges = (
+        ("filetools_disk_total_bytes", "挂载点总空间", lambda disk: disk.total),
+        ("filetools_disk_used_bytes", "挂载点已用空间", lambda disk: disk.used),
+        ("filetools_disk_free_bytes", "挂载点普通用户可用空间（扣除 root 预留）", lambda disk: disk.free),
+        ("filetools_disk_inodes", "挂载点 inode 总数（不限制 inode 的文件系统为 0）", lambda disk: disk.inodes_total),
+        ("filetools_disk_inodes_free", "挂载点可用 inode 数", lambda disk: disk.inodes_free),
+    )
+    available = [disk for disk in disks if disk.available]
+    writer.family("filetools_disk_up", "gauge", "挂载点最近一次统计是否成功")
+    for disk in disks:
+        writer.sample("filetools_disk_up", int(disk.available), _disk_labels(disk))
+    for name, help_text, value in gauges:
+        writer.family(name, "gauge", help_text, "bytes" if name.endswith("_bytes") else "")
+        for disk in available:
+            writer.sample(name, value(disk), _disk_labels(disk))
+    if snapshot_age is not None:
+        writer.family("filetools_disk_snapshot_age_seconds", "gauge", "磁盘快照距今的秒数", "seconds")
+        writer.sample("filetools_disk_snapshot_age_seconds", snapshot_age)
+
+
+def _disk_labels(disk: DiskUsage) -> Dict[str, str]:
+    return {"mountpoint": disk.mountpoint, "device": disk.device, "fstype": disk.fstype}
+
+
+def render_openmetrics(
+    disks: Sequence[DiskUsage],
+    jobs: Sequence[Job],
+    metrics: GenerationMetrics,
+    snapshot_age: Optional[float] = None,
+) -> str:
+    """
+    生成 OpenMetrics 文本
+
+    :param disks: 磁盘使用情况快照
+    :param jobs: 任务列表
+    :param metrics: 文件生成指标
+    :param snapshot_age: 磁盘快照距今的秒数（未知时不输出）
+    :return: OpenMetrics 文本（以 # EOF 结尾）
+    """
+    writer = _MetricWriter()
+    _write_disk_metrics(writer, disks, snapshot_age)
+
+    writer.family("filetools_jobs", "gauge", "各状态的任务数")
+    for state in _JOB_STATES:
+        writer.sample("filetools_jobs", sum(1 for job in jobs if job.status == state), {"state": state})
+    writer.family("filetools_jobs_active", "gauge", "未结束的任务数（排队中、执行中与已暂停）")
+    writer.sample("filetools_jobs_active", sum(1 for job in jobs if job.status not in FINISHED_STATES))
+
+    writer.family("filetools_written_bytes", "counter", "累计写入的字节数", "bytes")
+    writer.sample("filetools_written_bytes_total", metrics.bytes_written)
+    writer.family("filetools_files_generated", "counter", "累计生成完成的文件数")
+    writer.sample("filetools_files_generated_total", metrics.files_generated)
+
+    writer.family("filetools_write_latency_seconds", "histogram", "每个块 write 系统调用的耗时", "seconds")
+    writer.histogram("filetools_write_latency_seconds", metrics.write_latency.snapshot())
+    writer.family("filetools_flush_duration_seconds", "histogram", "每次 fdatasync 落盘的耗时", "seconds")
+    writer.histogram("filetools_flush_duration_seconds", metrics.flush_latency.snapshot())
+    return writer.render()
+
+
+def collect_openmetrics() -> str:
+    """
+    从默认快照缓存、任务管理器与生成指标收集 OpenMetrics 文本（不做磁盘系统调用）
+
+    :return: OpenMetrics 文本
+    """
+    return render_openmetrics(
+        disk_snapshot_cache.cached(), job_manager.list_jobs(), generation_metrics, disk_snapshot_cache.age
+    )
@@ -0,0 +1,128 @@
+"""写入进度事件与限流"""
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from filetools.config.constants import PROGRESS_MIN_BYTES, PROGRESS_MIN_INTERVAL
+
+
+@dataclass
+class ProgressEvent:
+    """
+    写入进度事件
+
+    :param bytes_written: 已写入字节数
+    :param total_bytes: 总字节数
+    :param elapsed: 已耗时（秒）
+    :param mbps: 距上一次事件的瞬时写入速度（MB/s）
+    :param eta: 按平均速度预计剩余秒数（尚无法估计时为 None）
+    """
+    bytes_written: int
+    total_bytes: int
+    elapsed: float
+    mbps: float = 0.0
+    eta: Optional[float] = None
+
+    @property
+    def percent(self) -> int:
+        """当前进度(0-100)"""
+        if self.total_bytes <= 0:
+            return 100
+        return min(100, int(self.bytes_written * 100 / self.total_bytes))
+
+    @property
+    def finished(self) -> bool:
+        """是否已写完"""
+        return self.bytes_written >= self.total_bytes
+
+
+class ProgressThrottle:
+    """
+    按时间和字节数限流的进度上报器
+
+    每个块只做一次整数比较：累计字节数不足 min_bytes 时直接返回，达到后才读取时钟，
+    距上一次上报不足 min_interval 秒时继续累计。写完时总会上报最后一个事件。
+
+    :param total_bytes: 总字节数
+    :param callback: 进度事件回调
+    :param min_interval: 两次上报的最小间隔（秒）
+    :param min_bytes: 两次上报之间的最小字节数
+    :param initial_bytes: 起始字节数（断点续传时为已写入部分，不计入速度与剩余时间估计）
+    """
+
+    def __init__(
+        self,
+        total_bytes: int,
+        callback: Callable[[ProgressEvent], None],
+        min_interval: float = PROGRESS_MIN_INTERVAL,
+        min_bytes: int = PROGRESS_MIN_BYTES,
+        initial_bytes: int = 0,
+    ):
+        self.total_bytes = total_bytes
+        self.callback = callback
+        self.min_interval = min_interval
+        self.min_bytes = min_bytes
+        self.events = 0
+        self._start = self._last_time = time.monotonic()
+        self.initial_bytes = self._last_bytes = initial_bytes
+        self._next_bytes = initial_bytes + min_bytes
+
+    def update(self, bytes_written: int) -> bool:
+        """
+        报告当前已写入字节数，满足限流条件时触发回调
+
+        :param bytes_written: 已写入字节数
+        :return: 是否触发了回调（调用方可以借此按同样的频率做其他低频采样）
+        """
+        if bytes_written < self._next_bytes and bytes_written < self.total_bytes:
+            return False
+        now = time.monotonic()
+        if now - self._last_time < self.min_interval and bytes_written < self.total_bytes:
+            return False
+        self._emit(bytes_written, now)
+        return True
+
+    def finish(self, bytes_written: int) -> None:
+        """
+        任务结束时上报最终进度（最后一个事件已是该值时不重复上报）
+
+        :param bytes_written: 最终写入字节数
+        """
+        if self.events == 0 or self._last_bytes != bytes_written:
+            self._emit(bytes_written, time.monotonic())
+
+    def _emit(self, bytes_written: int, now: float) -> None:
+        """构造并上报进度事件"""
+        interval = now - self._last_time
+        elapsed = now - self._start
+        mbps = (bytes_written - self._last_bytes) / (1024 * 1024) / interval if interval > 0 else 0.0
+        eta = None
+        if bytes_written > self.initial_bytes and elapsed > 0:
+            eta = (self.total_bytes - bytes_written) * elapsed / (bytes_written - self.initial_bytes)
+        self._last_time, self._last_bytes = now, bytes_written
+        self._next_bytes = bytes_written + self.min_bytes
+        self.events += 1
+        self.callback(ProgressEvent(bytes_written, self.total_bytes, elapsed, mbps, eta))
+
+
+def percent_listener(
+    progress_callback: Optional[Callable[[int], int]] = None,
+    progress_events: Optional[Callable[[ProgressEvent], None]] = None,
+) -> Optional[Callable[[ProgressEvent], None]]:
+    """
+    把百分比回调和进度事件回调合并为一个事件回调
+
+    :param progress_callback: 进度回调函数，参数为当前进度(0-100)
+    :param progress_events: 进度事件回调
+    :return: 合并后的回调，两者都为 None 时返回 None
+    """
+    if progress_callback is None:
+        return progress_events
+    if progress_events is None:
+        return lambda event: progress_callback(event.percent)
+
+    def emit(event: ProgressEvent) -> None:
+        progress_callback(event.percent)
+        progress_events(event)
+
+    return emit
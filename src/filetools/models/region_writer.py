@@ -0,0 +1,162 @@
+"""多线程按区域并行写入单个文件"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import psutil
+
+from filetools.config.constants import CHUNK_SIZE, DEFAULT_DURABILITY, DEFAULT_SYNC_INTERVAL, MAX_QUEUE_DEPTH
+from filetools.config.logger import logger
+from filetools.models.content_pattern import ContentPattern
+from filetools.models.generation_stats import GenerationStats
+from filetools.models.io_engine import ChunkWriter, open_for_write
+from filetools.models.job_control import JobControl
+from filetools.models.progress import ProgressThrottle
+from filetools.models.write_buffer import WriteBuffer
+
+
+def split_regions(file_size_bytes: int, chunk_size: int, queue_depth: int) -> List[range]:
+    """
+    把文件按块划分为连续的区域
+
+    区域边界总在块边界上，每个区域的块数最多相差一个；块数少于队列深度时区域数等于块数。
+
+    :param file_size_bytes: 文件大小（字节）
+    :param chunk_size: 块大小（字节）
+    :param queue_depth: 队列深度（区域数上限）
+    :return: 每个区域的块序号范围
+    """
+    chunks = -(-file_size_bytes // chunk_size)
+    count = min(queue_depth, chunks)
+    return [range(index * chunks // count, (index + 1) * chunks // count) for index in range(count)]
+
+
+def _region_durability(durability: str, sync_interval: int, regions: int) -> Tuple[str, int]:
+    """
+    区域写入器使用的持久化策略
+
+    end 策略由调用方在全部区域写完后统一落盘一次，区域内不落盘；interval 策略把间隔平分给各区域，
+    整个文件仍约每 sync_interval 字节落盘一次。
+
+    :return: (持久化策略, 落盘间隔)
+    """
+    if durability == 'end':
+        return 'none', sync_interval
+    if durability == 'interval':
+        return durability, max(1, sync_interval // regions)
+    return durability, sync_interval
+
+
+def write_regions(
+    path: Path,
+    io_mode: str,
+    file_size_bytes: int,
+    stats: GenerationStats,
+    pattern: ContentPattern,
+    queue_depth: int,
+    progress: Optional[ProgressThrottle] = None,
+    control: Optional[JobControl] = None,
+    chunk_size: int = CHUNK_SIZE,
+    durability: str = DEFAULT_DURABILITY,
+    sync_interval: int = DEFAULT_SYNC_INTERVAL,
+) -> List[ChunkWriter]:
+    """
+    用 queue_depth 个线程各自以 os.pwrite 写入文件的一个连续区域
+
+    条带化的 NVMe 或并行文件系统（Lustre、CephFS）上单个顺序写入流跑不满带宽，多个区域同时写入才能让
+    多个设备或 OST 并行工作。pwrite 系统调用期间释放 GIL，线程之间只在汇总进度时短暂持锁。
+
+    所有线程共享同一个按页对齐、只 prepare 一次的内容缓冲区；unique 模式逐块改写缓冲区，
+    每个线程各自持有一个缓冲区，内存占用约为队列深度乘以块大小。块序号与单线程写入一致，
+    相同种子和块大小写出的文件内容完全相同。
+
+    每个区域各自打开一个文件描述符：direct 模式下写不对齐的尾部或写入被拒绝时要清除 O_DIRECT，
+    F_SETFL 作用于整个打开的文件，共享描述符会让其他仍在写入的区域也失去 O_DIRECT。
+    各区域写入器记录自己实际使用的 I/O 模式。
+
+    各区域的已写入字节数汇总后交给同一个进度上报器；任一区域出错或任务被取消时其余区域在下一个块之前停止，
+    异常在调用线程中重新抛出。不写检查点，不支持断点续传。
+
+    :param path: 文件路径（调用方已创建）
+    :param io_mode: 实际 I/O 模式
+    :param file_size_bytes: 文件大小（字节）
+    :param stats: 生成统计信息（原地更新）
+    :param pattern: 内容模式
+    :param queue_depth: 队列深度（同时执行 pwrite 的线程数）
+    :param progress: 进度上报器
+    :param control: 任务控制标志，每个区域在每个块之前检查一次暂停与取消
+    :param chunk_size: 块大小（字节）
+    :param durability: 持久化策略（none, end, interval, chunk）
+    :param sync_interval: interval 策略的落盘间隔（字节）
+    :return: 各区域的块写入器（写入耗时与落盘耗时由调用方汇总）
+    """
+    if queue_depth <= 0 or queue_depth > MAX_QUEUE_DEPTH:
+        raise ValueError(f"队列深度必须在 1 到 {MAX_QUEUE_DEPTH} 之间")
+    if file_size_bytes <= 0:
+        return []
+    regions = split_regions(file_size_bytes, chunk_size, queue_depth)
+    region_durability, region_interval = _region_durability(durability, sync_interval, len(regions))
+    buffer_size = min(chunk_size, file_size_bytes)
+    buffers = [
+        WriteBuffer(buffer_size + pattern.extra_capacity(buffer_size))
+        for _ in range(len(regions) if pattern.mutates_buffer else 1)
+    ]
+    stats.queue_depth = len(regions)
+    stats.buffer_allocations = len(buffers)
+    stats.buffer_size = buffers[0].capacity
+    process = psutil.Process()
+    lock = threading.Lock()
+    failed = threading.Event()
+
+    def sample_rss() -> None:
+        rss = process.memory_info().rss
+        with lock:
+            stats.peak_rss = max(stats.peak_rss, rss)
+
+    def run(index: int) -> None:
+        writer = writers[index]
+        buffer = buffers[index % len(buffers)]
+        try:
+            for chunk_index in regions[index]:
+                if failed.is_set():
+                    return
+                if control:
+                    control.checkpoint()
+                length = min(chunk_size, file_size_bytes - chunk_index * chunk_size)
+                writer.write(pattern.chunk_view(buffer, chunk_index, length))
+                with lock:
+                    stats.bytes_written += length
+                    stats.chunks_written += 1
+                    reported = progress is not None and progress.update(stats.bytes_written)
+                # 内存只在进度上报时采样，系统调用不放在锁内
+                if reported:
+                    sample_rss()
+            writer.finish()
+        except BaseException:
+            failed.set()
+            raise
+
+    logger.info(f"按区域并行写入: {stats.file_path}, 区域数: {len(regions)}, 块大小: {chunk_size} 字节")
+    writers: List[ChunkWriter] = []
+    try:
+        with ExitStack() as files:
+            for region in regions:
+                file, region_mode = open_for_write(path, truncate=False, io_mode=io_mode)
+                files.enter_context(file)
+                writers.append(ChunkWriter(
+                    file, region_mode, offset=region.start * chunk_size, durability=region_durability,
+                    sync_interval=region_interval, positional=True,
+                ))
+            for buffer in buffers:
+                pattern.prepare(buffer, buffer_size)
+            with ThreadPoolExecutor(max_workers=len(regions), thread_name_prefix="filetools-region") as executor:
+                futures = [executor.submit(run, index) for index in range(len(regions))]
+            for future in futures:
+                future.result()
+        sample_rss()
+    finally:
+        for buffer in buffers:
+            buffer.close()
+    return writers
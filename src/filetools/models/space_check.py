@@ -0,0 +1,159 @@
+"""目标路径磁盘空间预检"""
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List
+
+import psutil
+
+from filetools.config.constants import DEFAULT_FS_BLOCK_SIZE, MOUNT_TABLE_TTL, PREALLOCATE_METADATA_RATIO
+from filetools.config.logger import logger
+from filetools.models.write_buffer import align_up
+
+# 挂载点表缓存（按路径长度降序，便于最长前缀匹配）
+_mount_table: List[str] = []
+_mount_table_time: float = 0.0
+_mount_table_lock = threading.Lock()
+
+
+@dataclass
+class SpaceCheck:
+    """
+    磁盘空间预检结果
+
+    :param mountpoint: 目标路径所在挂载点
+    :param required: 需要的空间（字节，含块对齐和元数据开销）
+    :param available: 当前用户可用空间（字节，已扣除文件系统预留空间）
+    :param reserved: 文件系统为 root 预留的空间（字节）
+    """
+    mountpoint: str
+    required: int
+    available: int
+    reserved: int = 0
+
+    @property
+    def sufficient(self) -> bool:
+        """空间是否足够"""
+        return self.required <= self.available
+
+
+def invalidate_mount_table() -> None:
+    """清空挂载点表缓存（挂载或卸载文件系统后调用）"""
+    global _mount_table_time
+    with _mount_table_lock:
+        _mount_table_time = 0.0
+
+
+def _get_mount_table() -> List[str]:
+    """
+    获取缓存的挂载点表，超过 MOUNT_TABLE_TTL 后重新读取
+
+    :return: 挂载点列表（按路径长度降序）
+    """
+    global _mount_table, _mount_table_time
+    with _mount_table_lock:
+        if time.monotonic() - _mount_table_time > MOUNT_TABLE_TTL:
+            mountpoints = {os.path.normcase(p.mountpoint) for p in psutil.disk_partitions(all=True)}
+            _mount_table = sorted(mountpoints, key=len, reverse=True)
+            _mount_table_time = time.monotonic()
+        return _mount_table
+
+
+def _existing_path(file_path: str) -> Path:
+    """
+    返回路径本身或最近的已存在父目录（解析符号链接后的真实路径）
+
+    :param file_path: 文件路径
+    :return: 已存在的真实路径
+    """
+    path = Path(os.path.realpath(Path(file_path).absolute()))
+    while not path.exists() and path != path.parent:
+        path = path.parent
+    return path
+
+
+def get_device_id(file_path: str) -> int:
+    """
+    获取路径所在设备 ID（文件尚不存在时使用最近的已存在父目录）
+
+    :param file_path: 文件路径
+    :return: 设备 ID（st_dev）
+    """
+    path = Path(file_path).absolute()
+    for candidate in (path, *path.parents):
+        if candidate.exists():
+            return os.stat(candidate).st_dev
+    return 0
+
+
+def resolve_mountpoint(file_path: str) -> str:
+    """
+    解析路径所在的挂载点（最长前缀匹配缓存的挂载点表，未命中时逐级向上查找）
+
+    :param file_path: 文件路径（可以尚不存在）
+    :return: 挂载点路径
+    """
+    path = _existing_path(file_path)
+    normalized = os.path.normcase(str(path))
+    for mountpoint in _get_mount_table():
+        prefix = mountpoint if mountpoint.endswith(os.sep) else mountpoint + os.sep
+        if normalized == mountpoint or normalized.startswith(prefix):
+            return mountpoint
+    while not os.path.ismount(path) and path != path.parent:
+        path = path.parent
+    return str(path)
+
+
+def estimate_required_space(file_size_bytes: int, allocation: str, block_size: int) -> int:
+    """
+    估算生成文件实际需要占用的磁盘空间
+
+    文件占用按块对齐向上取整；stream 和 preallocate 还需要额外的元数据块（区段树/间接块），
+    按 PREALLOCATE_METADATA_RATIO 保守估计。sparse 不分配数据块。
+
+    :param file_size_bytes: 文件大小（字节）
+    :param allocation: 分配模式
+    :param block_size: 文件系统块大小（字节）
+    :return: 需要的空间（字节）
+    """
+    if allocation == 'sparse' or file_size_bytes <= 0:
+        return 0
+    return align_up(file_size_bytes, block_size) + int(file_size_bytes * PREALLOCATE_METADATA_RATIO)
+
+
+def check_free_space(file_path: str, file_size_bytes: int, allocation: str = "stream") -> SpaceCheck:
+    """
+    检查目标路径所在挂载点是否有足够空间
+
+    只解析一次挂载点并执行一次 statvfs，不枚举全部分区。
+    非 root 用户不能使用文件系统预留块，可用空间按 f_bavail 计算；root 用户按 f_bfree 计算。
+
+    :param file_path: 目标文件路径
+    :param file_size_bytes: 文件大小（字节）
+    :param allocation: 分配模式
+    :return: 预检结果
+    """
+    mountpoint = resolve_mountpoint(file_path)
+    if not hasattr(os, 'statvfs'):
+        usage = shutil.disk_usage(mountpoint)
+        required = estimate_required_space(file_size_bytes, allocation, DEFAULT_FS_BLOCK_SIZE)
+        return SpaceCheck(mountpoint=mountpoint, required=required, available=usage.free)
+
+    stat = os.statvfs(mountpoint)
+    block_size = stat.f_frsize or stat.f_bsize
+    reserved = (stat.f_bfree - stat.f_bavail) * block_size
+    is_root = hasattr(os, 'geteuid') and os.geteuid() == 0
+    available = (stat.f_bfree if is_root else stat.f_bavail) * block_size
+    check = SpaceCheck(
+        mountpoint=mountpoint,
+        required=estimate_required_space(file_size_bytes, allocation, block_size),
+        available=available,
+        reserved=reserved,
+    )
+    logger.debug(
+        f"空间预检: 挂载点={mountpoint}, 需要={check.required}, 可用={check.available}, 预留={check.reserved}"
+    )
+    return check
@@ -0,0 +1,389 @@
+"""小文件目录树生成（inode 与元数据压力测试）"""
+import errno
+import math
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from filetools.config.constants import (
+    DEFAULT_CONTENT_PATTERN,
+    DEFAULT_TREE_DEPTH,
+    DEFAULT_TREE_FANOUT,
+    DEFAULT_TREE_FILE_SIZE,
+    DEFAULT_TREE_FILES,
+    DEFAULT_TREE_WORKERS,
+    TREE_LOGNORMAL_SIGMA,
+    TREE_MAX_FILE_SIZE,
+    TREE_SIZE_DISTRIBUTIONS,
+)
+from filetools.config.logger import logger
+from filetools.models.content_pattern import ContentPattern, create_pattern
+from filetools.models.disk_monitor import get_mount_usage
+from filetools.models.disk_snapshot import disk_snapshot_cache
+from filetools.models.disk_usage import DiskUsage
+from filetools.models.job_control import JobCancelled, JobControl
+from filetools.models.progress import ProgressEvent, ProgressThrottle
+from filetools.models.space_check import resolve_mountpoint
+from filetools.models.write_buffer import WriteBuffer
+
+# 表示磁盘空间或 inode 耗尽的错误码，遇到后所有线程停止创建文件
+_EXHAUSTED_ERRNOS = {errno.ENOSPC, getattr(errno, 'EDQUOT', errno.ENOSPC)}
+
+
+@dataclass
+class TreeResult:
+    """
+    目录树生成结果
+
+    :param root: 根目录
+    :param files_created: 创建的文件数
+    :param dirs_created: 创建的目录数
+    :param bytes_written: 写入的字节数
+    :param elapsed: 耗时（秒）
+    :param usage_before: 生成前所在挂载点的使用情况（含 inode，无法统计时为 None）
+    :param usage_after: 生成后所在挂载点的使用情况
+    :param errors: 错误信息（磁盘空间或 inode 耗尽时提前停止）
+    """
+    root: str
+    files_created: int = 0
+    dirs_created: int = 0
+    bytes_written: int = 0
+    elapsed: float = 0.0
+    usage_before: Optional[DiskUsage] = None
+    usage_after: Optional[DiskUsage] = None
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def files_per_second(self) -> float:
+        """文件创建速度（个/秒）"""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.files_created / self.elapsed
+
+    @property
+    def inodes_consumed(self) -> int:
+        """生成前后可用 inode 的减少量（文件系统不限制 inode 时为 0）"""
+        if not self.usage_before or not self.usage_after or not self.usage_before.inodes_total:
+            return 0
+        return self.usage_before.inodes_free - self.usage_after.inodes_free
+
+
+def draw_file_size(rng: random.Random, mean: int, distribution: str) -> int:
+    """
+    按大小分布抽取一个文件大小
+
+    :param rng: 随机数生成器
+    :param mean: 平均文件大小（字节）
+    :param distribution: 大小分布（fixed, uniform, lognormal）
+    :return: 文件大小（字节，不超过 TREE_MAX_FILE_SIZE）
+    """
+    if distribution == "fixed" or mean == 0:
+        size = mean
+    elif distribution == "uniform":
+        size = rng.randint(0, 2 * mean)
+    else:
+        # mu 取 ln(mean) - sigma²/2，使分布的期望等于 mean
+        mu = math.log(mean) - TREE_LOGNORMAL_SIGMA ** 2 / 2
+        size = int(rng.lognormvariate(mu, TREE_LOGNORMAL_SIGMA))
+    return min(size, TREE_MAX_FILE_SIZE)
+
+
+def _directory_plan(fanout: int, depth: int, leaf_count: int) -> List[int]:
+    """
+    计算每层需要创建的目录数：只创建前 leaf_count 个叶子目录及其祖先目录
+
+    :param fanout: 每级子目录数
+    :param depth: 目录层数
+    :param leaf_count: 叶子目录数（不超过 fanout^depth）
+    :return: 从第 1 层到第 depth 层的目录数
+    """
+    # spans[r]：距叶子 r 层的目录下最多有多少个叶子（超过 leaf_count 时截断，避免计算巨大的幂）
+    spans = []
+    span = 1
+    for _ in range(depth):
+        spans.append(span)
+        span = min(span * fanout, max(leaf_count, 1))
+    return [-(-leaf_count // span) for span in reversed(spans)]
+
+
+def _create_directories(
+    root: Path,
+    fanout: int,
+    depth: int,
+    leaf_count: int,
+    result: "TreeResult",
+    control: Optional[JobControl] = None,
+) -> List[Path]:
+    """
+    按层创建目录树（父目录总是先于子目录创建，每个目录只需一次 mkdir）
+
+    只创建前 leaf_count 个叶子目录及其祖先目录，目录数不会超过文件数乘以层数；
+    磁盘空间或 inode 耗尽时停止创建，错误记录在结果中，返回空的叶子目录列表。
+
+    :param root: 根目录（已存在）
+    :param fanout: 每级子目录数
+    :param depth: 目录层数
+    :param leaf_count: 叶子目录数
+    :param result: 生成结果（原地更新新创建的目录数与错误）
+    :param control: 任务控制标志，每个目录之前检查一次暂停与取消
+    :return: 叶子目录列表
+    """
+    level = [root]
+    for needed in _directory_plan(fanout, depth, leaf_count):
+        next_level = []
+        for position in range(needed):
+            if control:
+                control.checkpoint()
+            directory = level[position // fanout] / f"d{position % fanout:03d}"
+            try:
+                os.mkdir(directory)
+                result.dirs_created += 1
+            except FileExistsError:
+                pass
+            except OSError as e:
+                if e.errno not in _EXHAUSTED_ERRNOS:
+                    raise
+                result.errors.append(f"{directory}: {e}")
+                logger.error(f"创建目录失败: {directory}: {e}")
+                return []
+            next_level.append(directory)
+        level = next_level
+    return level
+
+
+def _write_small_file(path: Path, view: memoryview) -> None:
+    """
+    创建并写入一个小文件（直接使用文件描述符，不创建文件对象）
+
+    :param path: 文件路径
+    :param view: 文件内容
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        offset = 0
+        while offset < len(view):
+            offset += os.write(fd, view[offset:])
+    finally:
+        os.close(fd)
+
+
+class _TreeFiller:
+    """
+    按叶子目录并行创建文件，所有线程共享同一个只读内容缓冲区
+
+    :param result: 生成结果（原地更新）
+    :param content: 已 prepare 的内容模式
+    :param buffer: 共享内容缓冲区
+    :param mean_size: 平均文件大小（字节）
+    :param distribution: 大小分布
+    :param seed: 大小分布的随机种子
+    :param progress: 进度上报器（按已创建的文件数上报）
+    :param control: 任务控制标志，每个文件之前检查一次暂停与取消
+    """
+
+    def __init__(
+        self,
+        result: TreeResult,
+        content: ContentPattern,
+        buffer: WriteBuffer,
+        mean_size: int,
+        distribution: str,
+        seed: int,
+        progress: Optional[ProgressThrottle] = None,
+        control: Optional[JobControl] = None,
+    ):
+        self.result = result
+        self.content = content
+        self.buffer = buffer
+        self.mean_size = mean_size
+        self.distribution = distribution
+        self.seed = seed
+        self.progress = progress
+        self.control = control
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._done = 0
+
+    def fill_directory(self, leaf_index: int, directory: Path, first: int, count: int) -> None:
+        """
+        在一个叶子目录中创建文件，文件序号全局唯一
+
+        :param leaf_index: 叶子目录序号（决定大小序列，相同种子结果可复现）
+        :param directory: 叶子目录
+        :param first: 第一个文件的全局序号
+        :param count: 文件数
+        """
+        rng = random.Random(f"{self.seed}:{leaf_index}")
+        files = 0
+        written = 0
+        try:
+            for index in range(first, first + count):
+                if self._stop.is_set():
+                    break
+                if self.control:
+                    self.control.checkpoint()
+                size = draw_file_size(rng, self.mean_size, self.distribution)
+                _write_small_file(directory / f"f{index:08d}.bin", self.content.chunk_view(self.buffer, index, size))
+                files += 1
+                written += size
+                if self.progress:
+                    with self._lock:
+                        self._done += 1
+                        self.progress.update(self._done)
+        except JobCancelled:
+            # 其余线程在下一个文件之前停止
+            self._stop.set()
+            raise
+        except OSError as e:
+            if e.errno in _EXHAUSTED_ERRNOS:
+                self._stop.set()
+            with self._lock:
+                self.result.errors.append(f"{directory}: {e}")
+            logger.error(f"创建小文件失败: {directory}: {e}")
+        finally:
+            with self._lock:
+                self.result.files_created += files
+                self.result.bytes_written += written
+
+
+def _mount_usage(path: str) -> Optional[DiskUsage]:
+    """
+    统计路径所在挂载点的使用情况（含 inode）
+
+    :param path: 路径
+    :return: 磁盘使用情况，无法统计时为 None
+    """
+    try:
+        mountpoint = resolve_mountpoint(path)
+        return get_mount_usage(mountpoint, mountpoint)
+    except OSError as e:
+        logger.warning(f"无法统计挂载点使用情况: {path}: {e}")
+        return None
+
+
+def format_tree_result(result: TreeResult) -> str:
+    """
+    格式化目录树生成结果
+
+    :param result: 目录树生成结果
+    :return: 结果消息（提前停止时第一行为错误原因）
+    """
+    message = (
+        f"目录树生成完成：文件 {result.files_created:,} 个，目录 {result.dirs_created:,} 个，"
+        f"耗时 {result.elapsed:.2f} 秒，{result.files_per_second:,.0f} 个/秒"
+    )
+    before, after = result.usage_before, result.usage_after
+    if before and after and before.inodes_total:
+        message += (
+            f"\ninode 使用率 {before.inode_percent:.1f}% → {after.inode_percent:.1f}%"
+            f"（消耗 {result.inodes_consumed:,} 个，剩余 {after.inodes_free:,} 个）"
+        )
+    if result.errors:
+        message = f"提前停止：{result.errors[0]}\n{message}"
+    return message
+
+
+def generate_tree(
+    root: str,
+    file_count: int = DEFAULT_TREE_FILES,
+    fanout: int = DEFAULT_TREE_FANOUT,
+    depth: int = DEFAULT_TREE_DEPTH,
+    file_size: int = DEFAULT_TREE_FILE_SIZE,
+    distribution: str = "fixed",
+    pattern: str = DEFAULT_CONTENT_PATTERN,
+    seed: Optional[int] = None,
+    max_workers: int = DEFAULT_TREE_WORKERS,
+    progress_events: Optional[Callable[[ProgressEvent], None]] = None,
+    control: Optional[JobControl] = None,
+) -> TreeResult:
+    """
+    生成大量小文件组成的嵌套目录树，用于耗尽 inode 和施加元数据压力
+
+    先按层创建 min(fanout^depth, file_count) 个叶子目录，再把文件平均分配到叶子目录中，由线程池按目录并行创建；
+    不同线程写入不同目录，避免争用同一个目录的锁。整个任务只分配一个内容缓冲区，所有文件从中取只读视图写入。
+    创建目录或文件时磁盘空间或 inode 耗尽（ENOSPC、EDQUOT）则停止创建，已创建的文件保留，错误记录在结果中。
+    传入 control 时每个目录和文件之前检查一次暂停与取消；取消时抛出 JobCancelled，已创建的目录和文件保留。
+
+    :param root: 根目录（不存在时创建）
+    :param file_count: 文件总数
+    :param fanout: 每级子目录数
+    :param depth: 目录层数（0 表示文件直接放在根目录）
+    :param file_size: 平均文件大小（字节，不超过 TREE_MAX_FILE_SIZE）
+    :param distribution: 大小分布（fixed, uniform, lognormal）
+    :param pattern: 内容模式（zeros, random, compressible；unique 需要逐块改写缓冲区，不能在线程间共享）
+    :param seed: 内容与大小分布的随机种子，为 None 时随机选择
+    :param max_workers: 线程数
+    :param progress_events: 进度事件回调（bytes_written 与 total_bytes 为已创建的文件数与文件总数）
+    :param control: 任务控制标志
+    :return: 生成结果，包含文件数、files/s 以及生成前后的 inode 使用情况
+    :raises JobCancelled: 任务被取消
+    """
+    if file_count < 0:
+        raise ValueError("文件数不能为负数")
+    if fanout <= 0 or depth < 0:
+        raise ValueError("每级子目录数必须大于0，目录层数不能为负数")
+    if not 0 <= file_size <= TREE_MAX_FILE_SIZE:
+        raise ValueError(f"文件大小必须在 0 到 {TREE_MAX_FILE_SIZE} 字节之间")
+    if distribution not in TREE_SIZE_DISTRIBUTIONS:
+        raise ValueError(f"不支持的大小分布: {distribution}。支持的分布: {', '.join(TREE_SIZE_DISTRIBUTIONS)}")
+    if pattern == "unique":
+        raise ValueError("目录树模式不支持 unique 内容模式")
+    if max_workers <= 0:
+        raise ValueError("并发数必须大于0")
+    content = create_pattern(pattern, seed)
+
+    root_path = Path(root)
+    root_path.mkdir(parents=True, exist_ok=True)
+    result = TreeResult(root=str(root_path), usage_before=_mount_usage(str(root_path)))
+    # 叶子目录数不超过文件数，fanout^depth 很大时也只创建用得到的目录
+    leaf_count = 1
+    for _ in range(depth):
+        leaf_count = min(leaf_count * fanout, file_count)
+    if result.usage_before and result.usage_before.inodes_total:
+        needed = file_count + sum(_directory_plan(fanout, depth, leaf_count))
+        if needed > result.usage_before.inodes_free:
+            logger.warning(f"需要约 {needed} 个 inode，可用 {result.usage_before.inodes_free} 个，将在 inode 耗尽时停止")
+    logger.info(
+        f"开始生成目录树: {root_path}, 文件数: {file_count}, 每级子目录: {fanout}, 层数: {depth}, "
+        f"平均大小: {file_size} 字节, 分布: {distribution}, 内容模式: {pattern}, 线程数: {max_workers}"
+    )
+
+    # 进度按文件数上报，每个文件都检查一次（只在满足时间间隔时回调）
+    progress = ProgressThrottle(file_count, progress_events, min_bytes=1) if progress_events else None
+    start = time.perf_counter()
+    try:
+        leaves = _create_directories(root_path, fanout, depth, leaf_count, result, control)
+        per_leaf, extra = divmod(file_count, len(leaves)) if leaves else (0, 0)
+        with WriteBuffer(TREE_MAX_FILE_SIZE + content.extra_capacity(TREE_MAX_FILE_SIZE)) as buffer:
+            content.prepare(buffer, TREE_MAX_FILE_SIZE)
+            filler = _TreeFiller(result, content, buffer, file_size, distribution, content.seed, progress, control)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="filetools-tree") as executor:
+                futures = []
+                first = 0
+                for leaf_index, directory in enumerate(leaves):
+                    count = per_leaf + (1 if leaf_index < extra else 0)
+                    if count:
+                        futures.append(executor.submit(filler.fill_directory, leaf_index, directory, first, count))
+                    first += count
+                for future in futures:
+                    future.result()
+    except JobCancelled:
+        logger.info(f"目录树生成已取消: {root_path}, 已创建文件 {result.files_created} 个，已创建的文件保留")
+        raise
+    finally:
+        disk_snapshot_cache.invalidate_path(str(root_path))
+    result.elapsed = time.perf_counter() - start
+    if progress:
+        progress.finish(result.files_created)
+
+    result.usage_after = _mount_usage(str(root_path))
+    logger.info(
+        f"目录树生成完成: {root_path}, 文件 {result.files_created} 个, 目录 {result.dirs_created} 个, "
+        f"写入 {result.bytes_written} 字节, {result.files_per_second:.0f} 个/秒, 消耗 inode {result.inodes_consumed} 个"
+    )
+    return result
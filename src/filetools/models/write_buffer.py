@@ -0,0 +1,97 @@
+"""可复用写缓冲区"""
+import mmap
+import os
+from typing import BinaryIO
+
+
+def align_up(value: int, alignment: int) -> int:
+    """
+    将数值向上取整到对齐边界
+
+    :param value: 原始数值
+    :param alignment: 对齐边界（字节）
+    :return: 对齐后的数值
+    """
+    return (value + alignment - 1) // alignment * alignment
+
+
+def write_fully(file: BinaryIO, view: memoryview) -> None:
+    """
+    将视图中的数据完整写入文件（处理无缓冲写入可能出现的部分写入）
+
+    :param file: 以无缓冲模式打开的文件对象
+    :param view: 待写入的数据视图
+    """
+    offset = 0
+    length = len(view)
+    while offset < length:
+        written = file.write(view[offset:])
+        if not written:
+            raise OSError(f"写入失败：仅写入 {offset}/{length} 字节")
+        offset += written
+
+
+def pwrite_fully(fd: int, view: memoryview, position: int) -> None:
+    """
+    在指定偏移处把视图中的数据完整写入文件（os.pwrite 不移动文件偏移，多个线程可以共享同一个描述符）
+
+    :param fd: 文件描述符
+    :param view: 待写入的数据视图
+    :param position: 文件偏移（字节）
+    """
+    offset = 0
+    length = len(view)
+    while offset < length:
+        written = os.pwrite(fd, view[offset:], position + offset)
+        if not written:
+            raise OSError(f"写入失败：仅写入 {offset}/{length} 字节")
+        offset += written
+
+
+class WriteBuffer:
+    """
+    按页对齐的可复用写缓冲区
+
+    每个生成任务只分配一次缓冲区（匿名 mmap，天然按页对齐且初始全零），
+    之后通过 memoryview 切片写入，避免每个块都重新创建一个 bytes 对象。
+
+    :param size: 需要的缓冲区大小（字节），实际分配会向上取整到页大小
+    """
+
+    def __init__(self, size: int):
+        if size <= 0:
+            raise ValueError("缓冲区大小必须大于0")
+        self.size = size
+        self.capacity = align_up(size, mmap.PAGESIZE)
+        self._mmap = mmap.mmap(-1, self.capacity)
+        self._view = memoryview(self._mmap)
+        self.allocations = 1
+
+    def view(self, length: int, offset: int = 0) -> memoryview:
+        """
+        获取缓冲区从 offset 开始、长度为 length 的视图（零拷贝）
+
+        :param length: 视图长度（字节）
+        :param offset: 视图起始偏移（字节）
+        :return: memoryview 切片
+        """
+        if length < 0 or offset < 0 or offset + length > self.size:
+            raise ValueError(f"视图长度超出缓冲区范围: {offset} + {length} > {self.size}")
+        return self._view[offset:offset + length]
+
+    def close(self) -> None:
+        """释放缓冲区"""
+        if self._mmap.closed:
+            return
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # 写入出错时异常的 traceback 仍引用着块视图，mmap 在视图释放后由垃圾回收关闭
+            pass
+
+    def __enter__(self) -> "WriteBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
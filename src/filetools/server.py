@@ -0,0 +1,32 @@
+"""Web 服务：在同一个 FastAPI 应用上挂载 Gradio 界面、/api JSON 接口与 /metrics 接口"""
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+from filetools.api import install_api
+from filetools.models.openmetrics import OPENMETRICS_CONTENT_TYPE, collect_openmetrics
+
+
+def create_app(with_ui: bool = True) -> FastAPI:
+    """
+    创建 Web 应用
+
+    /metrics 只读取内存中的快照与计数（磁盘数据由后台采样线程更新），抓取时不做磁盘系统调用。
+
+    :param with_ui: 是否在根路径挂载 Gradio 界面
+    :return: FastAPI 应用
+    """
+    app = FastAPI(title="FileTools", docs_url="/api/docs", redoc_url=None, openapi_url="/api/openapi.json")
+    install_api(app)
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    def metrics() -> PlainTextResponse:
+        """OpenMetrics 格式的磁盘、任务与写入指标"""
+        return PlainTextResponse(collect_openmetrics(), media_type=OPENMETRICS_CONTENT_TYPE)
+
+    if with_ui:
+        import gradio as gr
+
+        from filetools.ui.interface import create_interface
+
+        app = gr.mount_gradio_app(app, create_interface(), path="/")
+    return app
@@ -1,12 +1,59 @@
 """Gradio界面组件"""
 import gradio as gr
 from pathlib import Path
-from typing import List, Tuple
-from filetools.config.constants import DEFAULT_UNIT, UNIT_MAPPING
+from typing import Dict, List, Optional, Tuple
+from filetools.config.constants import (
+    ALLOCATION_MODES,
+    CHUNK_SIZE,
+    CONTENT_PATTERNS,
+    DEFAULT_ALLOCATION_MODE,
+    DEFAULT_CONTENT_PATTERN,
+    DEFAULT_DURABILITY,
+    DEFAULT_IO_MODE,
+    DEFAULT_SYNC_INTERVAL,
+    DEFAULT_TREE_DEPTH,
+    DEFAULT_TREE_FANOUT,
+    DEFAULT_TREE_FILE_SIZE,
+    DEFAULT_TREE_FILES,
+    DEFAULT_UNIT,
+    DISK_SAMPLE_INTERVAL,
+    DURABILITY_MODES,
+    INODE_WARN_PERCENT,
+    IO_MODES,
+    IO_SAMPLE_INTERVAL,
+    JOB_POLL_INTERVAL,
+    TREE_SIZE_DISTRIBUTIONS,
+    UNIT_MAPPING,
+)
 from filetools.config.logger import logger
-from filetools.models.file_generator import generate_file_with_progress
-from filetools.models.disk_monitor import get_disk_usage_info
+from filetools.models.chunk_tuner import ChunkTuning, chunk_size_tuner
+from filetools.models.job_manager import (
+    JOB_CANCELLED,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_KIND_FILL,
+    JOB_KIND_TREE,
+    JOB_PAUSED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    Job,
+    job_manager,
+)
+from filetools.models.disk_io import DeviceIOStats, disk_io_sampler
+from filetools.models.disk_sampler import FillRate, disk_usage_sampler
+from filetools.models.disk_snapshot import disk_snapshot_cache
 from filetools.models.disk_usage import DiskUsage
+from filetools.models.progress import ProgressEvent
+
+# 任务状态显示名称
+JOB_STATUS_LABELS = {
+    JOB_QUEUED: "排队中",
+    JOB_RUNNING: "执行中",
+    JOB_PAUSED: "已暂停",
+    JOB_COMPLETED: "已完成",
+    JOB_FAILED: "失败",
+    JOB_CANCELLED: "已取消",
+}
 
 
 def format_disk_size(size: float, unit: str) -> str:
@@ -14,12 +61,57 @@ def format_disk_size(size: float, unit: str) -> str:
     return f"{size:.2f} {unit}"
 
 
-def format_disk_info(disk_usages: List[DiskUsage], unit: str) -> str:
+def format_duration(seconds: float) -> str:
+    """格式化时长"""
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    if days:
+        return f"{days}天{hours}小时"
+    if hours:
+        return f"{hours}小时{minutes}分"
+    if minutes:
+        return f"{minutes}分{secs}秒"
+    return f"{secs}秒"
+
+
+def _format_fill_rate(fill_rate: FillRate, unit: str) -> str:
+    """格式化写入速率与预计写满时间"""
+    rate = format_disk_size(fill_rate.bytes_per_second / UNIT_MAPPING[unit], f"{unit}/s")
+    if fill_rate.seconds_to_full is None:
+        return f"- **写入速率**: {rate}\n"
+    return f"- **写入速率**: {rate}，预计 {format_duration(fill_rate.seconds_to_full)} 后写满\n"
+
+
+def format_progress(event: ProgressEvent, unit: str) -> str:
+    """
+    格式化写入进度
+
+    :param event: 进度事件
+    :param unit: 显示单位
+    :return: 进度描述
+    """
+    divider = UNIT_MAPPING[unit]
+    message = (
+        f"{event.percent}%（{format_disk_size(event.bytes_written / divider, unit)} / "
+        f"{format_disk_size(event.total_bytes / divider, unit)}），速度 {event.mbps:.1f} MB/s"
+    )
+    if event.eta is not None:
+        message += f"，预计剩余 {format_duration(event.eta)}"
+    return message
+
+
+def format_disk_info(
+    disk_usages: List[DiskUsage],
+    unit: str,
+    fill_rates: Optional[Dict[str, FillRate]] = None,
+) -> str:
     """
     格式化磁盘信息为Markdown
     
     :param disk_usages: 磁盘使用情况列表
     :param unit: 显示单位
+    :param fill_rates: 按挂载点索引的写入速率（后台采样运行时提供）
     :return: Markdown格式的磁盘信息
     """
     if not disk_usages:
@@ -29,8 +121,16 @@ def format_disk_info(disk_usages: List[DiskUsage], unit: str) -> str:
     markdown_parts = []
     
     for disk_usage in disk_usages:
+        if not disk_usage.available:
+            markdown_parts.append(f"""
+### 💿 {disk_usage.device}
+**状态**: ⚠️ 不可用（{disk_usage.mountpoint} 响应超时，稍后自动重试）
+
+---
+""")
+            continue
         current_space = disk_usage.used / divider
-        available_space = (disk_usage.total - disk_usage.used) / divider
+        available_space = disk_usage.free / divider
         total_space = disk_usage.total / divider
         
         markdown = f"""
@@ -39,7 +139,23 @@ def format_disk_info(disk_usages: List[DiskUsage], unit: str) -> str:
 - **已用**: {format_disk_size(current_space, unit)}
 - **可用**: {format_disk_size(available_space, unit)}
 - **总计**: {format_disk_size(total_space, unit)}
-
+"""
+        if disk_usage.reserved:
+            markdown += f"- **root 预留**: {format_disk_size(disk_usage.reserved / divider, unit)}\n"
+        if disk_usage.fstype:
+            markdown += f"- **文件系统**: {disk_usage.fstype}"
+            if disk_usage.block_size:
+                markdown += f"，块大小 {disk_usage.block_size // UNIT_MAPPING['KB']} KB"
+            markdown += "\n"
+        if disk_usage.inodes_total:
+            warning = " ⚠️ inode 即将耗尽" if disk_usage.inode_percent >= INODE_WARN_PERCENT else ""
+            markdown += (
+                f"- **inode**: {disk_usage.inode_percent:.1f}%"
+                f"（已用 {disk_usage.inodes_used:,} / 总计 {disk_usage.inodes_total:,}）{warning}\n"
+            )
+        if fill_rates and disk_usage.mountpoint in fill_rates:
+            markdown += _format_fill_rate(fill_rates[disk_usage.mountpoint], unit)
+        markdown += """
 ---
 """
         markdown_parts.append(markdown)
@@ -47,18 +163,76 @@ def format_disk_info(disk_usages: List[DiskUsage], unit: str) -> str:
     return "\n".join(markdown_parts)
 
 
-def update_disk_display(unit: str) -> str:
+def _render_sampled(unit: str) -> str:
+    """按后台采样结果渲染磁盘信息（不做任何系统调用）"""
+    rates = {rate.mountpoint: rate for rate in disk_usage_sampler.fill_rates()}
+    return format_disk_info(disk_usage_sampler.latest(), unit, rates)
+
+
+def update_disk_display(unit: str, force: bool = False) -> str:
     """
     更新磁盘显示
     
+    后台采样运行时直接读取采样结果；否则使用带 TTL 的快照缓存（写入文件后对应挂载点会自动失效）。
+    
     :param unit: 显示单位
+    :param force: 是否强制重新采样/扫描全部分区
     :return: Markdown格式的磁盘信息
     """
     logger.info(f"更新磁盘显示，单位: {unit}")
-    disk_usages = get_disk_usage_info()
+    if disk_usage_sampler.running:
+        if force:
+            disk_usage_sampler.sample_once()
+        return _render_sampled(unit)
+    disk_usages = disk_snapshot_cache.get(force=force)
     return format_disk_info(disk_usages, unit)
 
 
+def change_disk_unit(unit: str) -> str:
+    """
+    切换磁盘显示单位（只重新格式化内存中的快照，不做任何系统调用）
+    
+    :param unit: 显示单位
+    :return: Markdown格式的磁盘信息
+    """
+    if disk_usage_sampler.running:
+        return _render_sampled(unit)
+    return format_disk_info(disk_snapshot_cache.peek(), unit)
+
+
+def format_disk_io(stats: List[DeviceIOStats]) -> str:
+    """
+    格式化设备 I/O 速率为Markdown表格
+
+    :param stats: 设备 I/O 速率列表
+    :return: Markdown格式的 I/O 信息
+    """
+    if not stats:
+        return "暂无 I/O 数据（至少需要两次采样）"
+    lines = [
+        "| 设备 | 挂载点 | 写入 MB/s | 平均写入 MB/s | 写 IOPS | 读取 MB/s | 繁忙 |",
+        "| --- | --- | --- | --- | --- | --- | --- |",
+    ]
+    for item in stats:
+        busy = f"{item.busy_percent:.0f}%" if item.busy_percent is not None else "-"
+        lines.append(
+            f"| {item.device} | {', '.join(item.mountpoints) or '-'} | {item.write_mbps:.1f} | "
+            f"{item.avg_write_mbps:.1f} | {item.write_iops:.0f} | {item.read_mbps:.1f} | {busy} |"
+        )
+    return "\n".join(lines)
+
+
+def update_io_display() -> str:
+    """
+    更新磁盘 I/O 显示（后台采样未运行时由界面定时器驱动采样）
+
+    :return: Markdown格式的 I/O 信息
+    """
+    if not disk_io_sampler.running:
+        disk_io_sampler.sample_once()
+    return format_disk_io(disk_io_sampler.latest())
+
+
 def _validate_inputs(dir_path: str, file_name: str, file_size_str: str) -> Tuple[bool, str]:
     """
     验证输入参数
@@ -111,18 +285,36 @@ def generate_file_handler(
     file_size_str: str,
     file_size_unit: str,
     disk_unit: str,
+    allocation_mode: str = DEFAULT_ALLOCATION_MODE,
+    content_pattern: str = DEFAULT_CONTENT_PATTERN,
+    resume: bool = False,
+    io_mode: str = DEFAULT_IO_MODE,
+    durability: str = DEFAULT_DURABILITY,
+    sync_interval_mb: float = DEFAULT_SYNC_INTERVAL // UNIT_MAPPING["MB"],
 ) -> Tuple[str, str]:
     """
     文件生成处理函数
     
+    验证通过后把任务提交到任务队列并立即返回任务ID，不占用界面的事件处理线程；
+    进度（已写入大小、MB/s、预计剩余时间）由任务列表定时轮询显示。
+    
     :param dir_path: 保存目录路径
     :param file_name: 文件名
     :param file_size_str: 文件大小字符串
     :param file_size_unit: 文件大小单位
     :param disk_unit: 磁盘显示单位
-    :return: (结果消息, 磁盘信息Markdown)
+    :param allocation_mode: 分配模式（stream, preallocate, sparse）
+    :param content_pattern: 内容模式（zeros, random, compressible, unique）
+    :param resume: 是否从检查点继续生成已存在的文件
+    :param io_mode: I/O 模式（buffered, direct, dropbehind）
+    :param durability: 持久化策略（none, end, interval, chunk）
+    :param sync_interval_mb: interval 策略的落盘间隔（MB）
+    :return: (提交结果消息, 磁盘信息Markdown)
     """
-    logger.info(f"收到文件生成请求: 目录={dir_path}, 文件名={file_name}, 大小={file_size_str} {file_size_unit}")
+    logger.info(
+        f"收到文件生成请求: 目录={dir_path}, 文件名={file_name}, "
+        f"大小={file_size_str} {file_size_unit}, 分配模式={allocation_mode}, 内容模式={content_pattern}"
+    )
     
     # 验证输入
     is_valid, error_msg = _validate_inputs(dir_path, file_name, file_size_str)
@@ -145,25 +337,221 @@ def generate_file_handler(
     # 构建完整文件路径
     file_path = dir_path_obj / file_name
     
-    # 检查文件是否已存在
-    if file_path.exists():
-        error_msg = f"❌ 错误：文件已存在：{file_path}"
+    if durability == 'interval' and not (sync_interval_mb and sync_interval_mb > 0):
+        error_msg = "❌ 错误：落盘间隔必须大于0！"
         logger.warning(error_msg)
         return error_msg, update_disk_display(disk_unit)
     
-    # 生成文件
-    result = generate_file_with_progress(str(file_path), file_size, file_size_unit, None)
+    # 提交到任务队列后立即返回，进度由界面定时轮询；已存在的文件由任务管理器拒绝（续传时要求存在检查点）
+    try:
+        job = job_manager.submit(
+            str(file_path), file_size, file_size_unit, allocation_mode, content_pattern,
+            resume=resume, io_mode=io_mode, durability=durability,
+            sync_interval=int((sync_interval_mb or 0) * UNIT_MAPPING["MB"]),
+        )
+    except ValueError as e:
+        logger.warning(f"提交任务失败: {e}")
+        return f"❌ 错误：{e}", change_disk_unit(disk_unit)
+    return f"📋 任务已提交，任务ID: {job.job_id}\n文件路径: {file_path}", change_disk_unit(disk_unit)
+
+
+def format_jobs(jobs: List[Job], unit: str) -> str:
+    """
+    格式化任务列表为Markdown
+
+    :param jobs: 任务列表
+    :param unit: 显示单位
+    :return: Markdown格式的任务列表
+    """
+    if not jobs:
+        return "暂无任务"
+    lines = []
+    for job in reversed(jobs):
+        if job.kind == JOB_KIND_FILL:
+            target = f"填充 {job.file_path}"
+        elif job.kind == JOB_KIND_TREE:
+            target = f"目录树 {job.file_path}"
+        else:
+            target = Path(job.file_path).name
+        line = f"- `{job.job_id}` **{JOB_STATUS_LABELS.get(job.status, job.status)}** {target}"
+        if job.finished:
+            line += f"：{job.message.splitlines()[0] if job.message else ''}"
+        elif job.progress is not None and job.kind == JOB_KIND_TREE:
+            # 目录树任务的进度按文件数上报
+            line += f"：{job.progress.percent}%（{job.progress.bytes_written:,} / {job.progress.total_bytes:,} 个文件）"
+        elif job.progress is not None:
+            line += f"：{format_progress(job.progress, unit)}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def job_action_handler(job_id: str, action: str, disk_unit: str) -> Tuple[str, str]:
+    """
+    任务操作处理函数（取消 / 暂停 / 恢复）
+
+    :param job_id: 任务 ID
+    :param action: 操作（cancel, pause, resume）
+    :param disk_unit: 显示单位
+    :return: (操作结果消息, 任务列表Markdown)
+    """
+    actions = {"cancel": job_manager.cancel, "pause": job_manager.pause, "resume": job_manager.resume}
+    job_id = (job_id or "").strip()
+    if not job_id:
+        return "❌ 错误：请输入任务ID！", format_jobs(job_manager.list_jobs(), disk_unit)
+    try:
+        job = actions[action](job_id)
+    except ValueError as e:
+        return f"❌ 错误：{e}", format_jobs(job_manager.list_jobs(), disk_unit)
+    return f"✅ 任务 {job.job_id}: {JOB_STATUS_LABELS.get(job.status, job.status)}", format_jobs(job_manager.list_jobs(), disk_unit)
+
+
+def generate_tree_handler(
+    dir_path: str,
+    file_count: float,
+    fanout: float,
+    depth: float,
+    file_size_kb: float,
+    distribution: str,
+    content_pattern: str,
+    disk_unit: str,
+) -> Tuple[str, str]:
+    """
+    小文件目录树生成处理函数
+
+    :param dir_path: 根目录
+    :param file_count: 文件总数
+    :param fanout: 每级子目录数
+    :param depth: 目录层数
+    :param file_size_kb: 平均文件大小（KB）
+    :param distribution: 大小分布
+    :param content_pattern: 内容模式
+    :param disk_unit: 磁盘显示单位
+    :return: (提交结果消息, 磁盘信息Markdown)
+    """
+    logger.info(f"收到目录树生成请求: 目录={dir_path}, 文件数={file_count}, 子目录数={fanout}, 层数={depth}")
+    if not dir_path:
+        return "❌ 错误：请先填写保存路径！", update_disk_display(disk_unit)
     
-    # 更新磁盘信息
-    disk_info = update_disk_display(disk_unit)
+    # 百万级文件需要数分钟，提交到任务队列，不占用 Gradio 的事件处理线程，可在任务列表中暂停和取消
+    try:
+        job = job_manager.submit_tree(
+            dir_path,
+            file_count=int(file_count or 0),
+            fanout=int(fanout or 0),
+            depth=int(depth or 0),
+            file_size=int((file_size_kb or 0) * UNIT_MAPPING["KB"]),
+            distribution=distribution,
+            pattern=content_pattern,
+        )
+    except ValueError as e:
+        logger.warning(f"提交目录树任务失败: {e}")
+        return f"❌ 错误：{e}", update_disk_display(disk_unit)
+    return f"📋 目录树任务已提交，任务ID: {job.job_id}\n根目录: {dir_path}", update_disk_display(disk_unit)
+
+
+def format_chunk_tunings(tunings: List[ChunkTuning]) -> str:
+    """
+    格式化块大小调优结果为Markdown
+
+    :param tunings: 调优结果列表
+    :return: Markdown格式的调优结果
+    """
+    if not tunings:
+        return f"尚未调优，生成文件使用默认块大小 {CHUNK_SIZE // UNIT_MAPPING['MB']} MB"
+    lines = []
+    for tuning in tunings:
+        lines.append(
+            f"**{tuning.directory}**（设备 {tuning.device}）：选用 **{tuning.chunk_size // UNIT_MAPPING['KB']} KB**"
+        )
+        for result in tuning.results:
+            marker = " ✅" if result.chunk_size == tuning.chunk_size else ""
+            lines.append(
+                f"- {result.chunk_size // UNIT_MAPPING['KB']} KB：{result.throughput_mbps:.1f} MB/s{marker}"
+            )
+    return "\n".join(lines)
+
+
+def tune_chunk_size_handler(dir_path: str, io_mode: str) -> str:
+    """
+    块大小调优处理函数：探测保存路径所在设备，结果按设备缓存，之后在该设备上生成文件时使用
+
+    :param dir_path: 保存路径
+    :param io_mode: I/O 模式
+    :return: 调优结果Markdown
+    """
+    if not dir_path:
+        return "❌ 错误：请先填写保存路径！"
+    is_valid, error_msg, dir_path_obj = _validate_directory(dir_path)
+    if not is_valid:
+        return error_msg
+    try:
+        chunk_size_tuner.tune(str(dir_path_obj), io_mode)
+    except (ValueError, OSError) as e:
+        logger.error(f"块大小调优失败: {e}")
+        return f"❌ 块大小调优失败：{e}"
+    return format_chunk_tunings(chunk_size_tuner.tunings())
+
+
+FILL_TARGET_PERCENT = "目标使用率 (%)"
+FILL_TARGET_FREE = "目标剩余空间"
+
+
+def _parse_fill_target(target_type: str, target_value_str: str, target_unit: str) -> Tuple[bool, str, dict]:
+    """
+    解析填充目标
+
+    :param target_type: 目标类型（目标使用率 / 目标剩余空间）
+    :param target_value_str: 目标值字符串
+    :param target_unit: 目标剩余空间的单位
+    :return: (是否有效, 错误消息, fill_to_target 的目标参数)
+    """
+    try:
+        target_value = float(target_value_str)
+    except (TypeError, ValueError):
+        return False, "❌ 错误：目标值必须是数字！", {}
+    if target_type == FILL_TARGET_PERCENT:
+        if not 0 < target_value <= 100:
+            return False, "❌ 错误：目标使用率必须在 0-100 之间！", {}
+        return True, "", {"target_percent": target_value}
+    if target_value < 0:
+        return False, "❌ 错误：目标剩余空间不能为负数！", {}
+    return True, "", {"target_free_bytes": int(target_value * UNIT_MAPPING[target_unit])}
+
+
+def fill_target_handler(
+    mountpoint: str,
+    target_type: str,
+    target_value_str: str,
+    target_unit: str,
+    content_pattern: str,
+    disk_unit: str,
+) -> Tuple[str, str]:
+    """
+    填充到目标处理函数
+
+    :param mountpoint: 挂载点
+    :param target_type: 目标类型（目标使用率 / 目标剩余空间）
+    :param target_value_str: 目标值字符串
+    :param target_unit: 目标剩余空间的单位
+    :param content_pattern: 内容模式
+    :param disk_unit: 磁盘显示单位
+    :return: (提交结果消息, 磁盘信息Markdown)
+    """
+    logger.info(f"收到填充请求: 挂载点={mountpoint}, {target_type}={target_value_str} {target_unit}")
+    is_valid, error_msg, dir_path_obj = _validate_directory(mountpoint)
+    if is_valid:
+        is_valid, error_msg, target = _parse_fill_target(target_type, target_value_str, target_unit)
+    if not is_valid:
+        logger.warning(f"填充参数验证失败: {error_msg}")
+        return error_msg, update_disk_display(disk_unit)
     
-    if "成功" in result:
-        success_msg = f"✅ {result}\n文件路径: {file_path}"
-        logger.info(success_msg)
-        return success_msg, disk_info
-    else:
-        logger.error(f"文件生成失败: {result}")
-        return f"❌ {result}", disk_info
+    # 与文件生成一样提交到任务队列，可在任务列表中查看进度、暂停和取消
+    try:
+        job = job_manager.submit_fill(str(dir_path_obj), pattern=content_pattern, **target)
+    except ValueError as e:
+        logger.warning(f"提交填充任务失败: {e}")
+        return f"❌ 错误：{e}", update_disk_display(disk_unit)
+    return f"📋 填充任务已提交，任务ID: {job.job_id}\n挂载点: {dir_path_obj}", update_disk_display(disk_unit)
 
 
 def create_interface():
@@ -209,8 +597,103 @@ def create_interface():
                             label="单位",
                         )
                     
+                    allocation_mode_input = gr.Radio(
+                        choices=list(ALLOCATION_MODES),
+                        value=DEFAULT_ALLOCATION_MODE,
+                        label="分配模式",
+                        info="stream: 顺序写入零数据；preallocate: 立即预留磁盘块（不支持时回退为 stream）；sparse: 稀疏文件，仅设置大小",
+                    )
+                    
+                    content_pattern_input = gr.Dropdown(
+                        choices=list(CONTENT_PATTERNS),
+                        value=DEFAULT_CONTENT_PATTERN,
+                        label="内容模式",
+                        info="zeros: 全零；random: 伪随机（不可压缩）；compressible: 约 2:1 可压缩；unique: 每块唯一（抗去重）",
+                    )
+                    
+                    io_mode_input = gr.Radio(
+                        choices=list(IO_MODES),
+                        value=DEFAULT_IO_MODE,
+                        label="I/O 模式",
+                        info="buffered: 经过页缓存；direct: O_DIRECT 绕过页缓存（不支持时回退）；dropbehind: 写后丢弃缓存，限制脏页",
+                    )
+                    
+                    with gr.Row():
+                        durability_input = gr.Dropdown(
+                            choices=list(DURABILITY_MODES),
+                            value=DEFAULT_DURABILITY,
+                            scale=3,
+                            label="持久化策略",
+                            info="none: 不主动落盘；end: 写完后落盘；interval: 每 N MB 落盘；chunk: 每块落盘",
+                        )
+                        sync_interval_input = gr.Number(
+                            value=DEFAULT_SYNC_INTERVAL // UNIT_MAPPING["MB"],
+                            minimum=1,
+                            precision=0,
+                            scale=1,
+                            label="落盘间隔 (MB)",
+                        )
+                    
+                    resume_input = gr.Checkbox(
+                        value=False,
+                        label="断点续传",
+                        info="文件已存在且有检查点（.ftckpt）时，从上次完整写入的位置继续生成",
+                    )
+                    
                     generate_btn = gr.Button("开始生成文件", variant="primary", size="lg")
                 
+                # 填充到目标区域
+                with gr.Accordion("🎯 填充到目标使用率", open=False):
+                    fill_mountpoint_input = gr.Textbox(
+                        label="挂载点",
+                        placeholder="例如: /data",
+                        value="",
+                    )
+                    fill_target_type = gr.Radio(
+                        choices=[FILL_TARGET_PERCENT, FILL_TARGET_FREE],
+                        value=FILL_TARGET_PERCENT,
+                        label="目标类型",
+                    )
+                    with gr.Row():
+                        fill_target_value = gr.Textbox(
+                            label="目标值",
+                            placeholder="例如: 95 或 500",
+                            scale=3,
+                            value="",
+                        )
+                        fill_target_unit = gr.Dropdown(
+                            choices=["KB", "MB", "GB", "TB"],
+                            value=DEFAULT_UNIT,
+                            scale=1,
+                            label="剩余空间单位",
+                        )
+                    fill_btn = gr.Button("开始填充", variant="primary")
+                
+                # 小文件目录树区域
+                with gr.Accordion("🌲 小文件目录树", open=False):
+                    gr.Markdown("在保存路径下生成大量小文件组成的嵌套目录树，用于耗尽 inode 和测试元数据性能")
+                    with gr.Row():
+                        tree_files_input = gr.Number(value=DEFAULT_TREE_FILES, minimum=0, precision=0, label="文件总数")
+                        tree_fanout_input = gr.Number(value=DEFAULT_TREE_FANOUT, minimum=1, precision=0, label="每级子目录数")
+                        tree_depth_input = gr.Number(value=DEFAULT_TREE_DEPTH, minimum=0, precision=0, label="目录层数")
+                    with gr.Row():
+                        tree_size_input = gr.Number(
+                            value=DEFAULT_TREE_FILE_SIZE // UNIT_MAPPING["KB"], minimum=0, label="平均文件大小 (KB)"
+                        )
+                        tree_distribution_input = gr.Dropdown(
+                            choices=list(TREE_SIZE_DISTRIBUTIONS),
+                            value=TREE_SIZE_DISTRIBUTIONS[0],
+                            label="大小分布",
+                            info="fixed: 固定大小；uniform: 0 到 2 倍平均值；lognormal: 多数很小、少数较大",
+                        )
+                    tree_btn = gr.Button("生成目录树", variant="primary")
+                
+                # 块大小调优区域
+                with gr.Accordion("🔧 块大小调优", open=False):
+                    gr.Markdown("在保存路径所在设备上用不同块大小各写入一小段数据并落盘，按设备缓存最快的块大小")
+                    chunk_tuning_md = gr.Markdown(value=format_chunk_tunings(chunk_size_tuner.tunings()))
+                    tune_btn = gr.Button("调优块大小", variant="secondary")
+                
                 # 生成进度和结果
                 with gr.Group():
                     gr.Markdown("### ⚙️ 文件生成进度")
@@ -221,6 +704,23 @@ def create_interface():
                         interactive=False,
                         lines=3,
                     )
+                
+                # 任务队列
+                with gr.Group():
+                    gr.Markdown("### 📋 任务列表")
+                    
+                    jobs_md = gr.Markdown(value=format_jobs(job_manager.list_jobs(), DEFAULT_UNIT))
+                    
+                    with gr.Row():
+                        job_id_input = gr.Textbox(
+                            label="任务ID",
+                            placeholder="例如: 3f2a9c1b",
+                            scale=2,
+                            value="",
+                        )
+                        cancel_btn = gr.Button("取消", variant="stop", scale=1)
+                        pause_btn = gr.Button("暂停", variant="secondary", scale=1)
+                        resume_btn = gr.Button("恢复", variant="secondary", scale=1)
             
             with gr.Column(scale=1):
                 # 磁盘监控区域
@@ -239,24 +739,88 @@ def create_interface():
                     )
                     
                     refresh_btn = gr.Button("刷新", variant="secondary")
+                
+                # 磁盘 I/O 区域
+                with gr.Group():
+                    gr.Markdown("### 📈 磁盘 I/O")
+                    
+                    io_md = gr.Markdown(value=format_disk_io(disk_io_sampler.latest()))
         
         # 事件绑定
         generate_btn.click(
             fn=generate_file_handler,
-            inputs=[dir_path_input, file_name_input, file_size_input, file_size_unit, disk_unit],
+            inputs=[
+                dir_path_input,
+                file_name_input,
+                file_size_input,
+                file_size_unit,
+                disk_unit,
+                allocation_mode_input,
+                content_pattern_input,
+                resume_input,
+                io_mode_input,
+                durability_input,
+                sync_interval_input,
+            ],
             outputs=[result_output, disk_info_md],
         )
         
+        fill_btn.click(
+            fn=fill_target_handler,
+            inputs=[
+                fill_mountpoint_input,
+                fill_target_type,
+                fill_target_value,
+                fill_target_unit,
+                content_pattern_input,
+                disk_unit,
+            ],
+            outputs=[result_output, disk_info_md],
+        )
+        
+        tree_btn.click(
+            fn=generate_tree_handler,
+            inputs=[
+                dir_path_input,
+                tree_files_input,
+                tree_fanout_input,
+                tree_depth_input,
+                tree_size_input,
+                tree_distribution_input,
+                content_pattern_input,
+                disk_unit,
+            ],
+            outputs=[result_output, disk_info_md],
+        )
+        
+        tune_btn.click(
+            fn=tune_chunk_size_handler,
+            inputs=[dir_path_input, io_mode_input],
+            outputs=[chunk_tuning_md],
+        )
+        
+        for button, action in ((cancel_btn, "cancel"), (pause_btn, "pause"), (resume_btn, "resume")):
+            button.click(
+                fn=lambda job_id, unit, action=action: job_action_handler(job_id, action, unit),
+                inputs=[job_id_input, disk_unit],
+                outputs=[result_output, jobs_md],
+            )
+        
         disk_unit_state = gr.State(value=DEFAULT_UNIT)
         
         def update_disk_with_unit(unit: str) -> str:
-            """更新磁盘显示并保存单位状态"""
+            """切换显示单位并保存单位状态"""
+            disk_unit_state.value = unit
+            return change_disk_unit(unit)
+        
+        def force_refresh(unit: str) -> str:
+            """手动刷新：强制重新扫描全部分区"""
             disk_unit_state.value = unit
-            return update_disk_display(unit)
+            return update_disk_display(unit, force=True)
         
         def auto_refresh() -> str:
-            """自动刷新磁盘信息"""
-            return update_disk_display(disk_unit_state.value)
+            """自动刷新磁盘信息（后台采样运行时只读取采样结果）"""
+            return change_disk_unit(disk_unit_state.value)
         
         disk_unit.change(
             fn=update_disk_with_unit,
@@ -265,7 +829,7 @@ def create_interface():
         )
         
         refresh_btn.click(
-            fn=update_disk_with_unit,
+            fn=force_refresh,
             inputs=[disk_unit],
             outputs=[disk_info_md],
         )
@@ -275,5 +839,26 @@ def create_interface():
             fn=auto_refresh,
             outputs=[disk_info_md],
         )
+        
+        # 按 I/O 采样间隔刷新设备吞吐量，观察生成任务是否跑满磁盘
+        io_timer = gr.Timer(IO_SAMPLE_INTERVAL)
+        io_timer.tick(
+            fn=update_io_display,
+            outputs=[io_md],
+        )
+        
+        # 按采样间隔定时刷新，便于观察写入速率
+        disk_timer = gr.Timer(DISK_SAMPLE_INTERVAL)
+        disk_timer.tick(
+            fn=auto_refresh,
+            outputs=[disk_info_md],
+        )
+        
+        # 定时轮询任务状态与进度
+        jobs_timer = gr.Timer(JOB_POLL_INTERVAL)
+        jobs_timer.tick(
+            fn=lambda: format_jobs(job_manager.list_jobs(), disk_unit_state.value),
+            outputs=[jobs_md],
+        )
     
     return app
@@ -0,0 +1,89 @@
+"""文件分配模式测试"""
+import errno
+import os
+import sys
+import tempfile
+
+import pytest
+
+from filetools.models import file_generator
+from filetools.models.file_generator import generate_file, generate_file_with_progress
+
+
+class TestAllocationModes:
+    """分配模式测试类"""
+    
+    def test_stream_mode(self):
+        """测试 stream 模式"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "stream.bin")
+            stats = generate_file(file_path, 4096, None, allocation="stream")
+            assert stats.allocation_mode == "stream"
+            assert os.path.getsize(file_path) == 4096
+    
+    def test_sparse_mode(self):
+        """测试 sparse 模式只设置文件大小"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "sparse.bin")
+            size = 64 * 1024 * 1024
+            stats = generate_file(file_path, size, None, allocation="sparse")
+            assert stats.allocation_mode == "sparse"
+            assert stats.chunks_written == 0
+            assert os.path.getsize(file_path) == size
+            if sys.platform != "win32":
+                assert os.stat(file_path).st_blocks * 512 < size
+    
+    @pytest.mark.skipif(not hasattr(os, "posix_fallocate"), reason="平台不支持 posix_fallocate")
+    def test_preallocate_mode(self):
+        """测试 preallocate 模式"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "prealloc.bin")
+            size = 4 * 1024 * 1024
+            stats = generate_file(file_path, size, None, allocation="preallocate")
+            assert stats.allocation_mode in ("preallocate", "stream")
+            assert os.path.getsize(file_path) == size
+    
+    def test_preallocate_fallback_to_stream(self, monkeypatch):
+        """测试文件系统不支持预分配时回退为 stream"""
+        def unsupported(fd, offset, length):
+            raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+        
+        monkeypatch.setattr(file_generator.os, "posix_fallocate", unsupported, raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "fallback.bin")
+            stats = generate_file(file_path, 8192, None, allocation="preallocate")
+            assert stats.requested_allocation == "preallocate"
+            assert stats.allocation_mode == "stream"
+            assert stats.chunks_written == 1
+            assert os.path.getsize(file_path) == 8192
+    
+    def test_preallocate_no_space_raises(self, monkeypatch):
+        """测试磁盘空间不足时不回退而是报错"""
+        def no_space(fd, offset, length):
+            raise OSError(errno.ENOSPC, "No space left on device")
+        
+        monkeypatch.setattr(file_generator.os, "posix_fallocate", no_space, raising=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(OSError):
+                generate_file(os.path.join(tmpdir, "full.bin"), 8192, None, allocation="preallocate")
+    
+    def test_invalid_mode(self):
+        """测试无效分配模式"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                generate_file(os.path.join(tmpdir, "x.bin"), 1024, None, allocation="invalid")
+    
+    def test_with_progress_reports_mode(self):
+        """测试结果消息包含实际分配模式"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "sparse.bin")
+            result = generate_file_with_progress(file_path, 1, "MB", None, "sparse")
+            assert "成功" in result
+            assert "sparse" in result
+    
+    def test_with_progress_invalid_mode(self):
+        """测试无效分配模式返回错误消息"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = generate_file_with_progress(os.path.join(tmpdir, "x.bin"), 1, "MB", None, "bad")
+            assert "失败" in result
+            assert "分配模式" in result
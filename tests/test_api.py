@@ -0,0 +1,144 @@
+"""JSON 接口测试"""
+import os
+import tempfile
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from filetools import api
+from filetools.models.disk_snapshot import DiskSnapshotCache
+from filetools.models.disk_usage import DiskUsage
+from filetools.models.job_manager import JobManager
+from filetools.server import create_app
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """接口使用独立的单线程任务管理器"""
+    manager = JobManager(max_workers=1, queue_limit=2)
+    monkeypatch.setattr(api, "job_manager", manager)
+    yield manager
+    manager.shutdown()
+
+
+@pytest.fixture
+def client(manager):
+    return TestClient(create_app(with_ui=False))
+
+
+def wait_finished(client, job_id: str, timeout: float = 10.0) -> dict:
+    """轮询直到任务结束"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = client.get(f"/api/jobs/{job_id}").json()
+        if job["finished"]:
+            return job
+        time.sleep(0.02)
+    raise AssertionError("任务未在超时时间内结束")
+
+
+class TestJobsApi:
+    """任务接口测试"""
+
+    def test_submit_and_status(self, client, tmpdir_path):
+        """提交后立即返回任务，结束后状态包含结果码与写入量"""
+        path = os.path.join(tmpdir_path, "a.bin")
+        response = client.post("/api/jobs", json={"file_path": path, "file_size": 2, "unit": "MB"})
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        job = wait_finished(client, job_id)
+        assert job["status"] == "completed"
+        assert job["error_code"] == "ok"
+        assert job["bytes_written"] == job["total_bytes"] == 2 * 1024 * 1024
+        assert job["percent"] == 100
+        assert os.path.getsize(path) == 2 * 1024 * 1024
+        assert [item["job_id"] for item in client.get("/api/jobs").json()["jobs"]] == [job_id]
+
+    def test_failed_job_error_code(self, client, tmpdir_path, monkeypatch):
+        """生成失败时返回稳定的错误码而不是消息文本"""
+        from filetools.models import file_generator
+        from filetools.models.space_check import SpaceCheck
+
+        monkeypatch.setattr(
+            file_generator, "check_free_space",
+            lambda path, size, allocation: SpaceCheck("/", size, 0),
+        )
+        response = client.post("/api/jobs", json={"file_path": os.path.join(tmpdir_path, "a.bin"), "file_size": 1})
+        job = wait_finished(client, response.json()["job_id"])
+        assert job["status"] == "failed"
+        assert job["error_code"] == "insufficient_space"
+
+    @pytest.mark.parametrize("body", [
+        {"file_path": "/tmp/a.bin", "file_size": 1, "unit": "PB"},
+        {"file_path": "/tmp/a.bin", "file_size": 0},
+        {"file_path": "  ", "file_size": 1},
+        {"file_path": "/tmp/a.bin", "file_size": 1, "pattern": "ones"},
+    ])
+    def test_invalid_argument(self, client, body):
+        """参数不合法时返回 400 与 invalid_argument"""
+        response = client.post("/api/jobs", json=body)
+        assert response.status_code == 400
+        assert response.json()["error"]["code"] == "invalid_argument"
+
+    def test_invalid_request(self, client):
+        """请求体格式错误时返回 422 与 invalid_request"""
+        response = client.post("/api/jobs", json={"file_size": "big"})
+        assert response.status_code == 422
+        assert response.json()["error"]["code"] == "invalid_request"
+
+    def test_unknown_job(self, client):
+        """任务不存在时返回 404 与 job_not_found"""
+        assert client.get("/api/jobs/missing").json()["error"]["code"] == "job_not_found"
+        response = client.post("/api/jobs/missing/cancel")
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "job_not_found"
+
+    def test_existing_file(self, client, manager, tmpdir_path):
+        """文件已存在时返回 409 与 file_exists，与界面一致；续传时要求存在检查点"""
+        path = os.path.join(tmpdir_path, "a.bin")
+        with open(path, 'wb') as file:
+            file.write(b"x")
+        for body in ({"file_path": path, "file_size": 1}, {"file_path": path, "file_size": 1, "resume": True}):
+            response = client.post("/api/jobs", json=body)
+            assert response.status_code == 409
+            assert response.json()["error"]["code"] == "file_exists"
+        assert manager.list_jobs() == []
+        with open(path + ".ftckpt", 'w') as file:
+            file.write("{}")
+        response = client.post("/api/jobs", json={"file_path": path, "file_size": 1, "resume": True})
+        assert response.status_code == 202
+        wait_finished(client, response.json()["job_id"])
+
+    def test_cancel_finished_job(self, client, tmpdir_path):
+        """已结束的任务不能取消"""
+        response = client.post("/api/jobs", json={"file_path": os.path.join(tmpdir_path, "a.bin"), "file_size": 1})
+        job_id = response.json()["job_id"]
+        wait_finished(client, job_id)
+        response = client.post(f"/api/jobs/{job_id}/cancel")
+        assert response.status_code == 409
+        assert response.json()["error"]["code"] == "job_finished"
+
+
+class TestDisksApi:
+    """磁盘快照接口测试"""
+
+    def test_snapshot(self, client, monkeypatch):
+        """返回快照缓存中的磁盘使用情况"""
+        cache = DiskSnapshotCache(loader=lambda: [
+            DiskUsage("sda1", 1000, 400, 40.0, "/", inodes_total=10, inodes_free=4, fstype="ext4"),
+            DiskUsage("sdb1", 2000, 100, 5.0, "/data"),
+        ])
+        monkeypatch.setattr(api, "disk_snapshot_cache", cache)
+        disks = client.get("/api/disks").json()["disks"]
+        assert [disk["mountpoint"] for disk in disks] == ["/", "/data"]
+        assert disks[0]["free"] == 600
+        assert disks[0]["inodes_free"] == 4
+        filtered = client.get("/api/disks", params={"mountpoint": "/data"}).json()["disks"]
+        assert [disk["device"] for disk in filtered] == ["sdb1"]
@@ -0,0 +1,85 @@
+"""批量文件生成测试"""
+import os
+import tempfile
+import threading
+
+import pytest
+
+from filetools.models import batch_generator
+from filetools.models.batch_generator import generate_files_batch, get_device_id
+
+
+class TestBatchGenerator:
+    """批量生成测试类"""
+    
+    def test_generate_multiple_files(self):
+        """测试批量生成多个文件"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            jobs = [(os.path.join(tmpdir, f"file_{i}.bin"), (i + 1) * 1024) for i in range(10)]
+            result = generate_files_batch(jobs, max_workers=4)
+            assert len(result.files) == 10
+            assert not result.failed
+            for path, size in jobs:
+                assert os.path.getsize(path) == size
+            assert result.bytes_written == sum(size for _, size in jobs)
+            assert result.aggregate_mbps > 0
+    
+    def test_results_keep_submission_order(self):
+        """测试结果顺序与提交顺序一致"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            jobs = [(os.path.join(tmpdir, f"f{i}.bin"), 1024) for i in range(5)]
+            result = generate_files_batch(jobs)
+            assert [r.path for r in result.files] == [path for path, _ in jobs]
+    
+    def test_per_file_throughput(self):
+        """测试单文件速度"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = generate_files_batch([(os.path.join(tmpdir, "a.bin"), 4 * 1024 * 1024)])
+            assert result.files[0].success
+            assert result.files[0].throughput_mbps > 0
+    
+    def test_per_device_limit(self, monkeypatch):
+        """测试同一设备的并发数不超过限制"""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+        original = batch_generator.generate_file
+        
+        def tracking_generate(*args, **kwargs):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            try:
+                return original(*args, **kwargs)
+            finally:
+                with lock:
+                    active -= 1
+        
+        monkeypatch.setattr(batch_generator, "generate_file", tracking_generate)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            jobs = [(os.path.join(tmpdir, f"f{i}.bin"), 1024 * 1024) for i in range(12)]
+            generate_files_batch(jobs, max_workers=8, per_device_limit=2)
+        assert peak <= 2
+    
+    def test_failed_job_is_reported(self):
+        """测试失败任务被记录而不影响其他任务"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            jobs = [
+                (os.path.join(tmpdir, "ok.bin"), 1024),
+                (os.path.join(tmpdir, "bad.bin"), 1024),
+            ]
+            result = generate_files_batch(jobs, pattern="invalid")
+            assert len(result.failed) == 2
+            assert "内容模式" in result.failed[0].error
+    
+    def test_invalid_concurrency(self):
+        """测试无效的并发参数"""
+        with pytest.raises(ValueError):
+            generate_files_batch([], max_workers=0)
+    
+    def test_device_id_for_missing_file(self):
+        """测试不存在的文件使用父目录的设备 ID"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = os.path.join(tmpdir, "a", "b", "c.bin")
+            assert get_device_id(missing) == os.stat(tmpdir).st_dev
@@ -0,0 +1,95 @@
+"""基准套件测试"""
+import os
+import tempfile
+
+import pytest
+
+from filetools.models.bench_suite import compare_reports, load_baseline, run_suite, save_baseline
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def _report(*results):
+    return {"version": 1, "results": [dict(item) for item in results]}
+
+
+def _result(name, value, higher_is_better=True, tolerance=0.0):
+    return {"name": name, "value": value, "unit": "", "higher_is_better": higher_is_better, "tolerance": tolerance}
+
+
+class TestRunSuite:
+    """基准套件运行测试"""
+
+    def test_small_suite(self, tmpdir_path):
+        """小规模运行生成吞吐量、内存和扫描延迟结果，并能保存和读取基线"""
+        report = run_suite(
+            {"tmp": tmpdir_path}, sizes_mb=[2], chunk_sizes_mb=[1, 4], patterns=["zeros"], mount_counts=[3], repeat=1
+        )
+        names = [item["name"] for item in report["results"]]
+        assert names == [
+            "generate/tmp/size=2MB/chunk=1MB/pattern=zeros/mbps",
+            "generate/tmp/size=2MB/chunk=1MB/pattern=zeros/rss",
+            "disk_scan/tmp/mounts=3/median",
+            "disk_scan/tmp/mounts=3/max",
+        ]
+        assert all(item["value"] >= 0 for item in report["results"])
+        assert os.listdir(tmpdir_path) == []
+        path = os.path.join(tmpdir_path, "baseline.json")
+        save_baseline(path, report)
+        assert load_baseline(path)["results"] == report["results"]
+
+    def test_missing_directory(self, tmpdir_path):
+        """测试目录不存在时报错"""
+        with pytest.raises(ValueError):
+            run_suite({"tmp": os.path.join(tmpdir_path, "missing")})
+
+    def test_unsupported_version(self, tmpdir_path):
+        """基线版本不一致时报错"""
+        path = os.path.join(tmpdir_path, "baseline.json")
+        save_baseline(path, {"version": 0, "results": []})
+        with pytest.raises(ValueError):
+            load_baseline(path)
+
+
+class TestCompareReports:
+    """基线对比测试"""
+
+    def test_throughput_regression(self):
+        """吞吐量下降超过阈值视为回退"""
+        [comparison] = compare_reports(_report(_result("a", 100.0)), _report(_result("a", 85.0)), threshold=0.1)
+        assert comparison.regressed
+        assert comparison.change == pytest.approx(-0.15)
+
+    def test_within_threshold(self):
+        """阈值以内的波动和变快都不算回退"""
+        comparisons = compare_reports(
+            _report(_result("a", 100.0), _result("b", 100.0)),
+            _report(_result("a", 95.0), _result("b", 150.0)),
+            threshold=0.1,
+        )
+        assert not any(comparison.regressed for comparison in comparisons)
+
+    def test_latency_regression(self):
+        """越小越好的指标上升超过阈值视为回退"""
+        [comparison] = compare_reports(
+            _report(_result("scan", 10.0, higher_is_better=False)),
+            _report(_result("scan", 20.0, higher_is_better=False)),
+        )
+        assert comparison.regressed
+
+    def test_absolute_tolerance(self):
+        """变化量不超过绝对容差时不算回退"""
+        [comparison] = compare_reports(
+            _report(_result("rss", 0.5, higher_is_better=False, tolerance=4.0)),
+            _report(_result("rss", 3.0, higher_is_better=False, tolerance=4.0)),
+        )
+        assert not comparison.regressed
+
+    def test_only_common_cases(self):
+        """只对比两边都存在的用例"""
+        comparisons = compare_reports(_report(_result("a", 1.0)), _report(_result("b", 1.0)))
+        assert comparisons == []
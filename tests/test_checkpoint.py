@@ -0,0 +1,187 @@
+"""断点续传测试"""
+import os
+import tempfile
+
+import pytest
+
+from filetools.models import file_generator
+from filetools.models.checkpoint import GenerationCheckpoint
+from filetools.models.file_generator import generate_file, generate_file_with_progress
+from filetools.models.job_control import JobCancelled, JobControl
+
+CHUNK = 64 * 1024
+
+
+class CancelAfter(JobControl):
+    """在第 n 个块之前取消任务"""
+    
+    def __init__(self, chunks: int):
+        super().__init__()
+        self.remaining = chunks
+    
+    def checkpoint(self):
+        if self.remaining == 0:
+            self.cancel()
+        self.remaining -= 1
+        super().checkpoint()
+
+
+class SimulatedCrash(Exception):
+    """模拟进程崩溃"""
+
+
+class CrashAfter(JobControl):
+    """在第 n 个块之前模拟崩溃"""
+    
+    def __init__(self, chunks: int):
+        super().__init__()
+        self.remaining = chunks
+    
+    def checkpoint(self):
+        if self.remaining == 0:
+            raise SimulatedCrash()
+        self.remaining -= 1
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """使用 64KB 块，每 2 个块更新一次检查点"""
+    monkeypatch.setattr(file_generator, "CHUNK_SIZE", CHUNK)
+    monkeypatch.setattr(file_generator, "CHECKPOINT_INTERVAL", 2 * CHUNK)
+
+
+@pytest.fixture
+def tmpdir_path():
+    """临时目录"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def read(path: str) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+class TestCheckpoint:
+    """检查点读写测试类"""
+    
+    def test_save_and_load(self, tmpdir_path):
+        """测试检查点保存后可以读回"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        checkpoint = GenerationCheckpoint(100, "random", 7, 10, 2.0, bytes_written=50)
+        checkpoint.save(file_path)
+        assert GenerationCheckpoint.path_for(file_path).name == "a.bin.ftckpt"
+        assert GenerationCheckpoint.load(file_path) == checkpoint
+        GenerationCheckpoint.remove(file_path)
+        assert GenerationCheckpoint.load(file_path) is None
+    
+    def test_corrupt_checkpoint_ignored(self, tmpdir_path):
+        """测试损坏的检查点被忽略"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        GenerationCheckpoint.path_for(file_path).write_text("{broken", encoding='utf-8')
+        assert GenerationCheckpoint.load(file_path) is None
+
+
+class TestResume:
+    """断点续传测试类"""
+    
+    @pytest.mark.parametrize("pattern", ["zeros", "random", "unique"])
+    def test_resume_after_crash_matches_full_run(self, tmpdir_path, small_chunks, pattern):
+        """测试崩溃后续传的文件与一次性生成的文件完全相同"""
+        size = 10 * CHUNK + 123
+        crashed = os.path.join(tmpdir_path, "crashed.bin")
+        with pytest.raises(SimulatedCrash):
+            generate_file(crashed, size, pattern=pattern, seed=42, control=CrashAfter(5))
+        checkpoint = GenerationCheckpoint.load(crashed)
+        assert checkpoint.bytes_written == 4 * CHUNK
+        assert checkpoint.seed == 42
+        
+        stats = generate_file(crashed, size, pattern=pattern, resume=True)
+        assert stats.resumed_from == 4 * CHUNK
+        assert stats.pattern_seed == 42
+        assert stats.bytes_written == size
+        assert not GenerationCheckpoint.path_for(crashed).exists()
+        
+        fresh = os.path.join(tmpdir_path, "fresh.bin")
+        generate_file(fresh, size, pattern=pattern, seed=42)
+        assert read(crashed) == read(fresh)
+    
+    def test_resume_truncates_partial_chunk(self, tmpdir_path, small_chunks):
+        """测试续传从最后一个检查点开始，丢弃检查点之后写入的数据"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        with pytest.raises(SimulatedCrash):
+            generate_file(file_path, 8 * CHUNK, pattern="random", seed=1, control=CrashAfter(3))
+        assert os.path.getsize(file_path) == 3 * CHUNK
+        events = []
+        stats = generate_file(file_path, 8 * CHUNK, pattern="random", resume=True, progress_events=events.append)
+        assert stats.resumed_from == 2 * CHUNK
+        assert events[-1].bytes_written == 8 * CHUNK
+    
+    def test_resume_seed_mismatch(self, tmpdir_path, small_chunks):
+        """测试种子与检查点不一致时拒绝续传"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        with pytest.raises(SimulatedCrash):
+            generate_file(file_path, 8 * CHUNK, pattern="random", seed=1, control=CrashAfter(3))
+        with pytest.raises(ValueError, match="seed"):
+            generate_file(file_path, 8 * CHUNK, pattern="random", seed=2, resume=True)
+    
+    def test_resume_shorter_file_starts_over(self, tmpdir_path, small_chunks):
+        """测试文件短于检查点记录时从头开始"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        with pytest.raises(SimulatedCrash):
+            generate_file(file_path, 8 * CHUNK, control=CrashAfter(5))
+        os.truncate(file_path, CHUNK)
+        stats = generate_file(file_path, 8 * CHUNK, resume=True)
+        assert stats.resumed_from == 0
+        assert os.path.getsize(file_path) == 8 * CHUNK
+    
+    def test_cancel_keeps_file_and_checkpoint(self, tmpdir_path, small_chunks):
+        """测试取消续传方式写检查点的任务时保留部分文件，检查点推进到取消位置，续传后与一次性生成的文件相同"""
+        size = 10 * CHUNK + 123
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        with pytest.raises(JobCancelled):
+            generate_file(file_path, size, pattern="unique", seed=3, resume=True, control=CancelAfter(5))
+        assert os.path.getsize(file_path) == 5 * CHUNK
+        assert GenerationCheckpoint.load(file_path).bytes_written == 5 * CHUNK
+        
+        with pytest.raises(JobCancelled):
+            generate_file(file_path, size, pattern="unique", resume=True, control=CancelAfter(2))
+        assert GenerationCheckpoint.load(file_path).bytes_written == 7 * CHUNK
+        
+        stats = generate_file(file_path, size, pattern="unique", resume=True)
+        assert stats.resumed_from == 7 * CHUNK
+        fresh = os.path.join(tmpdir_path, "fresh.bin")
+        generate_file(fresh, size, pattern="unique", seed=3)
+        assert read(file_path) == read(fresh)
+    
+    def test_cancel_without_resume_removes_partial(self, tmpdir_path, small_chunks):
+        """测试未以续传方式提交时，超过检查点间隔的文件取消后也删除部分文件与检查点"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        with pytest.raises(JobCancelled):
+            generate_file(file_path, 10 * CHUNK, control=CancelAfter(5))
+        assert not os.path.exists(file_path)
+        assert not GenerationCheckpoint.path_for(file_path).exists()
+    
+    def test_cancel_small_file_removes_partial(self, tmpdir_path, small_chunks):
+        """测试不写检查点的文件取消后删除部分文件"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        with pytest.raises(JobCancelled):
+            generate_file(file_path, 2 * CHUNK, control=CancelAfter(1))
+        assert not os.path.exists(file_path)
+        assert not GenerationCheckpoint.path_for(file_path).exists()
+    
+    def test_small_file_writes_no_checkpoint(self, tmpdir_path, small_chunks):
+        """测试不超过检查点间隔的文件不写检查点"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        with pytest.raises(SimulatedCrash):
+            generate_file(file_path, 2 * CHUNK, control=CrashAfter(1))
+        assert not GenerationCheckpoint.path_for(file_path).exists()
+    
+    def test_with_progress_reports_resume(self, tmpdir_path, small_chunks):
+        """测试结果消息包含续传起点"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        with pytest.raises(SimulatedCrash):
+            generate_file(file_path, 1024 * 1024, control=CrashAfter(5))
+        result = generate_file_with_progress(file_path, 1, "MB", resume=True)
+        assert "成功" in result
+        assert "续传" in result
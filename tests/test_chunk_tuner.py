@@ -0,0 +1,144 @@
+"""块大小调优测试"""
+import os
+import tempfile
+
+import pytest
+
+from filetools.models import chunk_tuner as chunk_tuner_module
+from filetools.models import file_generator
+from filetools.models.checkpoint import GenerationCheckpoint
+from filetools.models.chunk_tuner import (
+    ChunkProbeResult,
+    ChunkTuner,
+    memory_limited_sizes,
+    pick_chunk_size,
+    probe_chunk_size,
+)
+from filetools.models.file_generator import generate_file
+from filetools.models.metrics import generation_metrics
+from filetools.ui.interface import format_chunk_tunings, tune_chunk_size_handler
+
+KB = 1024
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def tuner(monkeypatch):
+    """使用很小的探测量，并替换全局调优器，避免影响其他测试"""
+    instance = ChunkTuner(sizes=(64 * KB, 128 * KB), probe_bytes=256 * KB)
+    monkeypatch.setattr(file_generator, "chunk_size_tuner", instance)
+    return instance
+
+
+class TestPickChunkSize:
+    """选择块大小测试"""
+
+    def test_pick_fastest(self):
+        """选择速度最快的块大小"""
+        results = [ChunkProbeResult(KB, 100, 1.0), ChunkProbeResult(2 * KB, 200, 1.0), ChunkProbeResult(4 * KB, 150, 1.0)]
+        assert pick_chunk_size(results) == 2 * KB
+
+    def test_prefer_smaller_within_tolerance(self):
+        """速度相差在容差内时选择更小的块"""
+        results = [ChunkProbeResult(KB, 97, 1.0), ChunkProbeResult(2 * KB, 100, 1.0)]
+        assert pick_chunk_size(results, tolerance=0.05) == KB
+        assert pick_chunk_size(results, tolerance=0.01) == 2 * KB
+
+    def test_memory_budget(self, monkeypatch):
+        """超过内存预算的块大小不参与探测，至少保留最小的一个"""
+        monkeypatch.setattr(chunk_tuner_module, "CHUNK_MEMORY_FRACTION", 1e-12)
+        assert memory_limited_sizes((4 * KB, KB)) == [KB]
+
+
+class TestProbe:
+    """探测测试"""
+
+    def test_probe_removes_temp_file(self, tmpdir_path):
+        """探测结束后删除临时文件"""
+        result = probe_chunk_size(tmpdir_path, 64 * KB, 256 * KB)
+        assert result.bytes_written == 256 * KB
+        assert result.throughput_mbps > 0
+        assert os.listdir(tmpdir_path) == []
+
+    def test_probe_not_recorded_in_metrics(self, tmpdir_path):
+        """探测写入不计入累计写入字节数与耗时直方图"""
+        bytes_before = generation_metrics.bytes_written
+        writes_before = generation_metrics.write_latency.snapshot().count
+        flushes_before = generation_metrics.flush_latency.snapshot().count
+        probe_chunk_size(tmpdir_path, 64 * KB, 256 * KB)
+        assert generation_metrics.bytes_written == bytes_before
+        assert generation_metrics.write_latency.snapshot().count == writes_before
+        assert generation_metrics.flush_latency.snapshot().count == flushes_before
+
+    def test_tune_caches_per_device(self, tmpdir_path, tuner):
+        """调优结果按设备缓存，同一设备上的任意路径都能取到"""
+        assert tuner.get(tmpdir_path) is None
+        tuning = tuner.tune(tmpdir_path)
+        assert tuning.chunk_size in (64 * KB, 128 * KB)
+        assert [result.chunk_size for result in tuning.results] == [64 * KB, 128 * KB]
+        assert tuner.get(os.path.join(tmpdir_path, "missing", "file.bin")) is tuning
+        assert tuner.chunk_size_for(tmpdir_path, 1) == tuning.chunk_size
+
+    def test_tune_missing_directory(self, tmpdir_path, tuner):
+        """探测目录不存在时抛出 ValueError"""
+        with pytest.raises(ValueError):
+            tuner.tune(os.path.join(tmpdir_path, "missing"))
+
+
+class TestGenerateWithTunedSize:
+    """生成文件使用调优结果测试"""
+
+    def test_uses_tuned_chunk_size(self, tmpdir_path, tuner):
+        """已调优的设备使用缓存的块大小"""
+        tuning = tuner.tune(tmpdir_path)
+        stats = generate_file(os.path.join(tmpdir_path, "a.bin"), 512 * KB, pattern="random", seed=1)
+        assert stats.chunk_size == tuning.chunk_size
+        assert stats.chunks_written == 512 * KB // tuning.chunk_size
+
+    def test_explicit_chunk_size_wins(self, tmpdir_path, tuner):
+        """显式指定的块大小优先于调优结果"""
+        tuner.tune(tmpdir_path)
+        stats = generate_file(os.path.join(tmpdir_path, "a.bin"), 100 * KB, chunk_size=32 * KB)
+        assert stats.chunk_size == 32 * KB
+        assert stats.chunks_written == 4
+        assert os.path.getsize(os.path.join(tmpdir_path, "a.bin")) == 100 * KB
+
+    def test_resume_keeps_checkpoint_chunk_size(self, tmpdir_path, tuner, monkeypatch):
+        """续传时沿用检查点中的块大小，显式指定不同的块大小时报错"""
+        monkeypatch.setattr(file_generator, "CHECKPOINT_INTERVAL", 128 * KB)
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        with open(file_path, 'wb') as file:
+            file.truncate(128 * KB)
+        GenerationCheckpoint(512 * KB, "zeros", 1, 64 * KB, 2.0, 128 * KB).save(file_path)
+        tuner.tune(tmpdir_path)
+        with pytest.raises(ValueError):
+            generate_file(file_path, 512 * KB, resume=True, chunk_size=32 * KB)
+        stats = generate_file(file_path, 512 * KB, resume=True)
+        assert stats.chunk_size == 64 * KB
+        assert stats.resumed_from == 128 * KB
+
+    def test_invalid_chunk_size(self, tmpdir_path):
+        """块大小必须大于0"""
+        with pytest.raises(ValueError):
+            generate_file(os.path.join(tmpdir_path, "a.bin"), KB, chunk_size=0)
+
+
+class TestTuningUI:
+    """调优界面测试"""
+
+    def test_format_empty(self):
+        """未调优时提示使用默认块大小"""
+        assert "默认块大小" in format_chunk_tunings([])
+
+    def test_handler_shows_results(self, tmpdir_path, monkeypatch):
+        """调优后显示每个块大小的探测速度"""
+        instance = ChunkTuner(sizes=(64 * KB,), probe_bytes=128 * KB)
+        monkeypatch.setattr("filetools.ui.interface.chunk_size_tuner", instance)
+        output = tune_chunk_size_handler(tmpdir_path, "buffered")
+        assert "64 KB" in output and "MB/s" in output
+        assert tune_chunk_size_handler("", "buffered").startswith("❌")
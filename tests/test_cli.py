@@ -0,0 +1,85 @@
+"""命令行入口测试"""
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from filetools import cli
+from filetools.config.logger import shutdown_logging
+
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture(autouse=True)
+def reset_logging():
+    """每个用例结束后移除命令行配置的日志处理器"""
+    yield
+    shutdown_logging()
+
+
+class TestCli:
+    """命令行子命令测试"""
+
+    def test_generate(self, tmpdir_path, capsys):
+        """generate 子命令生成指定大小的文件"""
+        path = os.path.join(tmpdir_path, "cli.bin")
+        assert cli.main(["generate", path, "2", "--unit", "MB", "--pattern", "random", "-q"]) == 0
+        assert os.path.getsize(path) == 2 * 1024 * 1024
+        assert "成功" in capsys.readouterr().out
+
+    def test_generate_queue_depth(self, tmpdir_path, capsys):
+        """--queue-depth 按区域并行写入"""
+        path = os.path.join(tmpdir_path, "cli.bin")
+        assert cli.main(["generate", path, "2", "--unit", "MB", "--queue-depth", "4", "-q"]) == 0
+        assert os.path.getsize(path) == 2 * 1024 * 1024
+
+    def test_clone(self, tmpdir_path, capsys):
+        """clone 子命令生成模板并复制出相同的文件"""
+        assert cli.main(["clone", tmpdir_path, "3", "1", "--unit", "MB", "--force-allocate", "-q"]) == 0
+        names = sorted(os.listdir(tmpdir_path))
+        assert names == ["clone_00000.bin", "clone_00001.bin", "clone_00002.bin"]
+        assert "克隆完成" in capsys.readouterr().out
+
+    def test_generate_failure_exit_code(self, tmpdir_path):
+        """生成失败时返回非零退出码"""
+        assert cli.main(["generate", os.path.join(tmpdir_path, "a.bin"), "0", "-q"]) == 1
+
+    def test_monitor(self, capsys):
+        """monitor 子命令打印挂载点表格"""
+        assert cli.main(["monitor"]) == 0
+        assert "挂载点" in capsys.readouterr().out
+
+    def test_requires_subcommand(self):
+        """缺少子命令时报错退出"""
+        with pytest.raises(SystemExit):
+            cli.main([])
+
+    def test_fill_requires_target(self, tmpdir_path):
+        """fill 子命令必须指定 --percent 或 --free"""
+        with pytest.raises(SystemExit):
+            cli.main(["fill", tmpdir_path])
+
+    def test_headless_does_not_import_gradio(self, tmpdir_path):
+        """无界面子命令不导入 Gradio"""
+        path = os.path.join(tmpdir_path, "headless.bin")
+        code = (
+            "import sys\n"
+            "from filetools.cli import main\n"
+            f"assert main(['generate', {path!r}, '1', '--unit', 'MB', '-q']) == 0\n"
+            "assert main(['monitor']) == 0\n"
+            "assert 'gradio' not in sys.modules, 'gradio imported'\n"
+        )
+        env = dict(os.environ, PYTHONPATH=SRC_DIR)
+        completed = subprocess.run(
+            [sys.executable, "-c", code], env=env, cwd=tmpdir_path, capture_output=True, text=True, timeout=120
+        )
+        assert completed.returncode == 0, completed.stderr
@@ -0,0 +1,158 @@
+"""模板克隆模式测试"""
+import errno
+import os
+import tempfile
+
+import pytest
+
+from filetools.models import clone_generator
+from filetools.models.clone_generator import clone_file, clone_methods, generate_clones
+from filetools.models.job_control import JobCancelled, JobControl
+
+SIZE = 256 * 1024 + 123
+
+
+@pytest.fixture
+def tmpdir_path():
+    """临时目录"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def no_kernel_clone(monkeypatch):
+    """模拟不支持 FICLONE 与 copy_file_range 的文件系统"""
+    def unsupported(*args, **kwargs):
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    monkeypatch.setattr(clone_generator.fcntl, "ioctl", unsupported)
+    monkeypatch.setattr(clone_generator.os, "copy_file_range", unsupported, raising=False)
+
+
+def read(path: str) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+class TestCloneFile:
+    """单个文件复制测试类"""
+
+    @pytest.mark.parametrize("method", ["copy_file_range", "sendfile", "copy"])
+    def test_methods_copy_content(self, tmpdir_path, method):
+        """各复制方式得到与模板完全相同的文件"""
+        source = os.path.join(tmpdir_path, "source.bin")
+        target = os.path.join(tmpdir_path, "target.bin")
+        with open(source, 'wb') as file:
+            file.write(os.urandom(SIZE))
+        copied = []
+        assert clone_file(source, target, [method], copied.append) == method
+        assert read(target) == read(source)
+        assert sum(copied) == SIZE
+
+    def test_fallback_order(self, tmpdir_path, no_kernel_clone):
+        """reflink 与 copy_file_range 不可用时回退为 sendfile"""
+        source = os.path.join(tmpdir_path, "source.bin")
+        with open(source, 'wb') as file:
+            file.write(os.urandom(SIZE))
+        target = os.path.join(tmpdir_path, "target.bin")
+        assert clone_file(source, target) == "sendfile"
+        assert read(target) == read(source)
+
+    def test_other_errors_raised(self, tmpdir_path, monkeypatch):
+        """磁盘写满等错误不回退，直接抛出"""
+        def no_space(*args):
+            raise OSError(errno.ENOSPC, "No space left on device")
+
+        monkeypatch.setattr(clone_generator.os, "copy_file_range", no_space, raising=False)
+        source = os.path.join(tmpdir_path, "source.bin")
+        with open(source, 'wb') as file:
+            file.write(b"x" * SIZE)
+        with pytest.raises(OSError) as exc_info:
+            clone_file(source, os.path.join(tmpdir_path, "target.bin"), ["copy_file_range", "copy"])
+        assert exc_info.value.errno == errno.ENOSPC
+
+    def test_force_allocate_methods(self):
+        """强制分配数据块时不使用可能共享数据块的方式"""
+        assert clone_methods(force_allocate=True) == ["sendfile", "copy"]
+        assert clone_methods()[0] == "reflink"
+
+    def test_unknown_method(self, tmpdir_path):
+        """不支持的复制方式报错"""
+        with pytest.raises(ValueError):
+            clone_file(__file__, os.path.join(tmpdir_path, "target.bin"), ["rsync"])
+
+
+class TestGenerateClones:
+    """模板克隆测试类"""
+
+    def test_identical_files(self, tmpdir_path):
+        """生成指定数量、内容完全相同的文件"""
+        result = generate_clones(tmpdir_path, 4, SIZE, pattern="random", seed=1)
+        assert [os.path.basename(path) for path in result.files] == [
+            "clone_00000.bin", "clone_00001.bin", "clone_00002.bin", "clone_00003.bin",
+        ]
+        template = read(result.template)
+        assert len(template) == SIZE
+        assert all(read(path) == template for path in result.files[1:])
+        assert result.copies == 3
+        assert sum(result.methods.values()) == 3
+
+    def test_force_allocate(self, tmpdir_path, monkeypatch):
+        """强制分配数据块时副本不使用 reflink 或 copy_file_range"""
+        def forbidden(*args, **kwargs):
+            raise AssertionError("强制分配数据块时不应共享数据块")
+
+        monkeypatch.setattr(clone_generator.fcntl, "ioctl", forbidden)
+        monkeypatch.setattr(clone_generator.os, "copy_file_range", forbidden, raising=False)
+        result = generate_clones(tmpdir_path, 3, SIZE, force_allocate=True)
+        assert result.methods == {"sendfile": 2}
+        assert not result.shared_extents
+
+    def test_method_remembered(self, tmpdir_path, no_kernel_clone, monkeypatch):
+        """第一个副本确定复制方式后，后续副本不再尝试不支持的方式"""
+        calls = []
+        real_copy_file_range = clone_generator.os.copy_file_range
+        monkeypatch.setattr(
+            clone_generator.os, "copy_file_range", lambda *args: (calls.append(args), real_copy_file_range(*args))[1]
+        )
+        result = generate_clones(tmpdir_path, 4, SIZE)
+        assert result.methods == {"sendfile": 3}
+        assert len(calls) == 1
+
+    def test_progress(self, tmpdir_path):
+        """进度按全部文件的逻辑大小汇总，结束时为 100%"""
+        events = []
+        generate_clones(tmpdir_path, 3, SIZE, progress_events=events.append)
+        written = [event.bytes_written for event in events]
+        assert written == sorted(written)
+        assert events[-1].bytes_written == 3 * SIZE
+        assert events[-1].percent == 100
+
+    def test_cancel_removes_partial_copy(self, tmpdir_path, monkeypatch):
+        """复制中取消时删除正在复制的文件，已完成的文件保留"""
+        control = JobControl()
+        real_clone_file = clone_generator.clone_file
+        calls = []
+
+        def clone_then_cancel(source, target, methods, on_copied, sync):
+            calls.append(target)
+            if len(calls) == 2:
+                control.cancel()
+            return real_clone_file(source, target, methods, on_copied, sync)
+
+        monkeypatch.setattr(clone_generator, "clone_file", clone_then_cancel)
+        with pytest.raises(JobCancelled):
+            generate_clones(tmpdir_path, 4, SIZE, control=control)
+        assert os.path.exists(os.path.join(tmpdir_path, "clone_00001.bin"))
+        assert not os.path.exists(os.path.join(tmpdir_path, "clone_00002.bin"))
+
+    @pytest.mark.parametrize("kwargs", [
+        {"count": 0, "file_size_bytes": SIZE},
+        {"count": 2, "file_size_bytes": 0},
+        {"count": 2, "file_size_bytes": SIZE, "prefix": "a/b"},
+        {"count": 2, "file_size_bytes": SIZE, "durability": "always"},
+    ])
+    def test_invalid_arguments(self, tmpdir_path, kwargs):
+        """参数不合法时报错"""
+        with pytest.raises(ValueError):
+            generate_clones(tmpdir_path, **kwargs)
@@ -0,0 +1,99 @@
+"""文件内容模式测试"""
+import os
+import struct
+import tempfile
+import zlib
+
+import pytest
+
+from filetools.config.constants import CONTENT_PATTERNS, PATTERN_BLOCK_SIZE
+from filetools.models.benchmark import benchmark_patterns, measure_pattern_fill
+from filetools.models.content_pattern import create_pattern
+from filetools.models.file_generator import generate_file
+
+SIZE = 2 * 1024 * 1024
+
+
+def _generate(pattern: str, size: int = SIZE, seed: int = 42, **kwargs) -> bytes:
+    """生成文件并返回其内容"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_path = os.path.join(tmpdir, f"{pattern}.bin")
+        generate_file(file_path, size, None, pattern=pattern, seed=seed, **kwargs)
+        with open(file_path, 'rb') as file:
+            return file.read()
+
+
+class TestContentPattern:
+    """内容模式测试类"""
+    
+    def test_zeros_pattern(self):
+        """测试全零模式"""
+        assert _generate("zeros", 8192) == b'\0' * 8192
+    
+    def test_random_is_incompressible(self):
+        """测试伪随机模式不可压缩"""
+        data = _generate("random")
+        assert len(data) == SIZE
+        assert len(zlib.compress(data, 1)) > SIZE * 0.95
+    
+    def test_same_seed_is_reproducible(self):
+        """测试相同种子生成相同内容"""
+        assert _generate("random", seed=7) == _generate("random", seed=7)
+        assert _generate("random", seed=7) != _generate("random", seed=8)
+    
+    def test_compressible_ratio(self):
+        """测试指定压缩比模式"""
+        data = _generate("compressible", compression_ratio=4.0)
+        ratio = len(data) / len(zlib.compress(data, 1))
+        assert 3.0 < ratio < 5.0
+    
+    def test_unique_blocks_are_distinct(self):
+        """测试每块唯一模式没有重复块"""
+        data = _generate("unique")
+        blocks = {data[i:i + PATTERN_BLOCK_SIZE] for i in range(0, len(data), PATTERN_BLOCK_SIZE)}
+        assert len(blocks) == len(data) // PATTERN_BLOCK_SIZE
+    
+    def test_unique_unaligned_chunk_size(self):
+        """测试块大小不按 4KB 对齐时文件中每个 4KB 块仍唯一，且并行写入与顺序写入内容相同"""
+        chunk_size = 3 * PATTERN_BLOCK_SIZE + 100
+        size = 20 * chunk_size
+        data = _generate("unique", size, chunk_size=chunk_size)
+        offsets = range(0, len(data) - 16 + 1, PATTERN_BLOCK_SIZE)
+        assert [struct.unpack_from('<QQ', data, offset) for offset in offsets] == [
+            (42, offset // PATTERN_BLOCK_SIZE) for offset in offsets
+        ]
+        blocks = {data[i:i + PATTERN_BLOCK_SIZE] for i in range(0, len(data), PATTERN_BLOCK_SIZE)}
+        assert len(blocks) == -(-len(data) // PATTERN_BLOCK_SIZE)
+        assert _generate("unique", size, chunk_size=chunk_size, queue_depth=4) == data
+    
+    def test_invalid_pattern(self):
+        """测试无效内容模式"""
+        with pytest.raises(ValueError):
+            create_pattern("invalid")
+    
+    def test_invalid_compression_ratio(self):
+        """测试无效压缩比"""
+        with pytest.raises(ValueError):
+            create_pattern("compressible", compression_ratio=0.5)
+    
+    def test_seed_recorded_in_stats(self):
+        """测试统计信息记录内容模式与种子"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stats = generate_file(os.path.join(tmpdir, "x.bin"), 4096, None, pattern="unique")
+            assert stats.pattern == "unique"
+            assert stats.pattern_seed == create_pattern("unique", stats.pattern_seed).seed
+    
+    def test_sparse_rejects_pattern(self):
+        """测试 sparse 模式不能使用非零内容模式"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with pytest.raises(ValueError):
+                generate_file(os.path.join(tmpdir, "x.bin"), 4096, None, allocation="sparse", pattern="random")
+    
+    def test_benchmark_patterns(self):
+        """测试内容模式基准测试"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            results = benchmark_patterns(tmpdir, SIZE)
+            assert [result.pattern for result in results] == list(CONTENT_PATTERNS)
+            assert all(result.write_mbps > 0 for result in results)
+            assert os.listdir(tmpdir) == []
+        assert measure_pattern_fill("random", SIZE) > 0
@@ -0,0 +1,132 @@
+"""磁盘 I/O 采样测试"""
+from types import SimpleNamespace
+
+import pytest
+
+from filetools.models import disk_io
+from filetools.models.disk_io import DeviceIOStats, DiskIOSampler, map_devices_to_mounts
+from filetools.ui.interface import format_disk_io
+
+MB = 1024 * 1024
+
+
+def _counter(read_bytes=0, write_bytes=0, read_count=0, write_count=0, busy_time=None):
+    values = dict(read_bytes=read_bytes, write_bytes=write_bytes, read_count=read_count, write_count=write_count)
+    if busy_time is not None:
+        values["busy_time"] = busy_time
+    return SimpleNamespace(**values)
+
+
+class FakeCounters:
+    """按顺序返回预设的计数器快照"""
+
+    def __init__(self, *snapshots):
+        self.snapshots = list(snapshots)
+
+    def __call__(self):
+        return self.snapshots.pop(0)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """每次采样前进 1 秒的单调时钟"""
+    clock = SimpleNamespace(now=100.0)
+
+    def monotonic():
+        clock.now += 1.0
+        return clock.now
+
+    monkeypatch.setattr(disk_io.time, "monotonic", monotonic)
+    return clock
+
+
+class TestDiskIOSampler:
+    """磁盘 I/O 采样器测试"""
+
+    def test_first_sample_has_no_rates(self, fake_clock):
+        """首次采样只记录基准计数"""
+        sampler = DiskIOSampler(counters=FakeCounters({"sda1": _counter()}), mounts=lambda: {"sda1": ["/"]})
+        assert sampler.sample_once() == []
+
+    def test_rates_from_deltas(self, fake_clock):
+        """按两次计数的差值计算 MB/s 与 IOPS"""
+        counters = FakeCounters(
+            {"sda1": _counter(busy_time=0)},
+            {"sda1": _counter(read_bytes=2 * MB, write_bytes=100 * MB, read_count=5, write_count=400, busy_time=500)},
+        )
+        sampler = DiskIOSampler(counters=counters, mounts=lambda: {"sda1": ["/"]})
+        sampler.sample_once()
+        [stats] = sampler.sample_once()
+        assert stats.device == "sda1"
+        assert stats.mountpoints == ["/"]
+        assert stats.write_mbps == pytest.approx(100.0)
+        assert stats.read_mbps == pytest.approx(2.0)
+        assert stats.write_iops == pytest.approx(400.0)
+        assert stats.read_iops == pytest.approx(5.0)
+        assert stats.busy_percent == pytest.approx(50.0)
+
+    def test_moving_average(self, fake_clock):
+        """写入速度的移动平均按平滑系数跟随最新值"""
+        counters = FakeCounters(
+            {"sda": _counter()},
+            {"sda": _counter(write_bytes=100 * MB)},
+            {"sda": _counter(write_bytes=100 * MB)},
+        )
+        sampler = DiskIOSampler(alpha=0.5, counters=counters, mounts=dict)
+        sampler.sample_once()
+        assert sampler.sample_once()[0].avg_write_mbps == pytest.approx(100.0)
+        [stats] = sampler.sample_once()
+        assert stats.write_mbps == 0.0
+        assert stats.avg_write_mbps == pytest.approx(50.0)
+
+    def test_counter_reset_skipped(self, fake_clock):
+        """计数器回绕时跳过该次差值"""
+        counters = FakeCounters({"sda": _counter(write_bytes=100 * MB)}, {"sda": _counter(write_bytes=MB)})
+        sampler = DiskIOSampler(counters=counters, mounts=dict)
+        sampler.sample_once()
+        assert sampler.sample_once() == []
+
+    def test_mounted_devices_preferred(self, fake_clock):
+        """有挂载点的设备优先显示，没有任何挂载点时显示全部设备"""
+        counters = FakeCounters(
+            {"sda1": _counter(), "loop0": _counter()},
+            {"sda1": _counter(write_bytes=MB), "loop0": _counter(write_bytes=MB)},
+        )
+        sampler = DiskIOSampler(counters=counters, mounts=lambda: {"sda1": ["/data"]})
+        sampler.sample_once()
+        assert [item.device for item in sampler.sample_once()] == ["sda1"]
+        assert len(sampler.latest(mounted_only=False)) == 2
+
+    def test_no_counters(self, fake_clock):
+        """平台不提供 I/O 计数器时返回空结果"""
+        sampler = DiskIOSampler(counters=lambda: None, mounts=dict)
+        assert sampler.sample_once() == []
+
+    def test_invalid_alpha(self):
+        """平滑系数必须在 0 到 1 之间"""
+        with pytest.raises(ValueError):
+            DiskIOSampler(alpha=0)
+
+    def test_device_mapping(self, monkeypatch):
+        """挂载表中的设备路径映射为计数器键"""
+        partitions = [
+            SimpleNamespace(device="/dev/sda1", mountpoint="/"),
+            SimpleNamespace(device="/dev/sda1", mountpoint="/boot"),
+            SimpleNamespace(device="", mountpoint="/proc"),
+        ]
+        monkeypatch.setattr(disk_io.psutil, "disk_partitions", lambda all=False: partitions)
+        assert map_devices_to_mounts() == {"sda1": ["/", "/boot"]}
+
+
+class TestDiskIOUI:
+    """磁盘 I/O 界面测试"""
+
+    def test_format_empty(self):
+        """没有数据时给出提示"""
+        assert "暂无" in format_disk_io([])
+
+    def test_format_table(self):
+        """每个设备一行"""
+        stats = [DeviceIOStats("sda1", ["/"], 1.0, 250.0, 10, 2000, 240.0, 1900, 97.0)]
+        result = format_disk_io(stats)
+        assert "| sda1 | / | 250.0 | 240.0 | 2000 | 1.0 | 97% |" in result
@@ -1,5 +1,12 @@
 """磁盘监控功能测试"""
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import psutil
 import pytest
+from filetools.models import disk_monitor
 from filetools.models.disk_monitor import get_disk_usage_info
 from filetools.models.disk_usage import DiskUsage
 
@@ -73,3 +80,129 @@ class TestDiskMonitor:
             for disk in result:
                 assert disk.device and len(disk.device) > 0
 
+
+    
+    def test_disk_usage_inodes(self):
+        """测试 inode 统计：可用数不超过总数"""
+        for disk in get_disk_usage_info():
+            if disk.available:
+                assert 0 <= disk.inodes_free <= disk.inodes_total or disk.inodes_total == 0
+                assert 0.0 <= disk.inode_percent <= 100.0
+
+    
+    def test_mount_usage_matches_psutil(self, tmp_path):
+        """测试单次 statvfs 的统计结果与 psutil.disk_usage 一致，并包含块大小与预留空间"""
+        if not hasattr(os, "statvfs"):
+            pytest.skip("平台不支持 statvfs")
+        disk = disk_monitor.get_mount_usage("test", str(tmp_path), "ext4")
+        usage = psutil.disk_usage(str(tmp_path))
+        assert disk.total == usage.total
+        assert disk.fstype == "ext4"
+        assert disk.block_size > 0
+        assert disk.reserved >= 0
+        assert abs(disk.free - usage.free) <= 64 * 1024 * 1024
+        assert abs(disk.percent - usage.percent) < 1.0
+    
+    def test_disk_usage_slots(self):
+        """测试 DiskUsage 使用 __slots__（实例不带 __dict__）"""
+        disk = DiskUsage("sda", 100, 40, 40.0, "/", reserved=10)
+        assert not hasattr(disk, "__dict__")
+        assert disk.free == 50
+
+
+class TestParallelStat:
+    """分区并行统计与超时测试类"""
+    
+    @pytest.fixture
+    def fake_mounts(self, monkeypatch):
+        """模拟两个正常分区和一个无响应的网络分区"""
+        release = threading.Event()
+        partitions = [
+            SimpleNamespace(device="/dev/sda1", mountpoint="/", fstype="ext4", opts="rw"),
+            SimpleNamespace(device="nas:/export", mountpoint="/mnt/nas", fstype="nfs", opts="rw"),
+            SimpleNamespace(device="/dev/sdb1", mountpoint="/data", fstype="xfs", opts="rw"),
+        ]
+        calls = []
+        
+        def fake_mount_usage(device, mountpoint, fstype):
+            calls.append(mountpoint)
+            if mountpoint == "/mnt/nas":
+                release.wait(5)
+            return DiskUsage(device, 10 ** 9, 10 ** 8, 10.0, mountpoint, fstype=fstype)
+        
+        monkeypatch.setattr(disk_monitor.platform, "system", lambda: "Linux")
+        monkeypatch.setattr(disk_monitor.psutil, "disk_partitions", lambda all=False: partitions)
+        monkeypatch.setattr(disk_monitor, "get_mount_usage", fake_mount_usage)
+        monkeypatch.setattr(disk_monitor, "DISK_STAT_TIMEOUT", 0.2)
+        monkeypatch.setattr(disk_monitor, "_pending_stats", {})
+        monkeypatch.setattr(disk_monitor, "_backoff_until", {})
+        monkeypatch.setattr(disk_monitor, "_stat_pool", disk_monitor._StatPool())
+        yield calls
+        release.set()
+    
+    def test_hung_mount_marked_unavailable(self, fake_mounts):
+        """测试无响应的挂载点被标记为不可用，正常分区照常返回"""
+        start = time.monotonic()
+        result = get_disk_usage_info()
+        assert time.monotonic() - start < 1.0
+        by_mount = {disk.mountpoint: disk for disk in result}
+        assert [disk.mountpoint for disk in result] == ["/", "/mnt/nas", "/data"]
+        assert by_mount["/"].available and by_mount["/data"].available
+        assert not by_mount["/mnt/nas"].available
+        assert by_mount["/mnt/nas"].total == 0
+        assert by_mount["/mnt/nas"].fstype == "nfs"
+        assert by_mount["/data"].fstype == "xfs"
+    
+    def test_hung_mount_skipped_during_backoff(self, fake_mounts):
+        """测试退避期内不再统计超时的挂载点"""
+        get_disk_usage_info()
+        get_disk_usage_info()
+        assert fake_mounts.count("/mnt/nas") == 1
+        assert fake_mounts.count("/") == 2
+    
+    def test_pending_stat_skipped(self, fake_mounts, monkeypatch):
+        """测试退避结束后上一次统计仍未返回时不重复提交、不再等待，直接标记为不可用"""
+        get_disk_usage_info()
+        monkeypatch.setattr(disk_monitor, "_backoff_until", {})
+        monkeypatch.setattr(disk_monitor, "DISK_STAT_TIMEOUT", 5.0)
+        start = time.monotonic()
+        result = get_disk_usage_info()
+        assert time.monotonic() - start < 1.0
+        assert fake_mounts.count("/mnt/nas") == 1
+        assert not [disk for disk in result if disk.mountpoint == "/mnt/nas"][0].available
+        assert "/mnt/nas" in disk_monitor._backoff_until
+    
+    def test_workers_reused(self, fake_mounts, monkeypatch):
+        """测试多次扫描复用空闲的工作线程，卡死的挂载点不会让线程数增长"""
+        for _ in range(5):
+            monkeypatch.setattr(disk_monitor, "_backoff_until", {})
+            get_disk_usage_info()
+        assert len(disk_monitor._stat_pool.workers) <= 3
+        assert fake_mounts.count("/mnt/nas") == 1
+        assert fake_mounts.count("/") == 5
+    
+    def test_healthy_mount_not_starved(self, monkeypatch):
+        """测试无响应的挂载点多于 DISK_STAT_WORKERS 时正常分区仍能按时返回"""
+        release = threading.Event()
+        hung = [f"/mnt/nas{index}" for index in range(disk_monitor.DISK_STAT_WORKERS + 2)]
+        partitions = [("nas", mountpoint, "nfs") for mountpoint in hung] + [("/dev/sda1", "/", "ext4")]
+        
+        def fake_mount_usage(device, mountpoint, fstype):
+            if mountpoint != "/":
+                release.wait(5)
+            return DiskUsage(device, 10 ** 9, 10 ** 8, 10.0, mountpoint, fstype=fstype)
+        
+        monkeypatch.setattr(disk_monitor, "get_mount_usage", fake_mount_usage)
+        monkeypatch.setattr(disk_monitor, "DISK_STAT_TIMEOUT", 0.2)
+        monkeypatch.setattr(disk_monitor, "_pending_stats", {})
+        monkeypatch.setattr(disk_monitor, "_backoff_until", {})
+        monkeypatch.setattr(disk_monitor, "_stat_pool", disk_monitor._StatPool())
+        try:
+            for _ in range(3):
+                monkeypatch.setattr(disk_monitor, "_backoff_until", {})
+                by_mount = {disk.mountpoint: disk for disk in get_disk_usage_info(partitions)}
+                assert by_mount["/"].available
+                assert not any(by_mount[mountpoint].available for mountpoint in hung)
+            assert len(disk_monitor._stat_pool.workers) <= len(hung) + disk_monitor.DISK_STAT_WORKERS
+        finally:
+            release.set()
@@ -0,0 +1,122 @@
+"""后台磁盘采样测试"""
+import time
+
+import pytest
+
+from filetools.models import disk_sampler as disk_sampler_module
+from filetools.models.disk_sampler import DiskSampler, MountHistory
+from filetools.models.disk_snapshot import DiskSnapshotCache
+from filetools.models.disk_usage import DiskUsage
+from filetools.ui import interface
+
+
+class GrowingDisk:
+    """每次采样已用空间增长固定字节数的模拟磁盘"""
+    
+    def __init__(self, step: int):
+        self.step = step
+        self.used = 0
+    
+    def __call__(self):
+        self.used += self.step
+        return [DiskUsage(device="disk", total=10 ** 9, used=self.used, percent=0.0, mountpoint="/data")]
+
+
+class TestMountHistory:
+    """环形历史测试类"""
+    
+    def test_ring_overwrites_oldest(self):
+        """测试写满后覆盖最旧的采样点"""
+        history = MountHistory(3)
+        for i in range(5):
+            history.append(float(i), i * 10)
+        assert history.count == 3
+        assert history.samples() == [(2.0, 20), (3.0, 30), (4.0, 40)]
+    
+    def test_fill_rate_linear(self):
+        """测试线性增长的写入速率"""
+        history = MountHistory(10)
+        for i in range(10):
+            history.append(float(i), 1000 + i * 500)
+        assert history.fill_rate() == pytest.approx(500.0)
+    
+    def test_fill_rate_window(self):
+        """测试只使用时间窗口内的采样点"""
+        history = MountHistory(10)
+        for i in range(5):
+            history.append(float(i), 0)
+        for i in range(5, 10):
+            history.append(float(i), (i - 5) * 100)
+        assert history.fill_rate(window=4) == pytest.approx(100.0)
+    
+    def test_fill_rate_matches_full_regression(self):
+        """测试环形缓冲回绕后，只遍历窗口内采样点的速率与对窗口内全部采样点回归的结果一致"""
+        history = MountHistory(8)
+        for i in range(13):
+            history.append(1000.0 + i * 2, 10 ** 12 + i * i * 4096)
+        samples = history.samples(window=6)
+        assert [t for t, _ in samples] == [1018.0, 1020.0, 1022.0, 1024.0]
+        mean_t = sum(t for t, _ in samples) / len(samples)
+        mean_u = sum(u for _, u in samples) / len(samples)
+        expected = sum((t - mean_t) * (u - mean_u) for t, u in samples) / sum((t - mean_t) ** 2 for t, _ in samples)
+        assert history.fill_rate(window=6) == pytest.approx(expected)
+    
+    def test_fill_rate_insufficient_samples(self):
+        """测试采样点不足时速率为0"""
+        history = MountHistory(10)
+        history.append(0.0, 100)
+        assert history.fill_rate() == 0.0
+    
+    def test_invalid_capacity(self):
+        """测试无效容量"""
+        with pytest.raises(ValueError):
+            MountHistory(1)
+
+
+class TestDiskSampler:
+    """后台采样器测试类"""
+    
+    def test_sample_once_updates_cache(self):
+        """测试采样结果同步到快照缓存"""
+        cache = DiskSnapshotCache(ttl=60, loader=pytest.fail)
+        sampler = DiskSampler(loader=GrowingDisk(100), cache=cache)
+        sampler.sample_once()
+        assert cache.get()[0].used == 100
+        assert sampler.latest()[0].used == 100
+    
+    def test_fill_rate_and_time_to_full(self, monkeypatch):
+        """测试写入速率与预计写满时间"""
+        clock = iter(range(100))
+        monkeypatch.setattr(disk_sampler_module.time, "monotonic", lambda: float(next(clock)))
+        sampler = DiskSampler(loader=GrowingDisk(1000), cache=None)
+        for _ in range(5):
+            sampler.sample_once()
+        rate = sampler.fill_rates()[0]
+        assert rate.bytes_per_second == pytest.approx(1000.0)
+        assert rate.seconds_to_full == pytest.approx((10 ** 9 - 5000) / 1000.0)
+    
+    def test_background_thread(self):
+        """测试后台线程按间隔采样"""
+        sampler = DiskSampler(interval=0.01, loader=GrowingDisk(1), cache=None)
+        sampler.start()
+        try:
+            time.sleep(0.2)
+            assert sampler.running
+        finally:
+            sampler.stop()
+        assert not sampler.running
+        assert sampler.history("/data").count >= 2
+    
+    def test_ui_reads_sampler_without_stat(self, monkeypatch):
+        """测试采样运行时界面只读取采样结果"""
+        sampler = DiskSampler(interval=60, loader=GrowingDisk(10), cache=None)
+        sampler.start()
+        try:
+            time.sleep(0.05)
+            monkeypatch.setattr(interface, "disk_usage_sampler", sampler)
+            monkeypatch.setattr(interface.disk_snapshot_cache, "get", pytest.fail)
+            result = interface.update_disk_display("MB")
+            assert "disk" in result
+            assert "写入速率" in result
+        finally:
+            sampler.stop()
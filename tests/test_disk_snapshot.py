@@ -0,0 +1,95 @@
+"""磁盘使用情况快照缓存测试"""
+import pytest
+
+from filetools.models import disk_monitor, disk_snapshot
+from filetools.models.disk_snapshot import DiskSnapshotCache
+from filetools.models.disk_usage import DiskUsage
+from filetools.ui import interface
+
+
+def _disk(mountpoint: str, used: int = 100) -> DiskUsage:
+    """构造测试用磁盘使用情况"""
+    return DiskUsage(device=mountpoint, total=1000, used=used, percent=used / 10, mountpoint=mountpoint)
+
+
+class CountingLoader:
+    """记录调用次数的全量扫描函数"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def __call__(self):
+        self.calls += 1
+        return [_disk("/a"), _disk("/b")]
+
+
+class TestDiskSnapshotCache:
+    """快照缓存测试类"""
+    
+    def test_reuse_within_ttl(self):
+        """测试 TTL 内复用快照"""
+        loader = CountingLoader()
+        cache = DiskSnapshotCache(ttl=60, loader=loader)
+        cache.get()
+        cache.get()
+        assert loader.calls == 1
+    
+    def test_reload_after_ttl(self):
+        """测试 TTL 过期后重新扫描"""
+        loader = CountingLoader()
+        cache = DiskSnapshotCache(ttl=0, loader=loader)
+        cache.get()
+        cache.get()
+        assert loader.calls == 2
+    
+    def test_force_reload(self):
+        """测试强制刷新"""
+        loader = CountingLoader()
+        cache = DiskSnapshotCache(ttl=60, loader=loader)
+        cache.get()
+        cache.get(force=True)
+        assert loader.calls == 2
+    
+    def test_invalidate_single_mount(self, monkeypatch):
+        """测试按挂载点失效时只重新统计该挂载点"""
+        refreshed = []
+        
+        def fake_mount_usage(device, mountpoint, fstype=""):
+            refreshed.append(mountpoint)
+            return _disk(mountpoint, used=500)
+        
+        monkeypatch.setattr(disk_snapshot, "get_mount_usage", fake_mount_usage)
+        loader = CountingLoader()
+        cache = DiskSnapshotCache(ttl=60, loader=loader)
+        cache.get()
+        cache.invalidate("/b")
+        snapshot = cache.get()
+        assert loader.calls == 1
+        assert refreshed == ["/b"]
+        assert [disk.used for disk in snapshot] == [100, 500]
+    
+    def test_peek_no_syscalls(self, monkeypatch):
+        """测试 peek 不做任何系统调用"""
+        loader = CountingLoader()
+        cache = DiskSnapshotCache(ttl=0, loader=loader)
+        cache.get()
+        monkeypatch.setattr(disk_snapshot, "get_mount_usage", pytest.fail)
+        cache.invalidate("/a")
+        assert len(cache.peek()) == 2
+        assert loader.calls == 1
+    
+    def test_update_replaces_snapshot(self):
+        """测试外部快照替换缓存"""
+        loader = CountingLoader()
+        cache = DiskSnapshotCache(ttl=60, loader=loader)
+        cache.update([_disk("/c")])
+        assert [disk.mountpoint for disk in cache.get()] == ["/c"]
+        assert loader.calls == 0
+    
+    def test_unit_change_no_syscalls(self, monkeypatch):
+        """测试切换显示单位不触发系统调用"""
+        interface.update_disk_display("GB")
+        monkeypatch.setattr(disk_monitor.psutil, "disk_usage", pytest.fail)
+        monkeypatch.setattr(disk_monitor.psutil, "disk_partitions", pytest.fail)
+        for unit in ["KB", "MB", "GB", "TB"]:
+            assert isinstance(interface.change_disk_unit(unit), str)
@@ -0,0 +1,83 @@
+"""持久化策略测试"""
+import os
+import tempfile
+
+import pytest
+
+from filetools.models import file_generator, io_engine
+from filetools.models.file_generator import generate_file, generate_file_with_progress
+from filetools.models.generation_stats import GenerationStats
+from filetools.models.io_engine import ChunkWriter
+
+CHUNK = 64 * 1024
+
+
+@pytest.fixture
+def synced(monkeypatch):
+    """记录 fdatasync 调用次数"""
+    calls = []
+    real = io_engine.fdatasync
+    monkeypatch.setattr(io_engine, "fdatasync", lambda fd: (calls.append(fd), real(fd)))
+    monkeypatch.setattr(file_generator, "CHUNK_SIZE", CHUNK)
+    return calls
+
+
+@pytest.fixture
+def tmpdir_path():
+    """临时目录"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+class TestDurability:
+    """持久化策略测试类"""
+    
+    @pytest.mark.parametrize("durability, sync_interval, expected", [
+        ("none", 0, 0),
+        ("end", 0, 1),
+        ("chunk", 0, 8),
+        ("interval", 3 * CHUNK, 3),
+        ("interval", 4 * CHUNK, 2),
+    ])
+    def test_flush_count(self, tmpdir_path, synced, durability, sync_interval, expected):
+        """测试各策略的落盘次数（写完时已落盘则不重复落盘）"""
+        stats = generate_file(
+            os.path.join(tmpdir_path, "a.bin"), 8 * CHUNK, durability=durability, sync_interval=sync_interval
+        )
+        assert len(synced) == expected
+        assert stats.flushes == expected
+        assert stats.durability == durability
+    
+    def test_timing_breakdown(self, tmpdir_path, synced):
+        """测试分别记录写入耗时与落盘耗时"""
+        stats = generate_file(os.path.join(tmpdir_path, "a.bin"), 8 * CHUNK, durability="chunk")
+        assert stats.write_time > 0
+        assert stats.flush_time > 0
+        assert stats.write_time + stats.flush_time <= stats.elapsed
+        assert 0 < stats.sustained_mbps <= stats.write_mbps
+    
+    def test_sparse_end_flushes(self, tmpdir_path, synced):
+        """测试 sparse 模式写完后同样落盘"""
+        stats = generate_file(os.path.join(tmpdir_path, "a.bin"), 1024, allocation="sparse")
+        assert stats.flushes == 1
+        assert stats.write_time == 0
+    
+    def test_invalid_durability(self, tmpdir_path):
+        """测试不支持的持久化策略"""
+        with pytest.raises(ValueError):
+            generate_file(os.path.join(tmpdir_path, "a.bin"), 1024, durability="sometimes")
+        with pytest.raises(ValueError):
+            generate_file(os.path.join(tmpdir_path, "b.bin"), 1024, durability="interval", sync_interval=0)
+        assert os.listdir(tmpdir_path) == []
+    
+    def test_with_progress_reports_bandwidth(self, tmpdir_path):
+        """测试结果消息区分页缓存速度和持续带宽"""
+        result = generate_file_with_progress(os.path.join(tmpdir_path, "a.bin"), 1, "MB", durability="end")
+        assert "成功" in result
+        assert "持续带宽" in result
+    
+    def test_stats_rates_without_timing(self):
+        """测试没有计时数据时速度为0"""
+        stats = GenerationStats(file_path="x", bytes_written=100)
+        assert stats.write_mbps == 0.0
+        assert stats.sustained_mbps == 0.0
@@ -0,0 +1,172 @@
+"""填充到目标使用率测试"""
+import functools
+import os
+import tempfile
+from collections import namedtuple
+
+import pytest
+
+from filetools.config.constants import UNIT_MAPPING
+from filetools.models import fill_target
+from filetools.models.fill_target import compute_fill_bytes, fill_to_target
+from filetools.models.job_control import JobCancelled, JobControl
+from filetools.models.progress import ProgressThrottle
+
+MB = UNIT_MAPPING["MB"]
+FakeUsage = namedtuple("FakeUsage", ["total", "used", "free", "percent"])
+
+
+class FakeDisk:
+    """模拟磁盘：已用空间 = 初始已用 + 目录中文件总大小 * 有效比例"""
+    
+    def __init__(self, directory: str, total: int, used: int, effective: float = 1.0):
+        self.directory = directory
+        self.total = total
+        self.base_used = used
+        self.effective = effective
+    
+    def __call__(self, mountpoint: str) -> FakeUsage:
+        written = 0
+        for root, _, files in os.walk(self.directory):
+            written += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+        used = self.base_used + int(written * self.effective)
+        free = self.total - used
+        return FakeUsage(self.total, used, free, round(used / self.total * 100, 1))
+
+
+class CancelAfter(JobControl):
+    """第 count 次检查点之后取消任务"""
+    
+    def __init__(self, count: int):
+        super().__init__()
+        self.count = count
+    
+    def checkpoint(self):
+        self.count -= 1
+        if self.count < 0:
+            self.cancel()
+        super().checkpoint()
+
+
+@pytest.fixture
+def tmpdir_path():
+    """临时目录 fixture"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+class TestFillTarget:
+    """填充到目标测试类"""
+    
+    def test_compute_fill_bytes_percent(self, tmpdir_path, monkeypatch):
+        """测试按使用率计算需要写入的字节数"""
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", FakeDisk(tmpdir_path, 100 * MB, 50 * MB))
+        assert compute_fill_bytes(tmpdir_path, target_percent=80) == 30 * MB
+        assert compute_fill_bytes(tmpdir_path, target_percent=40) == 0
+    
+    def test_compute_fill_bytes_free(self, tmpdir_path, monkeypatch):
+        """测试按剩余空间计算需要写入的字节数"""
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", FakeDisk(tmpdir_path, 100 * MB, 50 * MB))
+        assert compute_fill_bytes(tmpdir_path, target_free_bytes=10 * MB) == 40 * MB
+    
+    def test_fill_to_percent(self, tmpdir_path, monkeypatch):
+        """测试填充到目标使用率"""
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", FakeDisk(tmpdir_path, 100 * MB, 50 * MB))
+        result = fill_to_target(tmpdir_path, target_percent=70)
+        assert result.bytes_written == 20 * MB
+        assert result.final_percent == 70.0
+        assert result.warning is None
+    
+    def test_fill_splits_files(self, tmpdir_path, monkeypatch):
+        """测试超过单文件上限时分散到多个文件"""
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", FakeDisk(tmpdir_path, 100 * MB, 10 * MB))
+        result = fill_to_target(tmpdir_path, target_free_bytes=60 * MB, max_file_size=8 * MB)
+        assert result.bytes_written == 30 * MB
+        assert len(result.files) == 4
+        assert all(os.path.getsize(path) <= 8 * MB for path in result.files)
+        assert result.final_free == 60 * MB
+    
+    def test_fill_already_at_target(self, tmpdir_path, monkeypatch):
+        """测试已达到目标时不写入"""
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", FakeDisk(tmpdir_path, 100 * MB, 90 * MB))
+        result = fill_to_target(tmpdir_path, target_percent=80)
+        assert result.bytes_written == 0
+        assert result.files == []
+    
+    def test_fill_stops_when_space_not_consumed(self, tmpdir_path, monkeypatch):
+        """测试写入未占用空间（压缩/去重）时停止填充"""
+        monkeypatch.setattr(fill_target, "CHUNK_SIZE", MB)
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", FakeDisk(tmpdir_path, 100 * MB, 10 * MB, 0.0))
+        result = fill_to_target(tmpdir_path, target_percent=50)
+        assert result.warning is not None
+        assert "压缩" in result.warning
+    
+    def test_fill_progress_callback(self, tmpdir_path, monkeypatch):
+        """测试填充进度回调"""
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", FakeDisk(tmpdir_path, 100 * MB, 50 * MB))
+        progress_values = []
+        fill_to_target(tmpdir_path, target_percent=60, progress_callback=progress_values.append)
+        assert progress_values[-1] == 100
+    
+    def test_recheck_raises_target(self, tmpdir_path, monkeypatch):
+        """测试重新检查后剩余字节数超过开始时的缓冲区大小（其他进程释放了空间）"""
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", FakeDisk(tmpdir_path, 100 * MB, 10 * MB))
+        needed = iter([MB, 8 * MB])
+        monkeypatch.setattr(fill_target, "compute_fill_bytes", lambda *args: next(needed, 0))
+        result = fill_to_target(tmpdir_path, target_percent=50)
+        assert result.bytes_written == 9 * MB
+        assert sum(os.path.getsize(path) for path in result.files) == 9 * MB
+    
+    def test_progress_events_follow_recheck(self, tmpdir_path, monkeypatch):
+        """测试进度事件逐块上报，总字节数随重新检查更新，结束时为 100%"""
+        monkeypatch.setattr(fill_target, "CHUNK_SIZE", MB)
+        monkeypatch.setattr(fill_target, "ProgressThrottle", functools.partial(ProgressThrottle, min_interval=0))
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", FakeDisk(tmpdir_path, 100 * MB, 50 * MB))
+        events = []
+        fill_to_target(tmpdir_path, target_percent=70, progress_events=events.append)
+        written = [event.bytes_written for event in events]
+        assert written == sorted(written)
+        assert len(events) > 1
+        assert events[-1].bytes_written == 20 * MB
+        assert events[-1].percent == 100
+    
+    def test_cancel_removes_current_file(self, tmpdir_path, monkeypatch):
+        """测试取消时删除正在写入的填充文件，已写完的文件保留"""
+        monkeypatch.setattr(fill_target, "CHUNK_SIZE", MB)
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", FakeDisk(tmpdir_path, 100 * MB, 10 * MB))
+        control = CancelAfter(3)
+        with pytest.raises(JobCancelled):
+            fill_to_target(tmpdir_path, target_percent=50, max_file_size=2 * MB, control=control)
+        fill_dir = os.path.join(tmpdir_path, fill_target.FILL_DIR_NAME)
+        assert sorted(os.listdir(fill_dir)) == ["fill_0000.bin"]
+    
+    def test_second_fill_keeps_first_files(self, tmpdir_path, monkeypatch):
+        """测试再次填充同一目录时不覆盖之前的填充文件，而是接着使用下一个序号"""
+        disk = FakeDisk(tmpdir_path, 100 * MB, 10 * MB)
+        monkeypatch.setattr(fill_target.psutil, "disk_usage", disk)
+        first = fill_to_target(tmpdir_path, target_percent=30, max_file_size=8 * MB)
+        sizes = {path: os.path.getsize(path) for path in first.files}
+        disk.base_used -= 10 * MB  # 其他进程释放了空间
+        second = fill_to_target(tmpdir_path, target_percent=30, max_file_size=8 * MB)
+        assert second.bytes_written == 10 * MB
+        assert not set(first.files) & set(second.files)
+        assert {path: os.path.getsize(path) for path in first.files} == sizes
+        assert os.path.basename(second.files[0]) == "fill_0003.bin"
+        assert second.final_percent == 30.0
+    
+    @pytest.mark.parametrize("kwargs", [
+        {},
+        {"target_percent": 50, "target_free_bytes": MB},
+        {"target_percent": 150},
+        {"target_free_bytes": -1},
+        {"target_percent": 50, "max_file_size": 0},
+    ])
+    def test_invalid_arguments(self, tmpdir_path, kwargs):
+        """测试无效参数"""
+        with pytest.raises(ValueError):
+            fill_to_target(tmpdir_path, **kwargs)
+    
+    def test_missing_mountpoint(self):
+        """测试挂载点不存在"""
+        with pytest.raises(ValueError):
+            fill_to_target("/nonexistent/mount/point", target_percent=50)
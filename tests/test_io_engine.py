@@ -0,0 +1,112 @@
+"""写入 I/O 模式测试"""
+import errno
+import os
+import tempfile
+
+import pytest
+
+from filetools.models import file_generator, io_engine
+from filetools.models.file_generator import generate_file, generate_file_with_progress
+from filetools.models.io_engine import ChunkWriter, open_for_write
+
+
+@pytest.fixture
+def tmpdir_path():
+    """临时目录"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def reject_direct_open(monkeypatch):
+    """模拟 tmpfs：带 O_DIRECT 打开时返回 EINVAL"""
+    real_open = os.open
+    
+    def fake_open(path, flags, mode=0o777):
+        if flags & getattr(os, 'O_DIRECT', 0):
+            raise OSError(errno.EINVAL, "Invalid argument")
+        return real_open(path, flags, mode)
+    
+    monkeypatch.setattr(io_engine.os, "open", fake_open)
+
+
+def read(path: str) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+class TestIOModes:
+    """I/O 模式测试类"""
+    
+    @pytest.mark.parametrize("io_mode", ["direct", "dropbehind"])
+    @pytest.mark.parametrize("pattern", ["zeros", "random", "unique"])
+    def test_content_matches_buffered(self, tmpdir_path, monkeypatch, io_mode, pattern):
+        """测试各 I/O 模式写出的内容与 buffered 完全相同（含不对齐的尾部）"""
+        monkeypatch.setattr(file_generator, "CHUNK_SIZE", 256 * 1024)
+        monkeypatch.setattr(io_engine, "DROPBEHIND_INTERVAL", 256 * 1024)
+        size = 3 * 256 * 1024 + 1234
+        buffered = os.path.join(tmpdir_path, "buffered.bin")
+        other = os.path.join(tmpdir_path, f"{io_mode}.bin")
+        generate_file(buffered, size, pattern=pattern, seed=5)
+        stats = generate_file(other, size, pattern=pattern, seed=5, io_mode=io_mode)
+        assert stats.requested_io_mode == io_mode
+        assert stats.io_mode in (io_mode, "dropbehind")
+        assert read(other) == read(buffered)
+    
+    def test_direct_open_fallback(self, tmpdir_path, reject_direct_open):
+        """测试文件系统拒绝 O_DIRECT 时回退为 dropbehind"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        stats = generate_file(file_path, 1024 * 1024, io_mode="direct")
+        assert stats.io_mode == "dropbehind"
+        assert os.path.getsize(file_path) == 1024 * 1024
+    
+    def test_with_progress_reports_io_fallback(self, tmpdir_path, reject_direct_open):
+        """测试结果消息包含 I/O 模式回退说明"""
+        result = generate_file_with_progress(os.path.join(tmpdir_path, "a.bin"), 1, "MB", io_mode="direct")
+        assert "成功" in result
+        assert "dropbehind" in result
+    
+    def test_invalid_io_mode(self, tmpdir_path):
+        """测试不支持的 I/O 模式"""
+        with pytest.raises(ValueError):
+            generate_file(os.path.join(tmpdir_path, "a.bin"), 1024, io_mode="bad")
+    
+    def test_direct_write_rejected_falls_back(self, tmpdir_path, monkeypatch):
+        """测试打开成功但写入被拒绝时清除 O_DIRECT 并重写该块"""
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        file, _ = open_for_write(file_path, truncate=True, io_mode="buffered")
+        calls = []
+        
+        def reject_once(target, view):
+            calls.append(len(view))
+            if len(calls) == 1:
+                raise OSError(errno.EINVAL, "Invalid argument")
+            target.write(view)
+        
+        monkeypatch.setattr(io_engine, "write_fully", reject_once)
+        monkeypatch.setattr(io_engine, "disable_direct", lambda target: None)
+        with file:
+            writer = ChunkWriter(file, "direct")
+            writer.write(memoryview(b"x" * 8192))
+            assert writer.io_mode == "dropbehind"
+        assert read(file_path) == b"x" * 8192
+    
+    def test_dropbehind_bounds_windows(self, tmpdir_path, monkeypatch):
+        """测试 dropbehind 按窗口提交回写并丢弃上一窗口"""
+        synced = []
+        monkeypatch.setattr(io_engine, "sync_range", lambda fd, offset, length, wait: synced.append((offset, length, wait)))
+        file_path = os.path.join(tmpdir_path, "a.bin")
+        file, _ = open_for_write(file_path, truncate=True, io_mode="dropbehind")
+        with file:
+            writer = ChunkWriter(file, "dropbehind", interval=4096)
+            for _ in range(3):
+                writer.write(memoryview(bytes(4096)))
+            writer.finish()
+        assert synced == [
+            (0, 4096, False),
+            (4096, 4096, False),
+            (0, 4096, True),
+            (8192, 4096, False),
+            (4096, 4096, True),
+            (8192, 4096, True),
+        ]
@@ -0,0 +1,349 @@
+"""生成任务队列测试"""
+import os
+import tempfile
+import threading
+import time
+from collections import namedtuple
+
+import pytest
+
+from filetools.models import file_generator, fill_target, io_engine, tree_generator
+from filetools.models.checkpoint import GenerationCheckpoint
+from filetools.models.file_generator import generate_file
+from filetools.models.job_control import JobCancelled, JobControl
+from filetools.models.job_manager import (
+    ERROR_FILE_EXISTS,
+    JOB_CANCELLED,
+    JOB_COMPLETED,
+    JOB_KIND_FILL,
+    JOB_KIND_TREE,
+    JOB_PAUSED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JobError,
+    JobManager,
+)
+from filetools.ui import interface
+
+MB = 1024 * 1024
+FakeUsage = namedtuple("FakeUsage", ["total", "used", "free", "percent"])
+
+
+def fake_disk(directory: str, total: int, used: int):
+    """模拟磁盘：已用空间 = 初始已用 + 填充目录中文件总大小"""
+    def usage(mountpoint):
+        fill_dir = os.path.join(directory, fill_target.FILL_DIR_NAME)
+        written = sum(entry.stat().st_size for entry in os.scandir(fill_dir)) if os.path.isdir(fill_dir) else 0
+        return FakeUsage(total, used + written, total - used - written, (used + written) * 100 / total)
+    return usage
+
+
+def wait_for(predicate, timeout: float = 5.0) -> bool:
+    """轮询等待条件成立"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """使用 64KB 小块，便于在块之间暂停和取消"""
+    monkeypatch.setattr(file_generator, "CHUNK_SIZE", 64 * 1024)
+
+
+@pytest.fixture
+def manager():
+    """单线程任务管理器"""
+    manager = JobManager(max_workers=1)
+    yield manager
+    manager.shutdown()
+
+
+class GatedControl(JobControl):
+    """第一次检查点时阻塞，直到测试放行"""
+    
+    def __init__(self):
+        super().__init__()
+        self.reached = threading.Event()
+        self.release = threading.Event()
+    
+    def checkpoint(self):
+        if not self.reached.is_set():
+            self.reached.set()
+            self.release.wait(5)
+        super().checkpoint()
+
+
+class TestJobControl:
+    """任务控制测试类"""
+    
+    def test_cancel_removes_partial_file(self, small_chunks):
+        """测试取消后删除部分文件"""
+        control = GatedControl()
+        errors = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "cancel.bin")
+            
+            def run():
+                try:
+                    generate_file(file_path, 1024 * 1024, control=control)
+                except JobCancelled as e:
+                    errors.append(e)
+            
+            worker = threading.Thread(target=run)
+            worker.start()
+            assert control.reached.wait(5)
+            control.cancel()
+            control.release.set()
+            worker.join(5)
+            assert len(errors) == 1
+            assert not os.path.exists(file_path)
+    
+    def test_pause_blocks_until_resume(self):
+        """测试暂停时检查点阻塞，恢复后继续"""
+        control = JobControl()
+        control.pause()
+        passed = threading.Event()
+        worker = threading.Thread(target=lambda: (control.checkpoint(), passed.set()))
+        worker.start()
+        assert not passed.wait(0.1)
+        control.resume()
+        assert passed.wait(5)
+        worker.join()
+    
+    def test_cancel_wakes_paused_job(self):
+        """测试取消会唤醒暂停中的任务"""
+        control = JobControl()
+        control.pause()
+        control.cancel()
+        assert not control.paused
+        with pytest.raises(JobCancelled):
+            control.checkpoint()
+
+
+class TestJobManager:
+    """任务管理器测试类"""
+    
+    def test_submit_returns_immediately(self, manager):
+        """测试提交后立即返回并最终完成"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            job = manager.submit(os.path.join(tmpdir, "job.bin"), 1, "MB")
+            assert job.job_id
+            assert manager.get(job.job_id) is job
+            assert wait_for(lambda: job.finished)
+            assert job.status == JOB_COMPLETED
+            assert job.progress is not None and job.progress.percent == 100
+            assert os.path.getsize(os.path.join(tmpdir, "job.bin")) == 1024 * 1024
+    
+    def test_cancel_queued_job(self, manager, small_chunks):
+        """测试取消排队中的任务"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            first = manager.submit(os.path.join(tmpdir, "first.bin"), 64, "MB")
+            manager.pause(first.job_id)
+            second = manager.submit(os.path.join(tmpdir, "second.bin"), 1, "MB")
+            assert second.status == JOB_QUEUED
+            manager.cancel(second.job_id)
+            assert second.status == JOB_CANCELLED
+            manager.cancel(first.job_id)
+            assert wait_for(lambda: first.finished)
+            assert first.status == JOB_CANCELLED
+            assert not os.path.exists(os.path.join(tmpdir, "first.bin"))
+            assert not os.path.exists(os.path.join(tmpdir, "second.bin"))
+    
+    def test_pause_and_resume(self, manager, small_chunks):
+        """测试暂停与恢复任务"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            job = manager.submit(os.path.join(tmpdir, "pause.bin"), 64, "MB")
+            manager.pause(job.job_id)
+            assert wait_for(lambda: job.status == JOB_PAUSED)
+            manager.resume(job.job_id)
+            assert job.status in (JOB_RUNNING, JOB_COMPLETED)
+            assert wait_for(lambda: job.finished)
+            assert job.status == JOB_COMPLETED
+    
+    def test_queue_limit(self, small_chunks):
+        """测试未结束任务数达到上限时拒绝提交"""
+        manager = JobManager(max_workers=1, queue_limit=1)
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                job = manager.submit(os.path.join(tmpdir, "a.bin"), 64, "MB")
+                manager.pause(job.job_id)
+                with pytest.raises(ValueError):
+                    manager.submit(os.path.join(tmpdir, "b.bin"), 1, "MB")
+                manager.cancel(job.job_id)
+                assert wait_for(lambda: job.finished)
+        finally:
+            manager.shutdown()
+    
+    def test_fill_job(self, manager, monkeypatch):
+        """测试填充任务在任务队列中执行并上报进度"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monkeypatch.setattr(fill_target.psutil, "disk_usage", fake_disk(tmpdir, 100 * MB, 50 * MB))
+            job = manager.submit_fill(tmpdir, target_percent=52)
+            assert job.kind == JOB_KIND_FILL
+            assert wait_for(lambda: job.finished)
+            assert job.status == JOB_COMPLETED
+            assert job.error_code == "ok"
+            assert job.progress is not None and job.progress.bytes_written == 2 * MB
+            assert job.progress.percent == 100
+    
+    def test_cancel_fill_job(self, manager, monkeypatch):
+        """测试取消填充任务"""
+        monkeypatch.setattr(fill_target, "CHUNK_SIZE", 64 * 1024)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monkeypatch.setattr(fill_target.psutil, "disk_usage", fake_disk(tmpdir, 100 * MB, 10 * MB))
+            job = manager.submit_fill(tmpdir, target_percent=90)
+            manager.pause(job.job_id)
+            assert wait_for(lambda: job.status == JOB_PAUSED)
+            manager.cancel(job.job_id)
+            assert wait_for(lambda: job.finished)
+            assert job.status == JOB_CANCELLED
+    
+    def test_tree_job(self, manager):
+        """测试目录树任务在任务队列中执行，进度按文件数上报"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            job = manager.submit_tree(tmpdir, 20, fanout=2, depth=2, file_size=100)
+            assert job.kind == JOB_KIND_TREE
+            assert wait_for(lambda: job.finished)
+            assert job.status == JOB_COMPLETED
+            assert job.error_code == "ok"
+            assert "文件 20 个" in job.message
+            assert job.progress is not None and job.progress.bytes_written == job.progress.total_bytes == 20
+    
+    def test_cancel_tree_job(self, manager, monkeypatch):
+        """测试目录树任务可以在文件之间暂停和取消，已创建的文件保留"""
+        real_write = tree_generator._write_small_file
+        written = []
+        
+        def write_then_pause(path, view):
+            real_write(path, view)
+            written.append(path)
+            if len(written) == 5:
+                manager.pause(manager.list_jobs()[0].job_id)
+        
+        monkeypatch.setattr(tree_generator, "_write_small_file", write_then_pause)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            job = manager.submit_tree(tmpdir, 1000, fanout=4, depth=1, file_size=10)
+            assert wait_for(lambda: job.status == JOB_PAUSED and len(written) >= 5)
+            manager.cancel(job.job_id)
+            assert wait_for(lambda: job.finished)
+            assert job.status == JOB_CANCELLED
+            assert job.error_code == "cancelled"
+            assert len(written) < 1000
+            assert all(os.path.exists(path) for path in written)
+    
+    def test_tree_job_invalid_arguments(self, manager):
+        """测试目录树参数不合法时任务失败并返回 invalid_argument"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            job = manager.submit_tree(tmpdir, 10, fanout=0)
+            assert wait_for(lambda: job.finished)
+            assert job.error_code == "invalid_argument"
+    
+    def test_cancel_resumable_job_keeps_checkpoint(self, manager, small_chunks, monkeypatch):
+        """测试取消以续传方式提交、写检查点的任务时保留部分文件与检查点，之后可以续传"""
+        monkeypatch.setattr(file_generator, "CHECKPOINT_INTERVAL", 4 * 64 * 1024)
+        real_write = io_engine.ChunkWriter.write
+        writes = []
+        
+        def write_then_pause(writer, view):
+            real_write(writer, view)
+            writes.append(len(view))
+            if len(writes) == 6:
+                manager.pause(manager.list_jobs()[0].job_id)
+        
+        monkeypatch.setattr(io_engine.ChunkWriter, "write", write_then_pause)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "resumable.bin")
+            job = manager.submit(path, 8, "MB", resume=True)
+            assert wait_for(lambda: job.status == JOB_PAUSED and len(writes) == 6)
+            manager.cancel(job.job_id)
+            assert wait_for(lambda: job.finished)
+            assert job.status == JOB_CANCELLED
+            assert "检查点" in job.message
+            assert os.path.exists(path)
+            assert GenerationCheckpoint.load(path).bytes_written == os.path.getsize(path)
+            assert os.path.getsize(path) == 6 * 64 * 1024
+            resumed = manager.submit(path, 8, "MB", resume=True)
+            assert wait_for(lambda: resumed.finished)
+            assert resumed.status == JOB_COMPLETED
+            assert os.path.getsize(path) == 8 * 1024 * 1024
+    
+    def test_cancel_without_resume_removes_partial(self, manager, small_chunks, monkeypatch):
+        """测试未勾选断点续传的大文件取消后删除部分文件与检查点，可以直接重新提交"""
+        monkeypatch.setattr(file_generator, "CHECKPOINT_INTERVAL", 4 * 64 * 1024)
+        real_write = io_engine.ChunkWriter.write
+        writes = []
+        
+        def write_then_pause(writer, view):
+            real_write(writer, view)
+            writes.append(len(view))
+            if len(writes) == 6:
+                manager.pause(manager.list_jobs()[0].job_id)
+        
+        monkeypatch.setattr(io_engine.ChunkWriter, "write", write_then_pause)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "big.bin")
+            job = manager.submit(path, 8, "MB")
+            assert wait_for(lambda: job.status == JOB_PAUSED and len(writes) == 6)
+            manager.cancel(job.job_id)
+            assert wait_for(lambda: job.finished)
+            assert job.status == JOB_CANCELLED
+            assert "已删除" in job.message
+            assert not os.path.exists(path)
+            assert not GenerationCheckpoint.path_for(path).exists()
+            again = manager.submit(path, 1, "MB")
+            assert wait_for(lambda: again.finished)
+            assert again.status == JOB_COMPLETED
+    
+    def test_existing_file_rejected(self, manager):
+        """测试文件已存在时拒绝提交"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "exists.bin")
+            open(path, 'wb').close()
+            with pytest.raises(JobError) as exc_info:
+                manager.submit(path, 1, "MB")
+            assert exc_info.value.code == ERROR_FILE_EXISTS
+            assert manager.list_jobs() == []
+    
+    def test_action_on_unknown_job(self, manager):
+        """测试操作不存在的任务"""
+        with pytest.raises(ValueError):
+            manager.cancel("missing")
+
+
+class TestJobUI:
+    """任务界面测试类"""
+    
+    def test_handler_returns_job_id(self, manager, monkeypatch):
+        """测试生成按钮提交任务后立即返回任务ID"""
+        monkeypatch.setattr(interface, "job_manager", manager)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            message, _ = interface.generate_file_handler(tmpdir, "ui.bin", "1", "MB", "GB")
+            assert "任务ID" in message
+            job = manager.list_jobs()[0]
+            assert job.job_id in message
+            assert wait_for(lambda: job.finished)
+            assert "已完成" in interface.format_jobs(manager.list_jobs(), "MB")
+    
+    def test_fill_handler_returns_job_id(self, manager, monkeypatch):
+        """测试填充按钮提交任务后立即返回任务ID"""
+        monkeypatch.setattr(interface, "job_manager", manager)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monkeypatch.setattr(fill_target.psutil, "disk_usage", fake_disk(tmpdir, 100 * MB, 50 * MB))
+            message, _ = interface.fill_target_handler(tmpdir, interface.FILL_TARGET_PERCENT, "51", "MB", "zeros", "GB")
+            assert "任务ID" in message
+            job = manager.list_jobs()[0]
+            assert job.job_id in message
+            assert wait_for(lambda: job.finished)
+            assert "填充" in interface.format_jobs(manager.list_jobs(), "MB")
+    
+    def test_job_action_handler_errors(self, manager, monkeypatch):
+        """测试任务操作的错误提示"""
+        monkeypatch.setattr(interface, "job_manager", manager)
+        message, _ = interface.job_action_handler("", "cancel", "GB")
+        assert "❌" in message
+        message, _ = interface.job_action_handler("missing", "pause", "GB")
+        assert "任务不存在" in message
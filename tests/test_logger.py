@@ -0,0 +1,100 @@
+"""日志配置测试"""
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+from logging.handlers import QueueHandler, RotatingFileHandler
+from pathlib import Path
+
+import pytest
+
+from filetools.config.logger import configure_logging, default_log_file, logger, shutdown_logging
+
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture(autouse=True)
+def reset_logging():
+    """每个用例结束后恢复为未配置状态"""
+    yield
+    shutdown_logging()
+
+
+class TestLoggerImport:
+    """导入时无副作用测试"""
+
+    def test_import_has_no_side_effects(self, tmpdir_path):
+        """导入业务模块不创建目录、不打开日志文件"""
+        code = (
+            "import logging, os, pathlib\n"
+            "created = []\n"
+            "original_mkdir = os.mkdir\n"
+            "def mkdir(path, *args, **kwargs):\n"
+            "    created.append(str(path))\n"
+            "    return original_mkdir(path, *args, **kwargs)\n"
+            "os.mkdir = mkdir\n"
+            "import filetools.models\n"
+            "handlers = logging.getLogger('filetools').handlers\n"
+            "assert created == [], created\n"
+            "assert all(isinstance(h, logging.NullHandler) for h in handlers), handlers\n"
+            "assert not os.path.exists('logs')\n"
+        )
+        env = dict(os.environ, PYTHONPATH=SRC_DIR)
+        env.pop("FILETOOLS_LOG_DIR", None)
+        completed = subprocess.run(
+            [sys.executable, "-c", code], env=env, cwd=tmpdir_path, capture_output=True, text=True, timeout=120
+        )
+        assert completed.returncode == 0, completed.stderr
+
+
+class TestConfigureLogging:
+    """日志配置测试"""
+
+    def test_queue_handler_and_file(self, tmpdir_path):
+        """默认通过队列输出，关闭时输出队列中剩余的日志"""
+        log_file = os.path.join(tmpdir_path, "logs", "app.log")
+        configure_logging(log_file=log_file, console=False)
+        assert [type(handler) for handler in logger.handlers if not isinstance(handler, logging.NullHandler)] == [
+            QueueHandler
+        ]
+        logger.info("队列日志")
+        shutdown_logging()
+        with open(log_file, encoding="utf-8") as file:
+            assert "队列日志" in file.read()
+
+    def test_reconfigure_replaces_handlers(self, tmpdir_path):
+        """重复配置不会叠加处理器"""
+        configure_logging(console=False, log_file=os.path.join(tmpdir_path, "a.log"))
+        configure_logging(console=False, log_file=os.path.join(tmpdir_path, "b.log"))
+        assert sum(isinstance(handler, QueueHandler) for handler in logger.handlers) == 1
+
+    def test_rotation(self, tmpdir_path):
+        """超过单文件上限时轮转"""
+        log_file = os.path.join(tmpdir_path, "rotate.log")
+        configure_logging(log_file=log_file, console=False, use_queue=False, max_bytes=200, backup_count=2)
+        for index in range(20):
+            logger.info(f"轮转测试 {index}")
+        shutdown_logging()
+        assert os.path.exists(log_file + ".1")
+        assert not os.path.exists(log_file + ".3")
+
+    def test_unwritable_log_dir(self, tmpdir_path, capsys):
+        """日志目录不可创建时只输出到控制台"""
+        blocker = os.path.join(tmpdir_path, "file")
+        Path(blocker).write_text("")
+        configure_logging(log_file=os.path.join(blocker, "app.log"), use_queue=False)
+        assert "无法写入日志文件" in capsys.readouterr().err
+        assert all(not isinstance(handler, RotatingFileHandler) for handler in logger.handlers)
+
+    def test_default_log_file_env(self, monkeypatch, tmpdir_path):
+        """日志目录可通过环境变量指定"""
+        monkeypatch.setenv("FILETOOLS_LOG_DIR", tmpdir_path)
+        assert default_log_file() == Path(tmpdir_path) / "filetools.log"
+        assert not (Path(tmpdir_path) / "filetools.log").exists()
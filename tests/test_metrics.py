@@ -0,0 +1,104 @@
+"""指标与 /metrics 接口测试"""
+import os
+import tempfile
+
+import pytest
+from fastapi.testclient import TestClient
+
+from filetools.models import openmetrics
+from filetools.models.disk_snapshot import DiskSnapshotCache
+from filetools.models.disk_usage import DiskUsage
+from filetools.models.file_generator import generate_file
+from filetools.models.job_manager import JOB_COMPLETED, JOB_RUNNING, Job
+from filetools.models.metrics import GenerationMetrics, Histogram, generation_metrics
+from filetools.models.openmetrics import render_openmetrics
+from filetools.server import create_app
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+class TestHistogram:
+    """直方图测试"""
+
+    def test_cumulative_buckets(self):
+        """桶计数累计，边界值计入等于它的桶"""
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+        snapshot = histogram.snapshot()
+        assert snapshot.counts == [2, 3, 4]
+        assert snapshot.count == 4
+        assert snapshot.total == pytest.approx(3.65)
+
+    def test_invalid_buckets(self):
+        """桶上限必须递增"""
+        with pytest.raises(ValueError):
+            Histogram((1.0, 0.1))
+
+
+class TestOpenMetrics:
+    """OpenMetrics 文本测试"""
+
+    def test_render(self):
+        """输出挂载点、任务、写入字节数与直方图"""
+        metrics = GenerationMetrics(write_buckets=(0.01,), flush_buckets=(1.0,))
+        metrics.observe_write(4096, 0.002)
+        metrics.observe_flush(0.5)
+        metrics.file_generated()
+        disks = [
+            DiskUsage("sda1", 1000, 400, 40.0, "/da\"ta", inodes_total=100, inodes_free=60, fstype="ext4"),
+            DiskUsage("nfs", 0, 0, 0.0, "/mnt/nfs", available=False),
+        ]
+        jobs = [Job("a", "/tmp/a", 1, "GB", status=JOB_RUNNING), Job("b", "/tmp/b", 1, "GB", status=JOB_COMPLETED)]
+        text = render_openmetrics(disks, jobs, metrics, snapshot_age=1.5)
+        lines = text.splitlines()
+        labels = '{mountpoint="/da\\"ta",device="sda1",fstype="ext4"}'
+        assert f"filetools_disk_used_bytes{labels} 400" in lines
+        assert f"filetools_disk_free_bytes{labels} 600" in lines
+        assert f"filetools_disk_inodes_free{labels} 60" in lines
+        assert 'filetools_disk_up{mountpoint="/mnt/nfs",device="nfs",fstype=""} 0' in lines
+        assert not any(line.startswith("filetools_disk_total_bytes{mountpoint=\"/mnt/nfs\"") for line in lines)
+        assert 'filetools_jobs{state="running"} 1' in lines
+        assert "filetools_jobs_active 1" in lines
+        assert "filetools_written_bytes_total 4096" in lines
+        assert "filetools_files_generated_total 1" in lines
+        assert 'filetools_write_latency_seconds_bucket{le="0.01"} 1' in lines
+        assert 'filetools_flush_duration_seconds_bucket{le="+Inf"} 1' in lines
+        assert "filetools_disk_snapshot_age_seconds 1.5" in lines
+        assert lines[-1] == "# EOF"
+
+    def test_collect_does_not_scan(self, monkeypatch):
+        """抓取只读取快照缓存，尚无快照时也不触发扫描"""
+        def loader():
+            raise AssertionError("抓取时不应扫描分区")
+
+        monkeypatch.setattr(openmetrics, "disk_snapshot_cache", DiskSnapshotCache(loader=loader))
+        text = openmetrics.collect_openmetrics()
+        assert "filetools_disk_total_bytes{" not in text
+        assert text.endswith("# EOF\n")
+
+    def test_generate_updates_metrics(self, tmpdir_path):
+        """生成文件时累计写入字节数、块写入耗时与落盘耗时"""
+        bytes_before = generation_metrics.bytes_written
+        files_before = generation_metrics.files_generated
+        flushes_before = generation_metrics.flush_latency.snapshot().count
+        generate_file(os.path.join(tmpdir_path, "a.bin"), 3 * 1024 * 1024, chunk_size=1024 * 1024)
+        assert generation_metrics.bytes_written - bytes_before == 3 * 1024 * 1024
+        assert generation_metrics.files_generated - files_before == 1
+        assert generation_metrics.flush_latency.snapshot().count > flushes_before
+
+
+class TestMetricsEndpoint:
+    """/metrics 接口测试"""
+
+    def test_endpoint(self):
+        """返回 OpenMetrics 内容类型"""
+        client = TestClient(create_app(with_ui=False))
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/openmetrics-text")
+        assert "filetools_written_bytes_total" in response.text
@@ -0,0 +1,119 @@
+"""进度事件限流测试"""
+import os
+import tempfile
+
+import pytest
+
+from filetools.models import progress as progress_module
+from filetools.models.file_generator import generate_file
+from filetools.models.progress import ProgressEvent, ProgressThrottle, percent_listener
+from filetools.ui.interface import format_progress
+
+
+class FakeClock:
+    """可手动推进的单调时钟"""
+    
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """替换进度模块使用的时钟"""
+    fake = FakeClock()
+    monkeypatch.setattr(progress_module.time, "monotonic", fake)
+    return fake
+
+
+class TestProgressThrottle:
+    """进度限流测试类"""
+    
+    def test_byte_threshold_skips_clock(self, clock, monkeypatch):
+        """测试累计字节数不足时不读取时钟"""
+        events = []
+        throttle = ProgressThrottle(10 ** 9, events.append, min_interval=0.0, min_bytes=1000)
+        calls = []
+        monkeypatch.setattr(progress_module.time, "monotonic", lambda: calls.append(1) or clock.now)
+        for written in range(1, 1000):
+            throttle.update(written)
+        assert calls == []
+        assert events == []
+    
+    def test_time_threshold(self, clock):
+        """测试两次上报间隔不足时不上报"""
+        events = []
+        throttle = ProgressThrottle(10 ** 9, events.append, min_interval=1.0, min_bytes=1)
+        clock.now += 0.5
+        throttle.update(100)
+        assert events == []
+        clock.now += 0.5
+        throttle.update(200)
+        assert len(events) == 1
+        assert events[0].bytes_written == 200
+    
+    def test_event_rate_and_eta(self, clock):
+        """测试瞬时速度与预计剩余时间"""
+        events = []
+        mb = 1024 * 1024
+        throttle = ProgressThrottle(100 * mb, events.append, min_interval=1.0, min_bytes=1)
+        clock.now += 2.0
+        throttle.update(20 * mb)
+        clock.now += 1.0
+        throttle.update(50 * mb)
+        first, second = events
+        assert first.mbps == pytest.approx(10.0)
+        assert second.mbps == pytest.approx(30.0)
+        assert second.percent == 50
+        assert second.eta == pytest.approx(3.0)
+    
+    def test_final_update_always_emitted(self, clock):
+        """测试写完时不受限流影响"""
+        events = []
+        throttle = ProgressThrottle(100, events.append, min_interval=60.0, min_bytes=1000)
+        throttle.update(100)
+        throttle.finish(100)
+        assert len(events) == 1
+        assert events[0].finished
+        assert events[0].percent == 100
+    
+    def test_percent_listener(self):
+        """测试百分比回调与事件回调合并"""
+        percents, events = [], []
+        assert percent_listener() is None
+        listener = percent_listener(percents.append, events.append)
+        listener(ProgressEvent(bytes_written=50, total_bytes=200, elapsed=1.0))
+        assert percents == [25]
+        assert len(events) == 1
+
+
+class TestStreamingProgress:
+    """流式进度测试类"""
+    
+    def test_generate_file_events_throttled(self):
+        """测试小块写入时事件数量受限"""
+        events = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generate_file(os.path.join(tmpdir, "events.bin"), 8 * 1024 * 1024, progress_events=events.append)
+        assert events
+        assert events[-1].bytes_written == 8 * 1024 * 1024
+        assert events[-1].percent == 100
+        assert len(events) <= 2
+    
+    def test_sparse_emits_final_event(self):
+        """测试 sparse 模式也会上报最终进度"""
+        events = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            generate_file(os.path.join(tmpdir, "sparse.bin"), 1024, allocation="sparse", progress_events=events.append)
+        assert [event.percent for event in events] == [100]
+    
+    def test_format_progress(self):
+        """测试进度描述包含大小、速度和剩余时间"""
+        event = ProgressEvent(bytes_written=512 * 1024 ** 2, total_bytes=1024 ** 3, elapsed=2.0, mbps=256.0, eta=2.0)
+        message = format_progress(event, "MB")
+        assert "50%" in message
+        assert "512.00 MB" in message
+        assert "256.0 MB/s" in message
+        assert "2秒" in message
@@ -0,0 +1,182 @@
+"""按区域并行写入测试"""
+import fcntl
+import os
+import tempfile
+import threading
+
+import pytest
+
+from filetools.models import io_engine, region_writer
+from filetools.models.file_generator import generate_file, run_generation
+from filetools.models.job_control import JobCancelled, JobControl
+from filetools.models.region_writer import split_regions
+
+CHUNK = 64 * 1024
+
+
+@pytest.fixture
+def tmpdir_path():
+    """临时目录"""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def read(path: str) -> bytes:
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+class TestSplitRegions:
+    """区域划分测试类"""
+
+    def test_regions_cover_all_chunks(self):
+        """区域连续覆盖全部块，块数最多相差一个"""
+        regions = split_regions(10 * CHUNK + 1, CHUNK, 4)
+        assert [list(region) for region in regions] == [[0, 1], [2, 3, 4], [5, 6, 7], [8, 9, 10]]
+
+    def test_fewer_chunks_than_depth(self):
+        """块数少于队列深度时每个块一个区域"""
+        assert len(split_regions(2 * CHUNK, CHUNK, 8)) == 2
+
+
+class TestParallelWrite:
+    """并行写入测试类"""
+
+    @pytest.mark.parametrize("pattern", ["zeros", "random", "compressible", "unique"])
+    @pytest.mark.parametrize("io_mode", ["buffered", "direct", "dropbehind"])
+    def test_content_matches_sequential(self, tmpdir_path, pattern, io_mode):
+        """并行写出的内容与顺序写入完全相同（含不对齐的尾部）"""
+        size = 9 * CHUNK + 1234
+        sequential = os.path.join(tmpdir_path, "sequential.bin")
+        parallel = os.path.join(tmpdir_path, "parallel.bin")
+        generate_file(sequential, size, pattern=pattern, seed=3, chunk_size=CHUNK)
+        stats = generate_file(
+            parallel, size, pattern=pattern, seed=3, chunk_size=CHUNK, io_mode=io_mode, queue_depth=4
+        )
+        assert stats.queue_depth == 4
+        assert stats.bytes_written == size
+        assert stats.chunks_written == 10
+        assert read(parallel) == read(sequential)
+
+    def test_shared_buffer(self, tmpdir_path):
+        """不改写缓冲区的内容模式所有线程共享一个缓冲区，unique 模式每个线程一个"""
+        path = os.path.join(tmpdir_path, "a.bin")
+        assert generate_file(path, 8 * CHUNK, pattern="random", chunk_size=CHUNK, queue_depth=4).buffer_allocations == 1
+        assert generate_file(path, 8 * CHUNK, pattern="unique", chunk_size=CHUNK, queue_depth=4).buffer_allocations == 4
+
+    def test_writes_run_concurrently(self, tmpdir_path, monkeypatch):
+        """各区域在不同线程中用 pwrite 写入"""
+        threads = set()
+        real_pwrite = os.pwrite
+
+        def pwrite(fd, data, offset):
+            threads.add(threading.get_ident())
+            return real_pwrite(fd, data, offset)
+
+        monkeypatch.setattr(os, "pwrite", pwrite)
+        generate_file(os.path.join(tmpdir_path, "a.bin"), 8 * CHUNK, chunk_size=CHUNK, queue_depth=4)
+        assert len(threads) > 1
+        assert threading.get_ident() not in threads
+
+    def test_progress_combined(self, tmpdir_path):
+        """各区域的进度汇总为单调递增的一个进度，结束时为 100%"""
+        events = []
+        generate_file(
+            os.path.join(tmpdir_path, "a.bin"), 16 * CHUNK, chunk_size=CHUNK, queue_depth=4,
+            progress_events=events.append,
+        )
+        written = [event.bytes_written for event in events]
+        assert written == sorted(written)
+        assert events[-1].bytes_written == 16 * CHUNK
+        assert events[-1].percent == 100
+
+    def test_direct_tail_keeps_other_regions_direct(self, tmpdir_path, monkeypatch):
+        """最后一个区域写不对齐的尾部时，其余仍在写入的区域的描述符保留 O_DIRECT"""
+        size = 8 * CHUNK + 1234
+        last_region_start = split_regions(size, CHUNK, 4)[-1].start * CHUNK
+        tail_written = threading.Event()
+        direct_flags = []
+        real_pwrite_fully = io_engine.pwrite_fully
+
+        def pwrite_fully(fd, view, position):
+            if len(view) % io_engine.DIRECT_IO_ALIGNMENT:
+                real_pwrite_fully(fd, view, position)
+                tail_written.set()
+                return
+            if position < last_region_start:
+                assert tail_written.wait(5)
+            direct_flags.append(bool(fcntl.fcntl(fd, fcntl.F_GETFL) & os.O_DIRECT))
+            real_pwrite_fully(fd, view, position)
+
+        monkeypatch.setattr(io_engine, "pwrite_fully", pwrite_fully)
+        path = os.path.join(tmpdir_path, "a.bin")
+        stats = generate_file(path, size, pattern="random", seed=1, chunk_size=CHUNK, io_mode="direct", queue_depth=4)
+        if stats.io_mode != "direct":
+            pytest.skip("文件系统不支持 O_DIRECT")
+        assert tail_written.is_set()
+        assert len(direct_flags) == 8 and all(direct_flags)
+        assert os.path.getsize(path) == size
+
+    def test_unaligned_chunk_size_reports_dropbehind(self, tmpdir_path):
+        """块大小不按 4K 对齐时 direct 回退为 dropbehind 并如实记录"""
+        path = os.path.join(tmpdir_path, "a.bin")
+        stats = generate_file(path, 8 * CHUNK, chunk_size=CHUNK + 512, io_mode="direct", queue_depth=4)
+        assert stats.requested_io_mode == "direct"
+        assert stats.io_mode == "dropbehind"
+        assert os.path.getsize(path) == 8 * CHUNK
+
+    @pytest.mark.skipif(not os.path.isdir("/dev/shm"), reason="需要 tmpfs")
+    def test_write_mbps_not_divided_by_depth(self):
+        """并行写入的 write 耗时取最慢区域而不是累加，速度不会比单线程低约队列深度倍"""
+        with tempfile.TemporaryDirectory(dir="/dev/shm") as tmpdir:
+            path = os.path.join(tmpdir, "a.bin")
+            size = 64 * 1024 * 1024
+            single = generate_file(path, size, pattern="random", seed=1, chunk_size=CHUNK)
+            parallel = generate_file(path, size, pattern="random", seed=1, chunk_size=CHUNK, queue_depth=4)
+        assert parallel.write_mbps > single.write_mbps / 2
+
+    @pytest.mark.parametrize("durability, expected", [("none", 0), ("end", 1), ("chunk", 8)])
+    def test_durability(self, tmpdir_path, monkeypatch, durability, expected):
+        """end 策略在全部区域写完后只落盘一次"""
+        calls = []
+        real = io_engine.fdatasync
+        monkeypatch.setattr(io_engine, "fdatasync", lambda fd: (calls.append(fd), real(fd)))
+        stats = generate_file(
+            os.path.join(tmpdir_path, "a.bin"), 8 * CHUNK, chunk_size=CHUNK, queue_depth=4, durability=durability
+        )
+        assert len(calls) == stats.flushes == expected
+
+    def test_cancel_stops_all_regions(self, tmpdir_path, monkeypatch):
+        """任一区域取消后其余区域停止，部分文件被删除"""
+        control = JobControl()
+        real_write = io_engine.ChunkWriter.write
+
+        def write(self, view):
+            real_write(self, view)
+            control.cancel()
+
+        monkeypatch.setattr(io_engine.ChunkWriter, "write", write)
+        path = os.path.join(tmpdir_path, "a.bin")
+        with pytest.raises(JobCancelled):
+            generate_file(path, 64 * CHUNK, chunk_size=CHUNK, queue_depth=4, control=control)
+        assert not os.path.exists(path)
+
+    def test_region_error_propagates(self, tmpdir_path, monkeypatch):
+        """区域写入出错时异常在调用线程中抛出"""
+        def pwrite_fully(fd, view, position):
+            raise OSError(28, "No space left on device")
+
+        monkeypatch.setattr(io_engine, "pwrite_fully", pwrite_fully)
+        result = run_generation(os.path.join(tmpdir_path, "a.bin"), 1, "MB", queue_depth=4)
+        assert result.code == "os_error"
+
+    @pytest.mark.parametrize("queue_depth", [0, region_writer.MAX_QUEUE_DEPTH + 1])
+    def test_invalid_queue_depth(self, tmpdir_path, queue_depth):
+        """队列深度超出范围时报错"""
+        with pytest.raises(ValueError):
+            generate_file(os.path.join(tmpdir_path, "a.bin"), CHUNK, queue_depth=queue_depth)
+
+    def test_resume_not_supported(self, tmpdir_path):
+        """并行写入不能与断点续传同时使用"""
+        with pytest.raises(ValueError):
+            generate_file(os.path.join(tmpdir_path, "a.bin"), CHUNK, queue_depth=2, resume=True)
@@ -0,0 +1,79 @@
+"""磁盘空间预检测试"""
+import os
+import tempfile
+
+import pytest
+
+from filetools.models import disk_monitor, space_check
+from filetools.models.file_generator import generate_file_with_progress
+from filetools.models.space_check import (
+    check_free_space,
+    estimate_required_space,
+    invalidate_mount_table,
+    resolve_mountpoint,
+)
+
+
+class TestSpaceCheck:
+    """空间预检测试类"""
+    
+    def test_resolve_mountpoint_is_prefix(self):
+        """测试解析出的挂载点是路径的前缀"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mountpoint = resolve_mountpoint(os.path.join(tmpdir, "a", "b.bin"))
+            assert os.path.realpath(tmpdir).startswith(mountpoint.rstrip(os.sep))
+            assert os.stat(mountpoint).st_dev == os.stat(tmpdir).st_dev
+    
+    def test_mount_table_is_cached(self, monkeypatch):
+        """测试挂载点表只读取一次"""
+        calls = []
+        original = space_check.psutil.disk_partitions
+        
+        def counting_partitions(all=False):
+            calls.append(all)
+            return original(all=all)
+        
+        invalidate_mount_table()
+        monkeypatch.setattr(space_check.psutil, "disk_partitions", counting_partitions)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            resolve_mountpoint(tmpdir)
+            resolve_mountpoint(tmpdir)
+        assert len(calls) == 1
+        invalidate_mount_table()
+    
+    def test_required_space_block_aligned(self):
+        """测试需要的空间按块对齐并包含元数据开销"""
+        assert estimate_required_space(1, "stream", 4096) >= 4096
+        assert estimate_required_space(1024 ** 3, "preallocate", 4096) > 1024 ** 3
+        assert estimate_required_space(1024 ** 3, "sparse", 4096) == 0
+    
+    def test_check_free_space_small_file(self):
+        """测试小文件空间充足"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            check = check_free_space(os.path.join(tmpdir, "x.bin"), 1024)
+            assert check.sufficient
+            assert check.available > 0
+            assert check.reserved >= 0
+    
+    def test_check_free_space_huge_file(self):
+        """测试超大文件空间不足"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            check = check_free_space(os.path.join(tmpdir, "x.bin"), 1024 ** 6)
+            assert not check.sufficient
+    
+    def test_preflight_does_not_scan_partitions(self, monkeypatch):
+        """测试生成前的预检不会枚举全部分区"""
+        def fail_scan():
+            raise AssertionError("不应调用 get_disk_usage_info")
+        
+        monkeypatch.setattr(disk_monitor, "get_disk_usage_info", fail_scan)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = generate_file_with_progress(os.path.join(tmpdir, "x.bin"), 1, "KB", None)
+            assert "成功" in result
+    
+    def test_preflight_rejects_on_target_mount(self):
+        """测试按目标挂载点拒绝超大文件"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            result = generate_file_with_progress(os.path.join(tmpdir, "x.bin"), 1024 ** 2, "TB", None)
+            assert "磁盘空间不足" in result
+            assert not os.path.exists(os.path.join(tmpdir, "x.bin"))
@@ -0,0 +1,166 @@
+"""小文件目录树生成测试"""
+import errno
+import os
+import random
+import tempfile
+import time
+
+import pytest
+
+from filetools.config.constants import TREE_MAX_FILE_SIZE
+from filetools.models import tree_generator
+from filetools.models.disk_usage import DiskUsage
+from filetools.models.job_manager import job_manager
+from filetools.models.tree_generator import TreeResult, draw_file_size, format_tree_result, generate_tree
+from filetools.ui.interface import generate_tree_handler
+
+
+@pytest.fixture
+def tmpdir_path():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+def _list_files(root):
+    return sorted(
+        os.path.join(dirpath, name) for dirpath, _, names in os.walk(root) for name in names
+    )
+
+
+class TestGenerateTree:
+    """目录树生成测试"""
+
+    def test_tree_layout(self, tmpdir_path):
+        """按每级子目录数和层数创建目录，文件平均分配到叶子目录"""
+        result = generate_tree(tmpdir_path, file_count=25, fanout=3, depth=2, file_size=100)
+        assert result.dirs_created == 3 + 9
+        assert result.files_created == 25
+        assert result.bytes_written == 25 * 100
+        files = _list_files(tmpdir_path)
+        assert len(files) == 25
+        assert all(os.path.getsize(path) == 100 for path in files)
+        leaves = {os.path.dirname(path) for path in files}
+        assert len(leaves) == 9
+        assert all(os.path.relpath(leaf, tmpdir_path).count(os.sep) == 1 for leaf in leaves)
+
+    def test_depth_zero(self, tmpdir_path):
+        """层数为 0 时文件直接放在根目录"""
+        result = generate_tree(tmpdir_path, file_count=5, fanout=4, depth=0, file_size=10)
+        assert result.dirs_created == 0
+        assert sorted(os.listdir(tmpdir_path)) == [f"f{index:08d}.bin" for index in range(5)]
+
+    def test_distribution_reproducible(self, tmpdir_path):
+        """相同种子生成的文件大小完全相同"""
+        first = os.path.join(tmpdir_path, "a")
+        second = os.path.join(tmpdir_path, "b")
+        generate_tree(first, file_count=40, fanout=2, depth=1, file_size=2048, distribution="lognormal", seed=3)
+        generate_tree(second, file_count=40, fanout=2, depth=1, file_size=2048, distribution="lognormal", seed=3)
+        sizes_a = [os.path.getsize(path) for path in _list_files(first)]
+        sizes_b = [os.path.getsize(path) for path in _list_files(second)]
+        assert sizes_a == sizes_b
+        assert len(set(sizes_a)) > 1
+
+    def test_random_content(self, tmpdir_path):
+        """random 内容模式写入非零数据"""
+        generate_tree(tmpdir_path, file_count=3, fanout=1, depth=1, file_size=4096, pattern="random", seed=1)
+        for path in _list_files(tmpdir_path):
+            with open(path, 'rb') as file:
+                assert any(file.read())
+
+    def test_files_per_second_and_inodes(self, tmpdir_path):
+        """报告 files/s 与生成前后的 inode 使用情况"""
+        result = generate_tree(tmpdir_path, file_count=50, fanout=5, depth=1, file_size=0)
+        assert result.files_per_second > 0
+        assert result.usage_before is not None and result.usage_after is not None
+        if result.usage_before.inodes_total:
+            assert result.usage_after.inodes_free <= result.usage_before.inodes_free
+
+    def test_stops_when_exhausted(self, tmpdir_path, monkeypatch):
+        """inode 耗尽（ENOSPC）时所有线程停止创建并记录错误"""
+        original = tree_generator._write_small_file
+        created = []
+
+        def limited_write(path, view):
+            if len(created) >= 7:
+                raise OSError(errno.ENOSPC, "No space left on device")
+            original(path, view)
+            created.append(path)
+
+        monkeypatch.setattr(tree_generator, "_write_small_file", limited_write)
+        result = generate_tree(tmpdir_path, file_count=100, fanout=2, depth=1, file_size=1, max_workers=1)
+        assert result.files_created == 7
+        assert result.errors
+
+    def test_leaves_capped_at_file_count(self, tmpdir_path):
+        """叶子目录数不超过文件数，fanout^depth 很大时只创建用得到的目录"""
+        result = generate_tree(tmpdir_path, file_count=5, fanout=100, depth=3, file_size=1)
+        assert result.dirs_created == 1 + 1 + 5
+        assert result.files_created == 5
+        assert len({os.path.dirname(path) for path in _list_files(tmpdir_path)}) == 5
+
+    def test_mkdir_exhausted_recorded(self, tmpdir_path, monkeypatch):
+        """创建目录时空间或 inode 耗尽不抛出异常，错误记录在结果中"""
+        real_mkdir = os.mkdir
+        calls = []
+
+        def limited_mkdir(path, *args, **kwargs):
+            calls.append(path)
+            if len(calls) > 3:
+                raise OSError(errno.EDQUOT, "Disk quota exceeded")
+            real_mkdir(path, *args, **kwargs)
+
+        monkeypatch.setattr(tree_generator.os, "mkdir", limited_mkdir)
+        result = generate_tree(tmpdir_path, file_count=20, fanout=4, depth=2, file_size=1)
+        assert result.errors and "quota" in result.errors[0]
+        assert result.files_created == 0
+
+    @pytest.mark.parametrize("kwargs", [
+        {"file_count": -1},
+        {"fanout": 0},
+        {"depth": -1},
+        {"file_size": TREE_MAX_FILE_SIZE + 1},
+        {"distribution": "normal"},
+        {"pattern": "unique"},
+        {"max_workers": 0},
+    ])
+    def test_invalid_arguments(self, tmpdir_path, kwargs):
+        """非法参数抛出 ValueError"""
+        with pytest.raises(ValueError):
+            generate_tree(tmpdir_path, **kwargs)
+
+    def test_draw_file_size_bounds(self):
+        """抽取的文件大小不超过上限"""
+        rng = random.Random(0)
+        sizes = [draw_file_size(rng, TREE_MAX_FILE_SIZE, "lognormal") for _ in range(200)]
+        assert max(sizes) <= TREE_MAX_FILE_SIZE
+        assert all(0 <= draw_file_size(rng, 100, "uniform") <= 200 for _ in range(100))
+
+
+class TestTreeUI:
+    """目录树界面测试"""
+
+    def test_format_inode_change(self):
+        """结果中显示 inode 使用率变化"""
+        result = TreeResult(
+            root="/tmp/tree",
+            files_created=1000,
+            elapsed=2.0,
+            usage_before=DiskUsage("sda", 100, 10, 10.0, "/", inodes_total=10000, inodes_free=9000),
+            usage_after=DiskUsage("sda", 100, 10, 10.0, "/", inodes_total=10000, inodes_free=7990),
+        )
+        message = format_tree_result(result)
+        assert "500 个/秒" in message
+        assert "10.0% → 20.1%" in message
+        assert "消耗 1,010 个" in message
+
+    def test_handler(self, tmpdir_path):
+        """界面处理函数把目录树提交到任务队列并立即返回任务 ID"""
+        message, _ = generate_tree_handler(tmpdir_path, 10, 2, 1, 1, "fixed", "zeros", "GB")
+        assert message.startswith("📋")
+        job = job_manager.get(message.split("任务ID: ")[1].splitlines()[0])
+        deadline = time.monotonic() + 5
+        while not job.finished and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert job.error_code == "ok"
+        assert len(_list_files(tmpdir_path)) == 10
+        assert generate_tree_handler("", 10, 2, 1, 1, "fixed", "zeros", "GB")[0].startswith("❌")
@@ -49,6 +49,35 @@ class TestUIFunctions:
         assert "Disk2" in result
         assert result.count("###") == 2  # 两个磁盘标题
     
+    def test_format_disk_info_unavailable_disk(self):
+        """测试不可用的挂载点显示为超时状态"""
+        disks = [
+            DiskUsage(device="nas:/export", total=0, used=0, percent=0.0, mountpoint="/mnt/nas", available=False),
+            DiskUsage(device="Disk1", total=1024**3, used=512*1024**2, percent=50.0),
+        ]
+        result = format_disk_info(disks, "GB")
+        assert "不可用" in result
+        assert "/mnt/nas" in result
+        assert result.count("###") == 2
+    
+    def test_format_disk_info_inodes(self):
+        """测试显示 inode 使用率，不限制 inode 的文件系统不显示"""
+        disks = [DiskUsage(device="Disk1", total=1024**3, used=512*1024**2, percent=50.0,
+                           inodes_total=1000, inodes_free=250)]
+        assert "inode**: 75.0%" in format_disk_info(disks, "GB")
+        disks = [DiskUsage(device="Disk1", total=1024**3, used=512*1024**2, percent=50.0)]
+        assert "inode" not in format_disk_info(disks, "GB")
+    
+    def test_format_disk_info_filesystem_details(self):
+        """测试显示文件系统类型、块大小、预留空间和 inode 耗尽警告"""
+        disks = [DiskUsage(device="Disk1", total=1024**3, used=512*1024**2, percent=52.6, fstype="ext4",
+                           block_size=4096, reserved=50*1024**2, inodes_total=1000, inodes_free=50)]
+        result = format_disk_info(disks, "MB")
+        assert "ext4，块大小 4 KB" in result
+        assert "root 预留**: 50.00 MB" in result
+        assert "可用**: 462.00 MB" in result
+        assert "inode 即将耗尽" in result
+    
     def test_format_disk_info_different_units(self):
         """测试不同单位的格式化"""
         disk = DiskUsage(
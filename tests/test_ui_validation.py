@@ -5,7 +5,14 @@ import os
 import time
 import sys
 from pathlib import Path
-from filetools.ui.interface import _validate_inputs, _validate_directory, _validate_file_size
+from filetools.ui.interface import (
+    FILL_TARGET_FREE,
+    FILL_TARGET_PERCENT,
+    _parse_fill_target,
+    _validate_directory,
+    _validate_file_size,
+    _validate_inputs,
+)
 
 
 class TestUIValidation:
@@ -112,3 +119,31 @@ class TestUIValidation:
         assert is_valid is True
         assert size == 999999999
 
+
+
+class TestFillTargetValidation:
+    """填充目标解析测试类"""
+    
+    def test_parse_percent(self):
+        """测试解析目标使用率"""
+        is_valid, error_msg, target = _parse_fill_target(FILL_TARGET_PERCENT, "95", "GB")
+        assert is_valid is True
+        assert target == {"target_percent": 95.0}
+    
+    def test_parse_free_bytes(self):
+        """测试解析目标剩余空间"""
+        is_valid, error_msg, target = _parse_fill_target(FILL_TARGET_FREE, "500", "MB")
+        assert is_valid is True
+        assert target == {"target_free_bytes": 500 * 1024 * 1024}
+    
+    def test_parse_not_number(self):
+        """测试目标值不是数字"""
+        is_valid, error_msg, target = _parse_fill_target(FILL_TARGET_PERCENT, "abc", "GB")
+        assert is_valid is False
+        assert "数字" in error_msg
+    
+    def test_parse_percent_out_of_range(self):
+        """测试目标使用率超出范围"""
+        is_valid, error_msg, target = _parse_fill_target(FILL_TARGET_PERCENT, "120", "GB")
+        assert is_valid is False
+        assert "0-100" in error_msg
@@ -0,0 +1,94 @@
+"""写缓冲区与内存占用测试"""
+import ctypes
+import mmap
+import os
+import tempfile
+
+import pytest
+
+from filetools.config.constants import CHUNK_SIZE
+from filetools.models import file_generator
+from filetools.models.file_generator import generate_file
+from filetools.models.write_buffer import WriteBuffer, align_up
+
+
+class TestWriteBuffer:
+    """写缓冲区测试类"""
+    
+    def test_align_up(self):
+        """测试向上对齐"""
+        assert align_up(1, 4096) == 4096
+        assert align_up(4096, 4096) == 4096
+        assert align_up(4097, 4096) == 8192
+    
+    def test_buffer_is_page_aligned(self):
+        """测试缓冲区地址和容量按页对齐"""
+        with WriteBuffer(1000) as buffer:
+            assert buffer.capacity % mmap.PAGESIZE == 0
+            address = ctypes.addressof(ctypes.c_char.from_buffer(buffer._mmap))
+            assert address % mmap.PAGESIZE == 0
+    
+    def test_view_is_zero_filled(self):
+        """测试视图内容全为零"""
+        with WriteBuffer(4096) as buffer:
+            assert bytes(buffer.view(4096)) == b'\0' * 4096
+            assert len(buffer.view(10)) == 10
+    
+    def test_view_out_of_range(self):
+        """测试超出范围的视图长度"""
+        with WriteBuffer(1024) as buffer:
+            with pytest.raises(ValueError):
+                buffer.view(1025)
+    
+    def test_invalid_size(self):
+        """测试无效的缓冲区大小"""
+        with pytest.raises(ValueError):
+            WriteBuffer(0)
+    
+    def test_generate_file_allocates_once(self):
+        """测试多块文件只分配一次缓冲区"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_multi.bin")
+            stats = generate_file(file_path, CHUNK_SIZE * 2 + 1000, None)
+            assert stats.buffer_allocations == 1
+            assert stats.chunks_written == 3
+            assert stats.bytes_written == CHUNK_SIZE * 2 + 1000
+            assert stats.peak_rss >= stats.rss_before > 0
+    
+    def test_small_file_uses_small_buffer(self):
+        """测试小文件不会分配完整块大小的缓冲区"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_small.bin")
+            stats = generate_file(file_path, 1024, None)
+            assert stats.buffer_size == mmap.PAGESIZE
+            assert os.path.getsize(file_path) == 1024
+    
+    def test_memory_growth_bounded_by_buffer(self):
+        """测试内存增长不超过一个缓冲区（与文件大小无关）"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_rss.bin")
+            stats = generate_file(file_path, CHUNK_SIZE * 3, None)
+            assert stats.rss_growth <= stats.buffer_size + 16 * 1024 * 1024
+    
+    @pytest.mark.parametrize("queue_depth", [1, 4])
+    def test_rss_sampled_only_on_progress(self, monkeypatch, queue_depth):
+        """测试内存不逐块采样：没有进度上报时只在开始和结束时采样"""
+        calls = []
+        real_process = file_generator.psutil.Process
+        
+        class CountingProcess:
+            def __init__(self):
+                self._process = real_process()
+            
+            def memory_info(self):
+                calls.append(1)
+                return self._process.memory_info()
+        
+        monkeypatch.setattr(file_generator.psutil, "Process", CountingProcess)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            stats = generate_file(
+                os.path.join(tmpdir, "a.bin"), 64 * 64 * 1024, chunk_size=64 * 1024, queue_depth=queue_depth
+            )
+        assert stats.chunks_written == 64
+        assert len(calls) == 2
+        assert stats.peak_rss >= stats.rss_before > 0